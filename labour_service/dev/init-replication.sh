@@ -0,0 +1,5 @@
+#!/bin/bash
+set -e
+
+# Allow the replica container to stream WAL from the primary over the compose network
+echo "host replication all all scram-sha-256" >> "$PGDATA/pg_hba.conf"
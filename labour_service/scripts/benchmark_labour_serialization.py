@@ -0,0 +1,82 @@
+"""
+Microbenchmark for labour response serialization.
+
+Compares the per-request CPU cost of serializing a labour through the pydantic response
+model (the previous route behaviour) against serializing the dataclass DTOs directly
+with orjson, for labours with 10, 100 and 1000 contractions.
+
+Usage:
+    PYTHONPATH="." uv run python scripts/benchmark_labour_serialization.py
+"""
+
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+
+from fastapi.responses import ORJSONResponse
+
+from src.api.responses import DataclassResponse
+from src.labour.api.schemas.responses.labour import LabourResponse
+from src.labour.application.dtos.labour import LabourDTO
+from src.labour.domain.contraction.entity import Contraction
+from src.labour.domain.labour.entity import Labour
+from src.labour.domain.labour_update.enums import LabourUpdateType
+from src.user.domain.value_objects.user_id import UserId
+
+CONTRACTION_COUNTS = (10, 100, 1000)
+ITERATIONS = 200
+
+
+def build_labour(number_of_contractions: int) -> Labour:
+    start_time = datetime(2020, 1, 1, 1, 0, tzinfo=UTC)
+    labour = Labour.plan(
+        birthing_person_id=UserId("benchmark"), first_labour=True, due_date=start_time
+    )
+    labour.begin(start_time=start_time)
+    for i in range(number_of_contractions):
+        contraction = Contraction.start(
+            labour_id=labour.id_, start_time=start_time + timedelta(minutes=5 * i)
+        )
+        contraction.end(end_time=contraction.start_time + timedelta(minutes=1), intensity=5)
+        labour.contractions.append(contraction)
+    for i in range(number_of_contractions // 10):
+        labour.add_labour_update(
+            labour_update_type=LabourUpdateType.STATUS_UPDATE,
+            message=f"Status update {i}",
+            sent_time=start_time + timedelta(minutes=50 * i),
+        )
+    return labour
+
+
+def pydantic_path(labour: Labour) -> bytes:
+    dto = LabourDTO.from_domain(labour)
+    response = LabourResponse.model_validate(LabourResponse(labour=dto))
+    return ORJSONResponse(response.model_dump(mode="json")).body
+
+
+def dataclass_path(labour: Labour) -> bytes:
+    return DataclassResponse({"labour": LabourDTO.from_domain(labour)}).body
+
+
+def cpu_time_per_request(func: Callable[[Labour], bytes], labour: Labour) -> float:
+    func(labour)
+    start = time.process_time()
+    for _ in range(ITERATIONS):
+        func(labour)
+    return (time.process_time() - start) / ITERATIONS
+
+
+def main() -> None:
+    print(f"{'contractions':>12} {'pydantic (ms)':>14} {'dataclass (ms)':>15} {'speedup':>8}")
+    for number_of_contractions in CONTRACTION_COUNTS:
+        labour = build_labour(number_of_contractions)
+        pydantic_ms = cpu_time_per_request(pydantic_path, labour) * 1000
+        dataclass_ms = cpu_time_per_request(dataclass_path, labour) * 1000
+        print(
+            f"{number_of_contractions:>12} {pydantic_ms:>14.3f} {dataclass_ms:>15.3f} "
+            f"{pydantic_ms / dataclass_ms:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+Load test for the labour service.
+
+Runs migrations, then starts the API and the event consumer against a local Postgres and the
+Pub/Sub emulator, with Keycloak replaced by an in-process fake. Each scenario reports its
+throughput, latency percentiles, database queries per request and the events handled by the
+consumer. Results are written as JSON, and compared against a baseline when one is given.
+
+Start Postgres and the emulator first, see docker-compose.loadtest.yml, or run `make loadtest`.
+
+Usage:
+    PYTHONPATH="." uv run --all-groups python -m scripts.loadtest \
+        [--scenario NAME ...] [--output results.json] [--baseline baseline.json]
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import uvicorn
+
+from scripts.loadtest.fake_keycloak import FakeKeycloak
+from scripts.loadtest.runner import (
+    LoadTestClient,
+    ScenarioResult,
+    ServiceProcess,
+    compare,
+    print_report,
+    results_to_json,
+    run_migrations,
+    run_scenario,
+)
+from scripts.loadtest.scenarios import Scenarios
+
+KEYCLOAK_REALM = "labour_tracker"
+METRICS_SCRAPE_TOKEN = "loadtest"
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Labour service load test")
+    parser.add_argument("--scenario", action="append", dest="scenarios")
+    parser.add_argument("--output", type=Path, default=Path("loadtest-results.json"))
+    parser.add_argument("--baseline", type=Path)
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--api-port", type=int, default=8100)
+    parser.add_argument("--consumer-metrics-port", type=int, default=9564)
+    parser.add_argument("--keycloak-port", type=int, default=8180)
+    parser.add_argument("--postgres-host", default="0.0.0.0")
+    parser.add_argument("--postgres-port", default="5452")
+    parser.add_argument("--pubsub-emulator-host", default="0.0.0.0:8095")
+    return parser.parse_args()
+
+
+def service_env(args: argparse.Namespace) -> dict[str, str]:
+    return {
+        "ENVIRONMENT": "loadtest",
+        "LOG_LEVEL": "WARNING",
+        "KEYCLOAK_SERVER_URL": f"http://127.0.0.1:{args.keycloak_port}",
+        "KEYCLOAK_REALM": KEYCLOAK_REALM,
+        "POSTGRES_HOST": args.postgres_host,
+        "POSTGRES_PORT": args.postgres_port,
+        "POSTGRES_USER": "postgres",
+        "POSTGRES_PASSWORD": "changeme",
+        "POSTGRES_DB": "app",
+        "DATABASE_ENCRYPTION_KEY": "loadtest",
+        "SUBSCRIBER_TOKEN_SALT": "loadtest",
+        "PUBSUB_EMULATOR_HOST": args.pubsub_emulator_host,
+        "GCP_PROJECT_ID": "test",
+        "CONSUMER_METRICS_HOST": "127.0.0.1",
+        "CONSUMER_METRICS_PORT": str(args.consumer_metrics_port),
+        "SENTRY_TRACES_SAMPLE_RATE": "0",
+        "SENTRY_WRITE_TRACES_SAMPLE_RATE": "0",
+        "METRICS_SCRAPE_TOKEN": METRICS_SCRAPE_TOKEN,
+    }
+
+
+async def run(args: argparse.Namespace) -> list[ScenarioResult]:
+    keycloak = FakeKeycloak(realm=KEYCLOAK_REALM)
+    keycloak_server = uvicorn.Server(
+        uvicorn.Config(
+            keycloak.create_app(), host="127.0.0.1", port=args.keycloak_port, log_level="warning"
+        )
+    )
+    keycloak_task = asyncio.create_task(keycloak_server.serve())
+
+    env = service_env(args)
+    run_migrations(env)
+    api = ServiceProcess(
+        "api",
+        ["-m", "uvicorn", "src.run:app", "--port", str(args.api_port), "--no-access-log"],
+        env,
+    )
+    consumer = ServiceProcess("consumer", ["-m", "src.run_consumer"], env)
+    consumer_metrics_url = f"http://127.0.0.1:{args.consumer_metrics_port}/metrics"
+
+    scenarios = Scenarios(keycloak).all()
+    selected = args.scenarios or list(scenarios)
+    client = LoadTestClient(f"http://127.0.0.1:{args.api_port}", concurrency=args.concurrency)
+    try:
+        api.start()
+        consumer.start()
+        await api.wait_until_healthy(f"http://127.0.0.1:{args.api_port}/api/v1/health")
+        await consumer.wait_until_healthy(consumer_metrics_url)
+        return [
+            await run_scenario(
+                name, scenarios[name], client, consumer_metrics_url, METRICS_SCRAPE_TOKEN
+            )
+            for name in selected
+        ]
+    finally:
+        await client.close()
+        api.stop()
+        consumer.stop()
+        keycloak_server.should_exit = True
+        await keycloak_task
+
+
+def main() -> None:
+    args = parse_args()
+    results = asyncio.run(run(args))
+
+    print_report(results)
+    args.output.write_text(json.dumps(results_to_json(results), indent=2))
+
+    baseline = json.loads(args.baseline.read_text()) if args.baseline else {}
+    regressions = compare(results, baseline, tolerance=args.tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}", file=sys.stderr)
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
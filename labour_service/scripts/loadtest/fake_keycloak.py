@@ -0,0 +1,79 @@
+"""
+Stand-in for the Keycloak endpoints the labour service calls.
+
+Access tokens are `loadtest-<user id>` for any user created through `FakeKeycloak.add_user`,
+so the load test can act as any number of users without running Keycloak. The admin client
+is issued a token for any client credentials.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from fastapi import FastAPI, Header, HTTPException, Query
+
+TOKEN_PREFIX = "loadtest-"
+
+
+@dataclass
+class FakeKeycloak:
+    realm: str
+    users: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+    def add_user(self, user_id: str, username: str) -> str:
+        """Create a user and return the access token that authenticates as them."""
+        self.users[user_id] = {
+            "id": user_id,
+            "username": username,
+            "email": f"{username}@loadtest.invalid",
+            "firstName": username.capitalize(),
+            "lastName": "Loadtest",
+            "attributes": {"phone_number": ["+440000000000"]},
+        }
+        return f"{TOKEN_PREFIX}{user_id}"
+
+    def userinfo(self, authorization: str | None) -> dict[str, Any]:
+        token = (authorization or "").removeprefix("Bearer ")
+        user = self.users.get(token.removeprefix(TOKEN_PREFIX))
+        if not token.startswith(TOKEN_PREFIX) or user is None:
+            raise HTTPException(status_code=401, detail="invalid_token")
+        return {
+            "sub": user["id"],
+            "preferred_username": user["username"],
+            "email": user["email"],
+            "given_name": user["firstName"],
+            "family_name": user["lastName"],
+            "phone_number": user["attributes"]["phone_number"][0],
+        }
+
+    def create_app(self) -> FastAPI:
+        app = FastAPI(title="Fake Keycloak")
+        realm_path = f"/realms/{self.realm}/protocol/openid-connect"
+        admin_path = f"/admin/realms/{self.realm}/users"
+
+        @app.api_route(f"{realm_path}/userinfo", methods=["GET", "POST"])
+        async def userinfo(authorization: str | None = Header(default=None)) -> dict[str, Any]:
+            return self.userinfo(authorization)
+
+        @app.post(f"{realm_path}/token")
+        async def token() -> dict[str, Any]:
+            return {
+                "access_token": "loadtest-admin",
+                "refresh_token": "loadtest-admin",
+                "expires_in": 3600,
+                "refresh_expires_in": 3600,
+                "token_type": "Bearer",
+            }
+
+        @app.get(admin_path)
+        async def get_users(
+            first: int = Query(default=0), max: int = Query(default=100)
+        ) -> list[dict[str, Any]]:
+            return list(self.users.values())[first : first + max]
+
+        @app.get(f"{admin_path}/{{user_id}}")
+        async def get_user(user_id: str) -> dict[str, Any]:
+            if user_id not in self.users:
+                raise HTTPException(status_code=404, detail="User not found")
+            return self.users[user_id]
+
+        return app
@@ -0,0 +1,238 @@
+import asyncio
+import os
+import subprocess
+import sys
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+PROJECT_ROOT = Path(__file__).parents[2]
+
+
+def percentile(values: list[float], q: int) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) * q // 100, len(ordered) - 1)]
+
+
+def metric_total(exposition: str, name: str, exclude_routes: Iterable[str] = ()) -> float:
+    """Sum every series of a metric in a Prometheus text exposition, skipping some routes."""
+    excluded = tuple(f'route="{route}"' for route in exclude_routes)
+    total = 0.0
+    for line in exposition.splitlines():
+        if not line.startswith((f"{name}{{", f"{name} ")):
+            continue
+        if any(label in line for label in excluded):
+            continue
+        total += float(line.rsplit(" ", 1)[1])
+    return total
+
+
+@dataclass
+class ScenarioResult:
+    name: str
+    requests: int
+    errors: int
+    duration_seconds: float
+    throughput: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    db_queries: float
+    db_queries_per_request: float
+    events_handled: float
+
+
+@dataclass
+class Recorder:
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+
+
+class LoadTestClient:
+    """HTTP client for the labour service that records the latency of every recorded request."""
+
+    def __init__(self, base_url: str, concurrency: int) -> None:
+        self._client = httpx.AsyncClient(base_url=base_url, timeout=30.0)
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self.recorder = Recorder()
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        token: str | None = None,
+        json: Any = None,
+        record: bool = True,
+    ) -> httpx.Response:
+        headers = {"Authorization": f"Bearer {token}"} if token else {}
+        async with self._semaphore:
+            start = time.perf_counter()
+            response = await self._client.request(method, path, headers=headers, json=json)
+            elapsed = time.perf_counter() - start
+        if record:
+            self.recorder.latencies.append(elapsed)
+            if response.is_error:
+                self.recorder.errors += 1
+        elif response.is_error:
+            raise RuntimeError(
+                f"{method} {path} failed with {response.status_code}: {response.text}"
+            )
+        return response
+
+    async def scrape(self, url: str, token: str | None = None) -> str:
+        headers = {"Authorization": f"Bearer {token}"} if token else {}
+        response = await self._client.get(url, headers=headers)
+        response.raise_for_status()
+        return response.text
+
+
+async def run_scenario(
+    name: str,
+    scenario: Callable[[LoadTestClient], Awaitable[None]],
+    client: LoadTestClient,
+    consumer_metrics_url: str | None,
+    metrics_token: str | None = None,
+) -> ScenarioResult:
+    """Run a scenario and measure the requests it records, and the queries they executed."""
+
+    async def snapshot() -> tuple[float, float]:
+        queries = metric_total(
+            await client.scrape("/metrics", token=metrics_token),
+            "http_request_db_queries_sum",
+            ["/metrics"],
+        )
+        events = 0.0
+        if consumer_metrics_url:
+            events = metric_total(
+                await client.scrape(consumer_metrics_url), "event_handler_duration_seconds_count"
+            )
+        return queries, events
+
+    client.recorder = Recorder()
+    queries_before, events_before = await snapshot()
+    start = time.perf_counter()
+    await scenario(client)
+    duration = time.perf_counter() - start
+    queries_after, events_after = await snapshot()
+
+    latencies = client.recorder.latencies
+    requests = len(latencies)
+    db_queries = queries_after - queries_before
+    return ScenarioResult(
+        name=name,
+        requests=requests,
+        errors=client.recorder.errors,
+        duration_seconds=round(duration, 3),
+        throughput=round(requests / duration, 1) if duration else 0.0,
+        p50_ms=round(percentile(latencies, 50) * 1000, 1),
+        p95_ms=round(percentile(latencies, 95) * 1000, 1),
+        p99_ms=round(percentile(latencies, 99) * 1000, 1),
+        db_queries=db_queries,
+        db_queries_per_request=round(db_queries / requests, 2) if requests else 0.0,
+        events_handled=events_after - events_before,
+    )
+
+
+def compare(
+    results: list[ScenarioResult], baseline: dict[str, dict[str, Any]], tolerance: float
+) -> list[str]:
+    """
+    List the regressions of the results against a baseline.
+
+    A scenario regresses if its p95 latency grew by more than the tolerance, if it executed
+    more queries per request than the baseline, or if any of its requests failed.
+    """
+    regressions = []
+    for result in results:
+        if result.errors:
+            regressions.append(f"{result.name}: {result.errors} requests failed")
+        previous = baseline.get(result.name)
+        if previous is None:
+            continue
+        if result.p95_ms > previous["p95_ms"] * (1 + tolerance):
+            regressions.append(
+                f"{result.name}: p95 {result.p95_ms}ms, baseline {previous['p95_ms']}ms"
+            )
+        if result.db_queries_per_request > previous["db_queries_per_request"]:
+            regressions.append(
+                f"{result.name}: {result.db_queries_per_request} queries per request, "
+                f"baseline {previous['db_queries_per_request']}"
+            )
+    return regressions
+
+
+def print_report(results: list[ScenarioResult]) -> None:
+    columns = (
+        f"{'scenario':<26} {'requests':>8} {'errors':>6} {'req/s':>8} {'p50 ms':>8} "
+        f"{'p95 ms':>8} {'p99 ms':>8} {'queries/req':>11} {'events':>7}"
+    )
+    print(columns)
+    for result in results:
+        print(
+            f"{result.name:<26} {result.requests:>8} {result.errors:>6} {result.throughput:>8} "
+            f"{result.p50_ms:>8} {result.p95_ms:>8} {result.p99_ms:>8} "
+            f"{result.db_queries_per_request:>11} {result.events_handled:>7.0f}"
+        )
+
+
+def results_to_json(results: list[ScenarioResult]) -> dict[str, dict[str, Any]]:
+    return {result.name: asdict(result) for result in results}
+
+
+class ServiceProcess:
+    """A labour service process, run from the project root with settings overridden by env."""
+
+    def __init__(self, name: str, args: list[str], env: dict[str, str]) -> None:
+        self._name = name
+        self._args = args
+        self._env = env
+        self._process: subprocess.Popen[bytes] | None = None
+
+    def start(self) -> None:
+        self._process = subprocess.Popen(
+            [sys.executable, *self._args],
+            cwd=PROJECT_ROOT,
+            env={**os.environ, "PYTHONPATH": str(PROJECT_ROOT), **self._env},
+        )
+
+    def stop(self) -> None:
+        if self._process is None:
+            return
+        self._process.terminate()
+        try:
+            self._process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self._process.kill()
+        self._process = None
+
+    async def wait_until_healthy(self, url: str, timeout: float = 60.0) -> None:
+        deadline = time.monotonic() + timeout
+        async with httpx.AsyncClient() as client:
+            while time.monotonic() < deadline:
+                if self._process is not None and self._process.poll() is not None:
+                    raise RuntimeError(f"{self._name} exited with {self._process.returncode}")
+                try:
+                    if (await client.get(url)).is_success:
+                        return
+                except httpx.TransportError:
+                    pass
+                await asyncio.sleep(0.5)
+        raise TimeoutError(f"{self._name} was not healthy at {url} after {timeout}s")
+
+
+def run_migrations(env: dict[str, str]) -> None:
+    subprocess.run(
+        [sys.executable, "-m", "alembic", "upgrade", "head"],
+        cwd=PROJECT_ROOT,
+        env={**os.environ, "PYTHONPATH": str(PROJECT_ROOT), **env},
+        check=True,
+    )
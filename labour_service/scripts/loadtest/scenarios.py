@@ -0,0 +1,169 @@
+import asyncio
+import uuid
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+
+from scripts.loadtest.fake_keycloak import FakeKeycloak
+from scripts.loadtest.runner import LoadTestClient
+
+CONTRACTIONS = 500
+SUPPORTERS = 50
+ANNOUNCEMENT_LABOURS = 10
+POLLING_ROUNDS = 20
+
+
+@dataclass
+class LabourFixture:
+    labour_id: str
+    owner_token: str
+    supporter_tokens: list[str] = field(default_factory=list)
+
+
+class Scenarios:
+    """
+    Realistic workloads against the labour service.
+
+    Each scenario builds the data it needs without recording those requests, then records
+    only the requests under test.
+    """
+
+    def __init__(self, keycloak: FakeKeycloak) -> None:
+        self._keycloak = keycloak
+
+    def all(self) -> dict[str, Callable[[LoadTestClient], Awaitable[None]]]:
+        return {
+            "contraction_import": self.contraction_import,
+            "labour_with_contractions": self.labour_with_contractions,
+            "supporters_subscribe": self.supporters_subscribe,
+            "announcement_fan_out": self.announcement_fan_out,
+            "subscriber_polling": self.subscriber_polling,
+        }
+
+    def _new_user(self, role: str) -> str:
+        user_id = str(uuid.uuid4())
+        return self._keycloak.add_user(user_id=user_id, username=f"{role}-{user_id[:8]}")
+
+    async def _begin_labour(self, client: LoadTestClient, record: bool = False) -> LabourFixture:
+        owner_token = self._new_user("birthing-person")
+        due_date = (datetime.now(UTC) + timedelta(days=7)).isoformat()
+        response = await client.request(
+            "POST",
+            "/api/v1/labour/plan",
+            owner_token,
+            json={"first_labour": True, "due_date": due_date},
+            record=record,
+        )
+        labour_id = response.json()["labour"]["id"]
+        await client.request("POST", "/api/v1/labour/begin", owner_token, record=record)
+        return LabourFixture(labour_id=labour_id, owner_token=owner_token)
+
+    async def _import_contractions(
+        self, client: LoadTestClient, labour: LabourFixture, record: bool = False
+    ) -> None:
+        start = datetime.now(UTC) - timedelta(minutes=5 * CONTRACTIONS)
+        contractions = [
+            {
+                "contraction_id": str(uuid.uuid4()),
+                "start_time": (start + timedelta(minutes=5 * i)).isoformat(),
+                "end_time": (start + timedelta(minutes=5 * i, seconds=60)).isoformat(),
+                "intensity": 5,
+            }
+            for i in range(CONTRACTIONS)
+        ]
+        await client.request(
+            "POST",
+            "/api/v1/labour/contraction/import",
+            labour.owner_token,
+            json={"contractions": contractions},
+            record=record,
+        )
+
+    async def _add_supporters(
+        self, client: LoadTestClient, labour: LabourFixture, record: bool = False
+    ) -> None:
+        response = await client.request(
+            "GET", "/api/v1/labour/subscription-token", labour.owner_token, record=record
+        )
+        token = response.json()["token"]
+
+        async def subscribe_and_approve() -> str:
+            supporter_token = self._new_user("supporter")
+            response = await client.request(
+                "POST",
+                f"/api/v1/subscription/subscribe/{labour.labour_id}",
+                supporter_token,
+                json={"token": token},
+                record=record,
+            )
+            await client.request(
+                "PUT",
+                "/api/v1/subscription-management/approve-subscriber",
+                labour.owner_token,
+                json={"subscription_id": response.json()["subscription"]["id"]},
+                record=record,
+            )
+            return supporter_token
+
+        labour.supporter_tokens = await asyncio.gather(
+            *(subscribe_and_approve() for _ in range(SUPPORTERS))
+        )
+
+    async def contraction_import(self, client: LoadTestClient) -> None:
+        """Import 500 contractions into each of ten new labours."""
+        labours = await asyncio.gather(*(self._begin_labour(client) for _ in range(10)))
+        await asyncio.gather(
+            *(self._import_contractions(client, labour, record=True) for labour in labours)
+        )
+
+    async def labour_with_contractions(self, client: LoadTestClient) -> None:
+        """The birthing person repeatedly loads a labour with 500 contractions."""
+        labour = await self._begin_labour(client)
+        await self._import_contractions(client, labour)
+        await asyncio.gather(
+            *(
+                client.request("GET", path, labour.owner_token)
+                for _ in range(POLLING_ROUNDS)
+                for path in ("/api/v1/labour/active", "/api/v1/labour/active/summary")
+            )
+        )
+
+    async def supporters_subscribe(self, client: LoadTestClient) -> None:
+        """Fifty supporters subscribe to a labour and the birthing person approves each."""
+        labour = await self._begin_labour(client)
+        await self._add_supporters(client, labour, record=True)
+
+    async def announcement_fan_out(self, client: LoadTestClient) -> None:
+        """Ten labours with fifty supporters each post an announcement at the same time."""
+        labours = await asyncio.gather(
+            *(self._begin_labour(client) for _ in range(ANNOUNCEMENT_LABOURS))
+        )
+        await asyncio.gather(*(self._add_supporters(client, labour) for labour in labours))
+        await asyncio.gather(
+            *(
+                client.request(
+                    "POST",
+                    "/api/v1/labour/labour-update/",
+                    labour.owner_token,
+                    json={"labour_update_type": "announcement", "message": "Baby is here!"},
+                )
+                for labour in labours
+            )
+        )
+
+    async def subscriber_polling(self, client: LoadTestClient) -> None:
+        """Fifty supporters poll a labour with 500 contractions and their subscriptions."""
+        labour = await self._begin_labour(client)
+        await self._import_contractions(client, labour)
+        await self._add_supporters(client, labour)
+        await asyncio.gather(
+            *(
+                client.request("GET", path, supporter_token)
+                for _ in range(POLLING_ROUNDS)
+                for supporter_token in labour.supporter_tokens
+                for path in (
+                    f"/api/v1/labour/get/{labour.labour_id}",
+                    "/api/v1/subscription/subscriber_subscriptions",
+                )
+            )
+        )
@@ -17,11 +17,13 @@ from src.labour.application.exceptions import (
 )
 from src.labour.domain.contraction.exceptions import (
     CannotDeleteActiveContraction,
+    CannotImportActiveContraction,
     CannotUpdateActiveContraction,
     ContractionIdInvalid,
     ContractionNotFoundById,
     ContractionsOverlappingAfterUpdate,
     ContractionStartTimeAfterEndTime,
+    ImportedContractionsOverlapping,
 )
 from src.labour.domain.labour.exceptions import (
     CannotCompleteLabourWithActiveContraction,
@@ -114,6 +116,8 @@ class ExceptionHandler:
             CannotDeleteActiveLabour: status.HTTP_400_BAD_REQUEST,
             LabourNotFoundById: status.HTTP_404_NOT_FOUND,
             CannotDeleteActiveContraction: status.HTTP_400_BAD_REQUEST,
+            CannotImportActiveContraction: status.HTTP_400_BAD_REQUEST,
+            ImportedContractionsOverlapping: status.HTTP_400_BAD_REQUEST,
             StripeProductNotFound: status.HTTP_404_NOT_FOUND,
             LabourInviteRateLimitExceeded: status.HTTP_429_TOO_MANY_REQUESTS,
             SubscriberInviteRateLimitExceeded: status.HTTP_429_TOO_MANY_REQUESTS,
@@ -0,0 +1,167 @@
+import hashlib
+import logging
+
+from fastapi import status
+from fastapi.responses import ORJSONResponse
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.api.exception_handler import ExceptionSchema
+from src.core.infrastructure.idempotency_keys.interface import CachedResponse, IdempotencyKeyStore
+
+log = logging.getLogger(__name__)
+
+IDEMPOTENCY_KEY_HEADER = "idempotency-key"
+IDEMPOTENT_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+MAX_IDEMPOTENCY_KEY_LENGTH = 255
+
+# Client errors that may not recur when the request is retried, such as a lifted rate limit
+TRANSIENT_STATUS_CODES = frozenset(
+    {
+        status.HTTP_408_REQUEST_TIMEOUT,
+        status.HTTP_409_CONFLICT,
+        status.HTTP_425_TOO_EARLY,
+        status.HTTP_429_TOO_MANY_REQUESTS,
+    }
+)
+
+
+class IdempotencyMiddleware:
+    """
+    Replays the stored response for write requests retried with the same Idempotency-Key.
+
+    Keys are scoped to the caller's credentials, method and path, so the same key cannot be
+    used to read another user's response. Successful responses and client errors that would
+    recur on retry are stored; server errors and transient client errors, such as rate limits,
+    release the key so that the client can retry. A key reused with a different request body
+    is rejected rather than replaying the response to the original request.
+    """
+
+    def __init__(
+        self, app: ASGIApp, store: IdempotencyKeyStore, path_prefixes: tuple[str, ...]
+    ) -> None:
+        self._app = app
+        self._store = store
+        self._path_prefixes = path_prefixes
+
+    def _get_store_key(self, scope: Scope, headers: Headers, idempotency_key: str) -> str:
+        digest = hashlib.sha256()
+        for part in (
+            headers.get("authorization", ""),
+            scope["method"],
+            scope["path"],
+            idempotency_key,
+        ):
+            digest.update(part.encode())
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] not in IDEMPOTENT_METHODS
+            or not scope["path"].startswith(self._path_prefixes)
+        ):
+            return await self._app(scope, receive, send)
+
+        headers = Headers(scope=scope)
+        idempotency_key = headers.get(IDEMPOTENCY_KEY_HEADER)
+        if not idempotency_key:
+            return await self._app(scope, receive, send)
+
+        if len(idempotency_key) > MAX_IDEMPOTENCY_KEY_LENGTH:
+            response = ORJSONResponse(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                content=ExceptionSchema("Idempotency-Key is too long."),
+            )
+            return await response(scope, receive, send)
+
+        store_key = self._get_store_key(scope, headers, idempotency_key)
+        body = await self._read_body(receive)
+        request_hash = hashlib.sha256(body).hexdigest()
+
+        if cached := self._store.get(store_key):
+            if cached.request_hash != request_hash:
+                response = ORJSONResponse(
+                    status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                    content=ExceptionSchema(
+                        "Idempotency-Key was already used for a different request."
+                    ),
+                )
+                return await response(scope, receive, send)
+            log.debug("Replaying stored response for idempotency key")
+            return await self._replay(cached, send)
+
+        if not self._store.try_claim(store_key):
+            response = ORJSONResponse(
+                status_code=status.HTTP_409_CONFLICT,
+                content=ExceptionSchema(
+                    "A request with this Idempotency-Key is already in progress."
+                ),
+            )
+            return await response(scope, receive, send)
+
+        status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+        response_headers: list[tuple[bytes, bytes]] = []
+        body_parts: list[bytes] = []
+        body_received = False
+
+        async def receive_wrapper() -> Message:
+            nonlocal body_received
+            if body_received:
+                return await receive()
+            body_received = True
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, response_headers
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                response_headers = list(message.get("headers", []))
+            elif message["type"] == "http.response.body":
+                body_parts.append(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self._app(scope, receive_wrapper, send_wrapper)
+        except BaseException:
+            self._store.release(store_key)
+            raise
+
+        if (
+            status_code >= status.HTTP_500_INTERNAL_SERVER_ERROR
+            or status_code in TRANSIENT_STATUS_CODES
+        ):
+            self._store.release(store_key)
+            return
+
+        self._store.complete(
+            store_key,
+            CachedResponse(
+                request_hash=request_hash,
+                status_code=status_code,
+                headers=response_headers,
+                body=b"".join(body_parts),
+            ),
+        )
+
+    async def _read_body(self, receive: Receive) -> bytes:
+        body_parts: list[bytes] = []
+        while True:
+            message = await receive()
+            if message["type"] != "http.request":
+                break
+            body_parts.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                break
+        return b"".join(body_parts)
+
+    async def _replay(self, cached: CachedResponse, send: Send) -> None:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": cached.status_code,
+                "headers": [*cached.headers, (b"idempotent-replayed", b"true")],
+            }
+        )
+        await send({"type": "http.response.body", "body": cached.body})
@@ -0,0 +1,50 @@
+import time
+
+from fastapi import status
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.infrastructure.metrics.database import track_queries
+from src.core.infrastructure.metrics.instruments import (
+    HTTP_REQUEST_DB_DURATION,
+    HTTP_REQUEST_DB_QUERIES,
+    HTTP_REQUEST_DURATION,
+)
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class MetricsMiddleware:
+    """
+    Records the latency and database usage of every HTTP request.
+
+    Requests are labelled with the path template of the route that handled them rather than
+    the raw path, so that path parameters such as labour ids do not create new series.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self._app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            return await self._app(scope, receive, send)
+
+        status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        with track_queries() as queries:
+            try:
+                await self._app(scope, receive, send_wrapper)
+            finally:
+                method = scope["method"]
+                route = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+                HTTP_REQUEST_DURATION.observe(
+                    time.perf_counter() - started, method, route, str(status_code)
+                )
+                HTTP_REQUEST_DB_QUERIES.observe(queries.count, method, route)
+                HTTP_REQUEST_DB_DURATION.observe(queries.duration, method, route)
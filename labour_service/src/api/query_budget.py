@@ -0,0 +1,44 @@
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.api.metrics import UNMATCHED_ROUTE
+from src.core.infrastructure.metrics.database import track_queries
+from src.core.infrastructure.metrics.query_budget import QueryBudget
+
+QUERY_COUNT_HEADER = "X-DB-Query-Count"
+QUERY_TIME_HEADER = "X-DB-Query-Time-Ms"
+
+
+class QueryBudgetMiddleware:
+    """
+    Checks the queries executed by every HTTP request against a budget.
+
+    When `expose_headers` is set, the number of queries and the time spent executing them are
+    added to the response headers. They are counted when the response starts, so queries
+    executed while streaming the body or in background tasks are only checked against the
+    budget.
+    """
+
+    def __init__(self, app: ASGIApp, budget: QueryBudget, expose_headers: bool) -> None:
+        self._app = app
+        self._budget = budget
+        self._expose_headers = expose_headers
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            return await self._app(scope, receive, send)
+
+        with track_queries() as queries:
+
+            async def send_wrapper(message: Message) -> None:
+                if self._expose_headers and message["type"] == "http.response.start":
+                    headers = MutableHeaders(scope=message)
+                    headers.append(QUERY_COUNT_HEADER, str(queries.count))
+                    headers.append(QUERY_TIME_HEADER, f"{queries.duration * 1000:.1f}")
+                await send(message)
+
+            try:
+                await self._app(scope, receive, send_wrapper)
+            finally:
+                route = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+                self._budget.check(queries, "request", f"{scope['method']} {route}")
@@ -0,0 +1,55 @@
+import hashlib
+import logging
+
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.core.infrastructure.persistence.read_replica import allow_replica_reads
+from src.core.infrastructure.recent_writes.interface import RecentWriteTracker
+
+log = logging.getLogger(__name__)
+
+READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class ReadYourWritesMiddleware:
+    """
+    Serves reads from the replica unless the caller has written recently.
+
+    Callers are identified by their credentials. A write marks the caller when it starts and
+    again when it finishes, so that their reads stay on the primary until the replica has had
+    time to catch up. Anonymous requests always read from the primary.
+    """
+
+    def __init__(self, app: ASGIApp, tracker: RecentWriteTracker) -> None:
+        self._app = app
+        self._tracker = tracker
+
+    def _get_caller_key(self, headers: Headers) -> str | None:
+        authorization = headers.get("authorization")
+        if not authorization:
+            return None
+        return hashlib.sha256(authorization.encode()).hexdigest()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            return await self._app(scope, receive, send)
+
+        caller_key = self._get_caller_key(Headers(scope=scope))
+        if caller_key is None:
+            return await self._app(scope, receive, send)
+
+        if scope["method"] not in READ_METHODS:
+            self._tracker.record_write(caller_key)
+            try:
+                await self._app(scope, receive, send)
+            finally:
+                self._tracker.record_write(caller_key)
+            return
+
+        if self._tracker.has_recent_write(caller_key):
+            log.debug("Caller wrote recently, reading from the primary")
+            return await self._app(scope, receive, send)
+
+        with allow_replica_reads():
+            await self._app(scope, receive, send)
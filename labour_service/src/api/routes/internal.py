@@ -0,0 +1,73 @@
+import secrets
+from datetime import datetime
+from typing import Annotated
+
+from dishka import FromComponent
+from dishka.integrations.fastapi import inject
+from fastapi import APIRouter, Depends, status
+from fastapi.security import HTTPAuthorizationCredentials
+from pydantic import BaseModel, Field
+
+from src.api.dependencies import bearer_scheme
+from src.api.exception_handler import ExceptionSchema
+from src.core.infrastructure.sentry.profiling import ProfilingSession
+from src.setup.settings import Settings
+from src.user.infrastructure.auth.interfaces.exceptions import AuthorizationError
+
+internal_router = APIRouter(prefix="/internal")
+
+
+class StartProfilingRequest(BaseModel):
+    duration_seconds: int = Field(default=60, gt=0)
+
+
+class ProfilingResponse(BaseModel):
+    active: bool
+    ends_at: datetime | None
+
+
+def _verify_profiling_token(settings: Settings, credentials: HTTPAuthorizationCredentials) -> None:
+    expected = settings.observability.sentry.profiling_token
+    if not expected or not secrets.compare_digest(credentials.credentials, expected):
+        raise AuthorizationError("Invalid profiling token.")
+
+
+@internal_router.post(
+    "/profiling",
+    tags=["Internal"],
+    responses={
+        status.HTTP_200_OK: {"model": ProfilingResponse},
+        status.HTTP_401_UNAUTHORIZED: {"model": ExceptionSchema},
+    },
+    status_code=status.HTTP_200_OK,
+)
+@inject
+async def start_profiling(
+    request_data: StartProfilingRequest,
+    profiling_session: Annotated[ProfilingSession, FromComponent()],
+    settings: Annotated[Settings, FromComponent()],
+    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+) -> ProfilingResponse:
+    _verify_profiling_token(settings=settings, credentials=credentials)
+    ends_at = profiling_session.start(duration=request_data.duration_seconds)
+    return ProfilingResponse(active=True, ends_at=ends_at)
+
+
+@internal_router.delete(
+    "/profiling",
+    tags=["Internal"],
+    responses={
+        status.HTTP_200_OK: {"model": ProfilingResponse},
+        status.HTTP_401_UNAUTHORIZED: {"model": ExceptionSchema},
+    },
+    status_code=status.HTTP_200_OK,
+)
+@inject
+async def stop_profiling(
+    profiling_session: Annotated[ProfilingSession, FromComponent()],
+    settings: Annotated[Settings, FromComponent()],
+    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+) -> ProfilingResponse:
+    _verify_profiling_token(settings=settings, credentials=credentials)
+    profiling_session.stop()
+    return ProfilingResponse(active=False, ends_at=None)
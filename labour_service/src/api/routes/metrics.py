@@ -0,0 +1,45 @@
+import secrets
+from datetime import UTC, datetime
+from typing import Annotated
+
+from dishka import FromComponent
+from dishka.integrations.fastapi import inject
+from fastapi import APIRouter, Depends, status
+from fastapi.responses import PlainTextResponse
+from fastapi.security import HTTPAuthorizationCredentials
+
+from src.api.dependencies import bearer_scheme
+from src.api.exception_handler import ExceptionSchema
+from src.core.domain.domain_event.repository import DomainEventRepository
+from src.core.infrastructure.metrics.instruments import OUTBOX_LAG, REGISTRY
+from src.setup.settings import Settings
+from src.user.infrastructure.auth.interfaces.exceptions import AuthorizationError
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+metrics_router = APIRouter()
+
+
+def _verify_scrape_token(settings: Settings, credentials: HTTPAuthorizationCredentials) -> None:
+    expected = settings.observability.metrics.scrape_token
+    if not expected or not secrets.compare_digest(credentials.credentials, expected):
+        raise AuthorizationError("Invalid metrics scrape token.")
+
+
+@metrics_router.get(
+    "/metrics",
+    tags=["Internal"],
+    response_class=PlainTextResponse,
+    responses={status.HTTP_401_UNAUTHORIZED: {"model": ExceptionSchema}},
+)
+@inject
+async def metrics(
+    domain_event_repository: Annotated[DomainEventRepository, FromComponent()],
+    settings: Annotated[Settings, FromComponent()],
+    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+) -> PlainTextResponse:
+    _verify_scrape_token(settings=settings, credentials=credentials)
+    oldest_unpublished = await domain_event_repository.get_oldest_unpublished_time()
+    lag = (datetime.now(UTC) - oldest_unpublished).total_seconds() if oldest_unpublished else 0.0
+    OUTBOX_LAG.set(lag)
+    return PlainTextResponse(REGISTRY.render(), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -7,6 +7,8 @@ from fastapi.openapi.docs import get_redoc_html, get_swagger_ui_html
 from fastapi.openapi.utils import get_openapi
 from fastapi.responses import HTMLResponse, RedirectResponse
 
+from src.api.routes.internal import internal_router
+from src.api.routes.metrics import metrics_router
 from src.api.routes.router_api_v1 import api_v1_router
 from src.setup.settings import Settings
 
@@ -42,7 +44,7 @@ async def redoc(settings: Annotated[Settings, FromComponent()]) -> HTMLResponse:
     return HTMLResponse(content="Forbidden", status_code=403)
 
 
-root_sub_routers = (api_v1_router,)
+root_sub_routers = (api_v1_router, internal_router, metrics_router)
 
 for router in root_sub_routers:
     root_router.include_router(router)
@@ -6,10 +6,12 @@ from dishka import AsyncContainer
 
 from src.core.application.domain_event_publisher import DomainEventPublisher
 from src.core.infrastructure.persistence.initialize_mapping import map_all
+from src.labour.infrastructure.persistence.labour_archiver import LabourArchiver
 from src.setup.app_factory import create_dishka_container
 from src.setup.ioc.di_component_enum import ComponentEnum
 from src.setup.logs import configure_logging
 from src.setup.settings import Settings
+from src.user.infrastructure.persistence.user_projection_sync import KeycloakUserProjectionSync
 
 configure_logging()
 log = logging.getLogger(__name__)
@@ -39,6 +41,36 @@ async def publish_domain_events() -> None:
     log.info("CLI command finished.")
 
 
+async def sync_users() -> None:
+    """Copies all users from Keycloak into the local users projection."""
+    log.info("Starting user sync CLI command.")
+    container_manager = await _setup_container()
+
+    async with container_manager() as request_container:
+        user_projection_sync = await request_container.get(
+            KeycloakUserProjectionSync, component=ComponentEnum.USER
+        )
+        await user_projection_sync.sync()
+
+    await container_manager.close()
+    log.info("CLI command finished.")
+
+
+async def archive_labours() -> None:
+    """Moves long completed labours out of the hot tables into compressed snapshots."""
+    log.info("Starting labour archive CLI command.")
+    container_manager = await _setup_container()
+
+    async with container_manager() as request_container:
+        labour_archiver = await request_container.get(
+            LabourArchiver, component=ComponentEnum.LABOUR
+        )
+        await labour_archiver.archive_completed_labours()
+
+    await container_manager.close()
+    log.info("CLI command finished.")
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Fern Labour Labour Service CLI")
     subparsers = parser.add_subparsers(dest="command", help="Available commands", required=True)
@@ -48,6 +80,17 @@ def main() -> None:
     )
     publish_domain_events_parser.set_defaults(func=publish_domain_events)
 
+    sync_users_parser = subparsers.add_parser(
+        "sync-users", help="Copies all users from Keycloak into the local users projection"
+    )
+    sync_users_parser.set_defaults(func=sync_users)
+
+    archive_labours_parser = subparsers.add_parser(
+        "archive-labours",
+        help="Moves long completed labours out of the hot tables into compressed snapshots",
+    )
+    archive_labours_parser.set_defaults(func=archive_labours)
+
     args = parser.parse_args()
 
     async_func_kwargs = {k: v for k, v in vars(args).items() if k not in ["command", "func"]}
@@ -32,16 +32,16 @@ class DomainEventPublisher:
         async with self._unit_of_work:
             domain_events = await self._domain_event_repository.get_unpublished()
             if not domain_events:
-                log.info("No domain events to publish.")
+                log.debug("No domain events to publish.")
                 return
 
             result = await self._event_producer.publish_batch(events=domain_events)
 
-            log.info(f"{len(result.success_ids)} domain events successfully published.")
+            log.info("%d domain events successfully published.", len(result.success_ids))
 
             await self._domain_event_repository.mark_many_as_published(
                 domain_event_ids=result.success_ids
             )
 
         if result.failure_ids:
-            log.warning(f"{len(result.failure_ids)} domain events failed to publish.")
+            log.warning("%d domain events failed to publish.", len(result.failure_ids))
@@ -8,6 +8,9 @@ class TaskManager(Protocol):
     def set_max_concurrent(self, task_name_pattern: str, max_concurrent: int) -> None:
         """Set maximum concurrent tasks for a specific task name pattern."""
 
+    def set_coalescing(self, task_name_pattern: str, debounce_seconds: float = 0.0) -> None:
+        """Run at most one task for a specific task name pattern, plus one pending."""
+
     def create_task(self, coro: Coroutine[Any, Any, Any], name: str = "Task") -> None:
         """Create and manage a task."""
 
@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Protocol
 
 from fern_labour_core.events.event import DomainEvent
@@ -32,6 +33,14 @@ class DomainEventRepository(Protocol):
         Get a list of unpublished domain events.
         """
 
+    async def get_oldest_unpublished_time(self) -> datetime | None:
+        """
+        Get the time of the oldest unpublished domain event.
+
+        Returns:
+            The creation time of the oldest unpublished domain event, else returns None
+        """
+
     async def mark_as_published(self, domain_event_id: str) -> None:
         """
         Mark a domain event as published.
@@ -13,10 +13,13 @@ class AsyncioTaskManager(TaskManager):
     """Manages the lifecycle of asyncio tasks."""
 
     def __init__(self) -> None:
-        self._tasks: set[asyncio.Task[Coroutine[Any, Any, Any]]] = set()
+        self._tasks: set[asyncio.Task[Any]] = set()
         self._semaphores: dict[str, asyncio.Semaphore] = {}
         self._running_counts: dict[str, int] = defaultdict(int)
         self._max_concurrent: dict[str, int] = {}
+        self._debounce_seconds: dict[str, float] = {}
+        self._pending: dict[str, Coroutine[Any, Any, Any]] = {}
+        self._coalescing_runners: set[str] = set()
 
     def set_max_concurrent(self, task_name_pattern: str, max_concurrent: int) -> None:
         """Set maximum concurrent tasks for a specific task name pattern."""
@@ -28,16 +31,31 @@ class AsyncioTaskManager(TaskManager):
         self._max_concurrent[task_name] = max_concurrent
         self._semaphores[task_name] = asyncio.Semaphore(max_concurrent)
 
+    def set_coalescing(self, task_name_pattern: str, debounce_seconds: float = 0.0) -> None:
+        """
+        Coalesce tasks for a specific task name pattern.
+
+        At most one task with the name runs at a time and at most one more is kept pending.
+        A task created while another is pending replaces it, and each run waits out the
+        debounce window first, so a burst of triggers results in a single run.
+        """
+        task_name = self._get_task_name(name=task_name_pattern)
+        self._debounce_seconds[task_name] = debounce_seconds
+
     def create_task(self, coro: Coroutine[Any, Any, Any], name: str = "Task") -> None:
         """Create and manage a task with optional concurrency control."""
         task_name = self._get_task_name(name=name)
 
+        if task_name in self._debounce_seconds:
+            self._create_coalesced_task(coro, name=name, task_name=task_name)
+            return
+
         if task_name in self._semaphores:
             current_running = self._running_counts[task_name]
             max_allowed = self._max_concurrent[task_name]
 
             if current_running >= max_allowed:
-                log.info(f"Skipping task '{name}' - concurrency limit reached")
+                log.info("Skipping task '%s' - concurrency limit reached", name)
                 coro.close()
                 return
 
@@ -50,6 +68,38 @@ class AsyncioTaskManager(TaskManager):
         task.add_done_callback(self._tasks.discard)
         self._tasks.add(task)
 
+    def _create_coalesced_task(
+        self, coro: Coroutine[Any, Any, Any], name: str, task_name: str
+    ) -> None:
+        """Replace the pending run for the task name, starting a runner if none is active."""
+        if replaced := self._pending.get(task_name):
+            log.debug("Coalescing task '%s' into pending run", name)
+            replaced.close()
+        self._pending[task_name] = coro
+
+        if task_name in self._coalescing_runners:
+            return
+
+        self._coalescing_runners.add(task_name)
+        task = asyncio.create_task(self._run_coalesced(task_name), name=name)
+        task.add_done_callback(self._tasks.discard)
+        self._tasks.add(task)
+
+    async def _run_coalesced(self, task_name: str) -> None:
+        """Run pending tasks for the task name one at a time until none are left."""
+        try:
+            while task_name in self._pending:
+                await asyncio.sleep(self._debounce_seconds[task_name])
+                coro = self._pending.pop(task_name)
+                try:
+                    await coro
+                except Exception as e:
+                    log.error("Coalesced task '%s' failed: %s", task_name, e)
+        finally:
+            self._coalescing_runners.discard(task_name)
+            if pending := self._pending.pop(task_name, None):
+                pending.close()
+
     def _get_task_name(self, name: str) -> str:
         """Get task name from provided name."""
         return name.split(":")[0]
@@ -0,0 +1,147 @@
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import Counter, deque
+from contextlib import suppress
+
+from src.core.infrastructure.metrics.instruments import EVENT_LOOP_BLOCKED, EVENT_LOOP_LAG
+
+log = logging.getLogger(__name__)
+
+APP_PACKAGE_MARKER = "/src/"
+PERCENTILES = (50, 95, 99)
+
+
+def _location(stack: traceback.StackSummary) -> str:
+    """Name the innermost application frame of a stack, or its innermost frame if none."""
+    for frame in reversed(stack):
+        if APP_PACKAGE_MARKER in frame.filename and __file__ != frame.filename:
+            module = frame.filename.rsplit(APP_PACKAGE_MARKER, 1)[1]
+            return f"src/{module}:{frame.name}"
+    if not stack:
+        return "<unknown>"
+    frame = stack[-1]
+    return f"{frame.filename.rsplit('/', 1)[-1]}:{frame.name}"
+
+
+class LoopLagMonitor:
+    """
+    Measures event loop lag and reports the code holding the loop when it stalls.
+
+    A task on the loop sleeps for a fixed interval and records how late it wakes up. A
+    watchdog thread checks that the task keeps waking up, and if the loop is held beyond the
+    blocking threshold it captures the stack of the loop thread, which at that point is the
+    stack of the blocking call. Each stall is reported once, however long it lasts.
+    """
+
+    def __init__(
+        self,
+        interval: float = 0.1,
+        blocking_threshold: float = 0.1,
+        report_interval: float = 60.0,
+        window: int = 1000,
+    ) -> None:
+        self._interval = interval
+        self._blocking_threshold = blocking_threshold
+        self._report_interval = report_interval
+        self._lags: deque[float] = deque(maxlen=window)
+        self._offenders: Counter[str] = Counter()
+        self._heartbeat = time.monotonic()
+        self._stall_reported = False
+        self._loop_thread_id: int | None = None
+        self._stopped = threading.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._watchdog: threading.Thread | None = None
+
+    @property
+    def offenders(self) -> Counter[str]:
+        return self._offenders
+
+    def percentiles(self) -> dict[str, float]:
+        """The lag percentiles over the most recent measurements, in seconds."""
+        lags = sorted(self._lags)
+        if not lags:
+            return {}
+        result = {f"p{q}": lags[min(len(lags) * q // 100, len(lags) - 1)] for q in PERCENTILES}
+        result["max"] = lags[-1]
+        return result
+
+    async def start(self) -> None:
+        """Start monitoring the running event loop."""
+        if self._task is not None:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._stopped.clear()
+        self._task = asyncio.create_task(self._measure(), name="LoopLagMonitor")
+        self._watchdog = threading.Thread(target=self._watch, name="LoopLagWatchdog", daemon=True)
+        self._watchdog.start()
+        log.info(
+            "Monitoring event loop lag, reporting stalls over %.0fms",
+            self._blocking_threshold * 1000,
+        )
+
+    async def stop(self) -> None:
+        """Stop monitoring and log a final report."""
+        if self._task is None:
+            return
+        self._stopped.set()
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+        if self._watchdog is not None:
+            await asyncio.to_thread(self._watchdog.join)
+            self._watchdog = None
+        self._report()
+
+    async def _measure(self) -> None:
+        last_report = time.monotonic()
+        while True:
+            started = time.monotonic()
+            await asyncio.sleep(self._interval)
+            now = time.monotonic()
+            self._heartbeat = now
+            lag = max(now - started - self._interval, 0.0)
+            self._lags.append(lag)
+            EVENT_LOOP_LAG.observe(lag)
+            if now - last_report >= self._report_interval:
+                self._report()
+                last_report = now
+
+    def _watch(self) -> None:
+        while not self._stopped.wait(self._interval / 2):
+            stalled_for = time.monotonic() - self._heartbeat - self._interval
+            if stalled_for < self._blocking_threshold:
+                self._stall_reported = False
+            elif not self._stall_reported:
+                self._stall_reported = True
+                self._record_stall(stalled_for)
+
+    def _record_stall(self, stalled_for: float) -> None:
+        frame = sys._current_frames().get(self._loop_thread_id or 0)
+        if frame is None:
+            return
+        stack = traceback.extract_stack(frame)
+        location = _location(stack)
+        self._offenders[location] += 1
+        EVENT_LOOP_BLOCKED.inc(location)
+        log.warning(
+            "Event loop blocked for at least %.0fms in %s\n%s",
+            stalled_for * 1000,
+            location,
+            "".join(stack.format()),
+        )
+
+    def _report(self) -> None:
+        percentiles = self.percentiles()
+        if not percentiles:
+            return
+        log.info(
+            "Event loop lag %s, top blocking locations: %s",
+            ", ".join(f"{name}={value * 1000:.1f}ms" for name, value in percentiles.items()),
+            self._offenders.most_common(5) or "none",
+        )
@@ -0,0 +1,60 @@
+import logging
+import time
+from collections import OrderedDict
+
+from src.core.infrastructure.idempotency_keys.interface import CachedResponse, IdempotencyKeyStore
+
+log = logging.getLogger(__name__)
+
+
+class InMemoryIdempotencyKeyStore(IdempotencyKeyStore):
+    """
+    Bounded, in-process store of recent idempotency keys.
+
+    Entries are kept in insertion order so that expired and least recently stored keys can be
+    evicted from the front of the dict without scanning the whole store.
+    """
+
+    def __init__(self, expiry_seconds: int, max_entries: int) -> None:
+        self._expiry_seconds = expiry_seconds
+        self._max_entries = max_entries
+        self._responses: OrderedDict[str, tuple[float, CachedResponse]] = OrderedDict()
+        self._in_flight: dict[str, float] = {}
+
+    def _evict(self, now: float) -> None:
+        while self._responses:
+            key, (expiry, _) = next(iter(self._responses.items()))
+            if expiry > now and len(self._responses) <= self._max_entries:
+                break
+            del self._responses[key]
+
+        expired_claims = [key for key, expiry in self._in_flight.items() if expiry <= now]
+        for key in expired_claims:
+            del self._in_flight[key]
+
+    def get(self, key: str) -> CachedResponse | None:
+        entry = self._responses.get(key)
+        if not entry:
+            return None
+        expiry, response = entry
+        if expiry <= time.monotonic():
+            del self._responses[key]
+            return None
+        return response
+
+    def try_claim(self, key: str) -> bool:
+        now = time.monotonic()
+        self._evict(now)
+        if key in self._in_flight:
+            log.debug("Idempotency key '%s' is already in flight", key)
+            return False
+        self._in_flight[key] = now + self._expiry_seconds
+        return True
+
+    def complete(self, key: str, response: CachedResponse) -> None:
+        self._in_flight.pop(key, None)
+        self._responses[key] = (time.monotonic() + self._expiry_seconds, response)
+        self._responses.move_to_end(key)
+
+    def release(self, key: str) -> None:
+        self._in_flight.pop(key, None)
@@ -0,0 +1,28 @@
+from dataclasses import dataclass
+from typing import Protocol
+
+
+@dataclass(frozen=True, slots=True)
+class CachedResponse:
+    """A completed response stored against a client supplied idempotency key."""
+
+    request_hash: str
+    status_code: int
+    headers: list[tuple[bytes, bytes]]
+    body: bytes
+
+
+class IdempotencyKeyStore(Protocol):
+    """Protocol for storing responses to requests made with an Idempotency-Key."""
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Return the stored response for the key, if one exists and has not expired."""
+
+    def try_claim(self, key: str) -> bool:
+        """Claim the key for an in-flight request. Returns False if already claimed."""
+
+    def complete(self, key: str, response: CachedResponse) -> None:
+        """Store the response for a claimed key."""
+
+    def release(self, key: str) -> None:
+        """Release a claimed key without storing a response, allowing the request to retry."""
@@ -0,0 +1,74 @@
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine
+
+from src.core.infrastructure.metrics.instruments import DB_QUERY_DURATION
+
+_QUERY_START_TIMES_KEY = "query_start_times"
+
+
+@dataclass
+class QueryStats:
+    """Database queries executed within a `track_queries` block."""
+
+    count: int = 0
+    duration: float = 0.0
+    statements: Counter[str] = field(default_factory=Counter)
+
+    def repeated_statements(self, threshold: int) -> list[tuple[str, int]]:
+        """Statements executed at least `threshold` times, most frequent first."""
+        return [
+            (statement, count)
+            for statement, count in self.statements.most_common()
+            if count >= threshold
+        ]
+
+
+_active_query_stats: ContextVar[tuple[QueryStats, ...]] = ContextVar(
+    "active_query_stats", default=()
+)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """
+    Collect the queries executed by instrumented engines within the block.
+
+    Blocks can be nested, each one collects every query executed within it.
+    """
+    stats = QueryStats()
+    token = _active_query_stats.set((*_active_query_stats.get(), stats))
+    try:
+        yield stats
+    finally:
+        _active_query_stats.reset(token)
+
+
+def instrument_engine(engine: Engine, name: str) -> None:
+    """
+    Record the duration of every query executed by the engine.
+
+    Async engines are instrumented through their `sync_engine`. SQLAlchemy runs it in a greenlet
+    that shares the calling task's context, so queries are attributed to the right request.
+    """
+
+    def before_cursor_execute(conn: Connection, *_: Any) -> None:
+        conn.info.setdefault(_QUERY_START_TIMES_KEY, []).append(time.perf_counter())
+
+    def after_cursor_execute(conn: Connection, _cursor: Any, statement: str, *_: Any) -> None:
+        duration = time.perf_counter() - conn.info[_QUERY_START_TIMES_KEY].pop()
+        DB_QUERY_DURATION.observe(duration, name)
+        for stats in _active_query_stats.get():
+            stats.count += 1
+            stats.duration += duration
+            stats.statements[statement] += 1
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", after_cursor_execute)
@@ -0,0 +1,51 @@
+import functools
+import time
+from typing import Any
+
+from fern_labour_core.events.event_handler import EventHandler
+
+from src.core.infrastructure.metrics.database import track_queries
+from src.core.infrastructure.metrics.instruments import (
+    EVENT_HANDLER_DB_DURATION,
+    EVENT_HANDLER_DB_QUERIES,
+    EVENT_HANDLER_DURATION,
+    EVENT_HANDLER_FAILURES,
+)
+from src.core.infrastructure.metrics.query_budget import QueryBudget
+
+_INSTRUMENTED_ATTRIBUTE = "__metrics_topic__"
+
+
+def instrument_event_handler(
+    topic: str, event_handler: type[EventHandler], query_budget: QueryBudget | None = None
+) -> None:
+    """
+    Record the latency, failures and database usage of `event_handler` under `topic`.
+
+    When a `query_budget` is given, the queries executed for each event are checked against it.
+
+    Handlers are resolved from the container by their class, so the class' `handle` is wrapped
+    in place rather than substituted with a subclass the container does not know about.
+    """
+    handle = event_handler.handle
+    if getattr(handle, _INSTRUMENTED_ATTRIBUTE, None) is not None:
+        return
+
+    @functools.wraps(handle)
+    async def instrumented_handle(self: EventHandler, event: dict[str, Any]) -> None:
+        started = time.perf_counter()
+        with track_queries() as queries:
+            try:
+                await handle(self, event)
+            except Exception:
+                EVENT_HANDLER_FAILURES.inc(topic)
+                raise
+            finally:
+                EVENT_HANDLER_DURATION.observe(time.perf_counter() - started, topic)
+                EVENT_HANDLER_DB_QUERIES.observe(queries.count, topic)
+                EVENT_HANDLER_DB_DURATION.observe(queries.duration, topic)
+                if query_budget is not None:
+                    query_budget.check(queries, "event", topic)
+
+    setattr(instrumented_handle, _INSTRUMENTED_ATTRIBUTE, topic)
+    event_handler.handle = instrumented_handle  # type: ignore[method-assign]
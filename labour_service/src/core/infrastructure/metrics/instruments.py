@@ -0,0 +1,67 @@
+from src.core.infrastructure.metrics.registry import MetricsRegistry
+
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+
+REGISTRY = MetricsRegistry()
+
+HTTP_REQUEST_DURATION = REGISTRY.histogram(
+    "http_request_duration_seconds",
+    "Time taken to handle HTTP requests.",
+    labels=("method", "route", "status"),
+)
+HTTP_REQUEST_DB_QUERIES = REGISTRY.histogram(
+    "http_request_db_queries",
+    "Database queries executed while handling an HTTP request.",
+    labels=("method", "route"),
+    buckets=QUERY_COUNT_BUCKETS,
+)
+HTTP_REQUEST_DB_DURATION = REGISTRY.histogram(
+    "http_request_db_duration_seconds",
+    "Time spent executing database queries while handling an HTTP request.",
+    labels=("method", "route"),
+)
+DB_QUERY_DURATION = REGISTRY.histogram(
+    "db_query_duration_seconds",
+    "Time taken to execute database queries.",
+    labels=("engine",),
+)
+EVENT_HANDLER_DURATION = REGISTRY.histogram(
+    "event_handler_duration_seconds",
+    "Time taken by consumer event handlers.",
+    labels=("topic",),
+)
+EVENT_HANDLER_FAILURES = REGISTRY.counter(
+    "event_handler_failures",
+    "Consumer event handlers that raised.",
+    labels=("topic",),
+)
+OUTBOX_LAG = REGISTRY.gauge(
+    "domain_event_outbox_lag_seconds",
+    "Age of the oldest unpublished domain event, zero when the outbox is empty.",
+)
+EVENT_LOOP_LAG = REGISTRY.histogram(
+    "event_loop_lag_seconds",
+    "Delay between a scheduled event loop wake up and the loop running it.",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+EVENT_LOOP_BLOCKED = REGISTRY.counter(
+    "event_loop_blocked",
+    "Times the event loop was held beyond the blocking threshold, by the code holding it.",
+    labels=("location",),
+)
+EVENT_HANDLER_DB_QUERIES = REGISTRY.histogram(
+    "event_handler_db_queries",
+    "Database queries executed while handling a consumed event.",
+    labels=("topic",),
+    buckets=QUERY_COUNT_BUCKETS,
+)
+EVENT_HANDLER_DB_DURATION = REGISTRY.histogram(
+    "event_handler_db_duration_seconds",
+    "Time spent executing database queries while handling a consumed event.",
+    labels=("topic",),
+)
+QUERY_BUDGET_EXCEEDED = REGISTRY.counter(
+    "db_query_budget_exceeded",
+    "Requests and consumed events that exceeded the query budget or repeated a statement.",
+    labels=("source", "name"),
+)
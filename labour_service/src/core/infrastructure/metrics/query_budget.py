@@ -0,0 +1,54 @@
+import logging
+
+from src.core.infrastructure.metrics.database import QueryStats
+from src.core.infrastructure.metrics.instruments import QUERY_BUDGET_EXCEEDED
+
+log = logging.getLogger(__name__)
+
+MAX_LOGGED_STATEMENT_LENGTH = 200
+
+
+def _abbreviate(statement: str) -> str:
+    statement = " ".join(statement.split())
+    if len(statement) <= MAX_LOGGED_STATEMENT_LENGTH:
+        return statement
+    return f"{statement[:MAX_LOGGED_STATEMENT_LENGTH]}..."
+
+
+class QueryBudget:
+    """
+    Flags units of work that execute more queries than expected.
+
+    A unit of work, such as a request or a consumed event, exceeds the budget if it executes
+    more than `max_queries` queries, or executes the same statement at least
+    `repeated_statement_threshold` times, which is usually an N+1 pattern. Either check is
+    disabled when set to zero.
+    """
+
+    def __init__(self, max_queries: int, repeated_statement_threshold: int) -> None:
+        self._max_queries = max_queries
+        self._repeated_statement_threshold = repeated_statement_threshold
+
+    def check(self, stats: QueryStats, source: str, name: str) -> list[str]:
+        """Log and count the ways in which the queries exceeded the budget, and return them."""
+        violations = []
+        if self._max_queries and stats.count > self._max_queries:
+            violations.append(f"executed {stats.count} queries, budget is {self._max_queries}")
+        if self._repeated_statement_threshold:
+            violations.extend(
+                f"executed {count} times: {_abbreviate(statement)}"
+                for statement, count in stats.repeated_statements(
+                    self._repeated_statement_threshold
+                )
+            )
+        if violations:
+            QUERY_BUDGET_EXCEEDED.inc(source, name)
+            log.warning(
+                "%s %s exceeded its query budget, %d queries in %.1fms:\n  %s",
+                source,
+                name,
+                stats.count,
+                stats.duration * 1000,
+                "\n  ".join(violations),
+            )
+        return violations
@@ -0,0 +1,185 @@
+import math
+from bisect import bisect_left
+from collections.abc import Callable, Iterable, Iterator
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+LabelValues = tuple[str, ...]
+Collector = Callable[[], Iterable[str]]
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def format_labels(names: tuple[str, ...], values: LabelValues) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape(value)}"' for name, value in zip(names, values, strict=True)
+    )
+    return f"{{{pairs}}}"
+
+
+class Metric:
+    type_name = "untyped"
+
+    def __init__(self, name: str, documentation: str, labels: tuple[str, ...] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.label_names = labels
+
+    def _check_labels(self, values: LabelValues) -> None:
+        if len(values) != len(self.label_names):
+            raise ValueError(
+                f"Metric '{self.name}' expects labels {self.label_names}, got {len(values)} values."
+            )
+
+    def header(self) -> Iterator[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} {self.type_name}"
+
+    def samples(self) -> Iterator[str]:
+        raise NotImplementedError
+
+
+class Counter(Metric):
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labels: tuple[str, ...] = ()) -> None:
+        super().__init__(name, documentation, labels)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        self._check_labels(labels)
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0.0)
+
+    def samples(self) -> Iterator[str]:
+        for labels, value in self._values.items():
+            labels_text = format_labels(self.label_names, labels)
+            yield f"{self.name}_total{labels_text} {_format_value(value)}"
+
+
+class Gauge(Metric):
+    type_name = "gauge"
+
+    def __init__(self, name: str, documentation: str, labels: tuple[str, ...] = ()) -> None:
+        super().__init__(name, documentation, labels)
+        self._values: dict[LabelValues, float] = {}
+
+    def set(self, value: float, *labels: str) -> None:
+        self._check_labels(labels)
+        self._values[labels] = value
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0.0)
+
+    def samples(self) -> Iterator[str]:
+        for labels, value in self._values.items():
+            yield f"{self.name}{format_labels(self.label_names, labels)} {_format_value(value)}"
+
+
+class Histogram(Metric):
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labels)
+        self._buckets = buckets
+        self._counts: dict[LabelValues, list[int]] = {}
+        self._sums: dict[LabelValues, float] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        counts = self._counts.get(labels)
+        if counts is None:
+            self._check_labels(labels)
+            counts = self._counts[labels] = [0] * (len(self._buckets) + 1)
+            self._sums[labels] = 0.0
+        counts[bisect_left(self._buckets, value)] += 1
+        self._sums[labels] += value
+
+    def count(self, *labels: str) -> int:
+        return sum(self._counts.get(labels, ()))
+
+    def samples(self) -> Iterator[str]:
+        for labels, counts in self._counts.items():
+            cumulative = 0
+            for bound, count in zip((*self._buckets, math.inf), counts, strict=True):
+                cumulative += count
+                bucket_labels = format_labels(
+                    (*self.label_names, "le"), (*labels, _format_value(bound))
+                )
+                yield f"{self.name}_bucket{bucket_labels} {cumulative}"
+            labels_text = format_labels(self.label_names, labels)
+            yield f"{self.name}_sum{labels_text} {_format_value(self._sums[labels])}"
+            yield f"{self.name}_count{labels_text} {cumulative}"
+
+
+class MetricsRegistry:
+    """
+    In-process registry of metrics, rendered in the Prometheus text exposition format.
+
+    Collectors are called on every render and yield complete metric families of their own,
+    for values such as pool statistics that are read at scrape time rather than recorded.
+    """
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, Metric] = {}
+        self._collectors: list[Collector] = []
+
+    def _register(self, metric: Metric) -> None:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric '{metric.name}' is already registered.")
+        self._metrics[metric.name] = metric
+
+    def counter(self, name: str, documentation: str, labels: tuple[str, ...] = ()) -> Counter:
+        counter = Counter(name, documentation, labels)
+        self._register(counter)
+        return counter
+
+    def gauge(self, name: str, documentation: str, labels: tuple[str, ...] = ()) -> Gauge:
+        gauge = Gauge(name, documentation, labels)
+        self._register(gauge)
+        return gauge
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labels: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        histogram = Histogram(name, documentation, labels, buckets)
+        self._register(histogram)
+        return histogram
+
+    def add_collector(self, collector: Collector) -> None:
+        self._collectors.append(collector)
+
+    def remove_collector(self, collector: Collector) -> None:
+        self._collectors.remove(collector)
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.header())
+            lines.extend(metric.samples())
+        for collector in self._collectors:
+            lines.extend(collector())
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,67 @@
+import asyncio
+import logging
+
+from src.core.infrastructure.metrics.registry import MetricsRegistry
+
+log = logging.getLogger(__name__)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+MAX_REQUEST_HEAD_BYTES = 8192
+
+
+class MetricsServer:
+    """
+    Minimal HTTP server exposing a metrics registry at `/metrics`, for processes such as the
+    event consumer that do not otherwise serve HTTP.
+    """
+
+    def __init__(self, registry: MetricsRegistry, host: str, port: int) -> None:
+        self._registry = registry
+        self._host = host
+        self._port = port
+        self._server: asyncio.Server | None = None
+
+    @property
+    def port(self) -> int:
+        if self._server is None or not self._server.sockets:
+            return self._port
+        return int(self._server.sockets[0].getsockname()[1])
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, self._host, self._port)
+        log.info(f"Serving metrics on {self._host}:{self.port}")
+
+    async def stop(self) -> None:
+        if self._server is None:
+            return
+        self._server.close()
+        await self._server.wait_closed()
+        self._server = None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+            method, path, *_ = head[:MAX_REQUEST_HEAD_BYTES].decode("latin-1").split(" ", 2)
+            if method == "GET" and path.split("?", 1)[0] == "/metrics":
+                await self._respond(writer, "200 OK", self._registry.render())
+            else:
+                await self._respond(writer, "404 Not Found", "Not Found\n")
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ValueError):
+            await self._respond(writer, "400 Bad Request", "Bad Request\n")
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, writer: asyncio.StreamWriter, status: str, body: str) -> None:
+        payload = body.encode()
+        writer.write(
+            (
+                f"HTTP/1.1 {status}\r\n"
+                f"Content-Type: {PROMETHEUS_CONTENT_TYPE}\r\n"
+                f"Content-Length: {len(payload)}\r\n"
+                "Connection: close\r\n\r\n"
+            ).encode()
+            + payload
+        )
+        await writer.drain()
@@ -1,6 +1,7 @@
 __all__ = (
     "alembic_postgresql_enum",
     "idempotency_table",
+    "users_table",
 )
 import asyncio
 import os
@@ -15,6 +16,7 @@ from sqlalchemy.ext.asyncio import async_engine_from_config
 from src.core.infrastructure.persistence.idempotency import table as idempotency_table
 from src.core.infrastructure.persistence.initialize_mapping import map_all
 from src.core.infrastructure.persistence.orm_registry import mapper_registry
+from src.user.infrastructure.persistence import table as users_table
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -0,0 +1,46 @@
+"""Add indexes for subscriptions
+
+Revision ID: f45d9f40e2b2
+Revises: 8090ee268002
+Create Date: 2025-06-21 10:12:41.208317
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "f45d9f40e2b2"
+down_revision: str | None = "8090ee268002"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Authorization checks, subscribe/unsubscribe lookups and the birthing person's
+    # view of a labour's subscriptions all lead with labour_id.
+    op.create_index(
+        "idx_subscriptions_labour_subscriber", "subscriptions", ["labour_id", "subscriber_id"]
+    )
+
+    # A subscriber's active subscriptions and the active subscribers of a labour only ever
+    # read subscriptions in the SUBSCRIBED state.
+    op.create_index(
+        "idx_subscriptions_subscriber_id_subscribed",
+        "subscriptions",
+        ["subscriber_id"],
+        postgresql_where=sa.text("status = 'SUBSCRIBED'"),
+    )
+    op.create_index(
+        "idx_subscriptions_labour_id_subscribed",
+        "subscriptions",
+        ["labour_id"],
+        postgresql_where=sa.text("status = 'SUBSCRIBED'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_subscriptions_labour_id_subscribed", table_name="subscriptions")
+    op.drop_index("idx_subscriptions_subscriber_id_subscribed", table_name="subscriptions")
+    op.drop_index("idx_subscriptions_labour_subscriber", table_name="subscriptions")
@@ -0,0 +1,35 @@
+"""Add labour archives table
+
+Revision ID: 3f7a1c9e5b2d
+Revises: 8ad4658b6b2d
+Create Date: 2025-07-02 18:15:42.208113
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3f7a1c9e5b2d"
+down_revision: str | None = "8ad4658b6b2d"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "labour_archives",
+        sa.Column("labour_id", sa.UUID(), nullable=False),
+        sa.Column("archived_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("snapshot", sa.String(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["labour_id"], ["labours.id"], name=op.f("fk_labour_archives_labour_id_labours")
+        ),
+        sa.PrimaryKeyConstraint("labour_id", name=op.f("pk_labour_archives")),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("labour_archives")
@@ -0,0 +1,28 @@
+"""Encrypt contact details in users projection
+
+Revision ID: b71e0c4d2a93
+Revises: 3f7a1c9e5b2d
+Create Date: 2025-07-08 21:10:27.604318
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b71e0c4d2a93"
+down_revision: str | None = "3f7a1c9e5b2d"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Emails and phone numbers are now written encrypted. Rather than encrypting the existing
+    # plaintext here, the projection is emptied; lookups fall back to Keycloak until the next
+    # sync has refilled it.
+    op.execute("DELETE FROM users")
+
+
+def downgrade() -> None:
+    op.execute("DELETE FROM users")
@@ -1,7 +1,7 @@
 from datetime import UTC, datetime
 
 from fern_labour_core.events.event import DomainEvent
-from sqlalchemy import select, update
+from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.domain.domain_event.repository import DomainEventRepository
@@ -52,6 +52,20 @@ class SQLAlchemyDomainEventRepository(DomainEventRepository):
 
         return list(result.scalars())
 
+    async def get_oldest_unpublished_time(self) -> datetime | None:
+        """
+        Get the time of the oldest unpublished domain event.
+
+        Returns:
+            The creation time of the oldest unpublished domain event, else returns None
+        """
+        stmt = select(func.min(domain_events_table.c.created_at)).where(
+            domain_events_table.c.published_at.is_(None)
+        )
+        result = await self._session.execute(stmt)
+        oldest: datetime | None = result.scalar_one_or_none()
+        return oldest
+
     async def mark_as_published(self, domain_event_id: str) -> None:
         """
         Mark a domain event as published.
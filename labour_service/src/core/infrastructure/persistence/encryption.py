@@ -0,0 +1,111 @@
+import logging
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, Synonym, UOWTransaction, synonym
+from sqlalchemy_utils.types.encrypted.encrypted_type import AesEngine
+
+log = logging.getLogger(__name__)
+
+FIELD_ENCRYPTOR_INFO_KEY = "field_encryptor"
+_FIELD_ENCRYPTOR_ATTRIBUTE = "_field_encryptor"
+
+
+class FieldEncryptor:
+    """
+    Encrypts and decrypts individual column values.
+
+    Produces the same ciphertext as `StringEncryptedType(engine=AesEngine, padding="pkcs5")`,
+    so values written by either can be read by the other.
+    """
+
+    def __init__(self, key: str) -> None:
+        self._engine = AesEngine()
+        self._engine._update_key(key)
+        self._engine._set_padding_mechanism("pkcs5")
+
+    def encrypt(self, value: str) -> str:
+        return self._engine.encrypt(value)  # type: ignore[no-any-return]
+
+    def decrypt(self, value: str) -> str:
+        return self._engine.decrypt(value)  # type: ignore[no-any-return]
+
+
+class EncryptedAttribute:
+    """
+    Exposes the plaintext of an encrypted column, decrypting it on first access only.
+
+    The ciphertext is mapped to a private attribute and the decrypted value is memoized
+    against it, so rows that are loaded but never read do not pay for decryption. Values
+    assigned through this attribute are encrypted when the session is flushed.
+    """
+
+    def __init__(self, ciphertext_attribute: str) -> None:
+        self._ciphertext_attribute = ciphertext_attribute
+        self._plaintext_attribute = f"{ciphertext_attribute}_plaintext"
+
+    def __get__(self, instance: Any, owner: type) -> Any:
+        if instance is None:
+            return self
+
+        ciphertext = getattr(instance, self._ciphertext_attribute)
+        memoized = instance.__dict__.get(self._plaintext_attribute)
+        if memoized is not None and memoized[0] == ciphertext:
+            return memoized[1]
+        if ciphertext is None:
+            return None
+
+        encryptor: FieldEncryptor | None = instance.__dict__.get(_FIELD_ENCRYPTOR_ATTRIBUTE)
+        if encryptor is None:
+            raise RuntimeError(
+                f"No field encryptor available to decrypt '{self._ciphertext_attribute}'."
+            )
+        plaintext = encryptor.decrypt(ciphertext)
+        instance.__dict__[self._plaintext_attribute] = (ciphertext, plaintext)
+        return plaintext
+
+    def __set__(self, instance: Any, value: str | None) -> None:
+        instance.__dict__[self._plaintext_attribute] = (None, value)
+        setattr(instance, self._ciphertext_attribute, None)
+
+    def encrypt_pending(self, instance: Any, encryptor: FieldEncryptor) -> None:
+        memoized = instance.__dict__.get(self._plaintext_attribute)
+        if memoized is None or memoized[0] is not None or memoized[1] is None:
+            return
+        plaintext = memoized[1]
+        ciphertext = encryptor.encrypt(plaintext)
+        setattr(instance, self._ciphertext_attribute, ciphertext)
+        instance.__dict__[self._plaintext_attribute] = (ciphertext, plaintext)
+
+
+_encrypted_attributes: dict[type, list[EncryptedAttribute]] = {}
+
+
+def _attach_encryptor(target: Any, context: Any) -> None:
+    target.__dict__[_FIELD_ENCRYPTOR_ATTRIBUTE] = context.session.info.get(FIELD_ENCRYPTOR_INFO_KEY)
+
+
+def encrypted_synonym(class_: type, ciphertext_attribute: str) -> Synonym[Any]:
+    """
+    Map a plaintext attribute of `class_` onto the encrypted column mapped at
+    `ciphertext_attribute`, decrypting lazily with the encryptor from the session info.
+    """
+    attribute = EncryptedAttribute(ciphertext_attribute)
+    if class_ not in _encrypted_attributes:
+        event.listen(class_, "load", _attach_encryptor)
+    _encrypted_attributes.setdefault(class_, []).append(attribute)
+    return synonym(ciphertext_attribute, descriptor=attribute)
+
+
+@event.listens_for(Session, "before_flush")
+def encrypt_pending_attributes(session: Session, _: UOWTransaction, __: Any) -> None:
+    encryptor: FieldEncryptor | None = session.info.get(FIELD_ENCRYPTOR_INFO_KEY)
+    for instance in (*session.new, *session.dirty):
+        attributes = _encrypted_attributes.get(type(instance))
+        if not attributes:
+            continue
+        if encryptor is None:
+            raise RuntimeError("No field encryptor configured on the session.")
+        instance.__dict__[_FIELD_ENCRYPTOR_ATTRIBUTE] = encryptor
+        for attribute in attributes:
+            attribute.encrypt_pending(instance, encryptor)
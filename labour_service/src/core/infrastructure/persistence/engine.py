@@ -0,0 +1,44 @@
+import time
+from typing import Any
+
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection
+
+from src.core.infrastructure.metrics.database import instrument_engine
+from src.core.infrastructure.persistence.pool_metrics import PoolMetrics
+
+
+def instrumented_pool_class(metrics: PoolMetrics) -> type[AsyncAdaptedQueuePool]:
+    """
+    Build a pool class that reports every checkout to `metrics`.
+
+    The class is created per engine rather than taking `metrics` as an argument, because the
+    pool is recreated from its class when the engine is disposed.
+    """
+
+    class InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+        def connect(self) -> PoolProxiedConnection:
+            started = time.perf_counter()
+            try:
+                connection = super().connect()
+            except exc.TimeoutError:
+                metrics.record_timeout(self, time.perf_counter() - started)
+                raise
+            metrics.record_checkout(self, time.perf_counter() - started)
+            return connection
+
+    return InstrumentedAsyncAdaptedQueuePool
+
+
+def create_instrumented_async_engine(
+    dsn: str, metrics: PoolMetrics, **engine_options: Any
+) -> AsyncEngine:
+    """
+    Create an async engine whose pool reports every checkout to `metrics`, and whose queries
+    are recorded under the same name.
+    """
+    engine = create_async_engine(dsn, poolclass=instrumented_pool_class(metrics), **engine_options)
+    metrics.bind(engine.sync_engine.pool)  # type: ignore[arg-type]
+    instrument_engine(engine.sync_engine, metrics.name)
+    return engine
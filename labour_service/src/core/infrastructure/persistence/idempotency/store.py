@@ -28,7 +28,7 @@ class SQLAlchemyIdempotencyStore(IdempotencyStore):
 
     async def _acquire_advisory_lock(self, event_id: str) -> None:
         lock_key = await self._get_lock_key_for_event(event_id=event_id)
-        log.debug(f"Attempting to acquire advisory lock for event {event_id} (key: {lock_key})")
+        log.debug("Attempting to acquire advisory lock for event %s (key: %s)", event_id, lock_key)
 
         stmt_advisory_lock = text("SELECT pg_try_advisory_xact_lock(:key)")
         result = await self._session.execute(stmt_advisory_lock, {"key": lock_key})
@@ -36,7 +36,7 @@ class SQLAlchemyIdempotencyStore(IdempotencyStore):
         if not result.scalar_one():
             raise LockContentionError(f"Event '{event_id}' is locked by another consumer.")
 
-        log.debug(f"Advisory lock acquired for event: {event_id}")
+        log.debug("Advisory lock acquired for event: %s", event_id)
 
     async def _get_event_processing_state(self, event_id: str) -> str | None:
         stmt_select = select(consumer_processed_events_table.c.status).where(
@@ -62,10 +62,10 @@ class SQLAlchemyIdempotencyStore(IdempotencyStore):
             raise AlreadyCompletedError(f"Event '{event_id}' already completed.")
 
         if current_state is None:
-            log.debug(f"Event ID '{event_id}' not found. Inserting new record.")
+            log.debug("Event ID '%s' not found. Inserting new record.", event_id)
             await self._insert_event(event_id=event_id)
 
-        log.info(f"Claim successfully established for Event '{event_id}'")
+        log.debug("Claim successfully established for Event '%s'", event_id)
 
     async def mark_as_completed(self, event_id: str) -> None:
         stmt = (
@@ -74,4 +74,4 @@ class SQLAlchemyIdempotencyStore(IdempotencyStore):
             .values(status=ProcessingStatus.COMPLETED)
         )
         await self._session.execute(stmt)
-        log.info(f"Marked event '{event_id}' as COMPLETED within transaction.")
+        log.debug("Marked event '%s' as COMPLETED within transaction.", event_id)
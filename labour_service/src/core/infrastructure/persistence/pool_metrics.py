@@ -0,0 +1,155 @@
+import logging
+from collections.abc import Iterator
+
+from sqlalchemy.pool import QueuePool
+
+from src.core.infrastructure.metrics.registry import Counter, Histogram, Metric, format_labels
+
+log = logging.getLogger(__name__)
+
+POOL_GAUGES = {
+    "size": "Configured size of the connection pool.",
+    "checked_out": "Connections currently checked out of the pool.",
+    "overflow": "Overflow connections currently open beyond the pool size.",
+}
+POOL_COUNTERS = {
+    "checkouts": "Connections checked out of the pool.",
+    "timeouts": "Connection checkouts that timed out waiting for the pool.",
+}
+POOL_HISTOGRAMS = {
+    "checkout_wait_seconds": "Time spent waiting to check a connection out of the pool.",
+    "utilisation": "Share of the pool, including overflow, in use after each checkout.",
+    "overflow_connections": "Overflow connections open after each checkout.",
+}
+
+CHECKOUT_WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+UTILISATION_BUCKETS = (0.1, 0.25, 0.5, 0.75, 0.9, 1.0)
+OVERFLOW_BUCKETS = (0, 1, 2, 5, 10, 20, 50)
+
+
+class PoolInstruments:
+    """Counters and histograms shared by every pool, labelled by the name of the pool."""
+
+    def __init__(self) -> None:
+        labels = ("pool",)
+        self.checkouts = Counter("db_pool_checkouts", POOL_COUNTERS["checkouts"], labels)
+        self.timeouts = Counter("db_pool_timeouts", POOL_COUNTERS["timeouts"], labels)
+        self.checkout_wait = Histogram(
+            "db_pool_checkout_wait_seconds",
+            POOL_HISTOGRAMS["checkout_wait_seconds"],
+            labels,
+            buckets=CHECKOUT_WAIT_BUCKETS,
+        )
+        self.utilisation = Histogram(
+            "db_pool_utilisation",
+            POOL_HISTOGRAMS["utilisation"],
+            labels,
+            buckets=UTILISATION_BUCKETS,
+        )
+        self.overflow = Histogram(
+            "db_pool_overflow_connections",
+            POOL_HISTOGRAMS["overflow_connections"],
+            labels,
+            buckets=OVERFLOW_BUCKETS,
+        )
+
+    def __iter__(self) -> Iterator[Metric]:
+        return iter(
+            (self.checkouts, self.timeouts, self.checkout_wait, self.utilisation, self.overflow)
+        )
+
+
+class PoolMetrics:
+    """
+    Records connection checkouts for a single engine's pool.
+
+    Every checkout observes how long the caller waited for a connection, how much of the pool
+    (including overflow) was in use once it got one, and how many overflow connections were
+    open. Checkouts slower than the threshold are logged with the pool status at the time.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        slow_checkout_threshold: float,
+        instruments: PoolInstruments | None = None,
+    ) -> None:
+        self.name = name
+        self._slow_checkout_threshold = slow_checkout_threshold
+        self._pool: QueuePool | None = None
+        self.instruments = instruments or PoolInstruments()
+        self.instruments.checkouts.inc(name, amount=0)
+        self.instruments.timeouts.inc(name, amount=0)
+
+    def bind(self, pool: QueuePool) -> None:
+        """Track the current pool, which is replaced whenever the engine is disposed."""
+        self._pool = pool
+
+    def _capacity(self, pool: QueuePool) -> int:
+        return pool.size() + max(pool._max_overflow, 0)
+
+    def record_checkout(self, pool: QueuePool, wait_seconds: float) -> None:
+        self._pool = pool
+        self.instruments.checkouts.inc(self.name)
+        self.instruments.checkout_wait.observe(wait_seconds, self.name)
+        self.instruments.utilisation.observe(
+            pool.checkedout() / max(self._capacity(pool), 1), self.name
+        )
+        self.instruments.overflow.observe(max(pool.overflow(), 0), self.name)
+        if wait_seconds >= self._slow_checkout_threshold:
+            log.warning(
+                f"Slow connection checkout from '{self.name}' pool took {wait_seconds:.3f}s: "
+                f"{pool.status()}"
+            )
+
+    def record_timeout(self, pool: QueuePool, wait_seconds: float) -> None:
+        self._pool = pool
+        self.instruments.timeouts.inc(self.name)
+        self.instruments.checkout_wait.observe(wait_seconds, self.name)
+        log.error(
+            f"Connection checkout from '{self.name}' pool timed out after {wait_seconds:.3f}s: "
+            f"{pool.status()}"
+        )
+
+    def gauges(self) -> dict[str, int]:
+        """Read the current state of the pool, for the gauges rendered at scrape time."""
+        pool = self._pool
+        return {
+            "size": pool.size() if pool else 0,
+            "checked_out": pool.checkedout() if pool else 0,
+            "overflow": max(pool.overflow(), 0) if pool else 0,
+        }
+
+
+class PoolMetricsRegistry:
+    """Holds the pool metrics of every engine created by the container, keyed by name."""
+
+    def __init__(self, slow_checkout_threshold: float) -> None:
+        self._slow_checkout_threshold = slow_checkout_threshold
+        self._instruments = PoolInstruments()
+        self._metrics: dict[str, PoolMetrics] = {}
+
+    def register(self, name: str) -> PoolMetrics:
+        metrics = PoolMetrics(
+            name=name,
+            slow_checkout_threshold=self._slow_checkout_threshold,
+            instruments=self._instruments,
+        )
+        self._metrics[name] = metrics
+        return metrics
+
+    def collect(self) -> Iterator[str]:
+        """Yield the pool metrics of every engine in the Prometheus text exposition format."""
+        label_names = ("pool",)
+        gauges = {name: metrics.gauges() for name, metrics in self._metrics.items()}
+
+        for key, documentation in POOL_GAUGES.items():
+            name = f"db_pool_{key}"
+            yield f"# HELP {name} {documentation}"
+            yield f"# TYPE {name} gauge"
+            for pool, values in gauges.items():
+                yield f"{name}{format_labels(label_names, (pool,))} {values[key]}"
+
+        for metric in self._instruments:
+            yield from metric.header()
+            yield from metric.samples()
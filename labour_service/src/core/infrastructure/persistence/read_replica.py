@@ -0,0 +1,31 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import NewType
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+ReadOnlyAsyncEngine = NewType("ReadOnlyAsyncEngine", AsyncEngine)
+ReadOnlyAsyncSessionMaker = NewType("ReadOnlyAsyncSessionMaker", async_sessionmaker[AsyncSession])
+ReadOnlyAsyncSession = NewType("ReadOnlyAsyncSession", AsyncSession)
+
+_replica_reads_allowed: ContextVar[bool] = ContextVar("replica_reads_allowed", default=False)
+
+
+@contextmanager
+def allow_replica_reads() -> Iterator[None]:
+    """
+    Allow read-only sessions opened within the block to be served by the replica.
+
+    Replica reads are opt-in so that consumers, background tasks and write requests, which may
+    read back what they have just committed, always read from the primary.
+    """
+    token = _replica_reads_allowed.set(True)
+    try:
+        yield
+    finally:
+        _replica_reads_allowed.reset(token)
+
+
+def replica_reads_allowed() -> bool:
+    return _replica_reads_allowed.get()
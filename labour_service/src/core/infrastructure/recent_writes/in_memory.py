@@ -0,0 +1,40 @@
+import time
+from collections import OrderedDict
+
+from src.core.infrastructure.recent_writes.interface import RecentWriteTracker
+
+
+class InMemoryRecentWriteTracker(RecentWriteTracker):
+    """
+    Bounded, in-process record of callers that have written recently.
+
+    Entries are kept in order of their last write so that expired and least recent writers can
+    be evicted from the front of the dict without scanning the whole tracker.
+    """
+
+    def __init__(self, window_seconds: float, max_entries: int) -> None:
+        self._window_seconds = window_seconds
+        self._max_entries = max_entries
+        self._writes: OrderedDict[str, float] = OrderedDict()
+
+    def _evict(self, now: float) -> None:
+        while self._writes:
+            key, expiry = next(iter(self._writes.items()))
+            if expiry > now and len(self._writes) <= self._max_entries:
+                break
+            del self._writes[key]
+
+    def record_write(self, key: str) -> None:
+        now = time.monotonic()
+        self._writes[key] = now + self._window_seconds
+        self._writes.move_to_end(key)
+        self._evict(now)
+
+    def has_recent_write(self, key: str) -> bool:
+        expiry = self._writes.get(key)
+        if expiry is None:
+            return False
+        if expiry <= time.monotonic():
+            del self._writes[key]
+            return False
+        return True
@@ -0,0 +1,11 @@
+from typing import Protocol
+
+
+class RecentWriteTracker(Protocol):
+    """Protocol for remembering which callers have written recently."""
+
+    def record_write(self, key: str) -> None:
+        """Records that the caller identified by the key has just written."""
+
+    def has_recent_write(self, key: str) -> bool:
+        """Checks if the caller identified by the key has written within the tracked window."""
@@ -0,0 +1,45 @@
+import logging
+import time
+from collections import OrderedDict
+
+from src.core.infrastructure.security.authorization_cache.interface import AuthorizationCache
+
+log = logging.getLogger(__name__)
+
+
+class InMemoryAuthorizationCache(AuthorizationCache):
+    """
+    Short-lived, in-process cache of granted labour access decisions.
+
+    Decisions are grouped by labour so that everything cached for a labour can be dropped in
+    one step, and expire after `ttl_seconds` so that changes made in other processes are
+    picked up. Only granted decisions are cached; denials always go back to the database.
+    """
+
+    def __init__(self, ttl_seconds: int, max_labours: int) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._max_labours = max_labours
+        self._decisions: OrderedDict[str, dict[tuple[str, str], float]] = OrderedDict()
+
+    def is_allowed(self, rule: str, requester_id: str, labour_id: str) -> bool:
+        decisions = self._decisions.get(labour_id)
+        if not decisions:
+            return False
+        expiry = decisions.get((rule, requester_id))
+        if expiry is None:
+            return False
+        if expiry <= time.monotonic():
+            del decisions[(rule, requester_id)]
+            return False
+        return True
+
+    def allow(self, rule: str, requester_id: str, labour_id: str) -> None:
+        decisions = self._decisions.setdefault(labour_id, {})
+        decisions[(rule, requester_id)] = time.monotonic() + self._ttl_seconds
+        self._decisions.move_to_end(labour_id)
+        while len(self._decisions) > self._max_labours:
+            self._decisions.popitem(last=False)
+
+    def invalidate_labour(self, labour_id: str) -> None:
+        self._decisions.pop(labour_id, None)
+        log.debug("Invalidated access decisions for labour %s", labour_id)
@@ -0,0 +1,14 @@
+from typing import Protocol
+
+
+class AuthorizationCache(Protocol):
+    """Protocol for caching granted access decisions for a requester and labour."""
+
+    def is_allowed(self, rule: str, requester_id: str, labour_id: str) -> bool:
+        """Checks if access to the labour was recently granted to the requester under the rule."""
+
+    def allow(self, rule: str, requester_id: str, labour_id: str) -> None:
+        """Records that access to the labour was granted to the requester under the rule."""
+
+    def invalidate_labour(self, labour_id: str) -> None:
+        """Drops all cached decisions for the labour."""
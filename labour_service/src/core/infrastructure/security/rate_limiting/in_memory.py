@@ -40,7 +40,7 @@ class InMemoryRateLimiter(RateLimiter):
             entry = CacheEntry(key=key, count=0, expiry_seconds=expiry_seconds)
             entry.set_expiry(expiry_seconds)
             self._data[entry.key] = entry
-            log.debug(f"Key '{key}' created.")
+            log.debug("Key '%s' created.", key)
         if entry.expiry < datetime.now():
             entry.set_expiry(expiry_seconds)
             entry.count = 0
@@ -48,14 +48,14 @@ class InMemoryRateLimiter(RateLimiter):
         return entry.count
 
     def is_allowed(self, key: str, limit: int, expiry: int) -> bool:
-        log.debug(f"Running rate-limit check for {key=}")
+        log.debug("Running rate-limit check for key=%r", key)
         try:
             current_count = self._incr(key, expiry)
-            log.debug(f"Current count for {key} = {current_count}")
+            log.debug("Current count for %s = %d", key, current_count)
             if current_count > limit:
-                log.warning(f"Rate limit exceeded for key '{key}'")
+                log.warning("Rate limit exceeded for key '%s'", key)
                 return False
             return True
         except Exception as e:
-            log.error(f"Unexpected error during rate limit check for key '{key}': {e}")
+            log.error("Unexpected error during rate limit check for key '%s': %s", key, e)
             return True
@@ -0,0 +1,68 @@
+import asyncio
+import logging
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+
+from sentry_sdk.profiler import start_profiler, stop_profiler
+
+log = logging.getLogger(__name__)
+
+
+class ProfilingSession:
+    """
+    Runs the Sentry profiler for a limited time on demand, rather than continuously.
+
+    Starting a session while one is running extends it to the new duration. Durations are
+    capped, so a forgotten session always ends.
+    """
+
+    def __init__(
+        self,
+        max_duration: int,
+        start: Callable[[], None] = start_profiler,
+        stop: Callable[[], None] = stop_profiler,
+    ) -> None:
+        self._max_duration = max_duration
+        self._start = start
+        self._stop = stop
+        self._ends_at: datetime | None = None
+        self._stop_handle: asyncio.TimerHandle | None = None
+
+    @property
+    def ends_at(self) -> datetime | None:
+        return self._ends_at
+
+    @property
+    def active(self) -> bool:
+        return self._ends_at is not None
+
+    def start(self, duration: int) -> datetime:
+        """
+        Start profiling, or extend the running session, for the given number of seconds.
+
+        Args:
+            duration: Seconds to profile for, capped at the maximum duration
+
+        Returns:
+            The time at which profiling stops
+        """
+        duration = max(min(duration, self._max_duration), 1)
+        if self._stop_handle is not None:
+            self._stop_handle.cancel()
+        else:
+            self._start()
+            log.info(f"Started profiling for {duration}s")
+
+        self._stop_handle = asyncio.get_running_loop().call_later(duration, self.stop)
+        self._ends_at = datetime.now(UTC) + timedelta(seconds=duration)
+        return self._ends_at
+
+    def stop(self) -> None:
+        """Stop profiling, if a session is running."""
+        if self._stop_handle is None:
+            return
+        self._stop_handle.cancel()
+        self._stop_handle = None
+        self._ends_at = None
+        self._stop()
+        log.info("Stopped profiling")
@@ -0,0 +1,87 @@
+import random
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Any
+from urllib.parse import urlsplit
+
+from sentry_sdk.types import Event, Hint
+
+WRITE_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+
+
+def _duration_seconds(event: Event) -> float | None:
+    start, end = event.get("start_timestamp"), event.get("timestamp")
+    if isinstance(start, datetime) and isinstance(end, datetime):
+        return (end - start).total_seconds()
+    if isinstance(start, int | float) and isinstance(end, int | float):
+        return float(end - start)
+    return None
+
+
+class TraceSampler:
+    """
+    Decides which transactions are traced and sent to Sentry.
+
+    Requests to unsampled paths, such as health checks, are never traced. Writes are traced at
+    a higher rate than reads, and a trace continued from an upstream service keeps the upstream
+    decision. With a slow request threshold every request is traced, so that the decision can
+    be made once its duration is known: slow requests are always sent and the rest are sent at
+    the usual rates.
+    """
+
+    def __init__(
+        self,
+        traces_sample_rate: float,
+        write_traces_sample_rate: float,
+        unsampled_paths: Iterable[str] = (),
+        slow_request_threshold: float = 0.0,
+    ) -> None:
+        self._traces_sample_rate = traces_sample_rate
+        self._write_traces_sample_rate = write_traces_sample_rate
+        self._unsampled_paths = frozenset(unsampled_paths)
+        self._slow_request_threshold = slow_request_threshold
+
+    @property
+    def tail_sampling_enabled(self) -> bool:
+        return self._slow_request_threshold > 0
+
+    def _is_unsampled(self, path: str) -> bool:
+        return path.rstrip("/") in self._unsampled_paths
+
+    def rate_for(self, method: str, path: str) -> float:
+        """The share of requests with the given method and path that are sent to Sentry."""
+        if self._is_unsampled(path):
+            return 0.0
+        if method.upper() in WRITE_METHODS:
+            return self._write_traces_sample_rate
+        return self._traces_sample_rate
+
+    def traces_sampler(self, sampling_context: dict[str, Any]) -> float:
+        """Sampling function for the `traces_sampler` option of `sentry_sdk.init`."""
+        asgi_scope = sampling_context.get("asgi_scope") or {}
+        path = asgi_scope.get("path", "")
+        if self._is_unsampled(path):
+            return 0.0
+
+        parent_sampled = sampling_context.get("parent_sampled")
+        if parent_sampled is not None:
+            return float(parent_sampled)
+        if self.tail_sampling_enabled:
+            return 1.0
+        return self.rate_for(asgi_scope.get("method", "GET"), path)
+
+    def before_send_transaction(self, event: Event, _: Hint) -> Event | None:
+        """Drop fast transactions traced only so that slow ones could be kept."""
+        if not self.tail_sampling_enabled:
+            return event
+
+        duration = _duration_seconds(event)
+        if duration is None or duration >= self._slow_request_threshold:
+            return event
+
+        request = event.get("request") or {}
+        url, method = request.get("url"), request.get("method")
+        path = urlsplit(url).path if isinstance(url, str) else ""
+        if random.random() < self.rate_for(method if isinstance(method, str) else "GET", path):
+            return event
+        return None
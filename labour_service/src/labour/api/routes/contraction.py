@@ -2,20 +2,23 @@ from typing import Annotated
 
 from dishka import FromComponent
 from dishka.integrations.fastapi import inject
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
 from fastapi.security import HTTPAuthorizationCredentials
 
 from src.api.dependencies import bearer_scheme
 from src.api.exception_handler import ExceptionSchema
+from src.api.responses import DataclassResponse
 from src.labour.api.schemas.requests.contraction import (
     DeleteContractionRequest,
     EndContractionRequest,
+    ImportContractionsRequest,
     StartContractionRequest,
     UpdateContractionRequest,
 )
 from src.labour.api.schemas.responses.labour import (
     LabourResponse,
 )
+from src.labour.application.dtos.contraction import ImportedContractionDTO
 from src.labour.application.services.contraction_service import ContractionService
 from src.setup.ioc.di_component_enum import ComponentEnum
 from src.user.infrastructure.auth.interfaces.controller import AuthController
@@ -40,15 +43,17 @@ async def start_contraction(
     service: Annotated[ContractionService, FromComponent(ComponentEnum.LABOUR)],
     auth_controller: Annotated[AuthController, FromComponent(ComponentEnum.DEFAULT)],
     credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
-) -> LabourResponse:
+    recent_contractions_only: bool = Query(default=False),
+) -> DataclassResponse:
     user = auth_controller.get_authenticated_user(credentials=credentials)
     labour = await service.start_contraction(
         birthing_person_id=user.id,
         start_time=request_data.start_time,
         intensity=request_data.intensity,
         notes=request_data.notes,
+        recent_contractions_only=recent_contractions_only,
     )
-    return LabourResponse(labour=labour)
+    return DataclassResponse({"labour": labour})
 
 
 @contraction_router.put(
@@ -68,15 +73,17 @@ async def end_contraction(
     service: Annotated[ContractionService, FromComponent(ComponentEnum.LABOUR)],
     auth_controller: Annotated[AuthController, FromComponent(ComponentEnum.DEFAULT)],
     credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
-) -> LabourResponse:
+    recent_contractions_only: bool = Query(default=False),
+) -> DataclassResponse:
     user = auth_controller.get_authenticated_user(credentials=credentials)
     labour = await service.end_contraction(
         birthing_person_id=user.id,
         intensity=request_data.intensity,
         end_time=request_data.end_time,
         notes=request_data.notes,
+        recent_contractions_only=recent_contractions_only,
     )
-    return LabourResponse(labour=labour)
+    return DataclassResponse({"labour": labour})
 
 
 @contraction_router.put(
@@ -96,7 +103,7 @@ async def update_contraction(
     service: Annotated[ContractionService, FromComponent(ComponentEnum.LABOUR)],
     auth_controller: Annotated[AuthController, FromComponent(ComponentEnum.DEFAULT)],
     credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
-) -> LabourResponse:
+) -> DataclassResponse:
     user = auth_controller.get_authenticated_user(credentials=credentials)
     labour = await service.update_contraction(
         birthing_person_id=user.id,
@@ -106,7 +113,7 @@ async def update_contraction(
         intensity=request_data.intensity,
         notes=request_data.notes,
     )
-    return LabourResponse(labour=labour)
+    return DataclassResponse({"labour": labour})
 
 
 @contraction_router.delete(
@@ -126,10 +133,45 @@ async def delete_contraction(
     service: Annotated[ContractionService, FromComponent(ComponentEnum.LABOUR)],
     auth_controller: Annotated[AuthController, FromComponent(ComponentEnum.DEFAULT)],
     credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
-) -> LabourResponse:
+) -> DataclassResponse:
     user = auth_controller.get_authenticated_user(credentials=credentials)
     labour = await service.delete_contraction(
         birthing_person_id=user.id,
         contraction_id=request_data.contraction_id,
     )
-    return LabourResponse(labour=labour)
+    return DataclassResponse({"labour": labour})
+
+
+@contraction_router.post(
+    "/import",
+    responses={
+        status.HTTP_200_OK: {"model": LabourResponse},
+        status.HTTP_400_BAD_REQUEST: {"model": ExceptionSchema},
+        status.HTTP_401_UNAUTHORIZED: {"model": ExceptionSchema},
+        status.HTTP_404_NOT_FOUND: {"model": ExceptionSchema},
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {"model": ExceptionSchema},
+    },
+    status_code=status.HTTP_200_OK,
+)
+@inject
+async def import_contractions(
+    request_data: ImportContractionsRequest,
+    service: Annotated[ContractionService, FromComponent(ComponentEnum.LABOUR)],
+    auth_controller: Annotated[AuthController, FromComponent(ComponentEnum.DEFAULT)],
+    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+) -> DataclassResponse:
+    user = auth_controller.get_authenticated_user(credentials=credentials)
+    labour = await service.import_contractions(
+        birthing_person_id=user.id,
+        contractions=[
+            ImportedContractionDTO(
+                id=contraction.contraction_id,
+                start_time=contraction.start_time,
+                end_time=contraction.end_time,
+                intensity=contraction.intensity,
+                notes=contraction.notes,
+            )
+            for contraction in request_data.contractions
+        ],
+    )
+    return DataclassResponse({"labour": labour})
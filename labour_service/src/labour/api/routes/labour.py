@@ -7,6 +7,7 @@ from fastapi.security import HTTPAuthorizationCredentials
 
 from src.api.dependencies import bearer_scheme
 from src.api.exception_handler import ExceptionSchema
+from src.api.responses import DataclassResponse
 from src.labour.api.schemas.requests.labour import (
     CompleteLabourRequest,
     PlanLabourRequest,
@@ -43,7 +44,7 @@ async def plan_labour(
     service: Annotated[LabourService, FromComponent(ComponentEnum.LABOUR)],
     auth_controller: Annotated[AuthController, FromComponent(ComponentEnum.DEFAULT)],
     credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
-) -> LabourResponse:
+) -> DataclassResponse:
     user = auth_controller.get_authenticated_user(credentials=credentials)
     labour = await service.plan_labour(
         birthing_person_id=user.id,
@@ -51,7 +52,7 @@ async def plan_labour(
         due_date=request_data.due_date,
         labour_name=request_data.labour_name,
     )
-    return LabourResponse(labour=labour)
+    return DataclassResponse({"labour": labour})
 
 
 @labour_router.put(
@@ -71,7 +72,7 @@ async def update_labour_plan(
     service: Annotated[LabourService, FromComponent(ComponentEnum.LABOUR)],
     auth_controller: Annotated[AuthController, FromComponent(ComponentEnum.DEFAULT)],
     credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
-) -> LabourResponse:
+) -> DataclassResponse:
     user = auth_controller.get_authenticated_user(credentials=credentials)
     labour = await service.update_labour_plan(
         birthing_person_id=user.id,
@@ -79,7 +80,7 @@ async def update_labour_plan(
         due_date=request_data.due_date,
         labour_name=request_data.labour_name,
     )
-    return LabourResponse(labour=labour)
+    return DataclassResponse({"labour": labour})
 
 
 @labour_router.post(
@@ -98,10 +99,10 @@ async def begin_labour(
     service: Annotated[LabourService, FromComponent(ComponentEnum.LABOUR)],
     auth_controller: Annotated[AuthController, FromComponent(ComponentEnum.DEFAULT)],
     credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
-) -> LabourResponse:
+) -> DataclassResponse:
     user = auth_controller.get_authenticated_user(credentials=credentials)
     labour = await service.begin_labour(user.id)
-    return LabourResponse(labour=labour)
+    return DataclassResponse({"labour": labour})
 
 
 @labour_router.put(
@@ -121,12 +122,12 @@ async def complete_labour(
     service: Annotated[LabourService, FromComponent(ComponentEnum.LABOUR)],
     auth_controller: Annotated[AuthController, FromComponent(ComponentEnum.DEFAULT)],
     credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
-) -> LabourResponse:
+) -> DataclassResponse:
     user = auth_controller.get_authenticated_user(credentials=credentials)
     labour = await service.complete_labour(
         birthing_person_id=user.id, end_time=request_data.end_time, notes=request_data.notes
     )
-    return LabourResponse(labour=labour)
+    return DataclassResponse({"labour": labour})
 
 
 @labour_router.delete(
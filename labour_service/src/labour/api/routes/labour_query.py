@@ -2,23 +2,34 @@ from typing import Annotated
 
 from dishka import FromComponent
 from dishka.integrations.fastapi import inject
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import StreamingResponse
 from fastapi.security import HTTPAuthorizationCredentials
 
 from src.api.dependencies import bearer_scheme
 from src.api.exception_handler import ExceptionSchema
+from src.api.responses import DataclassResponse
 from src.labour.api.schemas.responses.labour import (
     LabourListResponse,
     LabourResponse,
+    LabourStatisticsResponse,
     LabourSummaryResponse,
 )
-from src.labour.application.security.labour_authorization_service import LabourAuthorizationService
+from src.labour.application.services.labour_export_service import (
+    LabourExportFormat,
+    LabourExportService,
+)
 from src.labour.application.services.labour_query_service import LabourQueryService
 from src.setup.ioc.di_component_enum import ComponentEnum
 from src.user.infrastructure.auth.interfaces.controller import AuthController
 
 labour_query_router = APIRouter(prefix="/labour", tags=["Labour Queries"])
 
+EXPORT_MEDIA_TYPES = {
+    LabourExportFormat.CSV: "text/csv",
+    LabourExportFormat.NDJSON: "application/x-ndjson",
+}
+
 
 @labour_query_router.get(
     "/get-all",
@@ -37,10 +48,10 @@ async def get_all_labours(
     service: Annotated[LabourQueryService, FromComponent(ComponentEnum.LABOUR)],
     auth_controller: Annotated[AuthController, FromComponent(ComponentEnum.DEFAULT)],
     credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
-) -> LabourListResponse:
+) -> DataclassResponse:
     user = auth_controller.get_authenticated_user(credentials=credentials)
     labours = await service.get_all_labours(birthing_person_id=user.id)
-    return LabourListResponse(labours=labours)
+    return DataclassResponse({"labours": labours})
 
 
 @labour_query_router.get(
@@ -59,18 +70,76 @@ async def get_all_labours(
 async def get_labour_by_id(
     labour_id: str,
     service: Annotated[LabourQueryService, FromComponent(ComponentEnum.LABOUR)],
-    labour_authorization_service: Annotated[
-        LabourAuthorizationService, FromComponent(ComponentEnum.LABOUR)
-    ],
     auth_controller: Annotated[AuthController, FromComponent(ComponentEnum.DEFAULT)],
     credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
-) -> LabourResponse:
+) -> DataclassResponse:
+    user = auth_controller.get_authenticated_user(credentials=credentials)
+    labour = await service.get_accessible_labour(requester_id=user.id, labour_id=labour_id)
+    return DataclassResponse({"labour": labour})
+
+
+@labour_query_router.get(
+    "/statistics/{labour_id}",
+    responses={
+        status.HTTP_200_OK: {"model": LabourStatisticsResponse},
+        status.HTTP_400_BAD_REQUEST: {"model": ExceptionSchema},
+        status.HTTP_401_UNAUTHORIZED: {"model": ExceptionSchema},
+        status.HTTP_403_FORBIDDEN: {"model": ExceptionSchema},
+        status.HTTP_404_NOT_FOUND: {"model": ExceptionSchema},
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {"model": ExceptionSchema},
+    },
+    status_code=status.HTTP_200_OK,
+)
+@inject
+async def get_labour_statistics(
+    labour_id: str,
+    service: Annotated[LabourQueryService, FromComponent(ComponentEnum.LABOUR)],
+    auth_controller: Annotated[AuthController, FromComponent(ComponentEnum.DEFAULT)],
+    window_minutes: int | None = Query(default=None, ge=1),
+    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+) -> DataclassResponse:
     user = auth_controller.get_authenticated_user(credentials=credentials)
-    await labour_authorization_service.ensure_can_access_labour(
-        requester_id=user.id, labour_id=labour_id
+    statistics = await service.get_labour_statistics(
+        requester_id=user.id, labour_id=labour_id, window_minutes=window_minutes
+    )
+    return DataclassResponse({"statistics": statistics})
+
+
+@labour_query_router.get(
+    "/export/{labour_id}",
+    responses={
+        status.HTTP_200_OK: {
+            "content": {media_type: {} for media_type in EXPORT_MEDIA_TYPES.values()},
+            "description": "The contractions and labour updates of the labour",
+        },
+        status.HTTP_400_BAD_REQUEST: {"model": ExceptionSchema},
+        status.HTTP_401_UNAUTHORIZED: {"model": ExceptionSchema},
+        status.HTTP_403_FORBIDDEN: {"model": ExceptionSchema},
+        status.HTTP_404_NOT_FOUND: {"model": ExceptionSchema},
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {"model": ExceptionSchema},
+    },
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+)
+@inject
+async def export_labour(
+    labour_id: str,
+    service: Annotated[LabourExportService, FromComponent(ComponentEnum.LABOUR)],
+    auth_controller: Annotated[AuthController, FromComponent(ComponentEnum.DEFAULT)],
+    export_format: LabourExportFormat = Query(default=LabourExportFormat.CSV, alias="format"),
+    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+) -> StreamingResponse:
+    user = auth_controller.get_authenticated_user(credentials=credentials)
+    export = await service.export_labour(
+        requester_id=user.id, labour_id=labour_id, export_format=export_format
+    )
+    return StreamingResponse(
+        export,
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": f'attachment; filename="labour-{labour_id}.{export_format}"'
+        },
     )
-    labour = await service.get_labour_by_id(labour_id=labour_id)
-    return LabourResponse(labour=labour)
 
 
 @labour_query_router.get(
@@ -89,10 +158,10 @@ async def get_active_labour(
     service: Annotated[LabourQueryService, FromComponent(ComponentEnum.LABOUR)],
     auth_controller: Annotated[AuthController, FromComponent(ComponentEnum.DEFAULT)],
     credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
-) -> LabourResponse:
+) -> DataclassResponse:
     user = auth_controller.get_authenticated_user(credentials=credentials)
     labour = await service.get_active_labour(birthing_person_id=user.id)
-    return LabourResponse(labour=labour)
+    return DataclassResponse({"labour": labour})
 
 
 @labour_query_router.get(
@@ -111,7 +180,7 @@ async def get_active_labour_summary(
     service: Annotated[LabourQueryService, FromComponent(ComponentEnum.LABOUR)],
     auth_controller: Annotated[AuthController, FromComponent(ComponentEnum.DEFAULT)],
     credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
-) -> LabourSummaryResponse:
+) -> DataclassResponse:
     user = auth_controller.get_authenticated_user(credentials=credentials)
     labour = await service.get_active_labour_summary(birthing_person_id=user.id)
-    return LabourSummaryResponse(labour=labour)
+    return DataclassResponse({"labour": labour})
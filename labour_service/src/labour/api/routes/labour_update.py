@@ -7,6 +7,7 @@ from fastapi.security import HTTPAuthorizationCredentials
 
 from src.api.dependencies import bearer_scheme
 from src.api.exception_handler import ExceptionSchema
+from src.api.responses import DataclassResponse
 from src.labour.api.schemas.requests.labour_update import (
     DeleteLabourUpdateRequest,
     LabourUpdateRequest,
@@ -39,7 +40,7 @@ async def post_labour_update(
     service: Annotated[LabourService, FromComponent(ComponentEnum.LABOUR)],
     auth_controller: Annotated[AuthController, FromComponent(ComponentEnum.DEFAULT)],
     credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
-) -> LabourResponse:
+) -> DataclassResponse:
     user = auth_controller.get_authenticated_user(credentials=credentials)
     labour = await service.post_labour_update(
         birthing_person_id=user.id,
@@ -47,7 +48,7 @@ async def post_labour_update(
         message=request_data.message,
         sent_time=request_data.sent_time,
     )
-    return LabourResponse(labour=labour)
+    return DataclassResponse({"labour": labour})
 
 
 @labour_update_router.put(
@@ -67,7 +68,7 @@ async def update_labour_update(
     service: Annotated[LabourService, FromComponent(ComponentEnum.LABOUR)],
     auth_controller: Annotated[AuthController, FromComponent(ComponentEnum.DEFAULT)],
     credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
-) -> LabourResponse:
+) -> DataclassResponse:
     user = auth_controller.get_authenticated_user(credentials=credentials)
     labour = await service.update_labour_update(
         birthing_person_id=user.id,
@@ -75,7 +76,7 @@ async def update_labour_update(
         labour_update_type=request_data.labour_update_type,
         message=request_data.message,
     )
-    return LabourResponse(labour=labour)
+    return DataclassResponse({"labour": labour})
 
 
 @labour_update_router.delete(
@@ -95,10 +96,10 @@ async def delete_labour_update(
     service: Annotated[LabourService, FromComponent(ComponentEnum.LABOUR)],
     auth_controller: Annotated[AuthController, FromComponent(ComponentEnum.DEFAULT)],
     credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
-) -> LabourResponse:
+) -> DataclassResponse:
     user = auth_controller.get_authenticated_user(credentials=credentials)
     labour = await service.delete_labour_update(
         birthing_person_id=user.id,
         labour_update_id=request_data.labour_update_id,
     )
-    return LabourResponse(labour=labour)
+    return DataclassResponse({"labour": labour})
@@ -1,6 +1,8 @@
 from datetime import datetime
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+CONTRACTION_IMPORT_MAX_BATCH_SIZE = 500
 
 
 class StartContractionRequest(BaseModel):
@@ -25,3 +27,17 @@ class UpdateContractionRequest(BaseModel):
 
 class DeleteContractionRequest(BaseModel):
     contraction_id: str
+
+
+class ImportedContractionRequest(BaseModel):
+    contraction_id: str
+    start_time: datetime
+    end_time: datetime
+    intensity: int
+    notes: str | None = None
+
+
+class ImportContractionsRequest(BaseModel):
+    contractions: list[ImportedContractionRequest] = Field(
+        min_length=1, max_length=CONTRACTION_IMPORT_MAX_BATCH_SIZE
+    )
@@ -1,6 +1,7 @@
 from pydantic import BaseModel
 
 from src.labour.application.dtos.labour import LabourDTO
+from src.labour.application.dtos.labour_statistics import LabourStatisticsDTO
 from src.labour.application.dtos.labour_summary import LabourSummaryDTO
 
 
@@ -12,6 +13,10 @@ class LabourSummaryResponse(BaseModel):
     labour: LabourSummaryDTO
 
 
+class LabourStatisticsResponse(BaseModel):
+    statistics: LabourStatisticsDTO
+
+
 class LabourListResponse(BaseModel):
     labours: list[LabourDTO]
 
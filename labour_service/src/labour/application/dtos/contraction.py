@@ -5,7 +5,7 @@ from typing import Any, Self
 from src.labour.domain.contraction.entity import Contraction
 
 
-@dataclass
+@dataclass(slots=True)
 class ContractionDTO:
     """Data Transfer Object for Contraction entity"""
 
@@ -44,3 +44,14 @@ class ContractionDTO:
             "notes": self.notes,
             "is_active": self.is_active,
         }
+
+
+@dataclass(slots=True)
+class ImportedContractionDTO:
+    """Data Transfer Object for a completed contraction recorded by the client"""
+
+    id: str
+    start_time: datetime
+    end_time: datetime
+    intensity: int
+    notes: str | None = None
@@ -28,7 +28,7 @@ RECOMMENDATION_TYPE_TO_FUNCTION = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class LabourDTO:
     """Data Transfer Object for Labour aggregate"""
 
@@ -0,0 +1,226 @@
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any, Self
+
+import numpy as np
+import numpy.typing as npt
+
+from src.labour.domain.contraction.entity import Contraction
+from src.labour.domain.labour.constants import (
+    ACTIVE_PHASE_MIN_DURATION_MINUTES,
+    ACTIVE_PHASE_MIN_INTENSITY,
+    PHASE_SAMPLE_CONTRACTION_SIZE,
+    TRANSITION_PHASE_MIN_DURATION_MINUTES,
+    TRANSITION_PHASE_MIN_INTENSITY,
+)
+from src.labour.domain.labour.entity import Labour
+from src.labour.domain.labour.enums import LabourPhase
+
+FloatArray = npt.NDArray[np.float64]
+
+SECONDS_PER_MINUTE = 60
+SECONDS_PER_HOUR = 3600
+FREQUENCY_PERIOD_SECONDS = 600
+
+
+@dataclass(slots=True)
+class ContractionColumns:
+    """
+    The completed contractions of a labour as columns, ordered by start time.
+
+    Times are seconds since the epoch, and intensities are NaN where none was recorded.
+    """
+
+    start: FloatArray
+    end: FloatArray
+    intensity: FloatArray
+
+    @classmethod
+    def from_contractions(cls, contractions: list[Contraction]) -> Self:
+        rows = np.array(
+            [
+                (
+                    contraction.start_time.timestamp(),
+                    contraction.end_time.timestamp(),
+                    np.nan if contraction.intensity is None else contraction.intensity,
+                )
+                for contraction in contractions
+                if not contraction.is_active
+            ],
+            dtype=np.float64,
+        ).reshape(-1, 3)
+        rows = rows[np.argsort(rows[:, 0], kind="stable")]
+        return cls(start=rows[:, 0], end=rows[:, 1], intensity=rows[:, 2])
+
+    def since(self, timestamp: float) -> Self:
+        first = int(np.searchsorted(self.start, timestamp))
+        return type(self)(
+            start=self.start[first:], end=self.end[first:], intensity=self.intensity[first:]
+        )
+
+
+@dataclass(slots=True)
+class DistributionDTO:
+    """Mean, median and 90th percentile of a set of values, in seconds"""
+
+    mean: float
+    median: float
+    p90: float
+
+    @classmethod
+    def from_values(cls, values: FloatArray) -> Self | None:
+        if not values.size:
+            return None
+        median, p90 = np.percentile(values, (50, 90))
+        return cls(
+            mean=round(float(values.mean()), 1),
+            median=round(float(median), 1),
+            p90=round(float(p90), 1),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert DTO to dictionary for JSON serialization"""
+        return {"mean": self.mean, "median": self.median, "p90": self.p90}
+
+
+@dataclass(slots=True)
+class PhaseChangeDTO:
+    """Data Transfer Object for the time a labour entered a phase"""
+
+    phase: str
+    start_time: datetime
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert DTO to dictionary for JSON serialization"""
+        return {"phase": self.phase, "start_time": self.start_time.isoformat()}
+
+
+def _rolling_mean(values: FloatArray, size: int) -> FloatArray:
+    """The mean of each value and up to `size - 1` values before it."""
+    cumulative = np.cumsum(values)
+    sums = cumulative.copy()
+    sums[size:] -= cumulative[:-size]
+    means: FloatArray = sums / np.minimum(np.arange(1, values.size + 1), size)
+    return means
+
+
+def _phase_timeline(labour: Labour, columns: ContractionColumns) -> list[PhaseChangeDTO]:
+    """
+    When the labour entered each phase.
+
+    The active and transition phases are reached at the end of the first contraction after
+    which UpdateLabourPhaseService would move the labour into them.
+    """
+    timeline = []
+    if labour.start_time:
+        timeline.append(PhaseChangeDTO(phase=LabourPhase.EARLY.value, start_time=labour.start_time))
+
+    if columns.start.size:
+        intensity = _rolling_mean(np.nan_to_num(columns.intensity), PHASE_SAMPLE_CONTRACTION_SIZE)
+        duration = _rolling_mean(
+            (columns.end - columns.start) / SECONDS_PER_MINUTE, PHASE_SAMPLE_CONTRACTION_SIZE
+        )
+        transition = (intensity >= TRANSITION_PHASE_MIN_INTENSITY) & (
+            duration >= TRANSITION_PHASE_MIN_DURATION_MINUTES
+        )
+        active = transition | (
+            (intensity >= ACTIVE_PHASE_MIN_INTENSITY)
+            & (duration >= ACTIVE_PHASE_MIN_DURATION_MINUTES)
+        )
+        for phase, reached in ((LabourPhase.ACTIVE, active), (LabourPhase.TRANSITION, transition)):
+            if reached.any():
+                reached_at = columns.end[int(reached.argmax())]
+                timeline.append(
+                    PhaseChangeDTO(
+                        phase=phase.value, start_time=datetime.fromtimestamp(reached_at, UTC)
+                    )
+                )
+
+    if labour.end_time:
+        timeline.append(
+            PhaseChangeDTO(phase=LabourPhase.COMPLETE.value, start_time=labour.end_time)
+        )
+    return timeline
+
+
+@dataclass(slots=True)
+class LabourStatisticsDTO:
+    """
+    Statistics over the completed contractions of a labour within a window.
+
+    The window ends when the labour ended, or now for active labours, and covers the whole
+    labour unless a length is given. Intervals are measured from the start of one contraction
+    to the start of the next, and gaps from the end of one to the start of the next.
+    """
+
+    labour_id: str
+    window_start: datetime | None
+    window_end: datetime
+    contraction_count: int
+    contractions_per_10_minutes: float | None
+    duration: DistributionDTO | None
+    interval: DistributionDTO | None
+    gap: DistributionDTO | None
+    regularity: float | None
+    mean_intensity: float | None
+    intensity_trend_per_hour: float | None
+    phase_timeline: list[PhaseChangeDTO]
+
+    @classmethod
+    def from_domain(cls, labour: Labour, window: timedelta | None = None) -> Self:
+        """Create DTO from domain aggregate"""
+        window_end = labour.end_time or datetime.now(UTC)
+        window_start = window_end - window if window else None
+
+        all_columns = ContractionColumns.from_contractions(labour.contractions)
+        columns = all_columns.since(window_start.timestamp()) if window_start else all_columns
+
+        intervals = np.diff(columns.start)
+        gaps = columns.start[1:] - columns.end[:-1]
+        mean_interval = float(intervals.mean()) if intervals.size else 0.0
+
+        regularity = None
+        if intervals.size > 1 and mean_interval > 0:
+            regularity = round(float(intervals.std() / mean_interval), 3)
+
+        intensity_recorded = ~np.isnan(columns.intensity)
+        intensities = columns.intensity[intensity_recorded]
+        intensity_times = columns.start[intensity_recorded]
+        intensity_trend = None
+        if intensities.size > 1 and np.ptp(intensity_times) > 0:
+            hours = (intensity_times - intensity_times[0]) / SECONDS_PER_HOUR
+            intensity_trend = round(float(np.polyfit(hours, intensities, 1)[0]), 3)
+
+        return cls(
+            labour_id=str(labour.id_.value),
+            window_start=window_start,
+            window_end=window_end,
+            contraction_count=int(columns.start.size),
+            contractions_per_10_minutes=(
+                round(FREQUENCY_PERIOD_SECONDS / mean_interval, 2) if mean_interval > 0 else None
+            ),
+            duration=DistributionDTO.from_values(columns.end - columns.start),
+            interval=DistributionDTO.from_values(intervals),
+            gap=DistributionDTO.from_values(gaps),
+            regularity=regularity,
+            mean_intensity=round(float(intensities.mean()), 2) if intensities.size else None,
+            intensity_trend_per_hour=intensity_trend,
+            phase_timeline=_phase_timeline(labour, all_columns),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert DTO to dictionary for JSON serialization"""
+        return {
+            "labour_id": self.labour_id,
+            "window_start": self.window_start.isoformat() if self.window_start else None,
+            "window_end": self.window_end.isoformat(),
+            "contraction_count": self.contraction_count,
+            "contractions_per_10_minutes": self.contractions_per_10_minutes,
+            "duration": self.duration.to_dict() if self.duration else None,
+            "interval": self.interval.to_dict() if self.interval else None,
+            "gap": self.gap.to_dict() if self.gap else None,
+            "regularity": self.regularity,
+            "mean_intensity": self.mean_intensity,
+            "intensity_trend_per_hour": self.intensity_trend_per_hour,
+            "phase_timeline": [phase_change.to_dict() for phase_change in self.phase_timeline],
+        }
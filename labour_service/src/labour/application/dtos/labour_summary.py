@@ -6,7 +6,7 @@ from src.labour.domain.labour.entity import Labour
 from src.labour.domain.labour.services.should_go_to_hospital import ShouldGoToHospitalService
 
 
-@dataclass
+@dataclass(slots=True)
 class LabourSummaryDTO:
     """Data Transfer Object for Labour aggregate"""
 
@@ -28,7 +28,7 @@ class LabourSummaryDTO:
         return cls(
             id=str(labour.id_.value),
             duration=duration,
-            contraction_count=len(labour.contractions),
+            contraction_count=labour.contraction_count,
             current_phase=labour.current_phase.value,
             hospital_recommended=hospital_recommended,
         )
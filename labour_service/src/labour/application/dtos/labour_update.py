@@ -5,7 +5,7 @@ from typing import Any, Self
 from src.labour.domain.labour_update.entity import LabourUpdate
 
 
-@dataclass
+@dataclass(slots=True)
 class LabourUpdateDTO:
     """Data Transfer Object for Labour Update entity"""
 
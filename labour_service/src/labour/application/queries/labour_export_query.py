@@ -0,0 +1,33 @@
+from collections.abc import AsyncIterator
+from typing import Protocol
+
+from src.labour.application.dtos.contraction import ContractionDTO
+from src.labour.application.dtos.labour_update import LabourUpdateDTO
+
+
+class LabourExportQuery(Protocol):
+    """Read-only query streaming the history of a labour, without loading the Labour aggregate."""
+
+    def stream_contractions(self, labour_id: str) -> AsyncIterator[ContractionDTO]:
+        """
+        Stream the contractions of a labour, oldest first.
+
+        Args:
+            labour_id: The ID of the labour to stream contractions for
+
+        Returns:
+            An async iterator over the contractions of the labour
+        """
+        ...
+
+    def stream_labour_updates(self, labour_id: str) -> AsyncIterator[LabourUpdateDTO]:
+        """
+        Stream the labour updates of a labour, oldest first.
+
+        Args:
+            labour_id: The ID of the labour to stream labour updates for
+
+        Returns:
+            An async iterator over the labour updates of the labour
+        """
+        ...
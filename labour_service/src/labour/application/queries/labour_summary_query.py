@@ -0,0 +1,18 @@
+from typing import Protocol
+
+from src.labour.application.dtos.labour_summary import LabourSummaryDTO
+
+
+class LabourSummaryQuery(Protocol):
+    """Read-only query for labour summaries, computed without loading the Labour aggregate."""
+
+    async def get_active_labour_summary(self, birthing_person_id: str) -> LabourSummaryDTO | None:
+        """
+        Retrieve a summary of the active labour for a Birthing Person.
+
+        Args:
+            birthing_person_id: The Birthing Person ID to retrieve the summary for
+
+        Returns:
+            The labour summary if an active labour exists, None otherwise
+        """
@@ -1,6 +1,7 @@
 import logging
 from uuid import UUID
 
+from src.core.infrastructure.security.authorization_cache.interface import AuthorizationCache
 from src.labour.domain.labour.exceptions import InvalidLabourId, UnauthorizedLabourRequest
 from src.labour.domain.labour.repository import LabourRepository
 from src.labour.domain.labour.value_objects.labour_id import LabourId
@@ -8,6 +9,8 @@ from src.user.domain.value_objects.user_id import UserId
 
 log = logging.getLogger(__name__)
 
+BIRTHING_PERSON_ACCESS_RULE = "labour:birthing_person"
+
 
 class LabourAuthorizationService:
     """
@@ -15,8 +18,11 @@ class LabourAuthorizationService:
     Methods raise specific Unauthorized exceptions if the check fails.
     """
 
-    def __init__(self, labour_repository: LabourRepository):
+    def __init__(
+        self, labour_repository: LabourRepository, authorization_cache: AuthorizationCache
+    ):
         self._labour_repository = labour_repository
+        self._authorization_cache = authorization_cache
 
     async def ensure_can_access_labour(self, requester_id: str, labour_id: str) -> None:
         """
@@ -30,6 +36,12 @@ class LabourAuthorizationService:
         except ValueError:
             raise InvalidLabourId()
 
+        cache_key = str(labour_domain_id.value)
+        if self._authorization_cache.is_allowed(
+            rule=BIRTHING_PERSON_ACCESS_RULE, requester_id=requester_id, labour_id=cache_key
+        ):
+            return
+
         labour_birthing_person_id = await self._labour_repository.get_birthing_person_id_for_labour(
             labour_id=labour_domain_id
         )
@@ -37,3 +49,7 @@ class LabourAuthorizationService:
         if labour_birthing_person_id != requester_domain_id:
             log.warning(f"User {requester_id} unauthorized to access labour {labour_id}")
             raise UnauthorizedLabourRequest()
+
+        self._authorization_cache.allow(
+            rule=BIRTHING_PERSON_ACCESS_RULE, requester_id=requester_id, labour_id=cache_key
+        )
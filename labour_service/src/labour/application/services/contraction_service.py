@@ -6,10 +6,15 @@ from fern_labour_core.unit_of_work import UnitOfWork
 
 from src.core.application.domain_event_publisher import DomainEventPublisher
 from src.core.domain.domain_event.repository import DomainEventRepository
+from src.labour.application.dtos.contraction import ImportedContractionDTO
 from src.labour.application.dtos.labour import LabourDTO
+from src.labour.domain.contraction.entity import Contraction
 from src.labour.domain.contraction.exceptions import ContractionIdInvalid
 from src.labour.domain.contraction.services.delete_contraction import DeleteContractionService
 from src.labour.domain.contraction.services.end_contraction import EndContractionService
+from src.labour.domain.contraction.services.import_contractions import (
+    ImportContractionsService,
+)
 from src.labour.domain.contraction.services.start_contraction import StartContractionService
 from src.labour.domain.contraction.services.update_contraction import UpdateContractionService
 from src.labour.domain.contraction.value_objects.contraction_id import ContractionId
@@ -34,9 +39,18 @@ class ContractionService:
         self._unit_of_work = unit_of_work
         self._domain_event_publisher = domain_event_publisher
 
-    async def _get_labour(self, birthing_person_id: str) -> Labour:
+    async def _get_labour(
+        self, birthing_person_id: str, recent_contractions_only: bool = False
+    ) -> Labour:
         domain_id = UserId(birthing_person_id)
-        labour = await self._labour_repository.get_active_labour_by_birthing_person_id(domain_id)
+        if recent_contractions_only:
+            labour = await self._labour_repository.get_active_labour_with_recent_contractions(
+                domain_id
+            )
+        else:
+            labour = await self._labour_repository.get_active_labour_by_birthing_person_id(
+                domain_id
+            )
         if not labour:
             raise UserDoesNotHaveActiveLabour(user_id=birthing_person_id)
         return labour
@@ -47,8 +61,12 @@ class ContractionService:
         intensity: int | None = None,
         start_time: datetime | None = None,
         notes: str | None = None,
+        recent_contractions_only: bool = False,
     ) -> LabourDTO:
-        labour = await self._get_labour(birthing_person_id=birthing_person_id)
+        labour = await self._get_labour(
+            birthing_person_id=birthing_person_id,
+            recent_contractions_only=recent_contractions_only,
+        )
 
         labour = StartContractionService().start_contraction(
             labour=labour, intensity=intensity, start_time=start_time, notes=notes
@@ -68,8 +86,12 @@ class ContractionService:
         intensity: int,
         end_time: datetime | None = None,
         notes: str | None = None,
+        recent_contractions_only: bool = False,
     ) -> LabourDTO:
-        labour = await self._get_labour(birthing_person_id=birthing_person_id)
+        labour = await self._get_labour(
+            birthing_person_id=birthing_person_id,
+            recent_contractions_only=recent_contractions_only,
+        )
 
         labour = EndContractionService().end_contraction(
             labour=labour, intensity=intensity, end_time=end_time, notes=notes
@@ -133,3 +155,35 @@ class ContractionService:
         self._domain_event_publisher.publish_batch_in_background()
 
         return LabourDTO.from_domain(labour)
+
+    async def import_contractions(
+        self, birthing_person_id: str, contractions: list[ImportedContractionDTO]
+    ) -> LabourDTO:
+        labour = await self._get_labour(birthing_person_id=birthing_person_id)
+
+        imported_contractions: list[Contraction] = []
+        for imported in contractions:
+            try:
+                contraction_id = UUID(imported.id)
+            except ValueError:
+                raise ContractionIdInvalid(contraction_id=imported.id)
+
+            contraction = Contraction.start(
+                labour_id=labour.id_,
+                start_time=imported.start_time,
+                contraction_id=contraction_id,
+                notes=imported.notes,
+            )
+            contraction.end(end_time=imported.end_time, intensity=imported.intensity)
+            imported_contractions.append(contraction)
+
+        labour = ImportContractionsService().import_contractions(
+            labour=labour, contractions=imported_contractions
+        )
+        async with self._unit_of_work:
+            await self._labour_repository.save(labour)
+            await self._domain_event_repository.save_many(labour.clear_domain_events())
+
+        self._domain_event_publisher.publish_batch_in_background()
+
+        return LabourDTO.from_domain(labour)
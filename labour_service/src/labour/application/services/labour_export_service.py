@@ -0,0 +1,127 @@
+import csv
+import io
+import logging
+from collections.abc import AsyncIterator
+from enum import StrEnum
+from typing import Any
+from uuid import UUID
+
+import orjson
+
+from src.labour.application.queries.labour_export_query import LabourExportQuery
+from src.labour.domain.labour.exceptions import InvalidLabourId, UnauthorizedLabourRequest
+from src.labour.domain.labour.repository import LabourRepository
+from src.labour.domain.labour.value_objects.labour_id import LabourId
+from src.user.domain.value_objects.user_id import UserId
+
+log = logging.getLogger(__name__)
+
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+CSV_COLUMNS = (
+    "record_type",
+    "id",
+    "labour_id",
+    "start_time",
+    "end_time",
+    "duration",
+    "intensity",
+    "notes",
+    "is_active",
+    "labour_update_type",
+    "message",
+    "sent_time",
+    "edited",
+    "application_generated",
+)
+
+# Spreadsheet applications evaluate cells starting with these as formulas
+CSV_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+class LabourExportFormat(StrEnum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
+def _csv_cell(value: Any) -> Any:
+    if isinstance(value, str) and value.startswith(CSV_FORMULA_PREFIXES):
+        return f"'{value}"
+    return value
+
+
+class LabourExportService:
+    """
+    Exports the contractions and labour updates of a labour as CSV or JSON lines.
+
+    Records are streamed from the database and written in chunks of roughly
+    `EXPORT_CHUNK_SIZE` characters, so memory use does not grow with the length of the labour.
+    """
+
+    def __init__(self, labour_repository: LabourRepository, labour_export_query: LabourExportQuery):
+        self._labour_repository = labour_repository
+        self._labour_export_query = labour_export_query
+
+    async def export_labour(
+        self, requester_id: str, labour_id: str, export_format: LabourExportFormat
+    ) -> AsyncIterator[str]:
+        """
+        Check the requester owns the labour, then return an iterator over the export.
+
+        The check happens before the first chunk is requested, so errors can still be
+        returned as a response instead of interrupting the stream.
+        """
+        try:
+            domain_id = LabourId(UUID(labour_id))
+        except ValueError:
+            raise InvalidLabourId()
+
+        birthing_person_id = await self._labour_repository.get_birthing_person_id_for_labour(
+            labour_id=domain_id
+        )
+        if birthing_person_id != UserId(requester_id):
+            log.warning(f"User {requester_id} unauthorized to export labour {labour_id}")
+            raise UnauthorizedLabourRequest()
+
+        return self._chunks(self._render(labour_id, export_format))
+
+    async def _records(self, labour_id: str) -> AsyncIterator[dict[str, Any]]:
+        async for contraction in self._labour_export_query.stream_contractions(labour_id):
+            yield {"record_type": "contraction", **contraction.to_dict()}
+        async for labour_update in self._labour_export_query.stream_labour_updates(labour_id):
+            yield {"record_type": "labour_update", **labour_update.to_dict()}
+
+    async def _render(
+        self, labour_id: str, export_format: LabourExportFormat
+    ) -> AsyncIterator[str]:
+        if export_format is LabourExportFormat.NDJSON:
+            async for record in self._records(labour_id):
+                yield orjson.dumps(record).decode() + "\n"
+            return
+
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=CSV_COLUMNS)
+
+        def flush() -> str:
+            written = buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            return written
+
+        writer.writeheader()
+        yield flush()
+        async for record in self._records(labour_id):
+            writer.writerow({key: _csv_cell(value) for key, value in record.items()})
+            yield flush()
+
+    async def _chunks(self, lines: AsyncIterator[str]) -> AsyncIterator[str]:
+        chunk: list[str] = []
+        size = 0
+        async for line in lines:
+            chunk.append(line)
+            size += len(line)
+            if size >= EXPORT_CHUNK_SIZE:
+                yield "".join(chunk)
+                chunk, size = [], 0
+        if chunk:
+            yield "".join(chunk)
@@ -1,13 +1,17 @@
 import logging
+from datetime import timedelta
 from uuid import UUID
 
 from src.labour.application.dtos.labour import LabourDTO
+from src.labour.application.dtos.labour_statistics import LabourStatisticsDTO
 from src.labour.application.dtos.labour_summary import LabourSummaryDTO
+from src.labour.application.queries.labour_summary_query import LabourSummaryQuery
 from src.labour.domain.labour.entity import Labour
 from src.labour.domain.labour.exceptions import (
     InvalidLabourId,
     LabourAlreadyCompleted,
     LabourNotFoundById,
+    UnauthorizedLabourRequest,
 )
 from src.labour.domain.labour.repository import LabourRepository
 from src.labour.domain.labour.services.can_accept_subscriber import CanAcceptSubscriberService
@@ -19,8 +23,11 @@ log = logging.getLogger(__name__)
 
 
 class LabourQueryService:
-    def __init__(self, labour_repository: LabourRepository):
+    def __init__(
+        self, labour_repository: LabourRepository, labour_summary_query: LabourSummaryQuery
+    ):
         self._labour_repository = labour_repository
+        self._labour_summary_query = labour_summary_query
 
     async def _get_active_labour(self, birthing_person_id: str) -> Labour:
         domain_id = UserId(birthing_person_id)
@@ -50,13 +57,48 @@ class LabourQueryService:
             raise LabourNotFoundById(labour_id=labour_id)
         return LabourDTO.from_domain(labour)
 
+    async def get_accessible_labour(self, requester_id: str, labour_id: str) -> LabourDTO:
+        try:
+            domain_id = LabourId(UUID(labour_id))
+        except ValueError:
+            raise InvalidLabourId()
+
+        labour = await self._labour_repository.get_accessible_labour(
+            labour_id=domain_id, requester_id=UserId(requester_id)
+        )
+        if not labour:
+            log.warning(f"User {requester_id} unauthorized to access labour {labour_id}")
+            raise UnauthorizedLabourRequest()
+        return LabourDTO.from_domain(labour)
+
+    async def get_labour_statistics(
+        self, requester_id: str, labour_id: str, window_minutes: int | None = None
+    ) -> LabourStatisticsDTO:
+        try:
+            domain_id = LabourId(UUID(labour_id))
+        except ValueError:
+            raise InvalidLabourId()
+
+        labour = await self._labour_repository.get_accessible_labour(
+            labour_id=domain_id, requester_id=UserId(requester_id)
+        )
+        if not labour:
+            log.warning(f"User {requester_id} unauthorized to access labour {labour_id}")
+            raise UnauthorizedLabourRequest()
+        window = timedelta(minutes=window_minutes) if window_minutes else None
+        return LabourStatisticsDTO.from_domain(labour, window=window)
+
     async def get_active_labour(self, birthing_person_id: str) -> LabourDTO:
         labour = await self._get_active_labour(birthing_person_id=birthing_person_id)
         return LabourDTO.from_domain(labour)
 
     async def get_active_labour_summary(self, birthing_person_id: str) -> LabourSummaryDTO:
-        labour = await self._get_active_labour(birthing_person_id=birthing_person_id)
-        return LabourSummaryDTO.from_domain(labour)
+        summary = await self._labour_summary_query.get_active_labour_summary(
+            birthing_person_id=birthing_person_id
+        )
+        if not summary:
+            raise UserDoesNotHaveActiveLabour(user_id=birthing_person_id)
+        return summary
 
     async def get_active_labour_id(self, birthing_person_id: str) -> str:
         domain_id = UserId(birthing_person_id)
@@ -6,6 +6,7 @@ from fern_labour_core.unit_of_work import UnitOfWork
 
 from src.core.application.domain_event_publisher import DomainEventPublisher
 from src.core.domain.domain_event.repository import DomainEventRepository
+from src.core.infrastructure.security.authorization_cache.interface import AuthorizationCache
 from src.labour.application.dtos.labour import LabourDTO
 from src.labour.application.exceptions import InvalidLabourUpdateRequest
 from src.labour.domain.labour.entity import Labour
@@ -38,11 +39,13 @@ class LabourService:
         domain_event_repository: DomainEventRepository,
         unit_of_work: UnitOfWork,
         domain_event_publisher: DomainEventPublisher,
+        authorization_cache: AuthorizationCache,
     ):
         self._labour_repository = labour_repository
         self._domain_event_repository = domain_event_repository
         self._unit_of_work = unit_of_work
         self._domain_event_publisher = domain_event_publisher
+        self._authorization_cache = authorization_cache
 
     async def _get_labour(self, birthing_person_id: str) -> Labour:
         domain_id = UserId(birthing_person_id)
@@ -239,5 +242,6 @@ class LabourService:
             await self._domain_event_repository.save_many(labour.clear_domain_events())
 
         self._domain_event_publisher.publish_batch_in_background()
+        self._authorization_cache.invalidate_labour(labour_id=str(labour_domain_id.value))
 
         return None
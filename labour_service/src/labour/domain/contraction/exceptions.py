@@ -43,3 +43,13 @@ class CannotUpdateActiveContraction(DomainError):
 class CannotDeleteActiveContraction(DomainError):
     def __init__(self) -> None:
         super().__init__("Cannot delete active contraction. Complete the contraction first.")
+
+
+class CannotImportActiveContraction(DomainError):
+    def __init__(self) -> None:
+        super().__init__("Cannot import active contraction. Contractions must be completed.")
+
+
+class ImportedContractionsOverlapping(DomainError):
+    def __init__(self) -> None:
+        super().__init__("Imported contractions overlap with each other or existing contractions.")
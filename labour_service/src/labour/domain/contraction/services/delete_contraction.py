@@ -13,20 +13,13 @@ class DeleteContractionService:
         if labour.current_phase == LabourPhase.COMPLETE:
             raise LabourAlreadyCompleted()
 
-        contraction = next(
-            (
-                contraction
-                for contraction in labour.contractions
-                if contraction.id_ == contraction_id
-            ),
-            None,
-        )
+        contraction = labour.get_contraction(contraction_id)
         if not contraction:
             raise ContractionNotFoundById(contraction_id=contraction_id.value)
 
         if contraction.is_active:
             raise CannotDeleteActiveContraction()
 
-        labour.contractions.remove(contraction)
+        labour.remove_contraction(contraction)
 
         return labour
@@ -0,0 +1,60 @@
+from datetime import UTC, datetime
+
+from src.labour.domain.contraction.entity import Contraction
+from src.labour.domain.contraction.exceptions import (
+    CannotImportActiveContraction,
+    ImportedContractionsOverlapping,
+)
+from src.labour.domain.labour.entity import Labour
+from src.labour.domain.labour.enums import LabourPhase
+from src.labour.domain.labour.exceptions import LabourAlreadyCompleted
+from src.labour.domain.labour.services.update_labour_phase import UpdateLabourPhaseService
+
+
+class ImportContractionsService:
+    def import_contractions(self, labour: Labour, contractions: list[Contraction]) -> Labour:
+        """
+        Import a batch of completed contractions recorded while the client was offline.
+
+        Contractions whose ids already exist on the labour (or appear earlier in the batch)
+        are skipped so that a client can safely retry a sync. Ordering and overlap are
+        validated once over the merged set, and the labour phase is recalculated once
+        after all contractions have been added.
+        """
+        if labour.current_phase is LabourPhase.COMPLETE:
+            raise LabourAlreadyCompleted()
+
+        seen_ids = {contraction.id_ for contraction in labour.contractions}
+        new_contractions: list[Contraction] = []
+        for contraction in contractions:
+            if contraction.id_ in seen_ids:
+                continue
+            if contraction.is_active:
+                raise CannotImportActiveContraction()
+            seen_ids.add(contraction.id_)
+            new_contractions.append(contraction)
+
+        if not new_contractions:
+            return labour
+
+        if self._has_overlapping_contractions([*labour.contractions, *new_contractions]):
+            raise ImportedContractionsOverlapping()
+
+        labour.import_contractions(contractions=new_contractions)
+
+        return UpdateLabourPhaseService().update_labour_phase(labour)
+
+    def _has_overlapping_contractions(self, contractions: list[Contraction]) -> bool:
+        """
+        Sweep the contractions in start time order, tracking the latest end time seen so far.
+        An active contraction has no end yet, so it overlaps anything that starts after it.
+        """
+        latest_end_time: datetime | None = None
+        for contraction in sorted(contractions, key=lambda c: c.start_time):
+            if latest_end_time and contraction.start_time < latest_end_time:
+                return True
+            end_time = (
+                datetime.max.replace(tzinfo=UTC) if contraction.is_active else contraction.end_time
+            )
+            latest_end_time = max(latest_end_time, end_time) if latest_end_time else end_time
+        return False
@@ -26,14 +26,7 @@ class UpdateContractionService:
         if labour.current_phase == LabourPhase.COMPLETE:
             raise LabourAlreadyCompleted()
 
-        contraction = next(
-            (
-                contraction
-                for contraction in labour.contractions
-                if contraction.id_ == contraction_id
-            ),
-            None,
-        )
+        contraction = labour.get_contraction(contraction_id)
         if not contraction:
             raise ContractionNotFoundById(contraction_id=contraction_id.value)
 
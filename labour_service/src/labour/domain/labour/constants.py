@@ -1,3 +1,5 @@
+from src.labour.domain.contraction.constants import CONTRACTION_MAX_IN_10_MINS
+
 SAMPLE_CONTRACTION_SIZE = 4
 
 CONTRACTIONS_REQUIRED_NULLIPAROUS = 20
@@ -7,3 +9,20 @@ TIME_BETWEEN_CONTRACTIONS_NULLIPAROUS = 3
 TIME_BETWEEN_CONTRACTIONS_PAROUS = 5
 
 LENGTH_OF_CONTRACTIONS_MINUTES = 1
+
+# Labour phases are estimated from the average of the most recent contractions
+PHASE_SAMPLE_CONTRACTION_SIZE = 5
+ACTIVE_PHASE_MIN_INTENSITY = 6
+ACTIVE_PHASE_MIN_DURATION_MINUTES = 1
+TRANSITION_PHASE_MIN_INTENSITY = 8
+TRANSITION_PHASE_MIN_DURATION_MINUTES = 1.5
+
+# The labour rules only look at this many of the most recent contractions, so a labour loaded
+# with these and a summary of the rest gives the same results as one loaded with all of them
+RECENT_CONTRACTIONS_REQUIRED = max(
+    CONTRACTIONS_REQUIRED_NULLIPAROUS,
+    CONTRACTIONS_REQUIRED_PAROUS,
+    SAMPLE_CONTRACTION_SIZE,
+    PHASE_SAMPLE_CONTRACTION_SIZE,
+    CONTRACTION_MAX_IN_10_MINS,
+)
@@ -7,8 +7,10 @@ from fern_labour_core.aggregate_root import AggregateRoot
 
 from src.labour.domain.contraction.entity import Contraction
 from src.labour.domain.contraction.events import ContractionEnded, ContractionStarted
+from src.labour.domain.contraction.value_objects.contraction_id import ContractionId
 from src.labour.domain.labour.enums import LabourPhase
 from src.labour.domain.labour.exceptions import LabourUpdateNotFoundById
+from src.labour.domain.labour.value_objects.earlier_contractions import EarlierContractions
 from src.labour.domain.labour.value_objects.labour_id import LabourId
 from src.labour.domain.labour_update.entity import LabourUpdate
 from src.labour.domain.labour_update.enums import LabourUpdateType
@@ -16,6 +18,58 @@ from src.labour.domain.labour_update.value_objects.labour_update_id import Labou
 from src.user.domain.value_objects.user_id import UserId
 
 
+@dataclass
+class _LabourIndex:
+    """
+    Lookups over the contractions and updates of a labour.
+
+    An index is only valid for the lists it was built from, and while they keep the length it
+    has indexed, so it is rebuilt when the ORM loads new lists or the lists are changed other
+    than through `Labour`.
+    """
+
+    contractions: list[Contraction]
+    labour_updates: list[LabourUpdate]
+    contractions_by_id: dict[ContractionId, Contraction]
+    labour_updates_by_id: dict[LabourUpdateId, LabourUpdate]
+    active_contraction: Contraction | None
+    last_announcement_time: datetime | None
+
+    @classmethod
+    def build(cls, contractions: list[Contraction], labour_updates: list[LabourUpdate]) -> Self:
+        return cls(
+            contractions=contractions,
+            labour_updates=labour_updates,
+            contractions_by_id={contraction.id_: contraction for contraction in contractions},
+            labour_updates_by_id={update.id_: update for update in labour_updates},
+            active_contraction=next(
+                (contraction for contraction in contractions if contraction.is_active), None
+            ),
+            last_announcement_time=_last_announcement_time(labour_updates),
+        )
+
+    def is_valid_for(
+        self, contractions: list[Contraction], labour_updates: list[LabourUpdate]
+    ) -> bool:
+        return (
+            self.contractions is contractions
+            and self.labour_updates is labour_updates
+            and len(self.contractions_by_id) == len(contractions)
+            and len(self.labour_updates_by_id) == len(labour_updates)
+        )
+
+
+def _last_announcement_time(labour_updates: list[LabourUpdate]) -> datetime | None:
+    return max(
+        (
+            update.sent_time
+            for update in labour_updates
+            if update.labour_update_type is LabourUpdateType.ANNOUNCEMENT
+        ),
+        default=None,
+    )
+
+
 @dataclass(eq=False, kw_only=True)
 class Labour(AggregateRoot[LabourId]):
     """
@@ -33,6 +87,16 @@ class Labour(AggregateRoot[LabourId]):
     end_time: datetime | None = None
     labour_name: str | None = None
     notes: str | None = None
+    earlier_contractions: EarlierContractions | None = field(default=None, init=False, repr=False)
+    _index: _LabourIndex | None = field(default=None, init=False, repr=False)
+
+    @property
+    def _indexes(self) -> _LabourIndex:
+        index = self._index
+        if index is None or not index.is_valid_for(self.contractions, self.labour_updates):
+            index = _LabourIndex.build(self.contractions, self.labour_updates)
+            self._index = index
+        return index
 
     @classmethod
     def plan(
@@ -72,18 +136,31 @@ class Labour(AggregateRoot[LabourId]):
     def is_active(self) -> bool:
         return self.end_time is None
 
+    @property
+    def contraction_count(self) -> int:
+        """How many contractions the labour has, including any not loaded with it"""
+        earlier = self.earlier_contractions.count if self.earlier_contractions else 0
+        return earlier + len(self.contractions)
+
     @property
     def active_contraction(self) -> Contraction | None:
         """Get the currently active contraction, if any"""
-        return next(
-            (contraction for contraction in self.contractions if contraction.is_active),
-            None,
-        )
+        return self._indexes.active_contraction
 
     @property
     def has_active_contraction(self) -> bool:
         """Check if there's currently an active contraction"""
-        return any(contraction.is_active for contraction in self.contractions)
+        return self._indexes.active_contraction is not None
+
+    def get_contraction(self, contraction_id: ContractionId) -> Contraction | None:
+        return self._indexes.contractions_by_id.get(contraction_id)
+
+    def remove_contraction(self, contraction: Contraction) -> None:
+        indexes = self._indexes
+        self.contractions.remove(contraction)
+        del indexes.contractions_by_id[contraction.id_]
+        if indexes.active_contraction is contraction:
+            indexes.active_contraction = None
 
     def start_contraction(
         self,
@@ -100,7 +177,11 @@ class Labour(AggregateRoot[LabourId]):
             intensity=intensity,
             notes=notes,
         )
+        indexes = self._indexes
         self.contractions.append(contraction)
+        indexes.contractions_by_id[contraction.id_] = contraction
+        if indexes.active_contraction is None:
+            indexes.active_contraction = contraction
         self.add_domain_event(ContractionStarted.from_contraction(contraction=contraction))
         return contraction
 
@@ -111,13 +192,29 @@ class Labour(AggregateRoot[LabourId]):
         notes: str | None = None,
     ) -> None:
         """End the currently active contraction"""
-        assert self.active_contraction
-        active_contraction = self.active_contraction
+        indexes = self._indexes
+        active_contraction = indexes.active_contraction
+        assert active_contraction
         if notes:
             active_contraction.notes = notes
         active_contraction.end(end_time=end_time or datetime.now(UTC), intensity=intensity)
+        indexes.active_contraction = None
         self.add_domain_event(ContractionEnded.from_contraction(contraction=active_contraction))
 
+    def import_contractions(self, contractions: list[Contraction]) -> None:
+        """Add a batch of completed contractions, keeping contractions ordered by start time"""
+        if self.current_phase is LabourPhase.PLANNED:
+            self.begin(start_time=min(contraction.start_time for contraction in contractions))
+        indexes = self._indexes
+        for contraction in contractions:
+            self.contractions.append(contraction)
+            indexes.contractions_by_id[contraction.id_] = contraction
+            if indexes.active_contraction is None and contraction.is_active:
+                indexes.active_contraction = contraction
+            self.add_domain_event(ContractionStarted.from_contraction(contraction=contraction))
+            self.add_domain_event(ContractionEnded.from_contraction(contraction=contraction))
+        self.contractions.sort(key=lambda contraction: contraction.start_time)
+
     def set_labour_phase(self, labour_phase: LabourPhase) -> None:
         self.current_phase = labour_phase
 
@@ -136,6 +233,14 @@ class Labour(AggregateRoot[LabourId]):
             if update.labour_update_type is LabourUpdateType.ANNOUNCEMENT
         ]
 
+    @property
+    def last_announcement_time(self) -> datetime | None:
+        """When the most recent announcement was sent, if any have been"""
+        return self._indexes.last_announcement_time
+
+    def get_labour_update(self, labour_update_id: LabourUpdateId) -> LabourUpdate | None:
+        return self._indexes.labour_updates_by_id.get(labour_update_id)
+
     def add_labour_update(
         self,
         labour_update_type: LabourUpdateType,
@@ -150,12 +255,36 @@ class Labour(AggregateRoot[LabourId]):
             sent_time=sent_time,
             application_generated=application_generated,
         )
+        indexes = self._indexes
         self.labour_updates.append(labour_update)
+        indexes.labour_updates_by_id[labour_update.id_] = labour_update
+        self._index_announcement(indexes, labour_update)
         return labour_update
 
+    def update_labour_update(
+        self,
+        labour_update: LabourUpdate,
+        message: str | None = None,
+        labour_update_type: LabourUpdateType | None = None,
+    ) -> None:
+        indexes = self._indexes
+        labour_update.update(message=message, labour_update_type=labour_update_type)
+        self._index_announcement(indexes, labour_update)
+
     def delete_labour_update(self, labour_update_id: LabourUpdateId) -> bool:
-        for labour_update in self.labour_updates:
-            if labour_update.id_ == labour_update_id:
-                self.labour_updates.remove(labour_update)
-                return True
-        raise LabourUpdateNotFoundById(labour_update_id)
+        indexes = self._indexes
+        labour_update = indexes.labour_updates_by_id.pop(labour_update_id, None)
+        if labour_update is None:
+            raise LabourUpdateNotFoundById(labour_update_id)
+        self.labour_updates.remove(labour_update)
+        if labour_update.labour_update_type is LabourUpdateType.ANNOUNCEMENT:
+            indexes.last_announcement_time = _last_announcement_time(self.labour_updates)
+        return True
+
+    @staticmethod
+    def _index_announcement(indexes: _LabourIndex, labour_update: LabourUpdate) -> None:
+        if labour_update.labour_update_type is not LabourUpdateType.ANNOUNCEMENT:
+            return
+        last_announcement_time = indexes.last_announcement_time
+        if last_announcement_time is None or labour_update.sent_time > last_announcement_time:
+            indexes.last_announcement_time = labour_update.sent_time
@@ -35,6 +35,21 @@ class LabourRepository(Protocol):
             The labour if found, None otherwise
         """
 
+    async def get_accessible_labour(
+        self, labour_id: LabourId, requester_id: UserId
+    ) -> Labour | None:
+        """
+        Retrieve a labour by its ID if the requester is its birthing person or
+        holds an active subscription to it.
+
+        Args:
+            labour_id: The ID of the labour to retrieve
+            requester_id: The ID of the user requesting the labour
+
+        Returns:
+            The labour if found and accessible to the requester, None otherwise
+        """
+
     async def get_labours_by_birthing_person_id(self, birthing_person_id: UserId) -> list[Labour]:
         """
         Retrieve an labours by Birthing Person ID.
@@ -59,6 +74,23 @@ class LabourRepository(Protocol):
             The labour if found, None otherwise
         """
 
+    async def get_active_labour_with_recent_contractions(
+        self, birthing_person_id: UserId
+    ) -> Labour | None:
+        """
+        Retrieve an active labour by Birthing Person ID with only its most recent contractions.
+
+        The labour holds its active contraction and the `RECENT_CONTRACTIONS_REQUIRED` most
+        recent contractions, and summarises the rest in `earlier_contractions`. It is only
+        suitable for starting and ending contractions, which never touch earlier ones.
+
+        Args:
+            birthing_person_id: The Birthing Person ID to retrieve the labour for
+
+        Returns:
+            The labour if found, None otherwise
+        """
+
     async def get_active_labour_id_by_birthing_person_id(
         self, birthing_person_id: UserId
     ) -> LabourId | None:
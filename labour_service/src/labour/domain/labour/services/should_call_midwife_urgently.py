@@ -19,6 +19,10 @@ class ShouldCallMidwifeUrgentlyService:
            - any of your contractions last longer than 2 minutes
            - you're having 6 or more contractions every 10 minutes
         """
+        earlier = labour.earlier_contractions
+        if earlier and earlier.longest_duration_seconds > CONTRACTION_MAX_TIME_SECONDS:
+            return True
+
         contractions_in_last_10_mins = []
         for contraction in labour.contractions:
             if contraction.duration.duration_seconds > CONTRACTION_MAX_TIME_SECONDS:
@@ -30,7 +30,7 @@ class ShouldGoToHospitalService:
             else TIME_BETWEEN_CONTRACTIONS_PAROUS
         )
 
-        if len(labour.contractions) < required_number_of_contractions:
+        if labour.contraction_count < required_number_of_contractions:
             return False
 
         recent_contractions = labour.contractions[-required_number_of_contractions:]
@@ -20,7 +20,7 @@ class ShouldPrepareForHospitalService:
             else TIME_BETWEEN_CONTRACTIONS_PAROUS
         )
 
-        if len(labour.contractions) < SAMPLE_CONTRACTION_SIZE:
+        if labour.contraction_count < SAMPLE_CONTRACTION_SIZE:
             return False
 
         recent_contractions = labour.contractions[-4:]
@@ -1,3 +1,10 @@
+from src.labour.domain.labour.constants import (
+    ACTIVE_PHASE_MIN_DURATION_MINUTES,
+    ACTIVE_PHASE_MIN_INTENSITY,
+    PHASE_SAMPLE_CONTRACTION_SIZE,
+    TRANSITION_PHASE_MIN_DURATION_MINUTES,
+    TRANSITION_PHASE_MIN_INTENSITY,
+)
 from src.labour.domain.labour.entity import Labour
 from src.labour.domain.labour.enums import LabourPhase
 from src.labour.domain.labour.exceptions import LabourAlreadyCompleted
@@ -17,7 +24,7 @@ class UpdateLabourPhaseService:
         if labour.current_phase is LabourPhase.COMPLETE:
             raise LabourAlreadyCompleted()
 
-        recent_contractions = labour.contractions[-5:]
+        recent_contractions = labour.contractions[-PHASE_SAMPLE_CONTRACTION_SIZE:]
         avg_intensity = sum(c.intensity for c in recent_contractions if c.intensity) / len(
             recent_contractions
         )
@@ -27,9 +34,15 @@ class UpdateLabourPhaseService:
 
         new_phase = labour.current_phase
 
-        if avg_intensity >= 8 and avg_duration >= 1.5:
+        if (
+            avg_intensity >= TRANSITION_PHASE_MIN_INTENSITY
+            and avg_duration >= TRANSITION_PHASE_MIN_DURATION_MINUTES
+        ):
             new_phase = LabourPhase.TRANSITION
-        elif avg_intensity >= 6 and avg_duration >= 1:
+        elif (
+            avg_intensity >= ACTIVE_PHASE_MIN_INTENSITY
+            and avg_duration >= ACTIVE_PHASE_MIN_DURATION_MINUTES
+        ):
             new_phase = LabourPhase.ACTIVE
 
         if self.labour_phase_order.index(new_phase) > self.labour_phase_order.index(
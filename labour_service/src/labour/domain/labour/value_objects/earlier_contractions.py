@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+
+from fern_labour_core.value_object import ValueObject
+
+
+@dataclass(frozen=True)
+class EarlierContractions(ValueObject):
+    """
+    What is known about the contractions of a labour that were not loaded with it.
+
+    A labour loaded with only its most recent contractions summarises the rest here, which
+    is all the labour rules need of them.
+    """
+
+    count: int
+    longest_duration_seconds: float
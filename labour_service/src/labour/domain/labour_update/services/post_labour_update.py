@@ -15,9 +15,9 @@ class PostLabourUpdateService:
         message: str,
         sent_time: datetime | None = None,
     ) -> Labour:
-        if labour_update_type is LabourUpdateType.ANNOUNCEMENT and labour.announcements:
-            most_recent_announcement = labour.announcements[-1]
-            if datetime.now(UTC) - most_recent_announcement.sent_time < timedelta(
+        last_announcement_time = labour.last_announcement_time
+        if labour_update_type is LabourUpdateType.ANNOUNCEMENT and last_announcement_time:
+            if datetime.now(UTC) - last_announcement_time < timedelta(
                 seconds=ANNOUNCEMENT_COOLDOWN_SECONDS
             ):
                 raise TooSoonSinceLastAnnouncement()
@@ -15,10 +15,10 @@ from src.labour.domain.labour_update.value_objects.labour_update_id import Labou
 
 class UpdateLabourUpdateService:
     def _get_labour_update(self, labour: Labour, labour_update_id: LabourUpdateId) -> LabourUpdate:
-        for labour_update in labour.labour_updates:
-            if labour_update.id_ == labour_update_id:
-                return labour_update
-        raise LabourUpdateNotFoundById(labour_update_id=labour_update_id)
+        labour_update = labour.get_labour_update(labour_update_id)
+        if labour_update is None:
+            raise LabourUpdateNotFoundById(labour_update_id=labour_update_id)
+        return labour_update
 
     def update_labour_type(
         self,
@@ -30,14 +30,14 @@ class UpdateLabourUpdateService:
         if labour_update.labour_update_type is LabourUpdateType.ANNOUNCEMENT:
             raise CannotUpdateLabourUpdate()
 
-        if labour_update_type is LabourUpdateType.ANNOUNCEMENT and labour.announcements:
-            most_recent_announcement = labour.announcements[-1]
-            if datetime.now(UTC) - most_recent_announcement.sent_time < timedelta(
+        last_announcement_time = labour.last_announcement_time
+        if labour_update_type is LabourUpdateType.ANNOUNCEMENT and last_announcement_time:
+            if datetime.now(UTC) - last_announcement_time < timedelta(
                 seconds=ANNOUNCEMENT_COOLDOWN_SECONDS
             ):
                 raise TooSoonSinceLastAnnouncement()
 
-        labour_update.update(labour_update_type=labour_update_type)
+        labour.update_labour_update(labour_update, labour_update_type=labour_update_type)
 
         if (
             labour_update.application_generated
@@ -61,6 +61,6 @@ class UpdateLabourUpdateService:
         if labour_update.application_generated:
             raise CannotUpdateLabourUpdate()
 
-        labour_update.update(message=message)
+        labour.update_labour_update(labour_update, message=message)
 
         return labour
@@ -0,0 +1,168 @@
+"""
+Cold storage for completed labours.
+
+Once a labour has been complete for long enough, its contractions and updates are moved out of
+the hot `contractions` and `labour_updates` tables into a single `labour_archives` row holding
+a compressed snapshot of them. The repository hydrates archived labours from their snapshot,
+so the rest of the service sees the same aggregate either way.
+"""
+
+import base64
+import zlib
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+import orjson
+from sqlalchemy.orm.attributes import set_committed_value
+
+from src.labour.domain.contraction.entity import Contraction
+from src.labour.domain.contraction.value_objects.contraction_duration import Duration
+from src.labour.domain.contraction.value_objects.contraction_id import ContractionId
+from src.labour.domain.labour.entity import Labour
+from src.labour.domain.labour.value_objects.labour_id import LabourId
+from src.labour.domain.labour_update.entity import LabourUpdate
+from src.labour.domain.labour_update.enums import LabourUpdateType
+from src.labour.domain.labour_update.value_objects.labour_update_id import LabourUpdateId
+
+SNAPSHOT_VERSION = 1
+
+
+@dataclass(eq=False, kw_only=True)
+class LabourArchive:
+    """The snapshot a labour's contractions and updates were archived into."""
+
+    labour_id: UUID
+    archived_at: datetime
+    snapshot: str
+
+
+def encode_snapshot(contractions: list[Contraction], labour_updates: list[LabourUpdate]) -> str:
+    """
+    Serialize contractions and labour updates into a compact text snapshot.
+
+    Records are stored as positional arrays rather than objects so field names are not
+    repeated, then deflated and base64 encoded to fit the encrypted string column.
+    """
+    payload = {
+        "version": SNAPSHOT_VERSION,
+        "contractions": [
+            [
+                str(contraction.id_.value),
+                contraction.start_time,
+                contraction.end_time,
+                contraction.intensity,
+                contraction.notes,
+            ]
+            for contraction in contractions
+        ],
+        "labour_updates": [
+            [
+                str(labour_update.id_.value),
+                labour_update.labour_update_type.value,
+                labour_update.message,
+                labour_update.sent_time,
+                labour_update.edited,
+                labour_update.application_generated,
+            ]
+            for labour_update in labour_updates
+        ],
+    }
+    compressed = zlib.compress(orjson.dumps(payload), level=9)
+    return base64.b64encode(compressed).decode("ascii")
+
+
+def decode_snapshot(
+    labour_id: LabourId, snapshot: str
+) -> tuple[list[Contraction], list[LabourUpdate]]:
+    """Rebuild the contractions and labour updates of a labour from its snapshot."""
+    payload: dict[str, Any] = orjson.loads(zlib.decompress(base64.b64decode(snapshot)))
+    if payload["version"] != SNAPSHOT_VERSION:
+        raise ValueError(f"Unsupported labour snapshot version {payload['version']}")
+
+    contractions = [
+        Contraction(
+            id_=ContractionId(UUID(contraction_id)),
+            labour_id=labour_id,
+            duration=Duration(
+                start_time=datetime.fromisoformat(start_time),
+                end_time=datetime.fromisoformat(end_time),
+            ),
+            intensity=intensity,
+            notes=notes,
+        )
+        for contraction_id, start_time, end_time, intensity, notes in payload["contractions"]
+    ]
+    labour_updates = [
+        LabourUpdate(
+            id_=LabourUpdateId(UUID(labour_update_id)),
+            labour_id=labour_id,
+            labour_update_type=LabourUpdateType(labour_update_type),
+            message=message,
+            sent_time=datetime.fromisoformat(sent_time),
+            edited=edited,
+            application_generated=application_generated,
+        )
+        for (
+            labour_update_id,
+            labour_update_type,
+            message,
+            sent_time,
+            edited,
+            application_generated,
+        ) in payload["labour_updates"]
+    ]
+    return contractions, labour_updates
+
+
+def get_archive(labour: Labour) -> LabourArchive | None:
+    archive: LabourArchive | None = getattr(labour, "_archive", None)
+    return archive
+
+
+def set_committed_collection(labour: Labour, key: str, entities: list[Any]) -> None:
+    """Set a relationship of a loaded labour as its committed state, without recording a change."""
+    set_committed_value(labour, key, entities)  # type: ignore[no-untyped-call]
+
+
+def hydrate_from_archive(labour: Labour) -> None:
+    """
+    Load the contractions and updates of an archived labour from its snapshot.
+
+    They are set as the committed state of the relationships, so reading an archived labour
+    does not write anything back. The hydrated entities are transient, and are inserted into
+    the hot tables again if the labour is saved, see `unarchive`.
+    """
+    archive = get_archive(labour)
+    if archive is None:
+        return
+    contractions, labour_updates = decode_snapshot(labour.id_, archive.snapshot)
+    set_committed_collection(labour, "contractions", contractions)
+    set_committed_collection(labour, "labour_updates", labour_updates)
+
+
+def archive_labour(labour: Labour, archived_at: datetime) -> LabourArchive:
+    """
+    Snapshot the contractions and updates of a labour into an archive.
+
+    The snapshot is taken from the loaded aggregate, the caller removes the detail rows.
+    """
+    archive = LabourArchive(
+        labour_id=labour.id_.value,
+        archived_at=archived_at,
+        snapshot=encode_snapshot(labour.contractions, labour.labour_updates),
+    )
+    labour._archive = archive  # type: ignore[attr-defined]
+    return archive
+
+
+def unarchive(labour: Labour) -> None:
+    """
+    Move an archived labour back into the hot tables.
+
+    Dropping the archive deletes its row, and saving the labour then cascades to the hydrated
+    contractions and updates, which are inserted as new rows.
+    """
+    if get_archive(labour) is not None:
+        labour._archive = None  # type: ignore[attr-defined]
@@ -0,0 +1,93 @@
+import logging
+from datetime import UTC, datetime, timedelta
+
+from fern_labour_core.unit_of_work import UnitOfWork
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.labour.domain.labour.entity import Labour
+from src.labour.domain.labour.enums import LabourPhase
+from src.labour.infrastructure.persistence.archive import archive_labour
+from src.labour.infrastructure.persistence.tables.contractions import contractions_table
+from src.labour.infrastructure.persistence.tables.labour_archives import labour_archives_table
+from src.labour.infrastructure.persistence.tables.labour_updates import labour_updates_table
+from src.labour.infrastructure.persistence.tables.labours import labours_table
+
+log = logging.getLogger(__name__)
+
+ARCHIVE_BATCH_SIZE = 50
+
+
+class LabourArchiver:
+    """
+    Moves labours that have been complete for a while into cold storage.
+
+    Labours are archived a batch at a time, each batch in its own transaction: their
+    contractions and updates are snapshotted into a `labour_archives` row and deleted from the
+    hot tables. Batches are locked with SKIP LOCKED, so concurrent runs archive different
+    labours and never wait on a labour that is being changed.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        unit_of_work: UnitOfWork,
+        archive_after: timedelta,
+        batch_size: int = ARCHIVE_BATCH_SIZE,
+    ) -> None:
+        self._session = session
+        self._unit_of_work = unit_of_work
+        self._archive_after = archive_after
+        self._batch_size = batch_size
+
+    async def archive_completed_labours(self) -> int:
+        """Archive every labour completed before the retention period, returning how many."""
+        cutoff = datetime.now(UTC) - self._archive_after
+        archived = 0
+
+        while True:
+            async with self._unit_of_work:
+                batch = await self._archive_batch(cutoff)
+            self._session.expunge_all()
+            archived += batch
+            log.debug(f"Archived {archived} labours")
+
+            if batch < self._batch_size:
+                break
+
+        log.info(f"Archived {archived} labours completed before {cutoff.isoformat()}")
+        return archived
+
+    async def _archive_batch(self, cutoff: datetime) -> int:
+        already_archived = (
+            select(labour_archives_table.c.labour_id)
+            .where(labour_archives_table.c.labour_id == labours_table.c.id)
+            .exists()
+        )
+        stmt = (
+            select(Labour)
+            .where(
+                labours_table.c.current_phase == LabourPhase.COMPLETE,
+                labours_table.c.end_time < cutoff,
+                ~already_archived,
+            )
+            .order_by(labours_table.c.end_time)
+            .limit(self._batch_size)
+            .with_for_update(of=labours_table, skip_locked=True)
+        )
+        labours = list((await self._session.execute(stmt)).scalars())
+        if not labours:
+            return 0
+
+        archived_at = datetime.now(UTC)
+        for labour in labours:
+            archive_labour(labour, archived_at=archived_at)
+
+        labour_ids = [labour.id_.value for labour in labours]
+        await self._session.execute(
+            delete(contractions_table).where(contractions_table.c.labour_id.in_(labour_ids))
+        )
+        await self._session.execute(
+            delete(labour_updates_table).where(labour_updates_table.c.labour_id.in_(labour_ids))
+        )
+        return len(labours)
@@ -3,6 +3,7 @@ from typing import Any
 from sqlalchemy import event
 from sqlalchemy.orm import composite, relationship
 
+from src.core.infrastructure.persistence.encryption import encrypted_synonym
 from src.core.infrastructure.persistence.orm_registry import mapper_registry
 from src.labour.domain.contraction.entity import Contraction
 from src.labour.domain.contraction.value_objects.contraction_duration import Duration
@@ -11,7 +12,9 @@ from src.labour.domain.labour.entity import Labour
 from src.labour.domain.labour.value_objects.labour_id import LabourId
 from src.labour.domain.labour_update.entity import LabourUpdate
 from src.labour.domain.labour_update.value_objects.labour_update_id import LabourUpdateId
+from src.labour.infrastructure.persistence.archive import LabourArchive
 from src.labour.infrastructure.persistence.tables.contractions import contractions_table
+from src.labour.infrastructure.persistence.tables.labour_archives import labour_archives_table
 from src.labour.infrastructure.persistence.tables.labour_updates import labour_updates_table
 from src.labour.infrastructure.persistence.tables.labours import labours_table
 from src.user.domain.value_objects.user_id import UserId
@@ -25,7 +28,8 @@ def map_labour_updates_table() -> None:
             "id_": composite(LabourUpdateId, labour_updates_table.c.id),
             "labour_update_type": labour_updates_table.c.labour_update_type,
             "labour_id": composite(LabourId, labour_updates_table.c.labour_id),
-            "message": labour_updates_table.c.message,
+            "_encrypted_message": labour_updates_table.c.message,
+            "message": encrypted_synonym(LabourUpdate, "_encrypted_message"),
             "sent_time": labour_updates_table.c.sent_time,
             "edited": labour_updates_table.c.edited,
             "application_generated": labour_updates_table.c.application_generated,
@@ -51,6 +55,19 @@ def map_contractions_table() -> None:
     )
 
 
+def map_labour_archives_table() -> None:
+    mapper_registry.map_imperatively(
+        LabourArchive,
+        labour_archives_table,
+        properties={
+            "labour_id": labour_archives_table.c.labour_id,
+            "archived_at": labour_archives_table.c.archived_at,
+            "_encrypted_snapshot": labour_archives_table.c.snapshot,
+            "snapshot": encrypted_synonym(LabourArchive, "_encrypted_snapshot"),
+        },
+    )
+
+
 def map_labours_table() -> None:
     mapper_registry.map_imperatively(
         Labour,
@@ -74,9 +91,17 @@ def map_labours_table() -> None:
                 cascade="all, delete-orphan",
                 lazy="selectin",
             ),
+            # Joined so that loading a labour never costs an extra query for its archive
+            "_archive": relationship(
+                LabourArchive,
+                uselist=False,
+                cascade="all, delete-orphan",
+                lazy="joined",
+            ),
             "start_time": labours_table.c.start_time,
             "end_time": labours_table.c.end_time,
-            "notes": labours_table.c.notes,
+            "_encrypted_notes": labours_table.c.notes,
+            "notes": encrypted_synonym(Labour, "_encrypted_notes"),
         },
         column_prefix="_",
     )
@@ -86,3 +111,10 @@ def map_labours_table() -> None:
 def initialize_domain_events(target: Any, _: Any) -> None:
     if not hasattr(target, "_domain_events"):
         target._domain_events = []
+
+
+@event.listens_for(Labour, "load")
+@event.listens_for(Labour, "refresh")
+def reset_indexes(target: Any, *_: Any) -> None:
+    """Indexes are rebuilt from the relationships on first use, once they have been loaded."""
+    target._index = None
@@ -0,0 +1,66 @@
+from collections.abc import AsyncIterator
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.labour.application.dtos.contraction import ContractionDTO
+from src.labour.application.dtos.labour_update import LabourUpdateDTO
+from src.labour.application.queries.labour_export_query import LabourExportQuery
+from src.labour.domain.contraction.entity import Contraction
+from src.labour.domain.labour.value_objects.labour_id import LabourId
+from src.labour.domain.labour_update.entity import LabourUpdate
+from src.labour.infrastructure.persistence.archive import LabourArchive, decode_snapshot
+from src.labour.infrastructure.persistence.tables.contractions import contractions_table
+from src.labour.infrastructure.persistence.tables.labour_updates import labour_updates_table
+
+EXPORT_BATCH_SIZE = 500
+
+
+class SQLAlchemyLabourExportQuery(LabourExportQuery):
+    """
+    Streams contractions and labour updates through a server-side cursor.
+
+    Rows are fetched `batch_size` at a time and mapped to DTOs one by one, so encrypted
+    messages are decrypted row by row and at most one batch of entities is held in memory.
+    Archived labours are read from their snapshot instead, which is already compact.
+    """
+
+    def __init__(self, session: AsyncSession, batch_size: int = EXPORT_BATCH_SIZE):
+        self._session = session
+        self._batch_size = batch_size
+
+    async def _get_archive(self, labour_id: str) -> LabourArchive | None:
+        return await self._session.get(LabourArchive, UUID(labour_id))
+
+    async def stream_contractions(self, labour_id: str) -> AsyncIterator[ContractionDTO]:
+        if archive := await self._get_archive(labour_id):
+            contractions, _ = decode_snapshot(LabourId(UUID(labour_id)), archive.snapshot)
+            for contraction in contractions:
+                yield ContractionDTO.from_domain(contraction)
+            return
+
+        stmt = (
+            select(Contraction)
+            .where(contractions_table.c.labour_id == UUID(labour_id))
+            .order_by(contractions_table.c.start_time)
+            .execution_options(yield_per=self._batch_size)
+        )
+        async for contraction in await self._session.stream_scalars(stmt):
+            yield ContractionDTO.from_domain(contraction)
+
+    async def stream_labour_updates(self, labour_id: str) -> AsyncIterator[LabourUpdateDTO]:
+        if archive := await self._get_archive(labour_id):
+            _, labour_updates = decode_snapshot(LabourId(UUID(labour_id)), archive.snapshot)
+            for labour_update in labour_updates:
+                yield LabourUpdateDTO.from_domain(labour_update)
+            return
+
+        stmt = (
+            select(LabourUpdate)
+            .where(labour_updates_table.c.labour_id == UUID(labour_id))
+            .order_by(labour_updates_table.c.sent_time)
+            .execution_options(yield_per=self._batch_size)
+        )
+        async for labour_update in await self._session.stream_scalars(stmt):
+            yield LabourUpdateDTO.from_domain(labour_update)
@@ -0,0 +1,136 @@
+from typing import Any
+
+from sqlalchemy import Select, and_, case, extract, func, literal, or_, select, true
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.labour.application.dtos.labour_summary import LabourSummaryDTO
+from src.labour.application.queries.labour_summary_query import LabourSummaryQuery
+from src.labour.domain.labour.constants import (
+    CONTRACTIONS_REQUIRED_NULLIPAROUS,
+    CONTRACTIONS_REQUIRED_PAROUS,
+    LENGTH_OF_CONTRACTIONS_MINUTES,
+    TIME_BETWEEN_CONTRACTIONS_NULLIPAROUS,
+    TIME_BETWEEN_CONTRACTIONS_PAROUS,
+)
+from src.labour.domain.labour.enums import LabourPhase
+from src.labour.infrastructure.persistence.tables.contractions import contractions_table
+from src.labour.infrastructure.persistence.tables.labours import labours_table
+
+
+def build_active_labour_summary_statement(birthing_person_id: str) -> Select[Any]:
+    """
+    Build a single statement computing the active labour summary in the database.
+
+    Mirrors `LabourSummaryDTO.from_domain` and `ShouldGoToHospitalService`: window functions
+    rank the labour's contractions from newest to oldest and pair each with the end time of
+    the one before it, then the most recent N contractions (N depending on first_labour) are
+    checked for length and spacing alongside a COUNT(*) of all contractions.
+    """
+    active_labour = (
+        select(
+            labours_table.c.id,
+            labours_table.c.first_labour,
+            labours_table.c.start_time,
+            labours_table.c.current_phase,
+        )
+        .where(
+            labours_table.c.birthing_person_id == birthing_person_id,
+            labours_table.c.current_phase != LabourPhase.COMPLETE,
+        )
+        .cte("active_labour")
+    )
+
+    ranked_contractions = (
+        select(
+            contractions_table.c.start_time,
+            contractions_table.c.end_time,
+            func.lag(contractions_table.c.end_time)
+            .over(order_by=contractions_table.c.start_time)
+            .label("previous_end_time"),
+            func.row_number()
+            .over(order_by=contractions_table.c.start_time.desc())
+            .label("position"),
+        )
+        .where(contractions_table.c.labour_id.in_(select(active_labour.c.id)))
+        .cte("ranked_contractions")
+    )
+
+    required_contractions = case(
+        (active_labour.c.first_labour, literal(CONTRACTIONS_REQUIRED_NULLIPAROUS)),
+        else_=literal(CONTRACTIONS_REQUIRED_PAROUS),
+    )
+    required_minutes_between = case(
+        (active_labour.c.first_labour, literal(TIME_BETWEEN_CONTRACTIONS_NULLIPAROUS)),
+        else_=literal(TIME_BETWEEN_CONTRACTIONS_PAROUS),
+    )
+    length_minutes = (
+        extract("epoch", ranked_contractions.c.end_time - ranked_contractions.c.start_time) / 60
+    )
+    minutes_since_previous = (
+        extract("epoch", ranked_contractions.c.start_time - ranked_contractions.c.previous_end_time)
+        / 60
+    )
+    # The oldest of the recent contractions is not compared with the one before it
+    recent_contraction_is_established = and_(
+        length_minutes >= LENGTH_OF_CONTRACTIONS_MINUTES,
+        or_(
+            ranked_contractions.c.position == required_contractions,
+            func.coalesce(minutes_since_previous <= required_minutes_between, False),
+        ),
+    )
+    contraction_stats = (
+        select(
+            func.count().label("contraction_count"),
+            func.bool_and(recent_contraction_is_established)
+            .filter(ranked_contractions.c.position <= required_contractions)
+            .label("recent_contractions_established"),
+        )
+        .select_from(ranked_contractions)
+        .lateral("contraction_stats")
+    )
+
+    hours_since_start = func.coalesce(
+        extract("epoch", func.now() - active_labour.c.start_time) / 3600, 0.0
+    )
+    hospital_recommended = and_(
+        contraction_stats.c.contraction_count >= required_contractions,
+        func.coalesce(contraction_stats.c.recent_contractions_established, False),
+    )
+
+    return select(
+        active_labour.c.id,
+        hours_since_start.label("duration"),
+        contraction_stats.c.contraction_count,
+        active_labour.c.current_phase,
+        hospital_recommended.label("hospital_recommended"),
+    ).select_from(active_labour.join(contraction_stats, true()))
+
+
+class SQLAlchemyLabourSummaryQuery(LabourSummaryQuery):
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def get_active_labour_summary(self, birthing_person_id: str) -> LabourSummaryDTO | None:
+        """
+        Retrieve a summary of the active labour for a Birthing Person.
+
+        Args:
+            birthing_person_id: The Birthing Person ID to retrieve the summary for
+
+        Returns:
+            The labour summary if an active labour exists, None otherwise
+        """
+        stmt = build_active_labour_summary_statement(birthing_person_id=birthing_person_id)
+
+        result = await self._session.execute(stmt)
+        row = result.one_or_none()
+        if not row:
+            return None
+
+        return LabourSummaryDTO(
+            id=str(row.id),
+            duration=float(row.duration),
+            contraction_count=row.contraction_count,
+            current_phase=row.current_phase.value,
+            hospital_recommended=bool(row.hospital_recommended),
+        )
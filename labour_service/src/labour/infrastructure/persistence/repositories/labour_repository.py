@@ -1,15 +1,36 @@
-from sqlalchemy import and_, select
+from sqlalchemy import and_, extract, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import noload
 
+from src.labour.domain.contraction.entity import Contraction
+from src.labour.domain.labour.constants import RECENT_CONTRACTIONS_REQUIRED
 from src.labour.domain.labour.entity import Labour
 from src.labour.domain.labour.enums import LabourPhase
 from src.labour.domain.labour.repository import LabourRepository
+from src.labour.domain.labour.value_objects.earlier_contractions import EarlierContractions
 from src.labour.domain.labour.value_objects.labour_id import LabourId
+from src.labour.infrastructure.persistence.archive import (
+    get_archive,
+    hydrate_from_archive,
+    set_committed_collection,
+    unarchive,
+)
+from src.labour.infrastructure.persistence.tables.contractions import contractions_table
 from src.labour.infrastructure.persistence.tables.labours import labours_table
+from src.subscription.domain.enums import SubscriptionStatus
+from src.subscription.infrastructure.persistence.table import subscriptions_table
 from src.user.domain.value_objects.user_id import UserId
 
 
 class SQLAlchemyLabourRepository(LabourRepository):
+    """
+    Persists the Labour aggregate.
+
+    Archived labours keep their contractions and updates in a snapshot rather than the hot
+    tables, see `src.labour.infrastructure.persistence.archive`. They are hydrated from the
+    snapshot when loaded, and moved back into the hot tables if they are saved.
+    """
+
     def __init__(self, session: AsyncSession):
         self._session = session
 
@@ -20,6 +41,7 @@ class SQLAlchemyLabourRepository(LabourRepository):
         Args:
             labour: The labour to save
         """
+        unarchive(labour)
         self._session.add(labour)
 
     async def delete(self, labour: Labour) -> None:
@@ -29,6 +51,10 @@ class SQLAlchemyLabourRepository(LabourRepository):
         Args:
             labour: The labour to delete
         """
+        if get_archive(labour) is not None:
+            # The hydrated contractions and updates have no rows to delete
+            set_committed_collection(labour, "contractions", [])
+            set_committed_collection(labour, "labour_updates", [])
         await self._session.delete(labour)
 
     async def get_by_id(self, labour_id: LabourId) -> Labour | None:
@@ -44,7 +70,46 @@ class SQLAlchemyLabourRepository(LabourRepository):
         stmt = select(Labour).where(labours_table.c.id == labour_id.value)
 
         result = await self._session.execute(stmt)
-        return result.scalar_one_or_none()
+        return self._hydrated(result.scalar_one_or_none())
+
+    async def get_accessible_labour(
+        self, labour_id: LabourId, requester_id: UserId
+    ) -> Labour | None:
+        """
+        Retrieve a labour by its ID if the requester is its birthing person or
+        holds an active subscription to it.
+
+        The access check is a correlated EXISTS on the subscriptions table, so the
+        labour is authorized and loaded in a single round trip.
+
+        Args:
+            labour_id: The ID of the labour to retrieve
+            requester_id: The ID of the user requesting the labour
+
+        Returns:
+            The labour if found and accessible to the requester, None otherwise
+        """
+        has_active_subscription = (
+            select(subscriptions_table.c.id)
+            .where(
+                subscriptions_table.c.labour_id == labours_table.c.id,
+                subscriptions_table.c.subscriber_id == requester_id.value,
+                subscriptions_table.c.status == SubscriptionStatus.SUBSCRIBED,
+            )
+            .exists()
+        )
+        stmt = select(Labour).where(
+            and_(
+                labours_table.c.id == labour_id.value,
+                or_(
+                    labours_table.c.birthing_person_id == requester_id.value,
+                    has_active_subscription,
+                ),
+            )
+        )
+
+        result = await self._session.execute(stmt)
+        return self._hydrated(result.scalar_one_or_none())
 
     async def get_labours_by_birthing_person_id(self, birthing_person_id: UserId) -> list[Labour]:
         """
@@ -59,7 +124,10 @@ class SQLAlchemyLabourRepository(LabourRepository):
         stmt = select(Labour).where(labours_table.c.birthing_person_id == birthing_person_id.value)
 
         result = await self._session.execute(stmt)
-        return list(result.scalars())
+        labours = list(result.scalars())
+        for labour in labours:
+            hydrate_from_archive(labour)
+        return labours
 
     async def get_active_labour_by_birthing_person_id(
         self, birthing_person_id: UserId
@@ -81,7 +149,87 @@ class SQLAlchemyLabourRepository(LabourRepository):
         )
 
         result = await self._session.execute(stmt)
-        return result.scalar_one_or_none()
+        return self._hydrated(result.scalar_one_or_none())
+
+    async def get_active_labour_with_recent_contractions(
+        self, birthing_person_id: UserId
+    ) -> Labour | None:
+        """
+        Retrieve an active labour by Birthing Person ID with only its most recent contractions.
+
+        Contractions are only ever appended to the most recent ones by starting and ending
+        them, so the rest are summarised by a single aggregate rather than hydrated. The
+        partially loaded collection is committed as is, so saving the labour inserts the new
+        contractions and leaves the earlier rows untouched.
+
+        Args:
+            birthing_person_id: The Birthing Person ID to retrieve the labour for
+
+        Returns:
+            The labour if found, None otherwise
+        """
+        stmt = (
+            select(Labour)
+            .where(
+                and_(
+                    labours_table.c.birthing_person_id == birthing_person_id.value,
+                    labours_table.c.current_phase != LabourPhase.COMPLETE,
+                )
+            )
+            .options(noload(Labour.contractions))  # type: ignore[arg-type]
+        )
+        result = await self._session.execute(stmt)
+        labour = result.scalar_one_or_none()
+        if labour is None or get_archive(labour) is not None:
+            return self._hydrated(labour)
+
+        recent_contraction_ids = (
+            select(contractions_table.c.id)
+            .where(contractions_table.c.labour_id == labour.id_.value)
+            .order_by(contractions_table.c.start_time.desc())
+            .limit(RECENT_CONTRACTIONS_REQUIRED)
+        )
+        contractions_stmt = (
+            select(Contraction)
+            .where(
+                and_(
+                    contractions_table.c.labour_id == labour.id_.value,
+                    or_(
+                        contractions_table.c.id.in_(recent_contraction_ids),
+                        contractions_table.c.start_time == contractions_table.c.end_time,
+                    ),
+                )
+            )
+            .order_by(contractions_table.c.start_time)
+        )
+        contractions = list((await self._session.execute(contractions_stmt)).scalars())
+        set_committed_collection(labour, "contractions", contractions)
+
+        labour.earlier_contractions = EarlierContractions(count=0, longest_duration_seconds=0.0)
+        if len(contractions) >= RECENT_CONTRACTIONS_REQUIRED:
+            earlier_stmt = select(
+                func.count(),
+                func.coalesce(
+                    func.max(
+                        extract(
+                            "epoch", contractions_table.c.end_time - contractions_table.c.start_time
+                        )
+                    ),
+                    0.0,
+                ),
+            ).where(
+                and_(
+                    contractions_table.c.labour_id == labour.id_.value,
+                    contractions_table.c.id.not_in(
+                        [contraction.id_.value for contraction in contractions]
+                    ),
+                )
+            )
+            count, longest_duration_seconds = (await self._session.execute(earlier_stmt)).one()
+            labour.earlier_contractions = EarlierContractions(
+                count=count, longest_duration_seconds=float(longest_duration_seconds)
+            )
+        return labour
 
     async def get_active_labour_id_by_birthing_person_id(
         self, birthing_person_id: UserId
@@ -122,3 +270,9 @@ class SQLAlchemyLabourRepository(LabourRepository):
         result = await self._session.execute(stmt)
         user_id_str = result.scalar_one_or_none()
         return UserId(user_id_str) if user_id_str else None
+
+    @staticmethod
+    def _hydrated(labour: Labour | None) -> Labour | None:
+        if labour is not None:
+            hydrate_from_archive(labour)
+        return labour
@@ -0,0 +1,14 @@
+from sqlalchemy import Column, DateTime, ForeignKey, String, Table
+from sqlalchemy.dialects.postgresql import UUID
+
+from src.core.infrastructure.persistence.orm_registry import mapper_registry
+
+labour_archives_table = Table(
+    "labour_archives",
+    mapper_registry.metadata,
+    Column("labour_id", UUID(as_uuid=True), ForeignKey("labours.id"), primary_key=True),
+    Column("archived_at", DateTime(timezone=True), nullable=False),
+    # Compressed snapshot of the labour's contractions and updates, AES encrypted and
+    # decrypted on access by the mapped EncryptedAttribute
+    Column("snapshot", String, nullable=False),
+)
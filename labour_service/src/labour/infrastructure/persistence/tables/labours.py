@@ -1,9 +1,5 @@
-import os
-
 from sqlalchemy import Boolean, Column, DateTime, Enum, String, Table
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy_utils import StringEncryptedType
-from sqlalchemy_utils.types.encrypted.encrypted_type import AesEngine
 
 from src.core.infrastructure.persistence.orm_registry import mapper_registry
 from src.labour.domain.labour.enums import LabourPhase
@@ -19,14 +15,6 @@ labours_table = Table(
     Column("start_time", DateTime(timezone=True), nullable=True),
     Column("end_time", DateTime(timezone=True), nullable=True),
     Column("current_phase", Enum(LabourPhase, name="labour_phase"), nullable=False),
-    Column(
-        "notes",
-        StringEncryptedType(
-            type_in=String,
-            key=os.getenv("DATABASE_ENCRYPTION_KEY"),  # TODO dependency injection
-            engine=AesEngine,
-            padding="pkcs5",
-        ),
-        nullable=True,
-    ),
+    # AES encrypted, decrypted on access by the mapped EncryptedAttribute
+    Column("notes", String, nullable=True),
 )
@@ -5,7 +5,11 @@ from src.setup.logs import configure_logging
 from src.setup.settings import Settings
 
 settings: Settings = Settings.from_file()
-configure_logging(level=settings.logging.level)
+configure_logging(
+    level=settings.logging.level,
+    json=settings.logging.json_format,
+    module_levels=settings.logging.all_module_levels,
+)
 app: FastAPI = create_app_with_container(settings)
 
 
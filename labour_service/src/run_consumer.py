@@ -12,22 +12,32 @@ from fern_labour_pub_sub.consumer import PubSubEventConsumer
 from fern_labour_pub_sub.topic_handler import TopicHandler
 
 from src.core.infrastructure.asyncio_task_manager import AsyncioTaskManager
+from src.core.infrastructure.diagnostics.loop_lag import LoopLagMonitor
+from src.core.infrastructure.metrics.event_handlers import instrument_event_handler
+from src.core.infrastructure.metrics.instruments import REGISTRY
+from src.core.infrastructure.metrics.server import MetricsServer
 from src.core.infrastructure.persistence.initialize_mapping import map_all
 from src.labour.application.event_handlers.mapping import LABOUR_EVENT_HANDLER_MAPPING
+from src.setup.diagnostics import create_loop_lag_monitor, create_query_budget
 from src.setup.ioc.di_component_enum import ComponentEnum
 from src.setup.ioc.ioc_registry import get_providers
+from src.setup.logs import configure_logging
 from src.setup.settings import Settings
 from src.subscription.application.event_handlers.mapping import SUBSCRIPTION_EVENT_HANDLER_MAPPING
 
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
 logger = logging.getLogger(__name__)
 
 
 class ConsumerRunner:
-    def __init__(self, consumer: EventConsumer) -> None:
+    def __init__(
+        self,
+        consumer: EventConsumer,
+        metrics_server: MetricsServer | None = None,
+        loop_lag_monitor: LoopLagMonitor | None = None,
+    ) -> None:
         self._consumer = consumer
+        self._metrics_server = metrics_server
+        self._loop_lag_monitor = loop_lag_monitor
         self._should_exit = asyncio.Event()
         self._task_manager: AsyncioTaskManager = AsyncioTaskManager()
         self.setup_signal_handlers()
@@ -35,6 +45,10 @@ class ConsumerRunner:
     async def start(self) -> None:
         """Start the consumer and initialize signal handlers"""
         logger.info("Starting consumer...")
+        if self._metrics_server:
+            await self._metrics_server.start()
+        if self._loop_lag_monitor:
+            await self._loop_lag_monitor.start()
         self._task_manager.create_task(self._consumer.start(), "EventConsumer")
         self._task_manager.create_task(self._health_check(), "HealthCheck")
 
@@ -59,6 +73,10 @@ class ConsumerRunner:
         logger.info("Shutting down consumer...")
         await self._consumer.stop()
         await self._task_manager.cancel_all()
+        if self._loop_lag_monitor:
+            await self._loop_lag_monitor.stop()
+        if self._metrics_server:
+            await self._metrics_server.stop()
         logger.info("Consumer shutdown complete")
 
     def setup_signal_handlers(self) -> None:
@@ -84,11 +102,14 @@ async def setup_container(settings: Settings) -> AsyncIterator[AsyncContainer]:
 
 
 def setup_consumer(settings: Settings, container: AsyncContainer) -> PubSubEventConsumer:
+    query_budget = create_query_budget(settings)
     topic_handlers = []
     for topic, event_handler in LABOUR_EVENT_HANDLER_MAPPING.items():
+        instrument_event_handler(topic, event_handler, query_budget)
         topic_handlers.append(TopicHandler(topic, event_handler, ComponentEnum.LABOUR_EVENTS))
 
     for topic, event_handler in SUBSCRIPTION_EVENT_HANDLER_MAPPING.items():
+        instrument_event_handler(topic, event_handler, query_budget)
         topic_handlers.append(TopicHandler(topic, event_handler, ComponentEnum.SUBSCRIPTION_EVENTS))
     consumer = PubSubEventConsumer(
         project_id=settings.events.gcp.project_id,
@@ -101,10 +122,24 @@ def setup_consumer(settings: Settings, container: AsyncContainer) -> PubSubEvent
 async def main() -> None:
     """Main entry point for the consumer script"""
     settings: Settings = Settings.from_file()
+    configure_logging(
+        level=settings.logging.level,
+        json=settings.logging.json_format,
+        module_levels=settings.logging.all_module_levels,
+    )
 
     async with setup_container(settings=settings) as container:
         consumer = setup_consumer(settings=settings, container=container)
-        runner = ConsumerRunner(consumer=consumer)
+        metrics_server = MetricsServer(
+            registry=REGISTRY,
+            host=settings.events.consumer.metrics_host,
+            port=settings.events.consumer.metrics_port,
+        )
+        runner = ConsumerRunner(
+            consumer=consumer,
+            metrics_server=metrics_server,
+            loop_lag_monitor=create_loop_lag_monitor(settings),
+        )
 
         try:
             await runner.start()
@@ -11,10 +11,20 @@ from fastapi.responses import ORJSONResponse
 from starlette.middleware.cors import CORSMiddleware
 
 from src.api.exception_handler import ExceptionHandler
+from src.api.idempotency import IdempotencyMiddleware
+from src.api.metrics import MetricsMiddleware
+from src.api.query_budget import QUERY_COUNT_HEADER, QUERY_TIME_HEADER, QueryBudgetMiddleware
+from src.api.read_your_writes import ReadYourWritesMiddleware
 from src.api.routes.router_root import root_router
+from src.core.infrastructure.diagnostics.loop_lag import LoopLagMonitor
+from src.core.infrastructure.idempotency_keys.in_memory import InMemoryIdempotencyKeyStore
 from src.core.infrastructure.persistence.initialize_mapping import map_all
+from src.core.infrastructure.recent_writes.in_memory import InMemoryRecentWriteTracker
+from src.core.infrastructure.sentry.sampling import TraceSampler
 from src.setup.background_tasks.background_worker import BackgroundWorker
 from src.setup.background_tasks.domain_event_publisher_task import DomainEventPublisherTask
+from src.setup.background_tasks.user_profile_refresh_task import UserProfileRefreshTask
+from src.setup.diagnostics import create_loop_lag_monitor, create_query_budget
 from src.setup.ioc.ioc_registry import get_providers
 from src.setup.settings import Settings
 
@@ -23,6 +33,10 @@ from src.setup.settings import Settings
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     map_all()
 
+    loop_lag_monitor: LoopLagMonitor | None = app.state.loop_lag_monitor
+    if loop_lag_monitor:
+        await loop_lag_monitor.start()
+
     app.state.background_worker = BackgroundWorker(container=app.state.dishka_container)
     app.state.background_worker.register(
         DomainEventPublisherTask(
@@ -31,11 +45,20 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
             max_concurrent=1,
         )
     )
+    app.state.background_worker.register(
+        UserProfileRefreshTask(
+            name="user_profile_refresh_task",
+            interval_seconds=30,
+            max_concurrent=1,
+        )
+    )
     app.state.background_worker.start()
 
     yield None
 
     await app.state.background_worker.stop()
+    if loop_lag_monitor:
+        await loop_lag_monitor.stop()
     await app.state.dishka_container.close()  # noqa; app.state is the place where dishka_container lives
 
 
@@ -51,21 +74,24 @@ def create_app_with_container(settings: Settings) -> FastAPI:
 
 
 def initialise_sentry(settings: Settings) -> None:
+    sentry_settings = settings.observability.sentry
+    sampler = TraceSampler(
+        traces_sample_rate=sentry_settings.traces_sample_rate,
+        write_traces_sample_rate=sentry_settings.write_traces_sample_rate,
+        unsampled_paths=sentry_settings.all_unsampled_paths,
+        slow_request_threshold=sentry_settings.slow_request_threshold,
+    )
     sentry_sdk.init(
         environment=settings.base.environment,
-        dsn="https://2e8e095bfd691bcc7f238e080ee09d07@o4508898015838208.ingest.de.sentry.io/4508898110210128",
+        dsn=sentry_settings.dsn,
         # Add data like request headers and IP for users,
         # see https://docs.sentry.io/platforms/python/data-management/data-collected/ for more info
         send_default_pii=True,
-        # Set traces_sample_rate to 1.0 to capture 100%
-        # of transactions for tracing.
-        traces_sample_rate=1.0,
-        _experiments={
-            # Set continuous_profiling_auto_start to True
-            # to automatically start the profiler on when
-            # possible.
-            "continuous_profiling_auto_start": True,
-        },
+        traces_sampler=sampler.traces_sampler,
+        before_send_transaction=sampler.before_send_transaction,
+        # The profiler only runs while started through POST /internal/profiling
+        profile_lifecycle="manual",
+        profile_session_sample_rate=1.0,
     )
 
 
@@ -79,18 +105,41 @@ def create_app(settings: Settings) -> FastAPI:
         redoc_url=None,
         openapi_url=None,
     )
+    new_app.state.loop_lag_monitor = create_loop_lag_monitor(settings)
     configure_app(new_app, settings)
     return new_app
 
 
 def configure_app(new_app: FastAPI, settings: Settings) -> None:
     new_app.include_router(root_router)
+    new_app.add_middleware(
+        ReadYourWritesMiddleware,
+        tracker=InMemoryRecentWriteTracker(
+            window_seconds=settings.db.replica.read_your_writes_window,
+            max_entries=settings.db.replica.max_tracked_writers,
+        ),
+    )
+    new_app.add_middleware(
+        IdempotencyMiddleware,
+        store=InMemoryIdempotencyKeyStore(
+            expiry_seconds=settings.security.idempotency.expiry,
+            max_entries=settings.security.idempotency.max_entries,
+        ),
+        path_prefixes=("/api/v1/labour",),
+    )
     new_app.add_middleware(
         CORSMiddleware,
         allow_origins=settings.security.cors.all_cors_origins,
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["Idempotent-Replayed", QUERY_COUNT_HEADER, QUERY_TIME_HEADER],
+    )
+    new_app.add_middleware(
+        QueryBudgetMiddleware,
+        budget=create_query_budget(settings),
+        expose_headers=settings.base.environment != "production",
     )
+    new_app.add_middleware(MetricsMiddleware)
     exception_handler = ExceptionHandler(new_app)
     exception_handler.setup_handlers()
@@ -0,0 +1,26 @@
+import logging
+
+from dishka import AsyncContainer
+
+from src.setup.background_tasks.background_task import BackgroundTask
+from src.setup.ioc.di_component_enum import ComponentEnum
+from src.user.application.services.user_service import UserService
+from src.user.infrastructure.auth.profile_refresh_queue import ProfileRefreshQueue
+
+log = logging.getLogger(__name__)
+
+
+class UserProfileRefreshTask(BackgroundTask):
+    """Background task for writing recently authenticated users to the users projection."""
+
+    async def execute(self, container: AsyncContainer) -> None:
+        profile_refresh_queue = await container.get(
+            ProfileRefreshQueue, component=ComponentEnum.DEFAULT
+        )
+        profiles = profile_refresh_queue.drain()
+        if not profiles:
+            return
+        async with container() as request_container:
+            user_service = await request_container.get(UserService, component=ComponentEnum.USER)
+            await user_service.save_profiles(profiles)
+        log.debug("Refreshed %d user profiles", len(profiles))
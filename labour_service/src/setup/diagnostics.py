@@ -0,0 +1,22 @@
+from src.core.infrastructure.diagnostics.loop_lag import LoopLagMonitor
+from src.core.infrastructure.metrics.query_budget import QueryBudget
+from src.setup.settings import Settings
+
+
+def create_loop_lag_monitor(settings: Settings) -> LoopLagMonitor | None:
+    loop_monitor_settings = settings.observability.loop_monitor
+    if not loop_monitor_settings.enabled:
+        return None
+    return LoopLagMonitor(
+        interval=loop_monitor_settings.interval,
+        blocking_threshold=loop_monitor_settings.blocking_threshold,
+        report_interval=loop_monitor_settings.report_interval,
+    )
+
+
+def create_query_budget(settings: Settings) -> QueryBudget:
+    query_budget_settings = settings.observability.query_budget
+    return QueryBudget(
+        max_queries=query_budget_settings.max_queries,
+        repeated_statement_threshold=query_budget_settings.repeated_statement_threshold,
+    )
@@ -11,6 +11,7 @@ from src.core.application.task_manager import TaskManager
 from src.core.domain.domain_event.repository import DomainEventRepository
 from src.core.infrastructure.asyncio_task_manager import AsyncioTaskManager
 from src.setup.ioc.di_component_enum import ComponentEnum
+from src.setup.settings import Settings
 
 log = logging.getLogger(__name__)
 
@@ -20,11 +21,12 @@ class CommonApplicationProvider(Provider):
     scope = Scope.REQUEST
 
     @provide(scope=Scope.APP)
-    async def provide_task_manager(self) -> AsyncIterable[TaskManager]:
+    async def provide_task_manager(self, settings: Settings) -> AsyncIterable[TaskManager]:
         log.debug("Creating AsyncioTaskManager")
         task_manager = AsyncioTaskManager()
-        task_manager.set_max_concurrent(
-            task_name_pattern="publish_batch_in_background", max_concurrent=1
+        task_manager.set_coalescing(
+            task_name_pattern="publish_batch_in_background",
+            debounce_seconds=settings.events.publisher.debounce,
         )
 
         yield task_manager
@@ -1,5 +1,5 @@
 import logging
-from collections.abc import AsyncIterable
+from collections.abc import AsyncIterable, Iterable
 
 from dishka import Provider, Scope, provide
 from fern_labour_core.unit_of_work import UnitOfWork
@@ -9,24 +9,42 @@ from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
-    create_async_engine,
 )
 
 from src.core.domain.domain_event.repository import DomainEventRepository
+from src.core.infrastructure.metrics.instruments import REGISTRY as METRICS_REGISTRY
 from src.core.infrastructure.persistence.domain_event.repository import (
     SQLAlchemyDomainEventRepository,
 )
+from src.core.infrastructure.persistence.encryption import (
+    FIELD_ENCRYPTOR_INFO_KEY,
+    FieldEncryptor,
+)
+from src.core.infrastructure.persistence.engine import create_instrumented_async_engine
 from src.core.infrastructure.persistence.idempotency.store import SQLAlchemyIdempotencyStore
+from src.core.infrastructure.persistence.pool_metrics import PoolMetricsRegistry
+from src.core.infrastructure.persistence.read_replica import (
+    ReadOnlyAsyncEngine,
+    ReadOnlyAsyncSession,
+    ReadOnlyAsyncSessionMaker,
+    replica_reads_allowed,
+)
 from src.core.infrastructure.persistence.unit_of_work import SQLAlchemyUnitOfWork
+from src.core.infrastructure.security.authorization_cache.in_memory import (
+    InMemoryAuthorizationCache,
+)
+from src.core.infrastructure.security.authorization_cache.interface import AuthorizationCache
 from src.core.infrastructure.security.rate_limiting.in_memory import InMemoryRateLimiter
 from src.core.infrastructure.security.rate_limiting.interface import RateLimiter
+from src.core.infrastructure.sentry.profiling import ProfilingSession
 from src.setup.ioc.di_component_enum import ComponentEnum
-from src.setup.ioc.di_providers.core.settings import PostgresDsn
+from src.setup.ioc.di_providers.core.settings import PostgresDsn, ReplicaPostgresDsn
 from src.setup.settings import Settings, SqlaEngineSettings
 from src.user.infrastructure.auth.interfaces.controller import AuthController
 from src.user.infrastructure.auth.interfaces.service import AuthService
 from src.user.infrastructure.auth.keycloak.auth_controller import KeycloakAuthController
 from src.user.infrastructure.auth.keycloak.auth_service import KeycloakAuthService
+from src.user.infrastructure.auth.profile_refresh_queue import ProfileRefreshQueue
 
 log = logging.getLogger(__name__)
 
@@ -35,27 +53,70 @@ class CommonInfrastructureProvider(Provider):
     component = ComponentEnum.DEFAULT
     scope = Scope.APP
 
+    @provide
+    def provide_pool_metrics_registry(
+        self, engine_settings: SqlaEngineSettings
+    ) -> Iterable[PoolMetricsRegistry]:
+        registry = PoolMetricsRegistry(
+            slow_checkout_threshold=engine_settings.slow_checkout_threshold
+        )
+        METRICS_REGISTRY.add_collector(registry.collect)
+        yield registry
+        METRICS_REGISTRY.remove_collector(registry.collect)
+
     @provide
     async def provide_async_engine(
         self,
         dsn: PostgresDsn,
         engine_settings: SqlaEngineSettings,
+        pool_metrics_registry: PoolMetricsRegistry,
     ) -> AsyncIterable[AsyncEngine]:
-        async_engine_params = {
-            "url": dsn,
-            **engine_settings.model_dump(),
-        }
-        async_engine = create_async_engine(**async_engine_params)
+        async_engine = create_instrumented_async_engine(
+            dsn=dsn,
+            metrics=pool_metrics_registry.register("primary"),
+            **engine_settings.engine_options,
+        )
         log.debug("Async engine created with DSN: %s", dsn)
         yield async_engine
         log.debug("Disposing async engine...")
         await async_engine.dispose()
         log.debug("Engine is disposed.")
 
+    @provide
+    async def provide_read_only_async_engine(
+        self,
+        dsn: ReplicaPostgresDsn,
+        engine_settings: SqlaEngineSettings,
+        settings: Settings,
+        engine: AsyncEngine,
+        pool_metrics_registry: PoolMetricsRegistry,
+    ) -> AsyncIterable[ReadOnlyAsyncEngine]:
+        if not settings.db.replica.replica_enabled:
+            log.debug("No replica configured, reads are served by the primary engine.")
+            yield ReadOnlyAsyncEngine(engine)
+            return
+
+        async_engine = create_instrumented_async_engine(
+            dsn=dsn,
+            metrics=pool_metrics_registry.register("replica"),
+            execution_options={"postgresql_readonly": True},
+            **engine_settings.engine_options,
+        )
+        log.debug("Read-only async engine created with DSN: %s", dsn)
+        yield ReadOnlyAsyncEngine(async_engine)
+        log.debug("Disposing read-only async engine...")
+        await async_engine.dispose()
+        log.debug("Read-only engine is disposed.")
+
+    @provide
+    def provide_field_encryptor(self, settings: Settings) -> FieldEncryptor:
+        return FieldEncryptor(key=settings.db.encryption.key)
+
     @provide
     def provide_async_session_maker(
         self,
         engine: AsyncEngine,
+        field_encryptor: FieldEncryptor,
     ) -> async_sessionmaker[AsyncSession]:
         session_factory = async_sessionmaker(
             bind=engine,
@@ -64,11 +125,31 @@ class CommonInfrastructureProvider(Provider):
             expire_on_commit=False,
             info={
                 "component": self.component,
+                FIELD_ENCRYPTOR_INFO_KEY: field_encryptor,
             },
         )
         log.debug("Async session maker initialized.")
         return session_factory
 
+    @provide
+    def provide_read_only_async_session_maker(
+        self,
+        engine: ReadOnlyAsyncEngine,
+        field_encryptor: FieldEncryptor,
+    ) -> ReadOnlyAsyncSessionMaker:
+        session_factory = async_sessionmaker(
+            bind=engine,
+            class_=AsyncSession,
+            autoflush=False,
+            expire_on_commit=False,
+            info={
+                "component": self.component,
+                FIELD_ENCRYPTOR_INFO_KEY: field_encryptor,
+            },
+        )
+        log.debug("Read-only async session maker initialized.")
+        return ReadOnlyAsyncSessionMaker(session_factory)
+
     @provide(scope=Scope.REQUEST)
     async def provide_async_session(
         self,
@@ -81,6 +162,22 @@ class CommonInfrastructureProvider(Provider):
             log.debug("Closing async session.")
         log.debug("Async session closed for '%s'.", self.component)
 
+    @provide(scope=Scope.REQUEST)
+    async def provide_read_only_async_session(
+        self,
+        settings: Settings,
+        async_session: AsyncSession,
+        read_only_async_session_maker: ReadOnlyAsyncSessionMaker,
+    ) -> AsyncIterable[ReadOnlyAsyncSession]:
+        if not settings.db.replica.replica_enabled or not replica_reads_allowed():
+            yield ReadOnlyAsyncSession(async_session)
+            return
+
+        async with read_only_async_session_maker() as session:
+            log.debug("Read-only async session started for '%s'.", self.component)
+            yield ReadOnlyAsyncSession(session)
+        log.debug("Read-only async session closed for '%s'.", self.component)
+
     @provide(scope=Scope.REQUEST)
     async def provide_unit_of_work(self, async_session: AsyncSession) -> UnitOfWork:
         return SQLAlchemyUnitOfWork(session=async_session)
@@ -100,13 +197,39 @@ class CommonInfrastructureProvider(Provider):
         return KeycloakAuthService(keycloak_openid=keycloak_openid)
 
     @provide
-    def provide_auth_controller(self, auth_service: AuthService) -> AuthController:
-        return KeycloakAuthController(auth_service=auth_service)
+    def provide_profile_refresh_queue(self, settings: Settings) -> ProfileRefreshQueue:
+        return ProfileRefreshQueue(
+            debounce_seconds=settings.security.user_management.profile_refresh_debounce,
+            max_entries=settings.security.user_management.profile_refresh_max_entries,
+        )
+
+    @provide
+    def provide_auth_controller(
+        self, auth_service: AuthService, profile_refresh_queue: ProfileRefreshQueue
+    ) -> AuthController:
+        return KeycloakAuthController(
+            auth_service=auth_service, profile_refresh_queue=profile_refresh_queue
+        )
 
     @provide
     def provide_rate_limiter(self) -> RateLimiter:
         return InMemoryRateLimiter()
 
+    @provide
+    def provide_authorization_cache(self, settings: Settings) -> AuthorizationCache:
+        return InMemoryAuthorizationCache(
+            ttl_seconds=settings.security.authorization_cache.ttl,
+            max_labours=settings.security.authorization_cache.max_labours,
+        )
+
+    @provide
+    def provide_profiling_session(self, settings: Settings) -> Iterable[ProfilingSession]:
+        session = ProfilingSession(
+            max_duration=settings.observability.sentry.max_profiling_duration
+        )
+        yield session
+        session.stop()
+
     @provide(scope=Scope.REQUEST)
     def provide_domain_event_repository(self, async_session: AsyncSession) -> DomainEventRepository:
         return SQLAlchemyDomainEventRepository(session=async_session)
@@ -8,6 +8,7 @@ from src.setup.ioc.di_component_enum import ComponentEnum
 from src.setup.settings import Settings, SqlaEngineSettings
 
 PostgresDsn = NewType("PostgresDsn", str)
+ReplicaPostgresDsn = NewType("ReplicaPostgresDsn", str)
 
 log = logging.getLogger(__name__)
 
@@ -21,6 +22,14 @@ class CommonSettingsProvider(Provider):
     def provide_postgres_dsn(self, settings: Settings) -> PostgresDsn:
         return PostgresDsn(settings.db.postgres.dsn)
 
+    @provide(scope=Scope.APP)
+    def provide_replica_postgres_dsn(self, settings: Settings) -> ReplicaPostgresDsn:
+        replica = settings.db.replica
+        postgres = settings.db.postgres.model_copy(
+            update={"host": replica.host, "port": replica.port}
+        )
+        return ReplicaPostgresDsn(postgres.dsn)
+
     @provide(scope=Scope.APP)
     def provide_sqla_engine_settings(self, settings: Settings) -> SqlaEngineSettings:
         return settings.db.sqla_engine
@@ -5,12 +5,17 @@ from fern_labour_core.unit_of_work import UnitOfWork
 
 from src.core.application.domain_event_publisher import DomainEventPublisher
 from src.core.domain.domain_event.repository import DomainEventRepository
+from src.core.infrastructure.security.authorization_cache.interface import AuthorizationCache
+from src.labour.application.queries.labour_export_query import LabourExportQuery
+from src.labour.application.queries.labour_summary_query import LabourSummaryQuery
 from src.labour.application.security.labour_authorization_service import LabourAuthorizationService
 from src.labour.application.services.contraction_service import ContractionService
+from src.labour.application.services.labour_export_service import LabourExportService
 from src.labour.application.services.labour_query_service import LabourQueryService
 from src.labour.application.services.labour_service import LabourService
 from src.labour.domain.labour.repository import LabourRepository
 from src.setup.ioc.di_component_enum import ComponentEnum
+from src.setup.ioc.di_providers.labour.infrastructure import ReadOnlyLabourRepository
 
 
 class LabourApplicationProvider(Provider):
@@ -28,12 +33,14 @@ class LabourApplicationProvider(Provider):
         domain_event_publisher: Annotated[
             DomainEventPublisher, FromComponent(ComponentEnum.DEFAULT)
         ],
+        authorization_cache: Annotated[AuthorizationCache, FromComponent(ComponentEnum.DEFAULT)],
     ) -> LabourService:
         return LabourService(
             labour_repository=labour_repository,
             domain_event_repository=domain_event_repository,
             unit_of_work=unit_of_work,
             domain_event_publisher=domain_event_publisher,
+            authorization_cache=authorization_cache,
         )
 
     @provide
@@ -57,12 +64,30 @@ class LabourApplicationProvider(Provider):
 
     @provide
     def provide_labour_query_service(
-        self, labour_repository: LabourRepository
+        self,
+        labour_repository: ReadOnlyLabourRepository,
+        labour_summary_query: LabourSummaryQuery,
     ) -> LabourQueryService:
-        return LabourQueryService(labour_repository=labour_repository)
+        return LabourQueryService(
+            labour_repository=labour_repository, labour_summary_query=labour_summary_query
+        )
+
+    @provide
+    def provide_labour_export_service(
+        self,
+        labour_repository: ReadOnlyLabourRepository,
+        labour_export_query: LabourExportQuery,
+    ) -> LabourExportService:
+        return LabourExportService(
+            labour_repository=labour_repository, labour_export_query=labour_export_query
+        )
 
     @provide
     def provide_labour_authorization_service(
-        self, labour_repository: LabourRepository
+        self,
+        labour_repository: LabourRepository,
+        authorization_cache: Annotated[AuthorizationCache, FromComponent(ComponentEnum.DEFAULT)],
     ) -> LabourAuthorizationService:
-        return LabourAuthorizationService(labour_repository=labour_repository)
+        return LabourAuthorizationService(
+            labour_repository=labour_repository, authorization_cache=authorization_cache
+        )
@@ -1,11 +1,23 @@
 import logging
-from typing import Annotated
+from datetime import timedelta
+from typing import Annotated, NewType
 
 from dishka import FromComponent, Provider, Scope, provide
+from fern_labour_core.unit_of_work import UnitOfWork
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.infrastructure.persistence.read_replica import ReadOnlyAsyncSession
+from src.labour.application.queries.labour_export_query import LabourExportQuery
+from src.labour.application.queries.labour_summary_query import LabourSummaryQuery
 from src.labour.application.security.token_generator import TokenGenerator
 from src.labour.domain.labour.repository import LabourRepository
+from src.labour.infrastructure.persistence.labour_archiver import LabourArchiver
+from src.labour.infrastructure.persistence.queries.labour_export_query import (
+    SQLAlchemyLabourExportQuery,
+)
+from src.labour.infrastructure.persistence.queries.labour_summary_query import (
+    SQLAlchemyLabourSummaryQuery,
+)
 from src.labour.infrastructure.persistence.repositories.labour_repository import (
     SQLAlchemyLabourRepository,
 )
@@ -13,6 +25,8 @@ from src.labour.infrastructure.security.sha256_token_generator import SHA256Toke
 from src.setup.ioc.di_component_enum import ComponentEnum
 from src.setup.settings import Settings
 
+ReadOnlyLabourRepository = NewType("ReadOnlyLabourRepository", SQLAlchemyLabourRepository)
+
 log = logging.getLogger(__name__)
 
 
@@ -26,6 +40,38 @@ class LabourInfrastructureProvider(Provider):
     ) -> LabourRepository:
         return SQLAlchemyLabourRepository(session=async_session)
 
+    @provide(scope=Scope.REQUEST)
+    def provide_read_only_labour_repository(
+        self, async_session: Annotated[ReadOnlyAsyncSession, FromComponent(ComponentEnum.DEFAULT)]
+    ) -> ReadOnlyLabourRepository:
+        return ReadOnlyLabourRepository(SQLAlchemyLabourRepository(session=async_session))
+
+    @provide(scope=Scope.REQUEST)
+    def provide_labour_summary_query(
+        self, async_session: Annotated[ReadOnlyAsyncSession, FromComponent(ComponentEnum.DEFAULT)]
+    ) -> LabourSummaryQuery:
+        return SQLAlchemyLabourSummaryQuery(session=async_session)
+
+    @provide(scope=Scope.REQUEST)
+    def provide_labour_export_query(
+        self, async_session: Annotated[ReadOnlyAsyncSession, FromComponent(ComponentEnum.DEFAULT)]
+    ) -> LabourExportQuery:
+        return SQLAlchemyLabourExportQuery(session=async_session)
+
+    @provide(scope=Scope.REQUEST)
+    def provide_labour_archiver(
+        self,
+        async_session: Annotated[AsyncSession, FromComponent(ComponentEnum.DEFAULT)],
+        unit_of_work: Annotated[UnitOfWork, FromComponent(ComponentEnum.DEFAULT)],
+        settings: Annotated[Settings, FromComponent(ComponentEnum.DEFAULT)],
+    ) -> LabourArchiver:
+        return LabourArchiver(
+            session=async_session,
+            unit_of_work=unit_of_work,
+            archive_after=timedelta(days=settings.db.archive.archive_after_days),
+            batch_size=settings.db.archive.batch_size,
+        )
+
     @provide
     def provide_token_generator(
         self, settings: Annotated[Settings, FromComponent(ComponentEnum.DEFAULT)]
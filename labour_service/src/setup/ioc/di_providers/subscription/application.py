@@ -8,6 +8,10 @@ from src.core.domain.domain_event.repository import DomainEventRepository
 from src.labour.application.security.token_generator import TokenGenerator
 from src.labour.application.services.labour_query_service import LabourQueryService
 from src.setup.ioc.di_component_enum import ComponentEnum
+from src.setup.ioc.di_providers.subscription.infrastructure import ReadOnlySubscriptionRepository
+from src.subscription.application.queries.labour_subscriptions_query import (
+    LabourSubscriptionsQuery,
+)
 from src.subscription.application.security.subscription_authorization_service import (
     SubscriptionAuthorizationService,
 )
@@ -58,12 +62,14 @@ class SubscriptionApplicationProvider(Provider):
     @provide
     def provide_subscription_query_service(
         self,
-        subscription_repository: SubscriptionRepository,
+        subscription_repository: ReadOnlySubscriptionRepository,
         subscription_authorization_service: SubscriptionAuthorizationService,
+        labour_subscriptions_query: LabourSubscriptionsQuery,
     ) -> SubscriptionQueryService:
         return SubscriptionQueryService(
             subscription_repository=subscription_repository,
             subscription_authorization_service=subscription_authorization_service,
+            labour_subscriptions_query=labour_subscriptions_query,
         )
 
     @provide
@@ -1,14 +1,26 @@
 import logging
-from typing import Annotated
+from typing import Annotated, NewType
 
 from dishka import FromComponent, Provider, Scope, provide
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.infrastructure.persistence.read_replica import ReadOnlyAsyncSession
 from src.setup.ioc.di_component_enum import ComponentEnum
+from src.subscription.application.queries.labour_subscriptions_query import (
+    LabourSubscriptionsQuery,
+)
 from src.subscription.domain.repository import SubscriptionRepository
+from src.subscription.infrastructure.persistence.queries.labour_subscriptions_query import (
+    SQLAlchemyLabourSubscriptionsQuery,
+)
 from src.subscription.infrastructure.persistence.repository import (
     SQLAlchemySubscriptionRepository,
 )
+from src.user.infrastructure.persistence.repositories.user_repository import KeycloakUserRepository
+
+ReadOnlySubscriptionRepository = NewType(
+    "ReadOnlySubscriptionRepository", SQLAlchemySubscriptionRepository
+)
 
 log = logging.getLogger(__name__)
 
@@ -22,3 +34,23 @@ class SubscriptionInfrastructureProvider(Provider):
         self, async_session: Annotated[AsyncSession, FromComponent(ComponentEnum.DEFAULT)]
     ) -> SubscriptionRepository:
         return SQLAlchemySubscriptionRepository(session=async_session)
+
+    @provide(scope=Scope.REQUEST)
+    def provide_read_only_subscription_repository(
+        self, async_session: Annotated[ReadOnlyAsyncSession, FromComponent(ComponentEnum.DEFAULT)]
+    ) -> ReadOnlySubscriptionRepository:
+        return ReadOnlySubscriptionRepository(
+            SQLAlchemySubscriptionRepository(session=async_session)
+        )
+
+    @provide(scope=Scope.REQUEST)
+    def provide_labour_subscriptions_query(
+        self,
+        async_session: Annotated[ReadOnlyAsyncSession, FromComponent(ComponentEnum.DEFAULT)],
+        keycloak_user_repository: Annotated[
+            KeycloakUserRepository, FromComponent(ComponentEnum.USER)
+        ],
+    ) -> LabourSubscriptionsQuery:
+        return SQLAlchemyLabourSubscriptionsQuery(
+            session=async_session, fallback=keycloak_user_repository
+        )
@@ -1,7 +1,11 @@
-from dishka import Provider, Scope, provide
+from typing import Annotated
+
+from dishka import FromComponent, Provider, Scope, provide
+from fern_labour_core.unit_of_work import UnitOfWork
 
 from src.setup.ioc.di_component_enum import ComponentEnum
 from src.user.application.services.user_query_service import UserQueryService
+from src.user.application.services.user_service import UserService
 from src.user.domain.repository import UserRepository
 
 
@@ -12,3 +16,11 @@ class UserApplicationProvider(Provider):
     @provide
     def provide_user_service(self, user_repository: UserRepository) -> UserQueryService:
         return UserQueryService(user_repository=user_repository)
+
+    @provide
+    def provide_user_profile_service(
+        self,
+        user_repository: UserRepository,
+        unit_of_work: Annotated[UnitOfWork, FromComponent(ComponentEnum.DEFAULT)],
+    ) -> UserService:
+        return UserService(user_repository=user_repository, unit_of_work=unit_of_work)
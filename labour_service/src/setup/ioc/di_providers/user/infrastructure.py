@@ -1,12 +1,19 @@
 from typing import Annotated
 
 from dishka import FromComponent, Provider, Scope, provide
+from fern_labour_core.unit_of_work import UnitOfWork
 from keycloak import KeycloakAdmin
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.setup.ioc.di_component_enum import ComponentEnum
 from src.setup.settings import Settings
 from src.user.domain.repository import UserRepository
+from src.user.infrastructure.auth.keycloak.admin_client import KeycloakAdminClient
+from src.user.infrastructure.persistence.repositories.user_projection_repository import (
+    SQLAlchemyUserRepository,
+)
 from src.user.infrastructure.persistence.repositories.user_repository import KeycloakUserRepository
+from src.user.infrastructure.persistence.user_projection_sync import KeycloakUserProjectionSync
 
 
 class UserInfrastructureProvider(Provider):
@@ -26,5 +33,44 @@ class UserInfrastructureProvider(Provider):
         )
 
     @provide
-    def provide_user_repository(self, keycloak_admin: KeycloakAdmin) -> UserRepository:
-        return KeycloakUserRepository(keycloak_admin=keycloak_admin)
+    def provide_keycloak_admin_client(
+        self,
+        keycloak_admin: KeycloakAdmin,
+        settings: Annotated[Settings, FromComponent(ComponentEnum.DEFAULT)],
+    ) -> KeycloakAdminClient:
+        return KeycloakAdminClient(
+            keycloak_admin=keycloak_admin,
+            max_concurrency=settings.security.user_management.max_concurrency,
+            max_retries=settings.security.user_management.max_retries,
+        )
+
+    @provide
+    def provide_keycloak_user_repository(
+        self, keycloak_admin_client: KeycloakAdminClient
+    ) -> KeycloakUserRepository:
+        return KeycloakUserRepository(keycloak_admin_client=keycloak_admin_client)
+
+    @provide(scope=Scope.REQUEST)
+    def provide_projection_user_repository(
+        self,
+        session: Annotated[AsyncSession, FromComponent(ComponentEnum.DEFAULT)],
+        keycloak_user_repository: KeycloakUserRepository,
+    ) -> SQLAlchemyUserRepository:
+        return SQLAlchemyUserRepository(session=session, fallback=keycloak_user_repository)
+
+    @provide(scope=Scope.REQUEST)
+    def provide_user_repository(self, user_repository: SQLAlchemyUserRepository) -> UserRepository:
+        return user_repository
+
+    @provide(scope=Scope.REQUEST)
+    def provide_user_projection_sync(
+        self,
+        keycloak_admin_client: KeycloakAdminClient,
+        user_repository: SQLAlchemyUserRepository,
+        unit_of_work: Annotated[UnitOfWork, FromComponent(ComponentEnum.DEFAULT)],
+    ) -> KeycloakUserProjectionSync:
+        return KeycloakUserProjectionSync(
+            keycloak_admin_client=keycloak_admin_client,
+            user_repository=user_repository,
+            unit_of_work=unit_of_work,
+        )
@@ -1,27 +1,105 @@
+import atexit
+import copy
 import logging
+import queue
+import sys
+from datetime import UTC, datetime
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any
+
+import orjson
 
 from src.core.infrastructure.custom_types import LoggingLevel
 
+TEXT_FORMAT = (
+    "[%(asctime)s.%(msecs)03d] %(funcName)20s %(module)s:%(lineno)d %(levelname)-8s - %(message)s"
+)
+TEXT_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+_listener: QueueListener | None = None
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats each record as a single line JSON object."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: dict[str, Any] = {
+            "timestamp": datetime.fromtimestamp(record.created, tz=UTC).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "module": record.module,
+            "function": record.funcName,
+            "line": record.lineno,
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        if record.stack_info:
+            entry["stack"] = self.formatStack(record.stack_info)
+        return orjson.dumps(entry, default=str).decode()
+
+
+class LogRecordQueueHandler(QueueHandler):
+    """
+    Queues records with their exception and stack info intact.
+
+    The default `prepare` formats the record on the calling thread and drops `exc_info` and
+    `stack_info`, folding the traceback into the message. Records here are only merged with
+    their arguments, and are formatted by the listener's handler, so a JSON formatter can
+    still write the traceback to its own field.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
 
-def configure_logging(level: LoggingLevel = "INFO") -> None:
-    level_map: dict[str, int] = {
-        "DEBUG": logging.DEBUG,
-        "INFO": logging.INFO,
-        "WARNING": logging.WARNING,
-        "ERROR": logging.ERROR,
-        "CRITICAL": logging.CRITICAL,
-    }
-
-    numeric_level: int = level_map.get(level, logging.INFO)
-
-    logging.basicConfig(
-        level=numeric_level,
-        datefmt="%Y-%m-%d %H:%M:%S",
-        format=(
-            "[%(asctime)s.%(msecs)03d] "
-            "%(funcName)20s "
-            "%(module)s:%(lineno)d "
-            "%(levelname)-8s - "
-            "%(message)s"
-        ),
+def _stop_listener() -> None:
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def configure_logging(
+    level: LoggingLevel = "INFO",
+    json: bool = False,
+    module_levels: dict[str, LoggingLevel] | None = None,
+) -> None:
+    """
+    Route all logging through a queue so that the event loop never blocks on log output.
+
+    Records are put on an unbounded queue by the root logger's handler and written to stderr
+    by a listener thread. Calling this again replaces the previous configuration.
+
+    Args:
+        level: The root logging level
+        json: Whether to write records as JSON objects rather than plain text
+        module_levels: Logging levels for individual loggers, overriding the root level
+    """
+    global _listener
+    _stop_listener()
+
+    stream_handler = logging.StreamHandler(sys.stderr)
+    stream_handler.setFormatter(
+        JsonFormatter() if json else logging.Formatter(TEXT_FORMAT, datefmt=TEXT_DATE_FORMAT)
     )
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+        handler.close()
+    root.addHandler(LogRecordQueueHandler(log_queue))
+    root.setLevel(level)
+
+    for name, module_level in (module_levels or {}).items():
+        logging.getLogger(name).setLevel(module_level)
+
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+
+
+atexit.register(_stop_listener)
@@ -1,10 +1,11 @@
 import logging
 import os
 from pathlib import Path
-from typing import Any, Literal, Self
+from typing import Any, Literal, Self, cast
 
 from pydantic import BaseModel, Field, PostgresDsn, computed_field
 
+from src.core.infrastructure.custom_types import LoggingLevel
 from src.setup.constants import BASE_DIR
 from src.setup.readers.abstract import ConfigReader
 from src.setup.readers.toml import TomlConfigReader
@@ -27,6 +28,12 @@ class KeycloakSettings(BaseModel):
 class UserManagementSettings(BaseModel):
     client_id: str = Field(alias="USER_MANAGEMENT_SERVICE_CLIENT_ID")
     client_secret: str = Field(alias="USER_MANAGEMENT_SERVICE_CLIENT_SECRET")
+    max_concurrency: int = Field(alias="USER_MANAGEMENT_MAX_CONCURRENCY", default=10)
+    max_retries: int = Field(alias="USER_MANAGEMENT_MAX_RETRIES", default=3)
+    profile_refresh_debounce: int = Field(alias="USER_PROFILE_REFRESH_DEBOUNCE", default=900)
+    profile_refresh_max_entries: int = Field(
+        alias="USER_PROFILE_REFRESH_MAX_ENTRIES", default=10_000
+    )
 
 
 class SubscriberTokenSettings(BaseModel):
@@ -56,11 +63,23 @@ class RateLimitSettings(BaseModel):
     )
 
 
+class IdempotencySettings(BaseModel):
+    expiry: int = Field(alias="IDEMPOTENCY_KEY_EXPIRY", default=3600)
+    max_entries: int = Field(alias="IDEMPOTENCY_KEY_MAX_ENTRIES", default=10000)
+
+
+class AuthorizationCacheSettings(BaseModel):
+    ttl: int = Field(alias="AUTHORIZATION_CACHE_TTL", default=30)
+    max_labours: int = Field(alias="AUTHORIZATION_CACHE_MAX_LABOURS", default=10000)
+
+
 class SecuritySettings(BaseModel):
     cors: CORSSettings
     keycloak: KeycloakSettings
     subscriber_token: SubscriberTokenSettings
     rate_limits: RateLimitSettings
+    idempotency: IdempotencySettings
+    authorization_cache: AuthorizationCacheSettings
     user_management: UserManagementSettings
 
 
@@ -72,6 +91,19 @@ class LoggingSettings(BaseModel):
         "ERROR",
         "CRITICAL",
     ] = Field(alias="LOG_LEVEL")
+    json_format: bool = Field(alias="LOG_JSON", default=False)
+    module_levels: str = Field(alias="LOG_MODULE_LEVELS", default="")
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def all_module_levels(self) -> dict[str, LoggingLevel]:
+        levels: dict[str, LoggingLevel] = {}
+        for override in self.module_levels.split(","):
+            if not override.strip():
+                continue
+            name, _, level = override.partition("=")
+            levels[name.strip()] = cast(LoggingLevel, level.strip().upper())
+        return levels
 
 
 class UvicornSettings(BaseModel):
@@ -101,16 +133,63 @@ class PostgresSettings(BaseModel):
         )
 
 
+class PostgresReplicaSettings(BaseModel):
+    host: str = Field(alias="POSTGRES_REPLICA_HOST", default="")
+    port: int = Field(alias="POSTGRES_REPLICA_PORT", default=5432)
+    read_your_writes_window: float = Field(
+        alias="POSTGRES_REPLICA_READ_YOUR_WRITES_WINDOW", default=5.0
+    )
+    max_tracked_writers: int = Field(alias="POSTGRES_REPLICA_MAX_TRACKED_WRITERS", default=10000)
+
+    @property
+    def replica_enabled(self) -> bool:
+        return bool(self.host)
+
+
 class SqlaEngineSettings(BaseModel):
     echo: bool = Field(alias="SQLA_ECHO")
     echo_pool: bool = Field(alias="SQLA_ECHO_POOL")
     pool_size: int = Field(alias="SQLA_POOL_SIZE")
     max_overflow: int = Field(alias="SQLA_MAX_OVERFLOW")
+    pool_timeout: float = Field(alias="SQLA_POOL_TIMEOUT", default=30.0)
+    pool_recycle: int = Field(alias="SQLA_POOL_RECYCLE", default=-1)
+    pool_pre_ping: bool = Field(alias="SQLA_POOL_PRE_PING", default=False)
+    prepare_threshold: int = Field(alias="SQLA_PREPARE_THRESHOLD", default=5)
+    pgbouncer_mode: bool = Field(alias="SQLA_PGBOUNCER_MODE", default=False)
+    slow_checkout_threshold: float = Field(alias="SQLA_SLOW_CHECKOUT_THRESHOLD", default=0.5)
+
+    @property
+    def engine_options(self) -> dict[str, Any]:
+        # A transaction pooler such as PgBouncer may run consecutive statements of one client on
+        # different server connections, so statements must never be prepared server side.
+        prepare_threshold = None if self.pgbouncer_mode else self.prepare_threshold
+        return {
+            "echo": self.echo,
+            "echo_pool": self.echo_pool,
+            "pool_size": self.pool_size,
+            "max_overflow": self.max_overflow,
+            "pool_timeout": self.pool_timeout,
+            "pool_recycle": self.pool_recycle,
+            "pool_pre_ping": self.pool_pre_ping,
+            "connect_args": {"prepare_threshold": prepare_threshold},
+        }
+
+
+class EncryptionSettings(BaseModel):
+    key: str = Field(alias="DATABASE_ENCRYPTION_KEY")
+
+
+class LabourArchiveSettings(BaseModel):
+    archive_after_days: int = Field(alias="LABOUR_ARCHIVE_AFTER_DAYS", default=30)
+    batch_size: int = Field(alias="LABOUR_ARCHIVE_BATCH_SIZE", default=50)
 
 
 class DbSettings(BaseModel):
     postgres: PostgresSettings
+    replica: PostgresReplicaSettings
     sqla_engine: SqlaEngineSettings
+    encryption: EncryptionSettings
+    archive: LabourArchiveSettings
 
 
 class GCPSettings(BaseModel):
@@ -118,8 +197,19 @@ class GCPSettings(BaseModel):
     retries: int = Field(alias="GCP_PRODUCER_RETRIES", default=3)
 
 
+class PublisherSettings(BaseModel):
+    debounce: float = Field(alias="DOMAIN_EVENT_PUBLISH_DEBOUNCE", default=0.2)
+
+
+class ConsumerSettings(BaseModel):
+    metrics_host: str = Field(alias="CONSUMER_METRICS_HOST")
+    metrics_port: int = Field(alias="CONSUMER_METRICS_PORT", default=9464)
+
+
 class EventSettings(BaseModel):
     gcp: GCPSettings
+    publisher: PublisherSettings
+    consumer: ConsumerSettings
 
 
 class StripeSettings(BaseModel):
@@ -135,10 +225,57 @@ class PaymentSettings(BaseModel):
     stripe: StripeSettings
 
 
+class SentrySettings(BaseModel):
+    dsn: str = Field(alias="SENTRY_DSN", default="")
+    traces_sample_rate: float = Field(alias="SENTRY_TRACES_SAMPLE_RATE", default=0.05)
+    write_traces_sample_rate: float = Field(alias="SENTRY_WRITE_TRACES_SAMPLE_RATE", default=0.25)
+    unsampled_paths: str = Field(alias="SENTRY_UNSAMPLED_PATHS", default="/api/v1/health,/metrics")
+    slow_request_threshold: float = Field(alias="SENTRY_SLOW_REQUEST_THRESHOLD", default=0.0)
+    profiling_token: str = Field(alias="SENTRY_PROFILING_TOKEN", default="")
+    max_profiling_duration: int = Field(alias="SENTRY_MAX_PROFILING_DURATION", default=300)
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def all_unsampled_paths(self) -> list[str]:
+        return [
+            path.strip().rstrip("/") for path in self.unsampled_paths.split(",") if path.strip()
+        ]
+
+    @property
+    def tail_sampling_enabled(self) -> bool:
+        return self.slow_request_threshold > 0
+
+
+class LoopMonitorSettings(BaseModel):
+    enabled: bool = Field(alias="LOOP_MONITOR_ENABLED", default=False)
+    interval: float = Field(alias="LOOP_MONITOR_INTERVAL", default=0.1)
+    blocking_threshold: float = Field(alias="LOOP_MONITOR_BLOCKING_THRESHOLD", default=0.1)
+    report_interval: float = Field(alias="LOOP_MONITOR_REPORT_INTERVAL", default=60.0)
+
+
+class QueryBudgetSettings(BaseModel):
+    max_queries: int = Field(alias="QUERY_BUDGET_MAX_QUERIES", default=20)
+    repeated_statement_threshold: int = Field(
+        alias="QUERY_BUDGET_REPEATED_STATEMENT_THRESHOLD", default=5
+    )
+
+
+class MetricsSettings(BaseModel):
+    scrape_token: str = Field(alias="METRICS_SCRAPE_TOKEN", default="")
+
+
+class ObservabilitySettings(BaseModel):
+    sentry: SentrySettings
+    metrics: MetricsSettings
+    loop_monitor: LoopMonitorSettings
+    query_budget: QueryBudgetSettings
+
+
 class Settings(BaseModel):
     base: BaseSettings
     security: SecuritySettings
     logging: LoggingSettings
+    observability: ObservabilitySettings
     uvicorn: UvicornSettings
     events: EventSettings
     db: DbSettings
@@ -1,4 +1,3 @@
-import asyncio
 from typing import Annotated
 
 from dishka import FromComponent
@@ -8,6 +7,7 @@ from fastapi.security import HTTPAuthorizationCredentials
 
 from src.api.dependencies import bearer_scheme
 from src.api.exception_handler import ExceptionSchema
+from src.api.responses import DataclassResponse
 from src.labour.application.security.labour_authorization_service import (
     LabourAuthorizationService,
 )
@@ -160,22 +160,22 @@ async def get_subscription_by_id(
     labour_query_service: Annotated[LabourQueryService, FromComponent(ComponentEnum.LABOUR)],
     auth_controller: Annotated[AuthController, FromComponent(ComponentEnum.DEFAULT)],
     credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
-) -> SubscriptionDataResponse:
+) -> DataclassResponse:
     user = auth_controller.get_authenticated_user(credentials=credentials)
     subscription = await subscription_query_service.get_by_id(
         requester_id=user.id, subscription_id=subscription_id
     )
-    async with asyncio.TaskGroup() as tg:
-        birthing_person_task = tg.create_task(
-            user_service.get_summary(user_id=subscription.birthing_person_id)
-        )
-        labour_task = tg.create_task(
-            labour_query_service.get_labour_by_id(labour_id=subscription.labour_id)
-        )
-    return SubscriptionDataResponse(
-        subscription=subscription,
-        birthing_person=birthing_person_task.result(),
-        labour=labour_task.result(),
+    # Both lookups share the request's database session, so they cannot run concurrently
+    labour = await labour_query_service.get_accessible_labour(
+        requester_id=user.id, labour_id=subscription.labour_id
+    )
+    birthing_person = await user_service.get_summary(user_id=subscription.birthing_person_id)
+    return DataclassResponse(
+        {
+            "subscription": subscription,
+            "birthing_person": birthing_person,
+            "labour": labour,
+        }
     )
 
 
@@ -199,7 +199,6 @@ async def get_labour_subscriptions(
     labour_authorization_service: Annotated[
         LabourAuthorizationService, FromComponent(ComponentEnum.LABOUR)
     ],
-    user_service: Annotated[UserQueryService, FromComponent(ComponentEnum.USER)],
     auth_controller: Annotated[AuthController, FromComponent(ComponentEnum.DEFAULT)],
     credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
 ) -> LabourSubscriptionsResponse:
@@ -207,10 +206,10 @@ async def get_labour_subscriptions(
     await labour_authorization_service.ensure_can_access_labour(
         requester_id=user.id, labour_id=labour_id
     )
-    subscriptions = await subscription_query_service.get_labour_subscriptions(
+    (
+        subscriptions,
+        subscribers,
+    ) = await subscription_query_service.get_labour_subscriptions_with_subscribers(
         requester_id=user.id, labour_id=labour_id
     )
-    subscribers = await user_service.get_many_summary(
-        user_ids=[subscription.subscriber_id for subscription in subscriptions]
-    )
     return LabourSubscriptionsResponse(subscriptions=subscriptions, subscribers=subscribers)
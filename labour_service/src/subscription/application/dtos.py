@@ -4,7 +4,7 @@ from typing import Any, Self
 from src.subscription.domain.entity import Subscription
 
 
-@dataclass
+@dataclass(slots=True)
 class SubscriptionDTO:
     id: str
     labour_id: str
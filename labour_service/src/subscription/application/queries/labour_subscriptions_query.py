@@ -0,0 +1,22 @@
+from typing import Protocol
+
+from src.subscription.application.dtos import SubscriptionDTO
+from src.user.application.dtos.user_summary import UserSummaryDTO
+
+
+class LabourSubscriptionsQuery(Protocol):
+    """Read-only query for the subscriptions to a labour together with their subscribers."""
+
+    async def get_labour_subscriptions(
+        self, labour_id: str, birthing_person_id: str
+    ) -> tuple[list[SubscriptionDTO], list[UserSummaryDTO]]:
+        """
+        Retrieve the subscriptions to a labour and a summary of each subscriber.
+
+        Args:
+            labour_id: The ID of the labour to retrieve subscriptions for
+            birthing_person_id: The ID of the Birthing Person the labour belongs to
+
+        Returns:
+            The subscriptions, and the subscribers in the order of their subscriptions
+        """
@@ -6,6 +6,9 @@ from src.labour.domain.labour.exceptions import (
 )
 from src.labour.domain.labour.value_objects.labour_id import LabourId
 from src.subscription.application.dtos import SubscriptionDTO
+from src.subscription.application.queries.labour_subscriptions_query import (
+    LabourSubscriptionsQuery,
+)
 from src.subscription.application.security.subscription_authorization_service import (
     SubscriptionAuthorizationService,
 )
@@ -17,6 +20,7 @@ from src.subscription.domain.exceptions import (
 )
 from src.subscription.domain.repository import SubscriptionRepository
 from src.subscription.domain.value_objects.subscription_id import SubscriptionId
+from src.user.application.dtos.user_summary import UserSummaryDTO
 from src.user.domain.value_objects.user_id import UserId
 
 log = logging.getLogger(__name__)
@@ -27,9 +31,11 @@ class SubscriptionQueryService:
         self,
         subscription_repository: SubscriptionRepository,
         subscription_authorization_service: SubscriptionAuthorizationService,
+        labour_subscriptions_query: LabourSubscriptionsQuery,
     ):
         self._subscription_repository = subscription_repository
         self._subscription_authorization_service = subscription_authorization_service
+        self._labour_subscriptions_query = labour_subscriptions_query
 
     async def get_by_id(self, requester_id: str, subscription_id: str) -> SubscriptionDTO:
         try:
@@ -74,3 +80,15 @@ class SubscriptionQueryService:
             access_level=access_level_domain,
         )
         return [SubscriptionDTO.from_domain(subscription) for subscription in subscriptions]
+
+    async def get_labour_subscriptions_with_subscribers(
+        self, requester_id: str, labour_id: str
+    ) -> tuple[list[SubscriptionDTO], list[UserSummaryDTO]]:
+        try:
+            UUID(labour_id)
+        except ValueError:
+            raise InvalidLabourId()
+
+        return await self._labour_subscriptions_query.get_labour_subscriptions(
+            labour_id=labour_id, birthing_person_id=requester_id
+        )
@@ -0,0 +1,97 @@
+import logging
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.subscription.application.dtos import SubscriptionDTO
+from src.subscription.application.queries.labour_subscriptions_query import (
+    LabourSubscriptionsQuery,
+)
+from src.subscription.domain.entity import Subscription
+from src.subscription.infrastructure.persistence.table import subscriptions_table
+from src.user.application.dtos.user_summary import UserSummaryDTO
+from src.user.domain.repository import UserRepository
+from src.user.domain.value_objects.user_id import UserId
+from src.user.infrastructure.persistence.table import users_table
+
+log = logging.getLogger(__name__)
+
+
+def build_labour_subscriptions_statement(labour_id: UUID, birthing_person_id: str) -> Select[Any]:
+    """
+    Build a single statement selecting a labour's subscriptions with the names of their subscribers.
+
+    The users projection is outer joined so that subscriptions are still returned for
+    subscribers who have not been synced into it yet.
+    """
+    return (
+        select(
+            Subscription,
+            users_table.c.id.label("user_id"),
+            users_table.c.first_name,
+            users_table.c.last_name,
+        )
+        .outerjoin(users_table, users_table.c.id == subscriptions_table.c.subscriber_id)
+        .where(
+            subscriptions_table.c.labour_id == labour_id,
+            subscriptions_table.c.birthing_person_id == birthing_person_id,
+        )
+    )
+
+
+class SQLAlchemyLabourSubscriptionsQuery(LabourSubscriptionsQuery):
+    """
+    Subscriptions to a labour joined with their subscribers from the users projection.
+
+    Subscribers missing from the projection are read from the fallback repository.
+    """
+
+    def __init__(self, session: AsyncSession, fallback: UserRepository):
+        self._session = session
+        self._fallback = fallback
+
+    async def get_labour_subscriptions(
+        self, labour_id: str, birthing_person_id: str
+    ) -> tuple[list[SubscriptionDTO], list[UserSummaryDTO]]:
+        """
+        Retrieve the subscriptions to a labour and a summary of each subscriber.
+
+        Args:
+            labour_id: The ID of the labour to retrieve subscriptions for
+            birthing_person_id: The ID of the Birthing Person the labour belongs to
+
+        Returns:
+            The subscriptions, and the subscribers in the order of their subscriptions
+        """
+        stmt = build_labour_subscriptions_statement(
+            labour_id=UUID(labour_id), birthing_person_id=birthing_person_id
+        )
+        result = await self._session.execute(stmt)
+
+        subscriptions: list[SubscriptionDTO] = []
+        subscribers: dict[str, UserSummaryDTO] = {}
+        for row in result:
+            subscription = SubscriptionDTO.from_domain(row.Subscription)
+            subscriptions.append(subscription)
+            if row.user_id is not None:
+                subscribers[row.user_id] = UserSummaryDTO(
+                    id=row.user_id, first_name=row.first_name, last_name=row.last_name
+                )
+
+        missing = [
+            UserId(subscription.subscriber_id)
+            for subscription in subscriptions
+            if subscription.subscriber_id not in subscribers
+        ]
+        if missing:
+            log.info("%d subscribers missing from projection, reading from fallback", len(missing))
+            for user in await self._fallback.get_by_ids(missing):
+                subscribers[user.id_.value] = UserSummaryDTO.from_domain(user)
+
+        return subscriptions, [
+            subscribers[subscription.subscriber_id]
+            for subscription in subscriptions
+            if subscription.subscriber_id in subscribers
+        ]
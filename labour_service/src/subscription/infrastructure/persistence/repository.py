@@ -1,4 +1,6 @@
-from sqlalchemy import select
+from typing import Any
+
+from sqlalchemy import Select, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.labour.domain.labour.value_objects.labour_id import LabourId
@@ -10,6 +12,33 @@ from src.subscription.infrastructure.persistence.table import subscriptions_tabl
 from src.user.domain.value_objects.user_id import UserId
 
 
+def build_subscriptions_filter_statement(
+    labour_id: LabourId | None = None,
+    subscriber_id: UserId | None = None,
+    birthing_person_id: UserId | None = None,
+    subscription_status: SubscriptionStatus | None = None,
+    access_level: SubscriptionAccessLevel | None = None,
+) -> Select[Any]:
+    """
+    Build the statement selecting subscriptions matching the given filters.
+
+    Shared by `filter` and `filter_one_or_none`, and by the query plan tests which assert
+    that each access pattern is served by an index on the subscriptions table.
+    """
+    stmt = select(Subscription)
+    if labour_id:
+        stmt = stmt.where(subscriptions_table.c.labour_id == labour_id.value)
+    if subscriber_id:
+        stmt = stmt.where(subscriptions_table.c.subscriber_id == subscriber_id.value)
+    if birthing_person_id:
+        stmt = stmt.where(subscriptions_table.c.birthing_person_id == birthing_person_id.value)
+    if subscription_status:
+        stmt = stmt.where(subscriptions_table.c.status == subscription_status.value)
+    if access_level:
+        stmt = stmt.where(subscriptions_table.c.access_level == access_level)
+    return stmt
+
+
 class SQLAlchemySubscriptionRepository(SubscriptionRepository):
     def __init__(self, session: AsyncSession):
         self._session = session
@@ -55,17 +84,13 @@ class SQLAlchemySubscriptionRepository(SubscriptionRepository):
         Returns:
             A list of subscriptions
         """
-        stmt = select(Subscription)
-        if labour_id:
-            stmt = stmt.where(subscriptions_table.c.labour_id == labour_id.value)
-        if subscriber_id:
-            stmt = stmt.where(subscriptions_table.c.subscriber_id == subscriber_id.value)
-        if birthing_person_id:
-            stmt = stmt.where(subscriptions_table.c.birthing_person_id == birthing_person_id.value)
-        if subscription_status:
-            stmt = stmt.where(subscriptions_table.c.status == subscription_status.value)
-        if access_level:
-            stmt = stmt.where(subscriptions_table.c.access_level == access_level)
+        stmt = build_subscriptions_filter_statement(
+            labour_id=labour_id,
+            subscriber_id=subscriber_id,
+            birthing_person_id=birthing_person_id,
+            subscription_status=subscription_status,
+            access_level=access_level,
+        )
 
         result = await self._session.execute(stmt)
         return list(result.scalars())
@@ -91,17 +116,13 @@ class SQLAlchemySubscriptionRepository(SubscriptionRepository):
         Returns:
             A subscription if found, else returns None
         """
-        stmt = select(Subscription)
-        if labour_id:
-            stmt = stmt.where(subscriptions_table.c.labour_id == labour_id.value)
-        if subscriber_id:
-            stmt = stmt.where(subscriptions_table.c.subscriber_id == subscriber_id.value)
-        if birthing_person_id:
-            stmt = stmt.where(subscriptions_table.c.birthing_person_id == birthing_person_id.value)
-        if subscription_status:
-            stmt = stmt.where(subscriptions_table.c.status == subscription_status.value)
-        if access_level:
-            stmt = stmt.where(subscriptions_table.c.access_level == access_level)
+        stmt = build_subscriptions_filter_statement(
+            labour_id=labour_id,
+            subscriber_id=subscriber_id,
+            birthing_person_id=birthing_person_id,
+            subscription_status=subscription_status,
+            access_level=access_level,
+        )
 
         result = await self._session.execute(stmt)
         return result.scalar_one_or_none()
@@ -4,7 +4,7 @@ from typing import Any, Self
 from src.user.domain.entity import User
 
 
-@dataclass
+@dataclass(slots=True)
 class UserSummaryDTO:
     """Summary Data Transfer Object for User entity"""
 
@@ -0,0 +1,31 @@
+from fern_labour_core.unit_of_work import UnitOfWork
+
+from src.user.application.dtos.user import UserDTO
+from src.user.domain.entity import User
+from src.user.domain.repository import UserRepository
+from src.user.domain.value_objects.user_id import UserId
+
+
+class UserService:
+    def __init__(self, user_repository: UserRepository, unit_of_work: UnitOfWork):
+        self._user_repository = user_repository
+        self._unit_of_work = unit_of_work
+
+    async def save_profile(self, user: UserDTO) -> None:
+        """Store the profile of an authenticated user, keeping the local copy up to date."""
+        await self.save_profiles([user])
+
+    async def save_profiles(self, users: list[UserDTO]) -> None:
+        """Store the profiles of authenticated users in a single transaction."""
+        async with self._unit_of_work:
+            for user in users:
+                await self._user_repository.save(
+                    User(
+                        id_=UserId(user.id),
+                        username=user.username,
+                        email=user.email,
+                        first_name=user.first_name,
+                        last_name=user.last_name,
+                        phone_number=user.phone_number,
+                    )
+                )
@@ -0,0 +1,80 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+from keycloak import KeycloakAdmin, KeycloakError
+
+log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+ADMIN_MAX_CONCURRENCY = 10
+ADMIN_MAX_RETRIES = 3
+ADMIN_RETRY_BACKOFF_SECONDS = 0.2
+
+RETRYABLE_STATUS_CODES = frozenset({429, 503})
+
+
+class KeycloakAdminClient:
+    """
+    Calls the Keycloak admin API through a single shared `KeycloakAdmin`.
+
+    At most `max_concurrency` requests are in flight at once, so looking up many users queues
+    them on the keep-alive connections of the admin client's pool rather than opening one
+    connection per user. The admin token is refreshed by one request while the others wait
+    for it. Requests that Keycloak throttles (429) or can't serve (503) are retried with
+    exponential backoff, keeping their slot so a struggling Keycloak sees less load.
+    """
+
+    def __init__(
+        self,
+        keycloak_admin: KeycloakAdmin,
+        max_concurrency: int = ADMIN_MAX_CONCURRENCY,
+        max_retries: int = ADMIN_MAX_RETRIES,
+        retry_backoff_seconds: float = ADMIN_RETRY_BACKOFF_SECONDS,
+    ) -> None:
+        self._keycloak_admin = keycloak_admin
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._token_lock = asyncio.Lock()
+        self._max_retries = max_retries
+        self._retry_backoff_seconds = retry_backoff_seconds
+
+    async def get_user(self, user_id: str) -> dict[str, Any]:
+        return await self._request(
+            self._keycloak_admin.a_get_user, user_id=user_id, user_profile_metadata=True
+        )
+
+    async def get_users(self, first: int, max_results: int) -> list[dict[str, Any]]:
+        return await self._request(
+            self._keycloak_admin.a_get_users, {"first": first, "max": max_results}
+        )
+
+    async def _request(self, call: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any) -> T:
+        async with self._semaphore:
+            attempt = 0
+            while True:
+                await self._refresh_token_if_required()
+                try:
+                    return await call(*args, **kwargs)
+                except KeycloakError as e:
+                    if (
+                        e.response_code not in RETRYABLE_STATUS_CODES
+                        or attempt >= self._max_retries
+                    ):
+                        raise
+                    delay = self._retry_backoff_seconds * 2**attempt
+                    log.warning(
+                        "Keycloak admin request failed with %s, retrying in %ss",
+                        e.response_code,
+                        delay,
+                    )
+                    await asyncio.sleep(delay)
+                attempt += 1
+
+    async def _refresh_token_if_required(self) -> None:
+        # The connection decides whether its token has expired, as the timezone of its expiry
+        # time differs between python-keycloak releases. Only the first request to find it
+        # expired refreshes it, the rest wait on the lock and then see the new token.
+        async with self._token_lock:
+            await self._keycloak_admin.connection.a__refresh_if_required()
@@ -2,6 +2,7 @@ from src.user.application.dtos.user import UserDTO
 from src.user.infrastructure.auth.interfaces.models import AuthorizationCredentials
 from src.user.infrastructure.auth.interfaces.schemas import TokenResponse
 from src.user.infrastructure.auth.interfaces.service import AuthService
+from src.user.infrastructure.auth.profile_refresh_queue import ProfileRefreshQueue
 
 
 class KeycloakAuthController:
@@ -9,8 +10,11 @@ class KeycloakAuthController:
     Controller for handling authentication logic.
     """
 
-    def __init__(self, auth_service: AuthService) -> None:
+    def __init__(
+        self, auth_service: AuthService, profile_refresh_queue: ProfileRefreshQueue | None = None
+    ) -> None:
         self._auth_service = auth_service
+        self._profile_refresh_queue = profile_refresh_queue
 
     def login(self, username: str, password: str) -> TokenResponse:
         """
@@ -46,4 +50,7 @@ class KeycloakAuthController:
         """
         token = credentials.credentials
 
-        return self._auth_service.verify_token(token)
+        user = self._auth_service.verify_token(token)
+        if self._profile_refresh_queue:
+            self._profile_refresh_queue.add(user)
+        return user
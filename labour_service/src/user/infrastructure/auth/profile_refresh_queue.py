@@ -0,0 +1,45 @@
+import time
+from collections import OrderedDict
+
+from src.user.application.dtos.user import UserDTO
+
+
+class ProfileRefreshQueue:
+    """
+    Profiles of recently authenticated users, waiting to be written to the users projection.
+
+    A user is queued at most once per debounce window, so a client making many requests after
+    logging in costs a single refresh. The queue is drained in the background rather than in
+    the request that authenticated the user, keeping writes off read routes.
+    """
+
+    def __init__(self, debounce_seconds: float, max_entries: int) -> None:
+        self._debounce_seconds = debounce_seconds
+        self._max_entries = max_entries
+        self._queued_at: OrderedDict[str, float] = OrderedDict()
+        self._pending: dict[str, UserDTO] = {}
+
+    def _evict(self, now: float) -> None:
+        while self._queued_at:
+            user_id, queued_at = next(iter(self._queued_at.items()))
+            if (
+                now - queued_at < self._debounce_seconds
+                and len(self._queued_at) <= self._max_entries
+            ):
+                break
+            del self._queued_at[user_id]
+
+    def add(self, user: UserDTO) -> None:
+        now = time.monotonic()
+        queued_at = self._queued_at.get(user.id)
+        if queued_at is not None and now - queued_at < self._debounce_seconds:
+            return
+        self._queued_at[user.id] = now
+        self._queued_at.move_to_end(user.id)
+        self._evict(now)
+        self._pending[user.id] = user
+
+    def drain(self) -> list[UserDTO]:
+        pending = list(self._pending.values())
+        self._pending.clear()
+        return pending
@@ -0,0 +1,179 @@
+import logging
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import Row, delete, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.infrastructure.persistence.encryption import FIELD_ENCRYPTOR_INFO_KEY, FieldEncryptor
+from src.user.domain.entity import User
+from src.user.domain.repository import UserRepository
+from src.user.domain.value_objects.user_id import UserId
+from src.user.infrastructure.persistence.table import users_table
+
+log = logging.getLogger(__name__)
+
+_USER_COLUMNS = (
+    users_table.c.id,
+    users_table.c.username,
+    users_table.c.email,
+    users_table.c.first_name,
+    users_table.c.last_name,
+    users_table.c.phone_number,
+)
+
+
+def _profile(user: User) -> tuple[str, str, str, str, str | None]:
+    return (user.username, user.email, user.first_name, user.last_name, user.phone_number)
+
+
+class SQLAlchemyUserRepository(UserRepository):
+    """
+    User repository backed by the local users projection.
+
+    Email addresses and phone numbers are stored encrypted with the field encryptor from the
+    session info, the same one used for the encrypted columns of mapped entities.
+
+    Users missing from the projection, for example those registered since the last sync, are
+    read from the fallback repository so that lookups never miss while the projection catches up.
+    """
+
+    def __init__(self, session: AsyncSession, fallback: UserRepository) -> None:
+        self._session = session
+        self._fallback = fallback
+
+    @property
+    def _encryptor(self) -> FieldEncryptor:
+        encryptor: FieldEncryptor | None = self._session.info.get(FIELD_ENCRYPTOR_INFO_KEY)
+        if encryptor is None:
+            raise RuntimeError("No field encryptor configured on the session.")
+        return encryptor
+
+    def _encrypt(self, value: str | None) -> str | None:
+        return self._encryptor.encrypt(value) if value else None
+
+    def _decrypt(self, value: str | None) -> str | None:
+        return self._encryptor.decrypt(value) if value else None
+
+    def _row_to_user(self, row: Row[Any]) -> User:
+        return User(
+            id_=UserId(row.id),
+            username=row.username,
+            email=self._decrypt(row.email),  # type: ignore[arg-type]
+            first_name=row.first_name,
+            last_name=row.last_name,
+            phone_number=self._decrypt(row.phone_number),
+        )
+
+    def _user_to_values(self, user: User, synced_at: datetime) -> dict[str, Any]:
+        return {
+            "id": user.id_.value,
+            "username": user.username,
+            "email": self._encrypt(user.email),
+            "first_name": user.first_name,
+            "last_name": user.last_name,
+            "phone_number": self._encrypt(user.phone_number),
+            "synced_at": synced_at,
+        }
+
+    async def save(self, user: User) -> None:
+        """
+        Insert or update a user in the projection, leaving it untouched if it is unchanged.
+
+        Args:
+            user: The user to save
+        """
+        stmt = select(*_USER_COLUMNS).where(users_table.c.id == user.id_.value)
+        stored = (await self._session.execute(stmt)).one_or_none()
+        if stored is not None and _profile(self._row_to_user(stored)) == _profile(user):
+            return
+        await self.save_many([user])
+
+    async def save_many(self, users: list[User]) -> None:
+        """
+        Insert or update users in the projection in a single statement.
+
+        Args:
+            users: The users to save
+        """
+        if not users:
+            return
+        synced_at = datetime.now(UTC)
+        stmt = insert(users_table).values([self._user_to_values(user, synced_at) for user in users])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[users_table.c.id],
+            set_={
+                "username": stmt.excluded.username,
+                "email": stmt.excluded.email,
+                "first_name": stmt.excluded.first_name,
+                "last_name": stmt.excluded.last_name,
+                "phone_number": stmt.excluded.phone_number,
+                "synced_at": stmt.excluded.synced_at,
+            },
+        )
+        await self._session.execute(stmt)
+
+    async def delete(self, user: User) -> None:
+        """
+        Delete a user from the projection.
+
+        Args:
+            user: The user to delete
+        """
+        await self._session.execute(delete(users_table).where(users_table.c.id == user.id_.value))
+
+    async def delete_synced_before(self, synced_before: datetime) -> int:
+        """
+        Delete users that have not been synced since the given time.
+
+        Args:
+            synced_before: Users last synced before this time are deleted
+
+        Returns:
+            The number of users deleted
+        """
+        result = await self._session.execute(
+            delete(users_table).where(users_table.c.synced_at < synced_before)
+        )
+        return result.rowcount
+
+    async def get_by_id(self, user_id: UserId) -> User | None:
+        """
+        Retrieve a user by their ID.
+
+        Args:
+            user_id: The ID of the user to retrieve
+
+        Returns:
+            The user if found, else returns None
+        """
+        users = await self.get_by_ids([user_id])
+        return users[0] if users else None
+
+    async def get_by_ids(self, user_ids: list[UserId]) -> list[User]:
+        """
+        Retrieve a list of users by their IDs with a single query against the projection.
+
+        Args:
+            user_ids: The IDs of the users to retrieve
+
+        Returns:
+            A list of users, in the order of the requested IDs
+        """
+        if not user_ids:
+            return []
+
+        stmt = select(*_USER_COLUMNS).where(
+            users_table.c.id.in_({user_id.value for user_id in user_ids})
+        )
+        result = await self._session.execute(stmt)
+        users = {row.id: self._row_to_user(row) for row in result}
+
+        missing = [user_id for user_id in user_ids if user_id.value not in users]
+        if missing:
+            log.info(f"{len(missing)} users missing from projection, reading from fallback")
+            for user in await self._fallback.get_by_ids(missing):
+                users[user.id_.value] = user
+
+        return [users[user_id.value] for user_id in user_ids if user_id.value in users]
@@ -1,11 +1,12 @@
 import asyncio
 from typing import Any
 
-from keycloak import KeycloakAdmin, KeycloakGetError
+from keycloak import KeycloakGetError
 
 from src.user.domain.entity import User
 from src.user.domain.repository import UserRepository
 from src.user.domain.value_objects.user_id import UserId
+from src.user.infrastructure.auth.keycloak.admin_client import KeycloakAdminClient
 
 
 def keycloak_query_to_user(user_info: dict[str, Any]) -> User:
@@ -35,8 +36,8 @@ def keycloak_query_to_user(user_info: dict[str, Any]) -> User:
 
 
 class KeycloakUserRepository(UserRepository):
-    def __init__(self, keycloak_admin: KeycloakAdmin) -> None:
-        self._keycloak_admin = keycloak_admin
+    def __init__(self, keycloak_admin_client: KeycloakAdminClient) -> None:
+        self._keycloak_admin_client = keycloak_admin_client
 
     async def save(self, user: User) -> None:
         raise NotImplementedError("user save not implemented")
@@ -46,15 +47,14 @@ class KeycloakUserRepository(UserRepository):
 
     async def get_by_id(self, user_id: UserId) -> User | None:
         try:
-            user = await self._keycloak_admin.a_get_user(
-                user_id=user_id.value, user_profile_metadata=True
-            )
+            user = await self._keycloak_admin_client.get_user(user_id=user_id.value)
         except KeycloakGetError as e:
             print(f"Error fetching user with ID {user_id}: {e}")
             return None
         return keycloak_query_to_user(user)
 
     async def get_by_ids(self, user_ids: list[UserId]) -> list[User]:
+        # Keycloak has no lookup by many IDs, the admin client bounds how many run at once
         users: list[User] = []
         results = await asyncio.gather(*[self.get_by_id(user_id) for user_id in user_ids])
         users = [user for user in results if user is not None]
@@ -0,0 +1,18 @@
+from sqlalchemy import Column, DateTime, String, Table, func
+
+from src.core.infrastructure.persistence.orm_registry import mapper_registry
+
+# Local read model of Keycloak users, kept in sync by KeycloakUserProjectionSync and on login
+users_table = Table(
+    "users",
+    mapper_registry.metadata,
+    Column("id", String, primary_key=True),
+    Column("username", String, nullable=False),
+    # Encrypted by SQLAlchemyUserRepository
+    Column("email", String, nullable=True),
+    Column("first_name", String, nullable=True),
+    Column("last_name", String, nullable=True),
+    # Encrypted by SQLAlchemyUserRepository
+    Column("phone_number", String, nullable=True),
+    Column("synced_at", DateTime(timezone=True), nullable=False, server_default=func.now()),
+)
@@ -0,0 +1,67 @@
+import logging
+from datetime import UTC, datetime
+
+from fern_labour_core.unit_of_work import UnitOfWork
+
+from src.user.infrastructure.auth.keycloak.admin_client import KeycloakAdminClient
+from src.user.infrastructure.persistence.repositories.user_projection_repository import (
+    SQLAlchemyUserRepository,
+)
+from src.user.infrastructure.persistence.repositories.user_repository import (
+    keycloak_query_to_user,
+)
+
+log = logging.getLogger(__name__)
+
+SYNC_PAGE_SIZE = 200
+
+
+class KeycloakUserProjectionSync:
+    """
+    Copies every user in the realm from Keycloak into the local users projection.
+
+    Users are fetched and upserted a page at a time, each page in its own transaction. Once
+    every page has been written, users that were not seen in this sync have been deleted from
+    Keycloak and are removed from the projection.
+    """
+
+    def __init__(
+        self,
+        keycloak_admin_client: KeycloakAdminClient,
+        user_repository: SQLAlchemyUserRepository,
+        unit_of_work: UnitOfWork,
+        page_size: int = SYNC_PAGE_SIZE,
+    ) -> None:
+        self._keycloak_admin_client = keycloak_admin_client
+        self._user_repository = user_repository
+        self._unit_of_work = unit_of_work
+        self._page_size = page_size
+
+    async def sync(self) -> int:
+        started_at = datetime.now(UTC)
+        synced = 0
+        first = 0
+
+        while True:
+            page = await self._keycloak_admin_client.get_users(
+                first=first, max_results=self._page_size
+            )
+            if not page:
+                break
+
+            async with self._unit_of_work:
+                await self._user_repository.save_many(
+                    [keycloak_query_to_user(user_info) for user_info in page]
+                )
+            synced += len(page)
+            log.debug(f"Synced {synced} users into projection")
+
+            if len(page) < self._page_size:
+                break
+            first += self._page_size
+
+        async with self._unit_of_work:
+            deleted = await self._user_repository.delete_synced_before(started_at)
+
+        log.info(f"Synced {synced} users into projection, removed {deleted} deleted users")
+        return synced
@@ -0,0 +1,43 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from src.labour.domain.contraction.entity import Contraction
+from src.labour.domain.labour.entity import Labour
+from src.labour.domain.labour_update.enums import LabourUpdateType
+from src.user.domain.value_objects.user_id import UserId
+
+LABOUR_SIZES = (10, 100, 1000)
+CONTRACTION_INTERVAL = timedelta(minutes=3)
+CONTRACTION_LENGTH = timedelta(seconds=75)
+
+
+def build_labour(number_of_contractions: int) -> Labour:
+    """
+    Build an active labour with regular contractions up to now and a status update for every
+    ten contractions, so that every recommendation has to inspect its recent contractions.
+    """
+    now = datetime.now(UTC)
+    start_time = now - CONTRACTION_INTERVAL * number_of_contractions
+    labour = Labour.plan(
+        birthing_person_id=UserId("benchmark"), first_labour=True, due_date=start_time
+    )
+    labour.begin(start_time=start_time)
+    for i in range(number_of_contractions):
+        contraction = Contraction.start(
+            labour_id=labour.id_, start_time=start_time + CONTRACTION_INTERVAL * i
+        )
+        contraction.end(end_time=contraction.start_time + CONTRACTION_LENGTH, intensity=i % 10 + 1)
+        labour.contractions.append(contraction)
+    for i in range(number_of_contractions // 10):
+        labour.add_labour_update(
+            labour_update_type=LabourUpdateType.STATUS_UPDATE,
+            message=f"Status update {i}",
+            sent_time=start_time + CONTRACTION_INTERVAL * 10 * i,
+        )
+    return labour
+
+
+@pytest.fixture(params=LABOUR_SIZES, ids=lambda size: f"{size}_contractions")
+def labour(request: pytest.FixtureRequest) -> Labour:
+    return build_labour(request.param)
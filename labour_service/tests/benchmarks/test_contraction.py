@@ -0,0 +1,28 @@
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from src.labour.domain.contraction.services.update_contraction import UpdateContractionService
+from src.labour.domain.labour.entity import Labour
+
+
+def test_update_contraction_intensity(benchmark: BenchmarkFixture, labour: Labour) -> None:
+    contraction = labour.contractions[len(labour.contractions) // 2]
+
+    benchmark(
+        UpdateContractionService().update_contraction,
+        labour,
+        contraction_id=contraction.id_,
+        intensity=5,
+    )
+
+
+def test_update_contraction_duration(benchmark: BenchmarkFixture, labour: Labour) -> None:
+    """Moving a contraction checks that it does not overlap any other contraction."""
+    contraction = labour.contractions[len(labour.contractions) // 2]
+
+    benchmark(
+        UpdateContractionService().update_contraction,
+        labour,
+        contraction_id=contraction.id_,
+        start_time=contraction.start_time,
+        end_time=contraction.end_time,
+    )
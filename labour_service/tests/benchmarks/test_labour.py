@@ -0,0 +1,47 @@
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from src.labour.application.dtos.labour import LabourDTO
+from src.labour.application.dtos.labour_summary import LabourSummaryDTO
+from src.labour.domain.labour.entity import Labour
+from src.labour.domain.labour.services.should_call_midwife_urgently import (
+    ShouldCallMidwifeUrgentlyService,
+)
+from src.labour.domain.labour.services.should_go_to_hospital import ShouldGoToHospitalService
+from src.labour.domain.labour.services.should_prepare_for_hospital import (
+    ShouldPrepareForHospitalService,
+)
+from src.labour.domain.labour.services.update_labour_phase import UpdateLabourPhaseService
+
+
+def test_active_contraction(benchmark: BenchmarkFixture, labour: Labour) -> None:
+    assert benchmark(lambda: labour.active_contraction) is None
+
+
+def test_update_labour_phase(benchmark: BenchmarkFixture, labour: Labour) -> None:
+    benchmark(UpdateLabourPhaseService().update_labour_phase, labour)
+
+
+def test_should_call_midwife_urgently(benchmark: BenchmarkFixture, labour: Labour) -> None:
+    benchmark(ShouldCallMidwifeUrgentlyService().should_call_midwife_urgently, labour)
+
+
+def test_should_go_to_hospital(benchmark: BenchmarkFixture, labour: Labour) -> None:
+    benchmark(ShouldGoToHospitalService().should_go_to_hospital, labour)
+
+
+def test_should_prepare_for_hospital(benchmark: BenchmarkFixture, labour: Labour) -> None:
+    benchmark(ShouldPrepareForHospitalService().should_prepare_for_hospital, labour)
+
+
+def test_labour_dto_from_domain(benchmark: BenchmarkFixture, labour: Labour) -> None:
+    dto = benchmark(LabourDTO.from_domain, labour)
+
+    assert len(dto.contractions) == len(labour.contractions)
+
+
+def test_labour_dto_to_dict(benchmark: BenchmarkFixture, labour: Labour) -> None:
+    benchmark(LabourDTO.from_domain(labour).to_dict)
+
+
+def test_labour_summary_dto_from_domain(benchmark: BenchmarkFixture, labour: Labour) -> None:
+    benchmark(LabourSummaryDTO.from_domain, labour)
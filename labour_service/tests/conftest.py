@@ -0,0 +1,33 @@
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager
+
+import pytest
+
+from src.core.infrastructure.metrics.database import QueryStats, track_queries
+
+AssertMaxQueries = Callable[[int], AbstractContextManager[QueryStats]]
+
+
+@pytest.fixture
+def assert_max_queries() -> AssertMaxQueries:
+    """
+    Fail the test if the block executes more than the given number of queries.
+
+    Only queries executed by engines passed to `instrument_engine` are counted.
+
+        with assert_max_queries(3):
+            client.get("/api/v1/labour/active")
+    """
+
+    @contextmanager
+    def assert_max_queries(max_queries: int) -> Iterator[QueryStats]:
+        with track_queries() as stats:
+            yield stats
+        statements = "\n".join(
+            f"  {count}x {statement}" for statement, count in stats.statements.most_common()
+        )
+        assert stats.count <= max_queries, (
+            f"Expected at most {max_queries} queries, executed {stats.count}:\n{statements}"
+        )
+
+    return assert_max_queries
@@ -0,0 +1,131 @@
+import os
+import subprocess
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+from sqlalchemy import Connection, Engine, create_engine, inspect, text
+
+from src.core.infrastructure.persistence.initialize_mapping import map_all
+from src.subscription.domain.entity import Subscription
+
+PROJECT_ROOT = Path(__file__).parents[3]
+
+RUN_QUERY_PLAN_TESTS_ENV = "RUN_QUERY_PLAN_TESTS"
+QUERY_PLAN_DATABASE = "labour_service_query_plans"
+
+SEEDED_LABOURS = 5_000
+SEEDED_SUBSCRIPTIONS = 100_000
+
+
+def postgres_dsn(database: str) -> str:
+    username = os.getenv("POSTGRES_USER", "postgres")
+    password = os.getenv("POSTGRES_PASSWORD", "changeme")
+    host = os.getenv("POSTGRES_HOST", "0.0.0.0")
+    port = os.getenv("POSTGRES_PORT", "5432")
+    return f"postgresql+psycopg://{username}:{password}@{host}:{port}/{database}"
+
+
+def recreate_database(database: str) -> None:
+    engine = create_engine(postgres_dsn("postgres"), isolation_level="AUTOCOMMIT")
+    with engine.connect() as connection:
+        connection.execute(text(f'DROP DATABASE IF EXISTS "{database}" WITH (FORCE)'))
+        connection.execute(text(f'CREATE DATABASE "{database}"'))
+    engine.dispose()
+
+
+def run_migrations(database: str) -> None:
+    subprocess.run(
+        [sys.executable, "-m", "alembic", "upgrade", "head"],
+        cwd=PROJECT_ROOT,
+        env={**os.environ, "POSTGRES_DB": database, "PYTHONPATH": str(PROJECT_ROOT)},
+        check=True,
+    )
+
+
+def seed(connection: Connection) -> None:
+    """
+    Seed labours and subscriptions at roughly production proportions.
+
+    Every labour has ~20 subscribers, every subscriber follows two labours and most
+    subscriptions are in the SUBSCRIBED state, so the planner sees realistic selectivity.
+    """
+    connection.execute(
+        text(
+            """
+            INSERT INTO labours (id, birthing_person_id, first_labour, due_date, current_phase)
+            SELECT
+                md5('labour-' || i)::uuid,
+                'birthing-person-' || i,
+                i % 2 = 0,
+                now() + interval '30 days',
+                (CASE WHEN i % 10 = 0 THEN 'ACTIVE' ELSE 'COMPLETE' END)::labour_phase
+            FROM generate_series(0, :labours - 1) AS i
+            """
+        ),
+        {"labours": SEEDED_LABOURS},
+    )
+    connection.execute(
+        text(
+            """
+            INSERT INTO subscriptions (
+                id, labour_id, birthing_person_id, subscriber_id, role, status, access_level
+            )
+            SELECT
+                md5('subscription-' || i)::uuid,
+                md5('labour-' || (i % :labours))::uuid,
+                'birthing-person-' || (i % :labours),
+                'subscriber-' || (i / 2),
+                (CASE WHEN i % 5 = 0 THEN 'BIRTH_PARTNER' ELSE 'FRIENDS_AND_FAMILY' END)
+                    ::subscriber_role,
+                (CASE (i / :labours) % 10
+                    WHEN 0 THEN 'REQUESTED'
+                    WHEN 1 THEN 'UNSUBSCRIBED'
+                    WHEN 2 THEN 'REMOVED'
+                    ELSE 'SUBSCRIBED'
+                END)::subscription_status,
+                (CASE WHEN i % 3 = 0 THEN 'SUPPORTER' ELSE 'BASIC' END)
+                    ::subscription_access_level
+            FROM generate_series(0, :subscriptions - 1) AS i
+            """
+        ),
+        {"labours": SEEDED_LABOURS, "subscriptions": SEEDED_SUBSCRIPTIONS},
+    )
+    connection.execute(text("ANALYZE labours"))
+    connection.execute(text("ANALYZE subscriptions"))
+
+
+@pytest.fixture(scope="session")
+def query_plan_engine() -> Iterator[Engine]:
+    if not os.getenv(RUN_QUERY_PLAN_TESTS_ENV):
+        pytest.skip(f"Set {RUN_QUERY_PLAN_TESTS_ENV}=1 to run query plan tests against Postgres")
+
+    if inspect(Subscription, raiseerr=False) is None:
+        map_all()
+
+    recreate_database(QUERY_PLAN_DATABASE)
+    run_migrations(QUERY_PLAN_DATABASE)
+
+    engine = create_engine(postgres_dsn(QUERY_PLAN_DATABASE))
+    with engine.begin() as connection:
+        seed(connection)
+
+    yield engine
+
+    engine.dispose()
+
+
+def explain(connection: Connection, statement: Any) -> list[dict[str, Any]]:
+    """Return every node of the JSON query plan for the statement, depth first."""
+    compiled = statement.compile(dialect=connection.dialect, compile_kwargs={"literal_binds": True})
+    plan = connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}").scalar_one()
+
+    nodes: list[dict[str, Any]] = []
+    pending = [plan[0]["Plan"]]
+    while pending:
+        node = pending.pop()
+        nodes.append(node)
+        pending.extend(node.get("Plans", []))
+    return nodes
@@ -0,0 +1,110 @@
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from typing import Any
+
+import pytest
+from sqlalchemy import ColumnElement, Engine, delete, func, select
+from sqlalchemy.orm import Session
+
+from src.core.infrastructure.persistence.encryption import (
+    FIELD_ENCRYPTOR_INFO_KEY,
+    FieldEncryptor,
+)
+from src.labour.domain.labour.entity import Labour
+from src.labour.domain.labour.value_objects.labour_id import LabourId
+from src.labour.domain.labour_update.enums import LabourUpdateType
+from src.labour.infrastructure.persistence.archive import (
+    archive_labour,
+    get_archive,
+    hydrate_from_archive,
+    unarchive,
+)
+from src.labour.infrastructure.persistence.tables.contractions import contractions_table
+from src.labour.infrastructure.persistence.tables.labour_archives import labour_archives_table
+from src.labour.infrastructure.persistence.tables.labour_updates import labour_updates_table
+from src.labour.infrastructure.persistence.tables.labours import labours_table
+from src.user.domain.value_objects.user_id import UserId
+from tests.unit.app.conftest import get_contractions
+
+SESSION_INFO = {FIELD_ENCRYPTOR_INFO_KEY: FieldEncryptor(key="test-key")}
+
+
+def count(session: Session, table_labour_id: ColumnElement[Any], labour_id: LabourId) -> int:
+    return session.scalar(select(func.count()).where(table_labour_id == labour_id.value)) or 0
+
+
+def load(session: Session, labour_id: LabourId) -> Labour:
+    labour = session.scalars(select(Labour).where(labours_table.c.id == labour_id.value)).one()
+    hydrate_from_archive(labour)
+    return labour
+
+
+@pytest.fixture
+def archived_labour_id(query_plan_engine: Engine) -> Iterator[LabourId]:
+    with Session(query_plan_engine, info=SESSION_INFO) as session:
+        labour = Labour.plan(
+            birthing_person_id=UserId("archive-test"), first_labour=True, due_date=datetime.now(UTC)
+        )
+        labour.begin()
+        labour.contractions.extend(
+            get_contractions(
+                labour_id=labour.id_,
+                number_of_contractions=5,
+                length_of_contractions=1,
+                time_between_contractions=4,
+            )
+        )
+        labour.add_labour_update(LabourUpdateType.STATUS_UPDATE, message="Going well")
+        labour.complete_labour()
+        session.add(labour)
+        session.commit()
+
+        archive_labour(labour, archived_at=datetime.now(UTC))
+        for table in (contractions_table, labour_updates_table):
+            session.execute(delete(table).where(table.c.labour_id == labour.id_.value))
+        session.commit()
+        labour_id = labour.id_
+
+    yield labour_id
+
+    with query_plan_engine.begin() as connection:
+        for table in (contractions_table, labour_updates_table, labour_archives_table):
+            connection.execute(delete(table).where(table.c.labour_id == labour_id.value))
+        connection.execute(delete(labours_table).where(labours_table.c.id == labour_id.value))
+
+
+def test_archived_labour_has_no_hot_rows(
+    query_plan_engine: Engine, archived_labour_id: LabourId
+) -> None:
+    with Session(query_plan_engine, info=SESSION_INFO) as session:
+        assert count(session, contractions_table.c.labour_id, archived_labour_id) == 0
+        assert count(session, labour_updates_table.c.labour_id, archived_labour_id) == 0
+        assert count(session, labour_archives_table.c.labour_id, archived_labour_id) == 1
+
+
+def test_archived_labour_is_hydrated_from_snapshot(
+    query_plan_engine: Engine, archived_labour_id: LabourId
+) -> None:
+    with Session(query_plan_engine, info=SESSION_INFO) as session:
+        labour = load(session, archived_labour_id)
+
+        assert len(labour.contractions) == 5
+        assert [update.message for update in labour.labour_updates][-1] == "Going well"
+        session.commit()
+        assert count(session, contractions_table.c.labour_id, archived_labour_id) == 0
+
+
+def test_saving_archived_labour_moves_it_back_to_hot_tables(
+    query_plan_engine: Engine, archived_labour_id: LabourId
+) -> None:
+    with Session(query_plan_engine, info=SESSION_INFO) as session:
+        labour = load(session, archived_labour_id)
+        unarchive(labour)
+        session.add(labour)
+        session.commit()
+
+    with Session(query_plan_engine, info=SESSION_INFO) as session:
+        labour = load(session, archived_labour_id)
+        assert get_archive(labour) is None
+        assert len(labour.contractions) == 5
+        assert count(session, labour_archives_table.c.labour_id, archived_labour_id) == 0
@@ -0,0 +1,133 @@
+from collections.abc import AsyncIterator, Iterator
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import Engine, delete
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.orm import Session
+
+from src.core.infrastructure.persistence.encryption import (
+    FIELD_ENCRYPTOR_INFO_KEY,
+    FieldEncryptor,
+)
+from src.labour.domain.labour.entity import Labour
+from src.labour.infrastructure.persistence.tables.labours import labours_table
+from src.subscription.domain.entity import Subscription
+from src.subscription.domain.enums import SubscriptionStatus
+from src.subscription.infrastructure.persistence.queries.labour_subscriptions_query import (
+    SQLAlchemyLabourSubscriptionsQuery,
+    build_labour_subscriptions_statement,
+)
+from src.subscription.infrastructure.persistence.table import subscriptions_table
+from src.user.domain.entity import User
+from src.user.domain.value_objects.user_id import UserId
+from src.user.infrastructure.persistence.repositories.user_projection_repository import (
+    SQLAlchemyUserRepository,
+)
+from src.user.infrastructure.persistence.table import users_table
+from tests.integration.persistence.conftest import explain
+from tests.integration.persistence.test_subscription_query_plans import (
+    BIRTHING_PERSON_ID,
+    LABOUR_ID,
+    LABOUR_SUBSCRIBER_INDEX,
+)
+
+SESSION_INFO = {FIELD_ENCRYPTOR_INFO_KEY: FieldEncryptor(key="test-key")}
+
+
+def get_user(user_id: str) -> User:
+    return User(
+        id_=UserId(user_id),
+        username=user_id,
+        email=f"{user_id}@email.com",
+        first_name="First",
+        last_name=user_id,
+    )
+
+
+@pytest_asyncio.fixture(scope="module")
+async def async_engine(query_plan_engine: Engine) -> AsyncIterator[AsyncEngine]:
+    engine = create_async_engine(query_plan_engine.url)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+def labour(query_plan_engine: Engine) -> Iterator[Labour]:
+    """A labour with three subscribers, the first of them synced into the users projection."""
+    birthing_person_id = UserId(f"labour-subscriptions-{uuid4()}")
+    labour = Labour.plan(
+        birthing_person_id=birthing_person_id, first_labour=True, due_date=datetime.now(UTC)
+    )
+    subscriber_ids = [UserId(f"{birthing_person_id.value}-subscriber-{i}") for i in range(3)]
+    with Session(query_plan_engine, info=SESSION_INFO) as session:
+        session.add(labour)
+        session.flush()
+        session.add_all(
+            Subscription.create(
+                labour_id=labour.id_,
+                birthing_person_id=birthing_person_id,
+                subscriber_id=subscriber_id,
+                status=SubscriptionStatus.SUBSCRIBED,
+            )
+            for subscriber_id in subscriber_ids
+        )
+        session.commit()
+        labour_id = labour.id_
+
+    yield labour
+
+    with query_plan_engine.begin() as connection:
+        connection.execute(
+            delete(users_table).where(users_table.c.id.in_(user.value for user in subscriber_ids))
+        )
+        connection.execute(
+            delete(subscriptions_table).where(subscriptions_table.c.labour_id == labour_id.value)
+        )
+        connection.execute(delete(labours_table).where(labours_table.c.id == labour_id.value))
+
+
+def test_labour_subscriptions_statement_uses_index(query_plan_engine: Engine) -> None:
+    statement = build_labour_subscriptions_statement(
+        labour_id=LABOUR_ID.value, birthing_person_id=BIRTHING_PERSON_ID.value
+    )
+
+    with query_plan_engine.connect() as connection:
+        nodes = explain(connection, statement)
+
+    subscription_nodes = [node for node in nodes if node.get("Relation Name") == "subscriptions"]
+    assert not any(node["Node Type"] == "Seq Scan" for node in subscription_nodes)
+    assert LABOUR_SUBSCRIBER_INDEX in {node.get("Index Name") for node in nodes}
+
+
+async def test_subscribers_are_joined_from_projection_with_fallback(
+    async_engine: AsyncEngine, labour: Labour
+) -> None:
+    birthing_person_id = labour.birthing_person_id.value
+    synced_subscriber_id = f"{birthing_person_id}-subscriber-0"
+    async with AsyncSession(async_engine, info=SESSION_INFO) as session:
+        await SQLAlchemyUserRepository(session, fallback=AsyncMock()).save(
+            get_user(synced_subscriber_id)
+        )
+        await session.commit()
+
+    fallback = AsyncMock()
+    fallback.get_by_ids.side_effect = lambda user_ids: [
+        get_user(user_id.value) for user_id in user_ids
+    ]
+    async with AsyncSession(async_engine, info=SESSION_INFO) as session:
+        subscriptions, subscribers = await SQLAlchemyLabourSubscriptionsQuery(
+            session, fallback=fallback
+        ).get_labour_subscriptions(
+            labour_id=str(labour.id_.value), birthing_person_id=birthing_person_id
+        )
+
+    subscriber_ids = [subscription.subscriber_id for subscription in subscriptions]
+    assert sorted(subscriber_ids) == [f"{birthing_person_id}-subscriber-{i}" for i in range(3)]
+    assert [subscriber.id for subscriber in subscribers] == subscriber_ids
+    assert all(subscriber.last_name == subscriber.id for subscriber in subscribers)
+    (missing,) = fallback.get_by_ids.await_args.args
+    assert {user_id.value for user_id in missing} == set(subscriber_ids) - {synced_subscriber_id}
@@ -0,0 +1,159 @@
+from collections.abc import AsyncIterator, Iterator
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import Engine, delete
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.orm import Session
+
+from src.core.infrastructure.persistence.encryption import (
+    FIELD_ENCRYPTOR_INFO_KEY,
+    FieldEncryptor,
+)
+from src.labour.application.dtos.labour_summary import LabourSummaryDTO
+from src.labour.domain.labour.entity import Labour
+from src.labour.domain.labour.enums import LabourPhase
+from src.labour.domain.labour.value_objects.labour_id import LabourId
+from src.labour.infrastructure.persistence.queries.labour_summary_query import (
+    SQLAlchemyLabourSummaryQuery,
+)
+from src.labour.infrastructure.persistence.repositories.labour_repository import (
+    SQLAlchemyLabourRepository,
+)
+from src.labour.infrastructure.persistence.tables.contractions import contractions_table
+from src.labour.infrastructure.persistence.tables.labour_updates import labour_updates_table
+from src.labour.infrastructure.persistence.tables.labours import labours_table
+from src.user.domain.value_objects.user_id import UserId
+from tests.unit.app.conftest import get_contractions
+
+SESSION_INFO = {FIELD_ENCRYPTOR_INFO_KEY: FieldEncryptor(key="test-key")}
+
+# Runs of (number of contractions, length in minutes, minutes before each contraction)
+ContractionRuns = list[tuple[int, int, float]]
+
+
+@pytest_asyncio.fixture(scope="module")
+async def async_engine(query_plan_engine: Engine) -> AsyncIterator[AsyncEngine]:
+    engine = create_async_engine(query_plan_engine.url)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+def labour_ids(query_plan_engine: Engine) -> Iterator[list[LabourId]]:
+    """Collects the labours a test creates and deletes them afterwards."""
+    labour_ids: list[LabourId] = []
+
+    yield labour_ids
+
+    with query_plan_engine.begin() as connection:
+        for labour_id in labour_ids:
+            for table in (contractions_table, labour_updates_table):
+                connection.execute(delete(table).where(table.c.labour_id == labour_id.value))
+            connection.execute(delete(labours_table).where(labours_table.c.id == labour_id.value))
+
+
+def create_labour(
+    engine: Engine, first_labour: bool, begun: bool, contraction_runs: ContractionRuns
+) -> Labour:
+    labour = Labour.plan(
+        birthing_person_id=UserId(f"labour-summary-{uuid4()}"),
+        first_labour=first_labour,
+        due_date=datetime.now(UTC),
+    )
+    if begun:
+        labour.begin(start_time=datetime.now(UTC) - timedelta(hours=6))
+
+    start_time = datetime.now(UTC) - timedelta(hours=5)
+    for number_of_contractions, length, time_between in contraction_runs:
+        if labour.contractions:
+            start_time = labour.contractions[-1].end_time + timedelta(minutes=time_between)
+        labour.contractions.extend(
+            get_contractions(
+                labour_id=labour.id_,
+                number_of_contractions=number_of_contractions,
+                length_of_contractions=length,
+                time_between_contractions=time_between,
+                start_time=start_time,
+            )
+        )
+
+    with Session(engine, info=SESSION_INFO, expire_on_commit=False) as session:
+        session.add(labour)
+        session.commit()
+    return labour
+
+
+@pytest.mark.parametrize(
+    ("first_labour", "begun", "contraction_runs", "hospital_recommended"),
+    [
+        pytest.param(True, False, [], False, id="planned"),
+        pytest.param(True, True, [(20, 1, 3)], True, id="nulliparous_at_threshold"),
+        pytest.param(True, True, [(19, 1, 3)], False, id="nulliparous_too_few"),
+        pytest.param(True, True, [(20, 1, 3.5)], False, id="nulliparous_too_far_apart"),
+        pytest.param(True, True, [(19, 1, 3), (1, 1, 3.5)], False, id="nulliparous_latest_late"),
+        pytest.param(True, True, [(5, 1, 30), (20, 1, 3)], True, id="nulliparous_only_recent"),
+        pytest.param(False, True, [(5, 1, 5)], True, id="parous_at_threshold"),
+        pytest.param(False, True, [(4, 1, 5)], False, id="parous_too_few"),
+        pytest.param(False, True, [(5, 1, 5.5)], False, id="parous_too_far_apart"),
+    ],
+)
+async def test_summary_query_matches_domain_summary(
+    query_plan_engine: Engine,
+    async_engine: AsyncEngine,
+    labour_ids: list[LabourId],
+    first_labour: bool,
+    begun: bool,
+    contraction_runs: ContractionRuns,
+    hospital_recommended: bool,
+) -> None:
+    labour = create_labour(query_plan_engine, first_labour, begun, contraction_runs)
+    labour_ids.append(labour.id_)
+    birthing_person_id = labour.birthing_person_id
+
+    async with AsyncSession(async_engine, info=SESSION_INFO) as session:
+        summary = await SQLAlchemyLabourSummaryQuery(session).get_active_labour_summary(
+            birthing_person_id=birthing_person_id.value
+        )
+        stored_labour = await SQLAlchemyLabourRepository(
+            session
+        ).get_active_labour_by_birthing_person_id(birthing_person_id)
+        assert stored_labour is not None
+        expected = LabourSummaryDTO.from_domain(stored_labour)
+
+    assert summary is not None
+    assert summary.hospital_recommended is hospital_recommended
+    assert summary.duration == pytest.approx(expected.duration, abs=1e-3)
+    assert (
+        summary.id,
+        summary.contraction_count,
+        summary.current_phase,
+        summary.hospital_recommended,
+    ) == (
+        expected.id,
+        expected.contraction_count,
+        expected.current_phase,
+        expected.hospital_recommended,
+    )
+
+
+async def test_summary_query_ignores_completed_labours(
+    query_plan_engine: Engine, async_engine: AsyncEngine, labour_ids: list[LabourId]
+) -> None:
+    labour = create_labour(query_plan_engine, True, True, [(20, 1, 3)])
+    labour_ids.append(labour.id_)
+    with query_plan_engine.begin() as connection:
+        connection.execute(
+            labours_table.update()
+            .where(labours_table.c.id == labour.id_.value)
+            .values(current_phase=LabourPhase.COMPLETE)
+        )
+
+    async with AsyncSession(async_engine, info=SESSION_INFO) as session:
+        summary = await SQLAlchemyLabourSummaryQuery(session).get_active_labour_summary(
+            birthing_person_id=labour.birthing_person_id.value
+        )
+
+    assert summary is None
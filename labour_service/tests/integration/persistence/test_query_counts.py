@@ -0,0 +1,41 @@
+from collections.abc import Iterator
+from uuid import UUID
+
+import pytest
+from sqlalchemy import Engine, select
+from sqlalchemy.orm import Session
+
+from src.core.infrastructure.metrics.database import instrument_engine
+from src.labour.domain.labour.entity import Labour
+from src.labour.domain.labour.enums import LabourPhase
+from src.labour.domain.labour.value_objects.labour_id import LabourId
+from src.labour.infrastructure.persistence.tables.labours import labours_table
+from tests.conftest import AssertMaxQueries
+
+# md5('labour-42')::uuid as seeded in conftest
+LABOUR_ID = LabourId(UUID("91668a15-534d-464b-f8a8-30d9e16afef6"))
+
+
+@pytest.fixture(scope="module")
+def session(query_plan_engine: Engine) -> Iterator[Session]:
+    instrument_engine(query_plan_engine, "query_counts")
+    with Session(query_plan_engine) as session:
+        yield session
+
+
+def test_labour_is_loaded_with_its_relationships(
+    session: Session, assert_max_queries: AssertMaxQueries
+) -> None:
+    statement = select(Labour).where(labours_table.c.id == LABOUR_ID.value)
+
+    with assert_max_queries(3):
+        assert session.scalars(statement).one_or_none() is not None
+
+
+def test_labour_relationships_are_not_loaded_per_labour(
+    session: Session, assert_max_queries: AssertMaxQueries
+) -> None:
+    statement = select(Labour).where(labours_table.c.current_phase == LabourPhase.ACTIVE).limit(100)
+
+    with assert_max_queries(3):
+        assert len(session.scalars(statement).all()) == 100
@@ -0,0 +1,80 @@
+import os
+import time
+from collections.abc import Iterator
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import Engine, create_engine, text
+from sqlalchemy.exc import DBAPIError
+
+RUN_READ_REPLICA_TESTS_ENV = "RUN_READ_REPLICA_TESTS"
+REPLICATION_TIMEOUT_SECONDS = 10
+
+
+def dsn(host_env: str, port_env: str, default_port: str) -> str:
+    username = os.getenv("POSTGRES_USER", "postgres")
+    password = os.getenv("POSTGRES_PASSWORD", "changeme")
+    host = os.getenv(host_env, "0.0.0.0")
+    port = os.getenv(port_env, default_port)
+    database = os.getenv("POSTGRES_DB", "app")
+    return f"postgresql+psycopg://{username}:{password}@{host}:{port}/{database}"
+
+
+@pytest.fixture(scope="module")
+def engines() -> Iterator[tuple[Engine, Engine]]:
+    if not os.getenv(RUN_READ_REPLICA_TESTS_ENV):
+        pytest.skip(f"Set {RUN_READ_REPLICA_TESTS_ENV}=1 to run tests against a streaming replica")
+
+    primary = create_engine(dsn("POSTGRES_HOST", "POSTGRES_PORT", "5442"))
+    replica = create_engine(
+        dsn("POSTGRES_REPLICA_HOST", "POSTGRES_REPLICA_PORT", "5443"),
+        execution_options={"postgresql_readonly": True},
+    )
+    with primary.begin() as connection:
+        connection.execute(
+            text("CREATE TABLE IF NOT EXISTS replica_probe (id uuid PRIMARY KEY, value text)")
+        )
+
+    yield primary, replica
+
+    with primary.begin() as connection:
+        connection.execute(text("DROP TABLE IF EXISTS replica_probe"))
+    primary.dispose()
+    replica.dispose()
+
+
+def test_replica_is_in_recovery(engines: tuple[Engine, Engine]) -> None:
+    _, replica = engines
+    with replica.connect() as connection:
+        assert connection.execute(text("SELECT pg_is_in_recovery()")).scalar_one() is True
+
+
+def test_replica_serves_rows_written_to_primary(engines: tuple[Engine, Engine]) -> None:
+    primary, replica = engines
+    probe_id = uuid4()
+    with primary.begin() as connection:
+        connection.execute(
+            text("INSERT INTO replica_probe (id, value) VALUES (:id, 'written')"), {"id": probe_id}
+        )
+
+    deadline = time.monotonic() + REPLICATION_TIMEOUT_SECONDS
+    value = None
+    while value is None and time.monotonic() < deadline:
+        with replica.connect() as connection:
+            value = connection.execute(
+                text("SELECT value FROM replica_probe WHERE id = :id"), {"id": probe_id}
+            ).scalar_one_or_none()
+        if value is None:
+            time.sleep(0.1)
+
+    assert value == "written"
+
+
+def test_replica_rejects_writes(engines: tuple[Engine, Engine]) -> None:
+    _, replica = engines
+    with pytest.raises(DBAPIError, match="read-only transaction"):
+        with replica.begin() as connection:
+            connection.execute(
+                text("INSERT INTO replica_probe (id, value) VALUES (:id, 'rejected')"),
+                {"id": uuid4()},
+            )
@@ -0,0 +1,150 @@
+from collections.abc import AsyncIterator, Iterator
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import Engine, delete, func, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.orm import Session
+
+from src.core.infrastructure.persistence.encryption import (
+    FIELD_ENCRYPTOR_INFO_KEY,
+    FieldEncryptor,
+)
+from src.labour.domain.contraction.services.end_contraction import EndContractionService
+from src.labour.domain.contraction.services.start_contraction import StartContractionService
+from src.labour.domain.labour.constants import RECENT_CONTRACTIONS_REQUIRED
+from src.labour.domain.labour.entity import Labour
+from src.labour.domain.labour.value_objects.earlier_contractions import EarlierContractions
+from src.labour.domain.labour.value_objects.labour_id import LabourId
+from src.labour.infrastructure.persistence.repositories.labour_repository import (
+    SQLAlchemyLabourRepository,
+)
+from src.labour.infrastructure.persistence.tables.contractions import contractions_table
+from src.labour.infrastructure.persistence.tables.labour_updates import labour_updates_table
+from src.labour.infrastructure.persistence.tables.labours import labours_table
+from src.user.domain.value_objects.user_id import UserId
+from tests.unit.app.conftest import get_contractions
+
+SESSION_INFO = {FIELD_ENCRYPTOR_INFO_KEY: FieldEncryptor(key="test-key")}
+
+EARLIER_CONTRACTIONS = 5
+LONGEST_CONTRACTION_MINUTES = 3
+
+
+@pytest_asyncio.fixture(scope="module")
+async def async_engine(query_plan_engine: Engine) -> AsyncIterator[AsyncEngine]:
+    engine = create_async_engine(query_plan_engine.url)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+def birthing_person_id(query_plan_engine: Engine) -> Iterator[UserId]:
+    """A labour with more contractions than are loaded, the earliest of them the longest."""
+    birthing_person_id = UserId(f"recent-contractions-{uuid4()}")
+    with Session(query_plan_engine, info=SESSION_INFO) as session:
+        labour = Labour.plan(
+            birthing_person_id=birthing_person_id,
+            first_labour=True,
+            due_date=datetime.now(UTC),
+        )
+        labour.begin()
+        start_time = datetime.now(UTC) - timedelta(hours=5)
+        labour.contractions.extend(
+            get_contractions(
+                labour_id=labour.id_,
+                number_of_contractions=1,
+                length_of_contractions=LONGEST_CONTRACTION_MINUTES,
+                time_between_contractions=0,
+                start_time=start_time,
+            )
+        )
+        labour.contractions.extend(
+            get_contractions(
+                labour_id=labour.id_,
+                number_of_contractions=RECENT_CONTRACTIONS_REQUIRED + EARLIER_CONTRACTIONS - 1,
+                length_of_contractions=1,
+                time_between_contractions=4,
+                start_time=start_time + timedelta(minutes=5),
+            )
+        )
+        session.add(labour)
+        session.commit()
+        labour_id = labour.id_
+
+    yield birthing_person_id
+
+    with query_plan_engine.begin() as connection:
+        for table in (contractions_table, labour_updates_table):
+            connection.execute(delete(table).where(table.c.labour_id == labour_id.value))
+        connection.execute(delete(labours_table).where(labours_table.c.id == labour_id.value))
+
+
+async def count_contractions(session: AsyncSession, labour_id: LabourId) -> int:
+    statement = select(func.count()).where(contractions_table.c.labour_id == labour_id.value)
+    return (await session.execute(statement)).scalar_one()
+
+
+async def test_labour_is_loaded_with_recent_contractions_and_a_summary_of_the_rest(
+    async_engine: AsyncEngine, birthing_person_id: UserId
+) -> None:
+    async with AsyncSession(async_engine, info=SESSION_INFO) as session:
+        repository = SQLAlchemyLabourRepository(session)
+        labour = await repository.get_active_labour_with_recent_contractions(birthing_person_id)
+
+        assert labour is not None
+        assert len(labour.contractions) == RECENT_CONTRACTIONS_REQUIRED
+        assert labour.contractions == sorted(
+            labour.contractions, key=lambda contraction: contraction.start_time
+        )
+        assert labour.earlier_contractions == EarlierContractions(
+            count=EARLIER_CONTRACTIONS,
+            longest_duration_seconds=LONGEST_CONTRACTION_MINUTES * 60,
+        )
+        assert labour.contraction_count == RECENT_CONTRACTIONS_REQUIRED + EARLIER_CONTRACTIONS
+
+
+async def test_saving_partially_loaded_labour_only_appends_contractions(
+    async_engine: AsyncEngine, birthing_person_id: UserId
+) -> None:
+    total = RECENT_CONTRACTIONS_REQUIRED + EARLIER_CONTRACTIONS
+
+    async with AsyncSession(async_engine, info=SESSION_INFO) as session:
+        repository = SQLAlchemyLabourRepository(session)
+        labour = await repository.get_active_labour_with_recent_contractions(birthing_person_id)
+        assert labour is not None
+        labour_id = labour.id_
+        StartContractionService().start_contraction(labour, intensity=4)
+        await repository.save(labour)
+        await session.commit()
+        assert await count_contractions(session, labour_id) == total + 1
+
+    async with AsyncSession(async_engine, info=SESSION_INFO) as session:
+        repository = SQLAlchemyLabourRepository(session)
+        labour = await repository.get_active_labour_with_recent_contractions(birthing_person_id)
+        assert labour is not None
+        assert labour.has_active_contraction
+        EndContractionService().end_contraction(labour, intensity=7, notes="Stronger")
+        await repository.save(labour)
+        await session.commit()
+        assert await count_contractions(session, labour_id) == total + 1
+
+    async with AsyncSession(async_engine, info=SESSION_INFO) as session:
+        repository = SQLAlchemyLabourRepository(session)
+        labour = await repository.get_active_labour_with_recent_contractions(birthing_person_id)
+        assert labour is not None
+        assert labour.earlier_contractions == EarlierContractions(
+            count=EARLIER_CONTRACTIONS + 1,
+            longest_duration_seconds=LONGEST_CONTRACTION_MINUTES * 60,
+        )
+        latest = labour.contractions[-1]
+        assert (latest.intensity, latest.notes) == (7, "Stronger")
+
+    async with AsyncSession(async_engine, info=SESSION_INFO) as session:
+        repository = SQLAlchemyLabourRepository(session)
+        full_labour = await repository.get_active_labour_by_birthing_person_id(birthing_person_id)
+        assert full_labour is not None
+        assert len(full_labour.contractions) == total + 1
+        assert not full_labour.has_active_contraction
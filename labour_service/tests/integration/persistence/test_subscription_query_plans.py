@@ -0,0 +1,70 @@
+from uuid import UUID
+
+import pytest
+from sqlalchemy import Engine
+
+from src.labour.domain.labour.value_objects.labour_id import LabourId
+from src.subscription.domain.enums import SubscriptionStatus
+from src.subscription.infrastructure.persistence.repository import (
+    build_subscriptions_filter_statement,
+)
+from src.user.domain.value_objects.user_id import UserId
+from tests.integration.persistence.conftest import explain
+
+# md5('labour-42')::uuid as seeded in conftest, with an active subscription for subscriber-7521
+LABOUR_ID = LabourId(UUID("91668a15-534d-464b-f8a8-30d9e16afef6"))
+BIRTHING_PERSON_ID = UserId("birthing-person-42")
+SUBSCRIBER_ID = UserId("subscriber-7521")
+
+LABOUR_SUBSCRIBER_INDEX = "idx_subscriptions_labour_subscriber"
+SUBSCRIBER_SUBSCRIBED_INDEX = "idx_subscriptions_subscriber_id_subscribed"
+LABOUR_SUBSCRIBED_INDEX = "idx_subscriptions_labour_id_subscribed"
+
+
+@pytest.mark.parametrize(
+    ("filters", "expected_indexes"),
+    [
+        pytest.param(
+            {
+                "labour_id": LABOUR_ID,
+                "subscriber_id": SUBSCRIBER_ID,
+                "subscription_status": SubscriptionStatus.SUBSCRIBED,
+            },
+            {LABOUR_SUBSCRIBER_INDEX, SUBSCRIBER_SUBSCRIBED_INDEX},
+            id="authorization_check",
+        ),
+        pytest.param(
+            {"labour_id": LABOUR_ID, "subscriber_id": SUBSCRIBER_ID},
+            {LABOUR_SUBSCRIBER_INDEX},
+            id="subscribe_and_unsubscribe",
+        ),
+        pytest.param(
+            {"subscriber_id": SUBSCRIBER_ID, "subscription_status": SubscriptionStatus.SUBSCRIBED},
+            {SUBSCRIBER_SUBSCRIBED_INDEX},
+            id="subscriber_subscriptions",
+        ),
+        pytest.param(
+            {"labour_id": LABOUR_ID, "birthing_person_id": BIRTHING_PERSON_ID},
+            {LABOUR_SUBSCRIBER_INDEX},
+            id="labour_subscriptions",
+        ),
+        pytest.param(
+            {"labour_id": LABOUR_ID, "subscription_status": SubscriptionStatus.SUBSCRIBED},
+            {LABOUR_SUBSCRIBED_INDEX, LABOUR_SUBSCRIBER_INDEX},
+            id="labour_subscribers_fan_out",
+        ),
+    ],
+)
+def test_subscription_filters_use_index(
+    query_plan_engine: Engine, filters: dict[str, object], expected_indexes: set[str]
+) -> None:
+    statement = build_subscriptions_filter_statement(**filters)  # type: ignore[arg-type]
+
+    with query_plan_engine.connect() as connection:
+        nodes = explain(connection, statement)
+
+    subscription_nodes = [node for node in nodes if node.get("Relation Name") == "subscriptions"]
+    assert subscription_nodes
+    assert not any(node["Node Type"] == "Seq Scan" for node in subscription_nodes)
+    # Bitmap heap scans name their index on the Bitmap Index Scan beneath them
+    assert {node.get("Index Name") for node in nodes} & expected_indexes
@@ -0,0 +1,90 @@
+from collections.abc import AsyncIterator, Iterator
+from datetime import datetime
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import Engine, delete, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+
+from src.core.infrastructure.persistence.encryption import (
+    FIELD_ENCRYPTOR_INFO_KEY,
+    FieldEncryptor,
+)
+from src.user.domain.entity import User
+from src.user.domain.value_objects.user_id import UserId
+from src.user.infrastructure.persistence.repositories.user_projection_repository import (
+    SQLAlchemyUserRepository,
+)
+from src.user.infrastructure.persistence.table import users_table
+
+SESSION_INFO = {FIELD_ENCRYPTOR_INFO_KEY: FieldEncryptor(key="test-key")}
+
+
+@pytest_asyncio.fixture(scope="module")
+async def async_engine(query_plan_engine: Engine) -> AsyncIterator[AsyncEngine]:
+    engine = create_async_engine(query_plan_engine.url)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+def user(query_plan_engine: Engine) -> Iterator[User]:
+    user = User(
+        id_=UserId(f"user-projection-{uuid4()}"),
+        username="test",
+        email="test@email.com",
+        first_name="User",
+        last_name="Name",
+    )
+
+    yield user
+
+    with query_plan_engine.begin() as connection:
+        connection.execute(delete(users_table).where(users_table.c.id == user.id_.value))
+
+
+async def save(async_engine: AsyncEngine, user: User) -> datetime:
+    """Save the user in its own transaction and return when it was last synced."""
+    async with AsyncSession(async_engine, info=SESSION_INFO) as session:
+        await SQLAlchemyUserRepository(session, fallback=AsyncMock()).save(user)
+        await session.commit()
+        statement = select(users_table.c.synced_at).where(users_table.c.id == user.id_.value)
+        return (await session.execute(statement)).scalar_one()
+
+
+async def test_saving_unchanged_user_does_not_write(async_engine: AsyncEngine, user: User) -> None:
+    synced_at = await save(async_engine, user)
+
+    assert await save(async_engine, user) == synced_at
+
+
+async def test_saving_changed_user_updates_projection(
+    async_engine: AsyncEngine, user: User
+) -> None:
+    synced_at = await save(async_engine, user)
+    user.phone_number = "07123456789"
+
+    assert await save(async_engine, user) > synced_at
+
+    async with AsyncSession(async_engine, info=SESSION_INFO) as session:
+        stored = await SQLAlchemyUserRepository(session, fallback=AsyncMock()).get_by_id(user.id_)
+    assert stored is not None
+    assert stored.phone_number == "07123456789"
+
+
+async def test_contact_details_are_stored_encrypted(async_engine: AsyncEngine, user: User) -> None:
+    user.phone_number = "07123456789"
+    await save(async_engine, user)
+
+    async with AsyncSession(async_engine, info=SESSION_INFO) as session:
+        statement = select(users_table.c.email, users_table.c.phone_number).where(
+            users_table.c.id == user.id_.value
+        )
+        email, phone_number = (await session.execute(statement)).one()
+        stored = await SQLAlchemyUserRepository(session, fallback=AsyncMock()).get_by_id(user.id_)
+
+    assert (email, phone_number) != ("test@email.com", "07123456789")
+    assert stored is not None
+    assert (stored.email, stored.phone_number) == ("test@email.com", "07123456789")
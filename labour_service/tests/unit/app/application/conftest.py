@@ -1,6 +1,8 @@
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime
 from typing import Self
 from unittest.mock import AsyncMock
+from uuid import UUID
 
 import pytest
 import pytest_asyncio
@@ -10,8 +12,17 @@ from fern_labour_core.unit_of_work import UnitOfWork
 from src.core.application.domain_event_publisher import DomainEventPublisher
 from src.core.domain.domain_event.repository import DomainEventRepository
 from src.core.infrastructure.asyncio_task_manager import AsyncioTaskManager
+from src.core.infrastructure.security.authorization_cache.in_memory import (
+    InMemoryAuthorizationCache,
+)
+from src.core.infrastructure.security.authorization_cache.interface import AuthorizationCache
 from src.core.infrastructure.security.rate_limiting.in_memory import InMemoryRateLimiter
 from src.core.infrastructure.security.rate_limiting.interface import RateLimiter
+from src.labour.application.dtos.contraction import ContractionDTO
+from src.labour.application.dtos.labour_summary import LabourSummaryDTO
+from src.labour.application.dtos.labour_update import LabourUpdateDTO
+from src.labour.application.queries.labour_export_query import LabourExportQuery
+from src.labour.application.queries.labour_summary_query import LabourSummaryQuery
 from src.labour.application.security.token_generator import TokenGenerator
 from src.labour.application.services.contraction_service import ContractionService
 from src.labour.application.services.labour_query_service import LabourQueryService
@@ -19,6 +30,10 @@ from src.labour.application.services.labour_service import LabourService
 from src.labour.domain.labour.entity import Labour
 from src.labour.domain.labour.repository import LabourRepository
 from src.labour.domain.labour.value_objects.labour_id import LabourId
+from src.subscription.application.dtos import SubscriptionDTO
+from src.subscription.application.queries.labour_subscriptions_query import (
+    LabourSubscriptionsQuery,
+)
 from src.subscription.application.security.subscription_authorization_service import (
     SubscriptionAuthorizationService,
 )
@@ -33,7 +48,9 @@ from src.subscription.domain.entity import Subscription
 from src.subscription.domain.enums import SubscriptionAccessLevel, SubscriptionStatus
 from src.subscription.domain.repository import SubscriptionRepository
 from src.subscription.domain.value_objects.subscription_id import SubscriptionId
+from src.user.application.dtos.user_summary import UserSummaryDTO
 from src.user.application.services.user_query_service import UserQueryService
+from src.user.application.services.user_service import UserService
 from src.user.domain.entity import User
 from src.user.domain.repository import UserRepository
 from src.user.domain.value_objects.user_id import UserId
@@ -64,6 +81,7 @@ class MockLabourRepository(LabourRepository):
     def __init__(self) -> None:
         self._data = {}
         self._changes = {}
+        self._active_subscribers: dict[UUID, set[str]] = {}
 
     async def save(self, labour: Labour) -> None:
         self._changes[labour.id_.value] = labour
@@ -74,6 +92,18 @@ class MockLabourRepository(LabourRepository):
     async def get_by_id(self, labour_id: LabourId) -> Labour | None:
         return self._data.get(labour_id.value, None)
 
+    async def get_accessible_labour(
+        self, labour_id: LabourId, requester_id: UserId
+    ) -> Labour | None:
+        labour = self._data.get(labour_id.value, None)
+        if not labour:
+            return None
+        if labour.birthing_person_id == requester_id:
+            return labour
+        if requester_id.value in self._active_subscribers.get(labour_id.value, set()):
+            return labour
+        return None
+
     async def get_labours_by_birthing_person_id(self, birthing_person_id: UserId):
         return [
             labour
@@ -91,6 +121,9 @@ class MockLabourRepository(LabourRepository):
             None,
         )
 
+    async def get_active_labour_with_recent_contractions(self, birthing_person_id: UserId):
+        return await self.get_active_labour_by_birthing_person_id(birthing_person_id)
+
     async def get_active_labour_id_by_birthing_person_id(self, birthing_person_id: UserId):
         return next(
             (
@@ -108,6 +141,54 @@ class MockLabourRepository(LabourRepository):
         return labour.birthing_person_id
 
 
+class MockLabourSummaryQuery(LabourSummaryQuery):
+    def __init__(self, labour_repository: MockLabourRepository) -> None:
+        self._labour_repository = labour_repository
+
+    async def get_active_labour_summary(self, birthing_person_id: str) -> LabourSummaryDTO | None:
+        labour = await self._labour_repository.get_active_labour_by_birthing_person_id(
+            UserId(birthing_person_id)
+        )
+        return LabourSummaryDTO.from_domain(labour) if labour else None
+
+
+class MockLabourSubscriptionsQuery(LabourSubscriptionsQuery):
+    def __init__(
+        self, subscription_repository: SubscriptionRepository, user_repository: UserRepository
+    ) -> None:
+        self._subscription_repository = subscription_repository
+        self._user_repository = user_repository
+
+    async def get_labour_subscriptions(
+        self, labour_id: str, birthing_person_id: str
+    ) -> tuple[list[SubscriptionDTO], list[UserSummaryDTO]]:
+        subscriptions = await self._subscription_repository.filter(
+            labour_id=LabourId(UUID(labour_id)), birthing_person_id=UserId(birthing_person_id)
+        )
+        subscribers = await self._user_repository.get_by_ids(
+            [subscription.subscriber_id for subscription in subscriptions]
+        )
+        return (
+            [SubscriptionDTO.from_domain(subscription) for subscription in subscriptions],
+            [UserSummaryDTO.from_domain(subscriber) for subscriber in subscribers],
+        )
+
+
+class MockLabourExportQuery(LabourExportQuery):
+    def __init__(self, labour_repository: MockLabourRepository) -> None:
+        self._labour_repository = labour_repository
+
+    async def stream_contractions(self, labour_id: str) -> AsyncIterator[ContractionDTO]:
+        labour = await self._labour_repository.get_by_id(LabourId(UUID(labour_id)))
+        for contraction in labour.contractions if labour else []:
+            yield ContractionDTO.from_domain(contraction)
+
+    async def stream_labour_updates(self, labour_id: str) -> AsyncIterator[LabourUpdateDTO]:
+        labour = await self._labour_repository.get_by_id(LabourId(UUID(labour_id)))
+        for labour_update in labour.labour_updates if labour else []:
+            yield LabourUpdateDTO.from_domain(labour_update)
+
+
 class MockSubscriptionRepository(SubscriptionRepository):
     def __init__(self) -> None:
         self._data: dict[str, Subscription] = {}
@@ -201,6 +282,10 @@ class MockDomainEventRepository(DomainEventRepository):
                 unpublished.append(domain_event)
         return unpublished
 
+    async def get_oldest_unpublished_time(self) -> datetime | None:
+        times = [event.time for event, published in self._changes.values() if not published]
+        return min(times, default=None)
+
     async def mark_as_published(self, domain_event_id: str) -> None:
         domain_event = self._changes.get(domain_event_id)
         domain_event[1] = datetime.now(UTC)
@@ -288,6 +373,11 @@ def rate_limiter() -> RateLimiter:
     return InMemoryRateLimiter()
 
 
+@pytest.fixture
+def authorization_cache() -> AuthorizationCache:
+    return InMemoryAuthorizationCache(ttl_seconds=30, max_labours=100)
+
+
 @pytest_asyncio.fixture
 async def domain_event_publisher(
     domain_event_repo: DomainEventRepository, unit_of_work: UnitOfWork
@@ -305,18 +395,25 @@ async def user_service(user_repo: UserRepository) -> UserQueryService:
     return UserQueryService(user_repository=user_repo)
 
 
+@pytest_asyncio.fixture
+async def user_profile_service(user_repo: UserRepository, unit_of_work: UnitOfWork) -> UserService:
+    return UserService(user_repository=user_repo, unit_of_work=unit_of_work)
+
+
 @pytest_asyncio.fixture
 async def labour_service(
     labour_repo: LabourRepository,
     domain_event_repo: DomainEventRepository,
     unit_of_work: UnitOfWork,
     domain_event_publisher: DomainEventPublisher,
+    authorization_cache: AuthorizationCache,
 ) -> LabourService:
     return LabourService(
         labour_repository=labour_repo,
         domain_event_repository=domain_event_repo,
         unit_of_work=unit_of_work,
         domain_event_publisher=domain_event_publisher,
+        authorization_cache=authorization_cache,
     )
 
 
@@ -341,6 +438,7 @@ async def labour_query_service(
 ) -> LabourQueryService:
     return LabourQueryService(
         labour_repository=labour_repo,
+        labour_summary_query=MockLabourSummaryQuery(labour_repo),
     )
 
 
@@ -374,10 +472,12 @@ async def subscription_service(
 async def subscription_query_service(
     subscription_repo: SubscriptionRepository,
     subscription_authorization_service: SubscriptionAuthorizationService,
+    user_repo: UserRepository,
 ) -> SubscriptionQueryService:
     return SubscriptionQueryService(
         subscription_repository=subscription_repo,
         subscription_authorization_service=subscription_authorization_service,
+        labour_subscriptions_query=MockLabourSubscriptionsQuery(subscription_repo, user_repo),
     )
 
 
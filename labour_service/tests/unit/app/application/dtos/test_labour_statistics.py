@@ -0,0 +1,128 @@
+import json
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from src.labour.application.dtos.labour_statistics import LabourStatisticsDTO
+from src.labour.domain.labour.entity import Labour
+from src.labour.domain.labour.enums import LabourPhase
+from tests.unit.app.conftest import get_contractions
+
+START_TIME = datetime(2020, 1, 1, 1, 0, tzinfo=UTC)
+
+
+def test_statistics_of_labour_without_contractions(sample_labour: Labour) -> None:
+    dto = LabourStatisticsDTO.from_domain(sample_labour)
+
+    assert dto.contraction_count == 0
+    assert dto.contractions_per_10_minutes is None
+    assert dto.duration is None
+    assert dto.interval is None
+    assert dto.regularity is None
+    assert dto.mean_intensity is None
+    assert dto.phase_timeline == []
+
+
+def test_statistics_of_regular_contractions(sample_labour: Labour) -> None:
+    sample_labour.begin(start_time=START_TIME)
+    # One minute contractions starting every five minutes
+    sample_labour.contractions = get_contractions(
+        labour_id=sample_labour.id_,
+        number_of_contractions=10,
+        length_of_contractions=1,
+        time_between_contractions=4,
+        start_time=START_TIME,
+    )
+    sample_labour.complete_labour(end_time=START_TIME + timedelta(hours=1))
+
+    dto = LabourStatisticsDTO.from_domain(sample_labour)
+
+    assert dto.window_start is None
+    assert dto.window_end == START_TIME + timedelta(hours=1)
+    assert dto.contraction_count == 10
+    assert dto.contractions_per_10_minutes == 2.0
+    assert dto.duration is not None
+    assert (dto.duration.mean, dto.duration.median, dto.duration.p90) == (60.0, 60.0, 60.0)
+    assert dto.interval is not None and dto.interval.mean == 300.0
+    assert dto.gap is not None and dto.gap.mean == 240.0
+    assert dto.regularity == 0.0
+    assert dto.mean_intensity == 5.0
+    assert dto.intensity_trend_per_hour == 0.0
+    assert [phase_change.phase for phase_change in dto.phase_timeline] == [
+        LabourPhase.EARLY.value,
+        LabourPhase.COMPLETE.value,
+    ]
+
+
+def test_statistics_are_limited_to_window(sample_labour: Labour) -> None:
+    sample_labour.begin(start_time=START_TIME)
+    sample_labour.contractions = get_contractions(
+        labour_id=sample_labour.id_,
+        number_of_contractions=12,
+        length_of_contractions=1,
+        time_between_contractions=4,
+        start_time=START_TIME,
+    )
+    sample_labour.complete_labour(end_time=START_TIME + timedelta(hours=1))
+
+    dto = LabourStatisticsDTO.from_domain(sample_labour, window=timedelta(minutes=30))
+
+    assert dto.window_start == START_TIME + timedelta(minutes=30)
+    assert dto.contraction_count == 6
+
+
+def test_active_contraction_is_excluded(sample_labour: Labour) -> None:
+    sample_labour.contractions = get_contractions(
+        labour_id=sample_labour.id_,
+        number_of_contractions=3,
+        length_of_contractions=1,
+        time_between_contractions=4,
+        start_time=datetime.now(UTC) - timedelta(hours=1),
+    )
+    sample_labour.start_contraction()
+
+    dto = LabourStatisticsDTO.from_domain(sample_labour)
+
+    assert dto.contraction_count == 3
+
+
+def test_intensity_trend_and_phase_timeline(sample_labour: Labour) -> None:
+    sample_labour.begin(start_time=START_TIME)
+    contractions = get_contractions(
+        labour_id=sample_labour.id_,
+        number_of_contractions=13,
+        length_of_contractions=2,
+        time_between_contractions=3,
+        start_time=START_TIME,
+    )
+    # Intensity rises by one every contraction, so by twelve every hour
+    for intensity, contraction in enumerate(contractions[:10], start=1):
+        contraction.intensity = intensity
+    for contraction in contractions[10:]:
+        contraction.intensity = None
+    sample_labour.contractions = contractions
+
+    dto = LabourStatisticsDTO.from_domain(sample_labour)
+
+    assert dto.mean_intensity == 5.5
+    assert dto.intensity_trend_per_hour == pytest.approx(12.0)
+    # Rolling mean intensity reaches 6 after the 8th contraction and 8 after the 10th
+    assert [
+        (phase_change.phase, phase_change.start_time) for phase_change in dto.phase_timeline
+    ] == [
+        (LabourPhase.EARLY.value, START_TIME),
+        (LabourPhase.ACTIVE.value, contractions[7].end_time),
+        (LabourPhase.TRANSITION.value, contractions[9].end_time),
+    ]
+
+
+def test_can_convert_labour_statistics_dto_to_dict(sample_labour: Labour) -> None:
+    sample_labour.contractions = get_contractions(
+        labour_id=sample_labour.id_,
+        number_of_contractions=5,
+        length_of_contractions=1,
+        time_between_contractions=4,
+        start_time=START_TIME,
+    )
+    dto = LabourStatisticsDTO.from_domain(sample_labour, window=timedelta(days=1))
+    json.dumps(dto.to_dict())
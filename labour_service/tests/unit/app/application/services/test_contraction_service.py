@@ -1,5 +1,6 @@
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock
+from uuid import uuid4
 
 import pytest
 import pytest_asyncio
@@ -7,6 +8,7 @@ from fern_labour_core.unit_of_work import UnitOfWork
 
 from src.core.application.domain_event_publisher import DomainEventPublisher
 from src.core.domain.domain_event.repository import DomainEventRepository
+from src.labour.application.dtos.contraction import ImportedContractionDTO
 from src.labour.application.dtos.labour import LabourDTO
 from src.labour.application.services.contraction_service import ContractionService
 from src.labour.application.services.labour_service import LabourService
@@ -95,6 +97,20 @@ async def test_can_end_contraction(
     await contraction_service.end_contraction(labour.birthing_person_id, intensity=5)
 
 
+async def test_can_start_and_end_contraction_with_recent_contractions_only(
+    contraction_service: ContractionService, labour: LabourDTO
+) -> None:
+    started = await contraction_service.start_contraction(
+        labour.birthing_person_id, recent_contractions_only=True
+    )
+    assert len(started.contractions) == 1
+
+    ended = await contraction_service.end_contraction(
+        labour.birthing_person_id, intensity=5, recent_contractions_only=True
+    )
+    assert ended.contractions[0].intensity == 5
+
+
 async def test_can_update_contraction(
     contraction_service: ContractionService, labour: LabourDTO
 ) -> None:
@@ -168,3 +184,45 @@ async def test_cannot_end_contraction_for_non_existent_user(
 ) -> None:
     with pytest.raises(UserDoesNotHaveActiveLabour):
         await contraction_service.end_contraction("TEST123456", intensity=5)
+
+
+async def test_can_import_contractions(
+    contraction_service: ContractionService, labour: LabourDTO
+) -> None:
+    start_time = datetime(2020, 1, 1, 1, 0, tzinfo=UTC)
+    contractions = [
+        ImportedContractionDTO(
+            id=str(uuid4()),
+            start_time=start_time + timedelta(minutes=5 * i),
+            end_time=start_time + timedelta(minutes=5 * i + 1),
+            intensity=5,
+        )
+        for i in range(3)
+    ]
+    labour = await contraction_service.import_contractions(
+        labour.birthing_person_id, contractions=contractions
+    )
+    assert [c.id for c in labour.contractions] == [c.id for c in contractions]
+
+
+async def test_cannot_import_contractions_with_invalid_id(
+    contraction_service: ContractionService, labour: LabourDTO
+) -> None:
+    start_time = datetime(2020, 1, 1, 1, 0, tzinfo=UTC)
+    contraction = ImportedContractionDTO(
+        id="test",
+        start_time=start_time,
+        end_time=start_time + timedelta(minutes=1),
+        intensity=5,
+    )
+    with pytest.raises(ContractionIdInvalid):
+        await contraction_service.import_contractions(
+            labour.birthing_person_id, contractions=[contraction]
+        )
+
+
+async def test_cannot_import_contractions_for_non_existent_user(
+    contraction_service: ContractionService,
+) -> None:
+    with pytest.raises(UserDoesNotHaveActiveLabour):
+        await contraction_service.import_contractions("TEST123456", contractions=[])
@@ -1,10 +1,15 @@
 from datetime import UTC, datetime
+from unittest.mock import AsyncMock
 
 import pytest
 import pytest_asyncio
 
+from src.core.infrastructure.security.authorization_cache.interface import AuthorizationCache
 from src.labour.application.dtos.labour import LabourDTO
-from src.labour.application.security.labour_authorization_service import LabourAuthorizationService
+from src.labour.application.security.labour_authorization_service import (
+    BIRTHING_PERSON_ACCESS_RULE,
+    LabourAuthorizationService,
+)
 from src.labour.application.services.labour_service import LabourService
 from src.labour.domain.labour.exceptions import InvalidLabourId, UnauthorizedLabourRequest
 from src.labour.domain.labour.repository import LabourRepository
@@ -13,8 +18,12 @@ BIRTHING_PERSON = "bp_id"
 
 
 @pytest_asyncio.fixture
-async def labour_authorization_service(labour_repo: LabourRepository) -> LabourAuthorizationService:
-    return LabourAuthorizationService(labour_repository=labour_repo)
+async def labour_authorization_service(
+    labour_repo: LabourRepository, authorization_cache: AuthorizationCache
+) -> LabourAuthorizationService:
+    return LabourAuthorizationService(
+        labour_repository=labour_repo, authorization_cache=authorization_cache
+    )
 
 
 @pytest_asyncio.fixture
@@ -42,3 +51,32 @@ async def test_checking_for_authorization_with_invalid_id_raises_error(
 ):
     with pytest.raises(InvalidLabourId):
         await labour_authorization_service.ensure_can_access_labour("someone-else", "test")
+
+
+async def test_ensure_can_access_labour_is_cached_once_granted(
+    labour_authorization_service: LabourAuthorizationService, labour: LabourDTO
+):
+    await labour_authorization_service.ensure_can_access_labour(BIRTHING_PERSON, labour.id)
+
+    repository = labour_authorization_service._labour_repository
+    repository.get_birthing_person_id_for_labour = AsyncMock()
+    await labour_authorization_service.ensure_can_access_labour(BIRTHING_PERSON, labour.id)
+    repository.get_birthing_person_id_for_labour.assert_not_called()
+
+
+async def test_cached_access_is_dropped_when_labour_deleted(
+    labour_authorization_service: LabourAuthorizationService,
+    labour_service: LabourService,
+    authorization_cache: AuthorizationCache,
+    labour: LabourDTO,
+):
+    await labour_service.begin_labour(BIRTHING_PERSON)
+    await labour_service.complete_labour(BIRTHING_PERSON)
+    await labour_authorization_service.ensure_can_access_labour(BIRTHING_PERSON, labour.id)
+    assert authorization_cache.is_allowed(BIRTHING_PERSON_ACCESS_RULE, BIRTHING_PERSON, labour.id)
+
+    await labour_service.delete_labour(requester_id=BIRTHING_PERSON, labour_id=labour.id)
+
+    assert not authorization_cache.is_allowed(
+        BIRTHING_PERSON_ACCESS_RULE, BIRTHING_PERSON, labour.id
+    )
@@ -0,0 +1,144 @@
+import csv
+import io
+import json
+from datetime import UTC, datetime
+from uuid import UUID
+
+import pytest
+import pytest_asyncio
+
+from src.labour.application.services import labour_export_service
+from src.labour.application.services.labour_export_service import (
+    CSV_COLUMNS,
+    LabourExportFormat,
+    LabourExportService,
+)
+from src.labour.domain.labour.entity import Labour
+from src.labour.domain.labour.exceptions import InvalidLabourId, UnauthorizedLabourRequest
+from src.labour.domain.labour.value_objects.labour_id import LabourId
+from src.labour.domain.labour_update.enums import LabourUpdateType
+from src.user.domain.value_objects.user_id import UserId
+from tests.unit.app.application.conftest import MockLabourExportQuery, MockLabourRepository
+from tests.unit.app.conftest import get_contractions
+
+BIRTHING_PERSON = "bp_id"
+SUBSCRIBER = "subscriber_id"
+LABOUR_ID = UUID("12345678-1234-5678-1234-567812345678")
+
+
+@pytest_asyncio.fixture
+async def labour_export_service_instance() -> LabourExportService:
+    labour = Labour(
+        id_=LabourId(LABOUR_ID),
+        birthing_person_id=UserId(BIRTHING_PERSON),
+        due_date=datetime.now(UTC),
+        first_labour=True,
+    )
+    labour.contractions = get_contractions(
+        labour_id=labour.id_,
+        number_of_contractions=3,
+        length_of_contractions=1,
+        time_between_contractions=4,
+    )
+    labour.add_labour_update(LabourUpdateType.STATUS_UPDATE, message="Going well, 3 so far")
+    labour.add_labour_update(LabourUpdateType.PRIVATE_NOTE, message='=HYPERLINK("x")')
+
+    labour_repo = MockLabourRepository()
+    labour_repo._data = {LABOUR_ID: labour}
+    labour_repo._active_subscribers = {LABOUR_ID: {SUBSCRIBER}}
+    return LabourExportService(
+        labour_repository=labour_repo, labour_export_query=MockLabourExportQuery(labour_repo)
+    )
+
+
+async def export(service: LabourExportService, export_format: LabourExportFormat) -> str:
+    chunks = await service.export_labour(
+        requester_id=BIRTHING_PERSON, labour_id=str(LABOUR_ID), export_format=export_format
+    )
+    return "".join([chunk async for chunk in chunks])
+
+
+async def test_can_export_labour_as_csv(
+    labour_export_service_instance: LabourExportService,
+) -> None:
+    rows = list(
+        csv.DictReader(
+            io.StringIO(await export(labour_export_service_instance, LabourExportFormat.CSV))
+        )
+    )
+
+    assert tuple(rows[0]) == CSV_COLUMNS
+    assert [row["record_type"] for row in rows] == ["contraction"] * 3 + ["labour_update"] * 2
+    assert rows[0]["duration"] == "60.0"
+    assert rows[0]["message"] == ""
+    assert rows[3]["message"] == "Going well, 3 so far"
+
+
+async def test_csv_export_escapes_formulas(
+    labour_export_service_instance: LabourExportService,
+) -> None:
+    rows = list(
+        csv.DictReader(
+            io.StringIO(await export(labour_export_service_instance, LabourExportFormat.CSV))
+        )
+    )
+
+    assert rows[4]["message"] == '\'=HYPERLINK("x")'
+
+
+async def test_can_export_labour_as_ndjson(
+    labour_export_service_instance: LabourExportService,
+) -> None:
+    lines = (await export(labour_export_service_instance, LabourExportFormat.NDJSON)).splitlines()
+    records = [json.loads(line) for line in lines]
+
+    assert len(records) == 5
+    assert records[0]["record_type"] == "contraction"
+    assert records[0]["labour_id"] == str(LABOUR_ID)
+    assert records[4]["record_type"] == "labour_update"
+    assert records[4]["labour_update_type"] == "private_note"
+    assert records[4]["message"] == '=HYPERLINK("x")'
+
+
+async def test_export_is_written_in_chunks(
+    labour_export_service_instance: LabourExportService, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(labour_export_service, "EXPORT_CHUNK_SIZE", 1)
+    chunks = await labour_export_service_instance.export_labour(
+        requester_id=BIRTHING_PERSON,
+        labour_id=str(LABOUR_ID),
+        export_format=LabourExportFormat.NDJSON,
+    )
+
+    assert len([chunk async for chunk in chunks]) == 5
+
+
+async def test_subscriber_cannot_export_labour(
+    labour_export_service_instance: LabourExportService,
+) -> None:
+    with pytest.raises(UnauthorizedLabourRequest):
+        await labour_export_service_instance.export_labour(
+            requester_id=SUBSCRIBER,
+            labour_id=str(LABOUR_ID),
+            export_format=LabourExportFormat.CSV,
+        )
+
+
+async def test_cannot_export_non_existent_labour(
+    labour_export_service_instance: LabourExportService,
+) -> None:
+    with pytest.raises(UnauthorizedLabourRequest):
+        await labour_export_service_instance.export_labour(
+            requester_id=BIRTHING_PERSON,
+            labour_id="87654321-4321-8765-4321-876543218765",
+            export_format=LabourExportFormat.CSV,
+        )
+
+
+async def test_cannot_export_labour_with_invalid_id(
+    labour_export_service_instance: LabourExportService,
+) -> None:
+    with pytest.raises(InvalidLabourId):
+        await labour_export_service_instance.export_labour(
+            requester_id=BIRTHING_PERSON, labour_id="test", export_format=LabourExportFormat.CSV
+        )
@@ -1,4 +1,4 @@
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from uuid import UUID, uuid4
 
 import pytest
@@ -11,16 +11,18 @@ from src.labour.domain.labour.exceptions import (
     InvalidLabourId,
     LabourAlreadyCompleted,
     LabourNotFoundById,
+    UnauthorizedLabourRequest,
 )
 from src.labour.domain.labour.value_objects.labour_id import LabourId
 from src.user.domain.exceptions import (
     UserDoesNotHaveActiveLabour,
 )
 from src.user.domain.value_objects.user_id import UserId
-from tests.unit.app.application.conftest import MockLabourRepository
+from tests.unit.app.application.conftest import MockLabourRepository, MockLabourSummaryQuery
 
 BIRTHING_PERSON = "bp_id"
 BIRTHING_PERSON_IN_LABOUR = "bp_2_id"
+SUBSCRIBER = "subscriber_id"
 LABOUR_ID = UUID("12345678-1234-5678-1234-567812345678")
 
 
@@ -35,7 +37,10 @@ async def labour_query_service() -> LabourQueryService:
             first_labour=True,
         ),
     }
-    return LabourQueryService(labour_repository=labour_repo)
+    labour_repo._active_subscribers = {LABOUR_ID: {SUBSCRIBER}}
+    return LabourQueryService(
+        labour_repository=labour_repo, labour_summary_query=MockLabourSummaryQuery(labour_repo)
+    )
 
 
 async def test_can_get_active_labour(labour_query_service: LabourQueryService) -> None:
@@ -84,6 +89,78 @@ async def test_invalid_labour_id_raises_error(labour_query_service: LabourQueryS
         await labour_query_service.get_labour_by_id("test")
 
 
+async def test_birthing_person_can_get_accessible_labour(
+    labour_query_service: LabourQueryService,
+) -> None:
+    labour = await labour_query_service.get_accessible_labour(
+        requester_id=BIRTHING_PERSON_IN_LABOUR, labour_id=str(LABOUR_ID)
+    )
+    assert labour.id == str(LABOUR_ID)
+
+
+async def test_subscriber_can_get_accessible_labour(
+    labour_query_service: LabourQueryService,
+) -> None:
+    labour = await labour_query_service.get_accessible_labour(
+        requester_id=SUBSCRIBER, labour_id=str(LABOUR_ID)
+    )
+    assert labour.id == str(LABOUR_ID)
+
+
+async def test_cannot_get_accessible_labour_without_active_subscription(
+    labour_query_service: LabourQueryService,
+) -> None:
+    with pytest.raises(UnauthorizedLabourRequest):
+        await labour_query_service.get_accessible_labour(
+            requester_id="other_user", labour_id=str(LABOUR_ID)
+        )
+
+
+async def test_cannot_get_accessible_labour_not_found(
+    labour_query_service: LabourQueryService,
+) -> None:
+    with pytest.raises(UnauthorizedLabourRequest):
+        await labour_query_service.get_accessible_labour(
+            requester_id=BIRTHING_PERSON_IN_LABOUR, labour_id=str(uuid4())
+        )
+
+
+async def test_cannot_get_accessible_labour_invalid_labour_id(
+    labour_query_service: LabourQueryService,
+) -> None:
+    with pytest.raises(InvalidLabourId):
+        await labour_query_service.get_accessible_labour(
+            requester_id=BIRTHING_PERSON_IN_LABOUR, labour_id="test"
+        )
+
+
+async def test_can_get_labour_statistics(labour_query_service: LabourQueryService) -> None:
+    statistics = await labour_query_service.get_labour_statistics(
+        requester_id=SUBSCRIBER, labour_id=str(LABOUR_ID), window_minutes=60
+    )
+    assert statistics.labour_id == str(LABOUR_ID)
+    assert statistics.contraction_count == 0
+    assert statistics.window_start == statistics.window_end - timedelta(minutes=60)
+
+
+async def test_cannot_get_labour_statistics_without_active_subscription(
+    labour_query_service: LabourQueryService,
+) -> None:
+    with pytest.raises(UnauthorizedLabourRequest):
+        await labour_query_service.get_labour_statistics(
+            requester_id="other_user", labour_id=str(LABOUR_ID)
+        )
+
+
+async def test_cannot_get_labour_statistics_invalid_labour_id(
+    labour_query_service: LabourQueryService,
+) -> None:
+    with pytest.raises(InvalidLabourId):
+        await labour_query_service.get_labour_statistics(
+            requester_id=BIRTHING_PERSON_IN_LABOUR, labour_id="test"
+        )
+
+
 async def test_can_get_all_labours(labour_query_service: LabourQueryService) -> None:
     response = await labour_query_service.get_all_labours(BIRTHING_PERSON_IN_LABOUR)
     assert isinstance(response, list)
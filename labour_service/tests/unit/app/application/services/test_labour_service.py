@@ -8,6 +8,7 @@ from fern_labour_core.unit_of_work import UnitOfWork
 
 from src.core.application.domain_event_publisher import DomainEventPublisher
 from src.core.domain.domain_event.repository import DomainEventRepository
+from src.core.infrastructure.security.authorization_cache.interface import AuthorizationCache
 from src.labour.application.dtos.labour import LabourDTO
 from src.labour.application.exceptions import InvalidLabourUpdateRequest
 from src.labour.application.services.contraction_service import ContractionService
@@ -47,6 +48,7 @@ async def labour_service(
     domain_event_repo: DomainEventRepository,
     unit_of_work: UnitOfWork,
     domain_event_publisher: DomainEventPublisher,
+    authorization_cache: AuthorizationCache,
 ) -> LabourService:
     user_service._user_repository._data = {
         BIRTHING_PERSON: User(
@@ -69,6 +71,7 @@ async def labour_service(
         domain_event_repository=domain_event_repo,
         unit_of_work=unit_of_work,
         domain_event_publisher=domain_event_publisher,
+        authorization_cache=authorization_cache,
     )
 
 
@@ -6,6 +6,7 @@ import pytest_asyncio
 
 from src.labour.application.dtos.labour import LabourDTO
 from src.labour.application.services.labour_service import LabourService
+from src.labour.domain.labour.exceptions import InvalidLabourId
 from src.subscription.application.dtos import SubscriptionDTO
 from src.subscription.application.services.subscription_management_service import (
     SubscriptionManagementService,
@@ -21,6 +22,10 @@ from src.subscription.domain.exceptions import (
     SubscriptionNotFoundById,
     UnauthorizedSubscriptionRequest,
 )
+from src.user.application.dtos.user_summary import UserSummaryDTO
+from src.user.domain.entity import User
+from src.user.domain.repository import UserRepository
+from src.user.domain.value_objects.user_id import UserId
 
 BIRTHING_PERSON = "bp_id"
 SUBSCRIBER = "subscriber_id"
@@ -256,3 +261,42 @@ async def test_cannot_query_subscriptions_for_other_labour(
         requester_id=SUBSCRIBER, labour_id=labour.id
     )
     assert subscriptions == []
+
+
+async def test_can_query_subscriptions_with_subscribers_for_own_labour(
+    subscription_service: SubscriptionService,
+    subscription_query_service: SubscriptionQueryService,
+    user_repo: UserRepository,
+    labour: LabourDTO,
+) -> None:
+    subscriber = User(
+        id_=UserId(SUBSCRIBER),
+        username="subscriber",
+        email="subscriber@email.com",
+        first_name="Sub",
+        last_name="Scriber",
+    )
+    await user_repo.save(subscriber)
+    token = subscription_service._token_generator.generate(labour.id)
+    subscription = await subscription_service.subscribe_to(
+        subscriber_id=SUBSCRIBER, labour_id=labour.id, token=token
+    )
+
+    (
+        subscriptions,
+        subscribers,
+    ) = await subscription_query_service.get_labour_subscriptions_with_subscribers(
+        requester_id=BIRTHING_PERSON, labour_id=labour.id
+    )
+
+    assert subscriptions == [subscription]
+    assert subscribers == [UserSummaryDTO.from_domain(subscriber)]
+
+
+async def test_cannot_query_subscriptions_with_subscribers_invalid_labour_id(
+    subscription_query_service: SubscriptionQueryService,
+) -> None:
+    with pytest.raises(InvalidLabourId):
+        await subscription_query_service.get_labour_subscriptions_with_subscribers(
+            requester_id=BIRTHING_PERSON, labour_id="not-a-uuid"
+        )
@@ -3,6 +3,7 @@ import pytest
 from src.user.application.dtos.user import UserDTO
 from src.user.application.dtos.user_summary import UserSummaryDTO
 from src.user.application.services.user_query_service import UserQueryService
+from src.user.application.services.user_service import UserService
 from src.user.domain.entity import User
 from src.user.domain.exceptions import (
     UserNotFoundById,
@@ -79,3 +80,51 @@ async def test_cannot_get_summary_for_non_existent_user(
 ):
     with pytest.raises(UserNotFoundById):
         await user_service.get_summary("test")
+
+
+async def test_save_profile(user_profile_service: UserService, user_service: UserQueryService):
+    profile = UserDTO(
+        id="test",
+        username="test",
+        first_name="User",
+        last_name="Name",
+        email="test@email.com",
+        phone_number=None,
+    )
+    await user_profile_service.save_profile(profile)
+
+    assert await user_service.get("test") == profile
+
+
+async def test_save_profile_updates_existing_user(
+    user_profile_service: UserService, user_service: UserQueryService
+):
+    await register(user_service, ["test"])
+    profile = UserDTO(
+        id="test",
+        username="test",
+        first_name="New",
+        last_name="Name",
+        email="new@email.com",
+        phone_number="07123456789",
+    )
+    await user_profile_service.save_profile(profile)
+
+    assert await user_service.get("test") == profile
+
+
+async def test_save_profiles(user_profile_service: UserService, user_service: UserQueryService):
+    profiles = [
+        UserDTO(
+            id=user_id,
+            username=user_id,
+            first_name="User",
+            last_name="Name",
+            email=f"{user_id}@email.com",
+            phone_number=None,
+        )
+        for user_id in ("a", "b")
+    ]
+    await user_profile_service.save_profiles(profiles)
+
+    assert await user_service.get_many(["a", "b"]) == profiles
@@ -1,8 +1,11 @@
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from uuid import UUID
 
+from src.labour.domain.contraction.entity import Contraction
 from src.labour.domain.labour.entity import Labour
+from src.labour.domain.labour.value_objects.earlier_contractions import EarlierContractions
 from src.labour.domain.labour.value_objects.labour_id import LabourId
+from src.labour.domain.labour_update.enums import LabourUpdateType
 from src.user.domain.value_objects.user_id import UserId
 
 
@@ -30,3 +33,77 @@ def test_labour_init():
     assert isinstance(indirect_labour, Labour)
     assert direct_labour.id_ == vo_labour_id == indirect_labour.id_
     assert direct_labour == indirect_labour
+
+
+def plan_labour() -> Labour:
+    return Labour.plan(
+        birthing_person_id=UserId("87654321-4321-1234-8765-567812345678"),
+        due_date=datetime.now(UTC),
+        first_labour=True,
+    )
+
+
+def test_active_contraction_is_tracked_across_start_and_end():
+    labour = plan_labour()
+    assert labour.active_contraction is None
+
+    contraction = labour.start_contraction(start_time=datetime.now(UTC) - timedelta(minutes=1))
+    assert labour.active_contraction is contraction
+    assert labour.has_active_contraction
+
+    labour.end_contraction(intensity=5)
+    assert labour.active_contraction is None
+    assert not labour.has_active_contraction
+
+
+def test_contractions_are_found_by_id_until_removed():
+    labour = plan_labour()
+    contraction = labour.start_contraction(start_time=datetime.now(UTC) - timedelta(minutes=1))
+    labour.end_contraction(intensity=5)
+
+    assert labour.get_contraction(contraction.id_) is contraction
+
+    labour.remove_contraction(contraction)
+    assert labour.get_contraction(contraction.id_) is None
+    assert labour.contractions == []
+
+
+def test_contraction_count_includes_earlier_contractions():
+    labour = plan_labour()
+    labour.start_contraction()
+    assert labour.contraction_count == 1
+
+    labour.earlier_contractions = EarlierContractions(count=20, longest_duration_seconds=60)
+    assert labour.contraction_count == 21
+
+
+def test_indexes_are_rebuilt_when_contractions_are_replaced():
+    labour = plan_labour()
+    labour.start_contraction()
+
+    contraction = Contraction.start(labour_id=labour.id_)
+    labour.contractions = [contraction]
+
+    assert labour.active_contraction is contraction
+    assert labour.get_contraction(contraction.id_) is contraction
+
+
+def test_last_announcement_time_follows_labour_updates():
+    labour = plan_labour()
+    sent_time = datetime.now(UTC) - timedelta(hours=1)
+    status_update = labour.add_labour_update(
+        labour_update_type=LabourUpdateType.STATUS_UPDATE, message="Status", sent_time=sent_time
+    )
+    assert labour.last_announcement_time is None
+
+    labour.update_labour_update(status_update, labour_update_type=LabourUpdateType.ANNOUNCEMENT)
+    assert labour.last_announcement_time == sent_time
+
+    announcement = labour.add_labour_update(
+        labour_update_type=LabourUpdateType.ANNOUNCEMENT, message="Announcement"
+    )
+    assert labour.last_announcement_time == announcement.sent_time
+
+    labour.delete_labour_update(announcement.id_)
+    assert labour.get_labour_update(announcement.id_) is None
+    assert labour.last_announcement_time == sent_time
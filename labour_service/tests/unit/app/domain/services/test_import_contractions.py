@@ -0,0 +1,121 @@
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from src.labour.domain.contraction.entity import Contraction
+from src.labour.domain.contraction.exceptions import (
+    CannotImportActiveContraction,
+    ImportedContractionsOverlapping,
+)
+from src.labour.domain.contraction.services.import_contractions import ImportContractionsService
+from src.labour.domain.contraction.services.start_contraction import StartContractionService
+from src.labour.domain.labour.entity import Labour
+from src.labour.domain.labour.enums import LabourPhase
+from src.labour.domain.labour.exceptions import LabourAlreadyCompleted
+from src.labour.domain.labour.services.begin_labour import BeginLabourService
+from src.labour.domain.labour.services.complete_labour import CompleteLabourService
+
+START_TIME = datetime(2020, 1, 1, 1, 0, tzinfo=UTC)
+
+
+def build_contraction(
+    labour: Labour, start_time: datetime, minutes: float = 1, intensity: int = 5
+) -> Contraction:
+    contraction = Contraction.start(
+        labour_id=labour.id_, start_time=start_time, contraction_id=uuid4()
+    )
+    contraction.end(end_time=start_time + timedelta(minutes=minutes), intensity=intensity)
+    return contraction
+
+
+def test_can_import_contractions(sample_labour: Labour):
+    BeginLabourService().begin_labour(sample_labour)
+    sample_labour.clear_domain_events()
+    contractions = [
+        build_contraction(sample_labour, START_TIME + timedelta(minutes=5 * i)) for i in range(3)
+    ]
+    ImportContractionsService().import_contractions(sample_labour, contractions)
+    assert len(sample_labour.contractions) == 3
+    assert len(sample_labour.clear_domain_events()) == 6
+
+
+def test_import_contractions_sorts_by_start_time(sample_labour: Labour):
+    BeginLabourService().begin_labour(sample_labour)
+    contractions = [
+        build_contraction(sample_labour, START_TIME + timedelta(minutes=5 * i)) for i in range(3)
+    ]
+    ImportContractionsService().import_contractions(sample_labour, list(reversed(contractions)))
+    assert [c.id_ for c in sample_labour.contractions] == [c.id_ for c in contractions]
+
+
+def test_import_contractions_begins_planned_labour(sample_labour: Labour):
+    contraction = build_contraction(sample_labour, START_TIME)
+    ImportContractionsService().import_contractions(sample_labour, [contraction])
+    assert sample_labour.current_phase is LabourPhase.EARLY
+    assert sample_labour.start_time == START_TIME
+
+
+def test_import_contractions_skips_existing_ids(sample_labour: Labour):
+    BeginLabourService().begin_labour(sample_labour)
+    contraction = build_contraction(sample_labour, START_TIME)
+    ImportContractionsService().import_contractions(sample_labour, [contraction])
+    ImportContractionsService().import_contractions(sample_labour, [contraction, contraction])
+    assert len(sample_labour.contractions) == 1
+
+
+def test_import_contractions_updates_labour_phase(sample_labour: Labour):
+    BeginLabourService().begin_labour(sample_labour)
+    contractions = [
+        build_contraction(sample_labour, START_TIME + timedelta(minutes=5 * i), 2, 9)
+        for i in range(5)
+    ]
+    ImportContractionsService().import_contractions(sample_labour, contractions)
+    assert sample_labour.current_phase is LabourPhase.TRANSITION
+
+
+def test_cannot_import_overlapping_contractions(sample_labour: Labour):
+    BeginLabourService().begin_labour(sample_labour)
+    contractions = [
+        build_contraction(sample_labour, START_TIME, minutes=2),
+        build_contraction(sample_labour, START_TIME + timedelta(minutes=1)),
+    ]
+    with pytest.raises(ImportedContractionsOverlapping):
+        ImportContractionsService().import_contractions(sample_labour, contractions)
+    assert sample_labour.contractions == []
+
+
+def test_cannot_import_contraction_overlapping_existing(sample_labour: Labour):
+    BeginLabourService().begin_labour(sample_labour)
+    ImportContractionsService().import_contractions(
+        sample_labour, [build_contraction(sample_labour, START_TIME, minutes=2)]
+    )
+    with pytest.raises(ImportedContractionsOverlapping):
+        ImportContractionsService().import_contractions(
+            sample_labour, [build_contraction(sample_labour, START_TIME + timedelta(minutes=1))]
+        )
+
+
+def test_cannot_import_contraction_after_active_contraction(sample_labour: Labour):
+    BeginLabourService().begin_labour(sample_labour)
+    StartContractionService().start_contraction(sample_labour, start_time=START_TIME)
+    with pytest.raises(ImportedContractionsOverlapping):
+        ImportContractionsService().import_contractions(
+            sample_labour, [build_contraction(sample_labour, START_TIME + timedelta(minutes=1))]
+        )
+
+
+def test_cannot_import_active_contraction(sample_labour: Labour):
+    BeginLabourService().begin_labour(sample_labour)
+    contraction = Contraction.start(labour_id=sample_labour.id_, start_time=START_TIME)
+    with pytest.raises(CannotImportActiveContraction):
+        ImportContractionsService().import_contractions(sample_labour, [contraction])
+
+
+def test_cannot_import_contractions_for_completed_labour(sample_labour: Labour):
+    BeginLabourService().begin_labour(sample_labour)
+    CompleteLabourService().complete_labour(sample_labour)
+    with pytest.raises(LabourAlreadyCompleted):
+        ImportContractionsService().import_contractions(
+            sample_labour, [build_contraction(sample_labour, START_TIME)]
+        )
@@ -11,6 +11,7 @@ from src.labour.domain.labour.entity import Labour
 from src.labour.domain.labour.services.should_call_midwife_urgently import (
     ShouldCallMidwifeUrgentlyService,
 )
+from src.labour.domain.labour.value_objects.earlier_contractions import EarlierContractions
 from src.user.domain.value_objects.user_id import UserId
 from tests.unit.app.conftest import get_contractions
 
@@ -50,3 +51,10 @@ def test_should_call_midwife_returns_true_contraction_count(labour: Labour):
     )
     labour.contractions = contractions
     assert ShouldCallMidwifeUrgentlyService().should_call_midwife_urgently(labour)
+
+
+def test_should_call_midwife_returns_true_earlier_contraction_length(labour: Labour):
+    labour.earlier_contractions = EarlierContractions(
+        count=1, longest_duration_seconds=CONTRACTION_MAX_TIME_SECONDS + 1
+    )
+    assert ShouldCallMidwifeUrgentlyService().should_call_midwife_urgently(labour)
@@ -13,6 +13,7 @@ from src.labour.domain.labour.constants import (
 from src.labour.domain.labour.entity import Labour
 from src.labour.domain.labour.services.begin_labour import BeginLabourService
 from src.labour.domain.labour.services.should_go_to_hospital import ShouldGoToHospitalService
+from src.labour.domain.labour.value_objects.earlier_contractions import EarlierContractions
 from src.user.domain.value_objects.user_id import UserId
 from tests.unit.app.conftest import get_contractions
 
@@ -65,3 +66,17 @@ def test_should_go_to_hospital_returns_false_when_contractions_too_far_apart(lab
 
     labour.contractions = contractions
     assert not ShouldGoToHospitalService().should_go_to_hospital(labour)
+
+
+def test_should_go_to_hospital_counts_earlier_contractions(labour: Labour):
+    contractions = get_contractions(
+        labour_id=labour.id_.value,
+        number_of_contractions=CONTRACTIONS_REQUIRED_NULLIPAROUS - 1,
+        length_of_contractions=LENGTH_OF_CONTRACTIONS_MINUTES,
+        time_between_contractions=TIME_BETWEEN_CONTRACTIONS_NULLIPAROUS,
+    )
+    labour.contractions = contractions
+    assert not ShouldGoToHospitalService().should_go_to_hospital(labour)
+
+    labour.earlier_contractions = EarlierContractions(count=1, longest_duration_seconds=60)
+    assert ShouldGoToHospitalService().should_go_to_hospital(labour)
@@ -5,6 +5,7 @@ from src.user.infrastructure.auth.interfaces.models import AuthorizationCredenti
 from src.user.infrastructure.auth.interfaces.schemas import TokenResponse
 from src.user.infrastructure.auth.keycloak.auth_controller import KeycloakAuthController
 from src.user.infrastructure.auth.keycloak.auth_service import KeycloakAuthService
+from src.user.infrastructure.auth.profile_refresh_queue import ProfileRefreshQueue
 
 
 class MockAuthorizationCredentials(AuthorizationCredentials):
@@ -45,3 +46,24 @@ def test_can_get_authenticated_user():
     user = auth_controller.get_authenticated_user(credentials=creds)
 
     assert isinstance(user, UserDTO)
+
+
+def test_authenticated_user_is_queued_for_profile_refresh():
+    auth_service_mock = Mock()
+    auth_service_mock.verify_token.return_value = UserDTO(
+        id="123",
+        username="test",
+        email="email@test.com",
+        first_name="first",
+        last_name="last",
+        phone_number=None,
+    )
+    profile_refresh_queue = ProfileRefreshQueue(debounce_seconds=60, max_entries=10)
+
+    auth_controller = KeycloakAuthController(
+        auth_service=auth_service_mock, profile_refresh_queue=profile_refresh_queue
+    )
+
+    user = auth_controller.get_authenticated_user(MockAuthorizationCredentials("test", "test"))
+
+    assert profile_refresh_queue.drain() == [user]
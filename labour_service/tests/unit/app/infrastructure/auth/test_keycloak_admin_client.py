@@ -0,0 +1,103 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from keycloak import KeycloakGetError
+
+from src.user.infrastructure.auth.keycloak.admin_client import KeycloakAdminClient
+
+
+def build_keycloak_admin(token_expires_in: timedelta = timedelta(minutes=5)) -> MagicMock:
+    keycloak_admin = MagicMock()
+    keycloak_admin.connection.expires_at = datetime.now(UTC) + token_expires_in
+    keycloak_admin.connection.token_refreshes = 0
+
+    async def refresh_if_required() -> None:
+        # As python-keycloak, which compares its timezone-aware expiry time against now
+        if datetime.now(UTC) >= keycloak_admin.connection.expires_at:
+            await asyncio.sleep(0)
+            keycloak_admin.connection.expires_at = datetime.now(UTC) + timedelta(minutes=5)
+            keycloak_admin.connection.token_refreshes += 1
+
+    keycloak_admin.connection.a__refresh_if_required = AsyncMock(side_effect=refresh_if_required)
+    keycloak_admin.a_get_user = AsyncMock(return_value={"id": "user"})
+    keycloak_admin.a_get_users = AsyncMock(return_value=[])
+    return keycloak_admin
+
+
+async def test_limits_requests_in_flight() -> None:
+    keycloak_admin = build_keycloak_admin()
+    in_flight = 0
+    most_in_flight = 0
+
+    async def get_user(**kwargs: Any) -> dict[str, Any]:
+        nonlocal in_flight, most_in_flight
+        in_flight += 1
+        most_in_flight = max(most_in_flight, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return {"id": kwargs["user_id"]}
+
+    keycloak_admin.a_get_user.side_effect = get_user
+    client = KeycloakAdminClient(keycloak_admin=keycloak_admin, max_concurrency=3)
+
+    users = await asyncio.gather(*(client.get_user(f"user-{i}") for i in range(20)))
+
+    assert [user["id"] for user in users] == [f"user-{i}" for i in range(20)]
+    assert most_in_flight == 3
+
+
+async def test_retries_throttled_requests() -> None:
+    keycloak_admin = build_keycloak_admin()
+    keycloak_admin.a_get_user.side_effect = [
+        KeycloakGetError(response_code=429),
+        KeycloakGetError(response_code=503),
+        {"id": "user"},
+    ]
+    client = KeycloakAdminClient(keycloak_admin=keycloak_admin, retry_backoff_seconds=0)
+
+    assert await client.get_user("user") == {"id": "user"}
+    assert keycloak_admin.a_get_user.await_count == 3
+
+
+async def test_gives_up_after_max_retries() -> None:
+    keycloak_admin = build_keycloak_admin()
+    keycloak_admin.a_get_user.side_effect = KeycloakGetError(response_code=429)
+    client = KeycloakAdminClient(
+        keycloak_admin=keycloak_admin, max_retries=2, retry_backoff_seconds=0
+    )
+
+    with pytest.raises(KeycloakGetError):
+        await client.get_user("user")
+    assert keycloak_admin.a_get_user.await_count == 3
+
+
+async def test_does_not_retry_other_errors() -> None:
+    keycloak_admin = build_keycloak_admin()
+    keycloak_admin.a_get_user.side_effect = KeycloakGetError(response_code=404)
+    client = KeycloakAdminClient(keycloak_admin=keycloak_admin, retry_backoff_seconds=0)
+
+    with pytest.raises(KeycloakGetError):
+        await client.get_user("user")
+    assert keycloak_admin.a_get_user.await_count == 1
+
+
+async def test_expired_token_is_refreshed_once_for_concurrent_requests() -> None:
+    keycloak_admin = build_keycloak_admin(token_expires_in=-timedelta(seconds=1))
+    client = KeycloakAdminClient(keycloak_admin=keycloak_admin)
+
+    await asyncio.gather(*(client.get_users(first=i, max_results=10) for i in range(5)))
+
+    assert keycloak_admin.connection.token_refreshes == 1
+    keycloak_admin.a_get_users.assert_awaited_with({"first": 4, "max": 10})
+
+
+async def test_valid_token_is_not_refreshed() -> None:
+    keycloak_admin = build_keycloak_admin()
+    client = KeycloakAdminClient(keycloak_admin=keycloak_admin)
+
+    await client.get_user("user")
+
+    assert keycloak_admin.connection.token_refreshes == 0
@@ -0,0 +1,60 @@
+import pytest
+
+from src.user.application.dtos.user import UserDTO
+from src.user.infrastructure.auth.profile_refresh_queue import ProfileRefreshQueue
+
+
+def get_user(user_id: str, first_name: str = "User") -> UserDTO:
+    return UserDTO(
+        id=user_id,
+        username=user_id,
+        first_name=first_name,
+        last_name="Name",
+        email=f"{user_id}@email.com",
+        phone_number=None,
+    )
+
+
+@pytest.fixture
+def queue() -> ProfileRefreshQueue:
+    return ProfileRefreshQueue(debounce_seconds=60, max_entries=2)
+
+
+def test_empty_queue_drains_nothing(queue: ProfileRefreshQueue) -> None:
+    assert queue.drain() == []
+
+
+def test_added_profile_is_drained_once(queue: ProfileRefreshQueue) -> None:
+    user = get_user("test")
+    queue.add(user)
+
+    assert queue.drain() == [user]
+    assert queue.drain() == []
+
+
+def test_user_is_not_queued_again_within_debounce(queue: ProfileRefreshQueue) -> None:
+    queue.add(get_user("test"))
+    queue.drain()
+    queue.add(get_user("test", first_name="New"))
+
+    assert queue.drain() == []
+
+
+def test_user_is_queued_again_after_debounce() -> None:
+    queue = ProfileRefreshQueue(debounce_seconds=0, max_entries=2)
+    queue.add(get_user("test"))
+    queue.drain()
+    user = get_user("test", first_name="New")
+    queue.add(user)
+
+    assert queue.drain() == [user]
+
+
+def test_least_recently_queued_user_is_forgotten(queue: ProfileRefreshQueue) -> None:
+    for user_id in ("a", "b", "c"):
+        queue.add(get_user(user_id))
+    queue.drain()
+    queue.add(get_user("c"))
+    queue.add(get_user("a"))
+
+    assert [user.id for user in queue.drain()] == ["a"]
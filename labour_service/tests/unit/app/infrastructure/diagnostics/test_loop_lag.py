@@ -0,0 +1,57 @@
+import asyncio
+import logging
+import time
+
+import pytest
+
+from src.core.infrastructure.diagnostics.loop_lag import LoopLagMonitor
+from src.core.infrastructure.metrics.instruments import EVENT_LOOP_BLOCKED
+
+
+def block_the_loop(seconds: float) -> None:
+    time.sleep(seconds)
+
+
+async def test_lag_is_measured() -> None:
+    monitor = LoopLagMonitor(interval=0.01, blocking_threshold=1.0)
+
+    await monitor.start()
+    await asyncio.sleep(0.1)
+    await monitor.stop()
+
+    percentiles = monitor.percentiles()
+    assert set(percentiles) == {"p50", "p95", "p99", "max"}
+    assert percentiles["p50"] <= percentiles["max"]
+
+
+async def test_blocking_call_is_reported_once(caplog: pytest.LogCaptureFixture) -> None:
+    monitor = LoopLagMonitor(interval=0.01, blocking_threshold=0.05)
+
+    await monitor.start()
+    await asyncio.sleep(0.05)
+    with caplog.at_level(logging.WARNING):
+        block_the_loop(0.3)
+        await asyncio.sleep(0.05)
+    await monitor.stop()
+
+    [(location, count)] = monitor.offenders.items()
+    assert location.endswith(":block_the_loop")
+    assert count == 1
+    assert EVENT_LOOP_BLOCKED.value(location) >= 1
+    assert "Event loop blocked" in caplog.text
+    assert "block_the_loop" in caplog.text
+
+
+async def test_short_pauses_are_not_reported() -> None:
+    monitor = LoopLagMonitor(interval=0.01, blocking_threshold=0.5)
+
+    await monitor.start()
+    block_the_loop(0.05)
+    await asyncio.sleep(0.05)
+    await monitor.stop()
+
+    assert not monitor.offenders
+
+
+async def test_percentiles_are_empty_before_start() -> None:
+    assert LoopLagMonitor().percentiles() == {}
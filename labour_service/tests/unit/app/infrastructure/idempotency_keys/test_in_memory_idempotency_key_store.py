@@ -0,0 +1,50 @@
+import pytest
+
+from src.core.infrastructure.idempotency_keys.in_memory import InMemoryIdempotencyKeyStore
+from src.core.infrastructure.idempotency_keys.interface import CachedResponse, IdempotencyKeyStore
+
+RESPONSE = CachedResponse(request_hash="hash", status_code=200, headers=[], body=b"{}")
+
+
+@pytest.fixture
+def store() -> IdempotencyKeyStore:
+    return InMemoryIdempotencyKeyStore(expiry_seconds=60, max_entries=2)
+
+
+def test_get_missing_key(store: IdempotencyKeyStore) -> None:
+    assert store.get("test") is None
+
+
+def test_claim_and_complete(store: IdempotencyKeyStore) -> None:
+    assert store.try_claim("test")
+    store.complete("test", RESPONSE)
+    assert store.get("test") == RESPONSE
+
+
+def test_cannot_claim_in_flight_key(store: IdempotencyKeyStore) -> None:
+    assert store.try_claim("test")
+    assert not store.try_claim("test")
+
+
+def test_released_key_can_be_claimed(store: IdempotencyKeyStore) -> None:
+    assert store.try_claim("test")
+    store.release("test")
+    assert store.try_claim("test")
+    assert store.get("test") is None
+
+
+def test_expired_response_is_not_returned() -> None:
+    store = InMemoryIdempotencyKeyStore(expiry_seconds=0, max_entries=2)
+    store.try_claim("test")
+    store.complete("test", RESPONSE)
+    assert store.get("test") is None
+
+
+def test_oldest_responses_evicted_when_full(store: IdempotencyKeyStore) -> None:
+    for key in ("a", "b", "c"):
+        store.try_claim(key)
+        store.complete(key, RESPONSE)
+    store.try_claim("d")
+    assert store.get("a") is None
+    assert store.get("b") == RESPONSE
+    assert store.get("c") == RESPONSE
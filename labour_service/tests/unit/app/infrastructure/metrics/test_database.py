@@ -0,0 +1,61 @@
+import pytest
+from sqlalchemy import create_engine, text
+
+from src.core.infrastructure.metrics.database import instrument_engine, track_queries
+from src.core.infrastructure.metrics.instruments import DB_QUERY_DURATION
+from tests.conftest import AssertMaxQueries
+
+
+def test_queries_are_tracked_within_block() -> None:
+    engine = create_engine("sqlite://")
+    instrument_engine(engine, "test_tracked")
+
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        with track_queries() as stats:
+            connection.execute(text("SELECT 1"))
+            connection.execute(text("SELECT 2"))
+
+    assert stats.count == 2
+    assert stats.duration > 0
+    assert DB_QUERY_DURATION.count("test_tracked") == 3
+
+
+def test_nested_blocks_each_track_their_queries() -> None:
+    engine = create_engine("sqlite://")
+    instrument_engine(engine, "test_nested")
+
+    with engine.connect() as connection, track_queries() as outer:
+        connection.execute(text("SELECT 1"))
+        with track_queries() as inner:
+            connection.execute(text("SELECT 2"))
+
+    assert outer.count == 2
+    assert inner.count == 1
+
+
+def test_repeated_statements_are_counted() -> None:
+    engine = create_engine("sqlite://")
+    instrument_engine(engine, "test_repeated")
+
+    with engine.connect() as connection, track_queries() as stats:
+        for value in range(3):
+            connection.execute(text("SELECT :value"), {"value": value})
+        connection.execute(text("SELECT 1"))
+
+    assert stats.repeated_statements(threshold=3) == [("SELECT ?", 3)]
+    assert stats.repeated_statements(threshold=4) == []
+
+
+def test_assert_max_queries_fails_when_exceeded(assert_max_queries: AssertMaxQueries) -> None:
+    engine = create_engine("sqlite://")
+    instrument_engine(engine, "test_assert_max_queries")
+
+    with engine.connect() as connection:
+        with assert_max_queries(2):
+            connection.execute(text("SELECT 1"))
+            connection.execute(text("SELECT 2"))
+        with pytest.raises(AssertionError, match="at most 1 queries, executed 2"):
+            with assert_max_queries(1):
+                connection.execute(text("SELECT 1"))
+                connection.execute(text("SELECT 2"))
@@ -0,0 +1,71 @@
+from typing import Any
+
+import pytest
+from fern_labour_core.events.event_handler import EventHandler
+from sqlalchemy import Engine, create_engine, text
+
+from src.core.infrastructure.metrics.database import instrument_engine
+from src.core.infrastructure.metrics.event_handlers import instrument_event_handler
+from src.core.infrastructure.metrics.instruments import (
+    EVENT_HANDLER_DB_QUERIES,
+    EVENT_HANDLER_DURATION,
+    EVENT_HANDLER_FAILURES,
+    QUERY_BUDGET_EXCEEDED,
+)
+from src.core.infrastructure.metrics.query_budget import QueryBudget
+
+
+class SucceedingEventHandler(EventHandler):
+    async def handle(self, event: dict[str, Any]) -> None:
+        return None
+
+
+class FailingEventHandler(EventHandler):
+    async def handle(self, event: dict[str, Any]) -> None:
+        raise RuntimeError("Failed")
+
+
+async def test_handler_latency_is_recorded() -> None:
+    instrument_event_handler("test.succeeded", SucceedingEventHandler)
+    instrument_event_handler("test.succeeded", SucceedingEventHandler)
+
+    await SucceedingEventHandler().handle({})
+
+    assert EVENT_HANDLER_DURATION.count("test.succeeded") == 1
+    assert EVENT_HANDLER_FAILURES.value("test.succeeded") == 0
+
+
+async def test_handler_failures_are_recorded() -> None:
+    instrument_event_handler("test.failed", FailingEventHandler)
+
+    with pytest.raises(RuntimeError):
+        await FailingEventHandler().handle({})
+
+    assert EVENT_HANDLER_DURATION.count("test.failed") == 1
+    assert EVENT_HANDLER_FAILURES.value("test.failed") == 1
+
+
+class QueryingEventHandler(EventHandler):
+    def __init__(self, engine: Engine) -> None:
+        self._engine = engine
+
+    async def handle(self, event: dict[str, Any]) -> None:
+        with self._engine.connect() as connection:
+            for _ in range(event["queries"]):
+                connection.execute(text("SELECT 1"))
+
+
+async def test_handler_queries_are_checked_against_budget() -> None:
+    engine = create_engine("sqlite://")
+    instrument_engine(engine, "test_event_handler")
+    instrument_event_handler(
+        "test.querying",
+        QueryingEventHandler,
+        QueryBudget(max_queries=0, repeated_statement_threshold=3),
+    )
+
+    await QueryingEventHandler(engine).handle({"queries": 2})
+    await QueryingEventHandler(engine).handle({"queries": 3})
+
+    assert EVENT_HANDLER_DB_QUERIES.count("test.querying") == 2
+    assert QUERY_BUDGET_EXCEEDED.value("event", "test.querying") == 1
@@ -0,0 +1,33 @@
+import asyncio
+
+from src.core.infrastructure.metrics.registry import MetricsRegistry
+from src.core.infrastructure.metrics.server import MetricsServer
+
+
+async def request(path: str) -> str:
+    registry = MetricsRegistry()
+    registry.gauge("up", "Up.").set(1)
+    server = MetricsServer(registry=registry, host="127.0.0.1", port=0)
+    await server.start()
+    try:
+        reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+        writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+        await writer.drain()
+        response = await reader.read()
+        writer.close()
+    finally:
+        await server.stop()
+    return response.decode()
+
+
+async def test_metrics_are_served() -> None:
+    response = await request("/metrics")
+
+    assert response.startswith("HTTP/1.1 200 OK")
+    assert response.endswith("up 1\n")
+
+
+async def test_other_paths_are_not_found() -> None:
+    response = await request("/other")
+
+    assert response.startswith("HTTP/1.1 404 Not Found")
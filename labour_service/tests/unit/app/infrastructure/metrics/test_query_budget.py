@@ -0,0 +1,36 @@
+from collections import Counter
+
+from src.core.infrastructure.metrics.database import QueryStats
+from src.core.infrastructure.metrics.instruments import QUERY_BUDGET_EXCEEDED
+from src.core.infrastructure.metrics.query_budget import QueryBudget
+
+
+def stats(statements: dict[str, int]) -> QueryStats:
+    return QueryStats(count=sum(statements.values()), duration=0.01, statements=Counter(statements))
+
+
+def test_queries_within_budget_are_not_flagged() -> None:
+    budget = QueryBudget(max_queries=3, repeated_statement_threshold=3)
+
+    assert budget.check(stats({"SELECT a": 2, "SELECT b": 1}), "request", "GET /within") == []
+    assert QUERY_BUDGET_EXCEEDED.value("request", "GET /within") == 0
+
+
+def test_queries_over_budget_are_flagged() -> None:
+    budget = QueryBudget(max_queries=3, repeated_statement_threshold=0)
+
+    violations = budget.check(
+        stats({"SELECT a": 2, "SELECT b": 1, "SELECT c": 1}), "request", "GET /over"
+    )
+
+    assert violations == ["executed 4 queries, budget is 3"]
+    assert QUERY_BUDGET_EXCEEDED.value("request", "GET /over") == 1
+
+
+def test_repeated_statements_are_flagged() -> None:
+    budget = QueryBudget(max_queries=0, repeated_statement_threshold=3)
+
+    violations = budget.check(stats({"SELECT a": 5, "SELECT b": 1}), "event", "test.repeated")
+
+    assert violations == ["executed 5 times: SELECT a"]
+    assert QUERY_BUDGET_EXCEEDED.value("event", "test.repeated") == 1
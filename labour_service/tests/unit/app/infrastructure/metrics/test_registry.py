@@ -0,0 +1,76 @@
+import pytest
+
+from src.core.infrastructure.metrics.registry import MetricsRegistry
+
+
+@pytest.fixture
+def registry() -> MetricsRegistry:
+    return MetricsRegistry()
+
+
+def test_counter_is_rendered_with_labels(registry: MetricsRegistry) -> None:
+    counter = registry.counter("failures", "Failures.", labels=("topic",))
+    counter.inc("labour.begun")
+    counter.inc("labour.begun", amount=2)
+
+    assert counter.value("labour.begun") == 3
+    assert registry.render() == (
+        "# HELP failures Failures.\n"
+        "# TYPE failures counter\n"
+        'failures_total{topic="labour.begun"} 3\n'
+    )
+
+
+def test_gauge_is_rendered_without_labels(registry: MetricsRegistry) -> None:
+    registry.gauge("lag_seconds", "Lag.").set(1.5)
+
+    assert registry.render().splitlines()[-1] == "lag_seconds 1.5"
+
+
+def test_histogram_buckets_are_cumulative(registry: MetricsRegistry) -> None:
+    histogram = registry.histogram(
+        "duration_seconds", "Duration.", labels=("route",), buckets=(0.1, 1.0)
+    )
+    for value in (0.05, 0.5, 5.0):
+        histogram.observe(value, "/labour")
+
+    assert histogram.count("/labour") == 3
+    assert registry.render().splitlines()[2:] == [
+        'duration_seconds_bucket{route="/labour",le="0.1"} 1',
+        'duration_seconds_bucket{route="/labour",le="1"} 2',
+        'duration_seconds_bucket{route="/labour",le="+Inf"} 3',
+        'duration_seconds_sum{route="/labour"} 5.55',
+        'duration_seconds_count{route="/labour"} 3',
+    ]
+
+
+def test_label_values_are_escaped(registry: MetricsRegistry) -> None:
+    registry.counter("requests", "Requests.", labels=("route",)).inc('/"quoted"')
+
+    assert 'requests_total{route="/\\"quoted\\""} 1' in registry.render()
+
+
+def test_wrong_number_of_labels_is_rejected(registry: MetricsRegistry) -> None:
+    counter = registry.counter("requests", "Requests.", labels=("route",))
+
+    with pytest.raises(ValueError):
+        counter.inc()
+
+
+def test_metric_cannot_be_registered_twice(registry: MetricsRegistry) -> None:
+    registry.counter("requests", "Requests.")
+
+    with pytest.raises(ValueError):
+        registry.gauge("requests", "Requests.")
+
+
+def test_collectors_are_rendered_after_metrics(registry: MetricsRegistry) -> None:
+    def collector() -> list[str]:
+        return ["# TYPE collected gauge", "collected 1"]
+
+    registry.gauge("recorded", "Recorded.").set(1)
+    registry.add_collector(collector)
+    assert registry.render().splitlines()[-2:] == ["# TYPE collected gauge", "collected 1"]
+
+    registry.remove_collector(collector)
+    assert "collected" not in registry.render()
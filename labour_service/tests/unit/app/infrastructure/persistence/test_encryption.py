@@ -0,0 +1,65 @@
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy_utils import StringEncryptedType
+from sqlalchemy_utils.types.encrypted.encrypted_type import AesEngine
+
+from src.core.infrastructure.persistence.encryption import EncryptedAttribute, FieldEncryptor
+
+KEY = "test-key"
+
+
+class Row:
+    message = EncryptedAttribute("_encrypted_message")
+
+    def __init__(self, ciphertext: str | None, encryptor: Any) -> None:
+        self._encrypted_message = ciphertext
+        self._field_encryptor = encryptor
+
+
+def test_field_encryptor_round_trips():
+    encryptor = FieldEncryptor(key=KEY)
+    assert encryptor.decrypt(encryptor.encrypt("hello")) == "hello"
+
+
+def test_field_encryptor_is_compatible_with_string_encrypted_type():
+    column_type = StringEncryptedType(key=KEY, engine=AesEngine, padding="pkcs5")
+    ciphertext = column_type.process_bind_param("hello", None)
+    assert FieldEncryptor(key=KEY).decrypt(ciphertext) == "hello"
+
+
+def test_encrypted_attribute_decrypts_on_first_access_only():
+    encryptor = MagicMock(wraps=FieldEncryptor(key=KEY))
+    row = Row(FieldEncryptor(key=KEY).encrypt("hello"), encryptor)
+    encryptor.decrypt.assert_not_called()
+
+    assert row.message == "hello"
+    assert row.message == "hello"
+    encryptor.decrypt.assert_called_once()
+
+
+def test_encrypted_attribute_returns_none_for_null_column():
+    encryptor = MagicMock()
+    row = Row(None, encryptor)
+    assert row.message is None
+    encryptor.decrypt.assert_not_called()
+
+
+def test_encrypted_attribute_set_is_encrypted_when_pending_flushed():
+    encryptor = FieldEncryptor(key=KEY)
+    row = Row(encryptor.encrypt("hello"), encryptor)
+    row.message = "updated"
+    assert row.message == "updated"
+    assert row._encrypted_message is None
+
+    Row.message.encrypt_pending(row, encryptor)
+    assert row._encrypted_message is not None
+    assert encryptor.decrypt(row._encrypted_message) == "updated"
+    assert row.message == "updated"
+
+
+def test_encrypted_attribute_without_encryptor_raises():
+    row = Row(FieldEncryptor(key=KEY).encrypt("hello"), None)
+    with pytest.raises(RuntimeError):
+        row.message  # noqa: B018
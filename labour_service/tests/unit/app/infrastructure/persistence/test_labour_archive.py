@@ -0,0 +1,76 @@
+import base64
+import zlib
+from datetime import UTC, datetime
+from uuid import uuid4
+
+import orjson
+import pytest
+
+from src.labour.domain.labour.value_objects.labour_id import LabourId
+from src.labour.domain.labour_update.entity import LabourUpdate
+from src.labour.domain.labour_update.enums import LabourUpdateType
+from src.labour.infrastructure.persistence.archive import decode_snapshot, encode_snapshot
+from tests.unit.app.conftest import get_contractions
+
+LABOUR_ID = LabourId(uuid4())
+
+
+def test_snapshot_round_trips() -> None:
+    contractions = get_contractions(
+        labour_id=LABOUR_ID,
+        number_of_contractions=3,
+        length_of_contractions=1,
+        time_between_contractions=4,
+    )
+    contractions[0].intensity = 7
+    contractions[1].notes = "Strong one"
+    labour_update = LabourUpdate.create(
+        labour_update_type=LabourUpdateType.ANNOUNCEMENT,
+        labour_id=LABOUR_ID,
+        message="Baby is here!",
+        sent_time=datetime(2020, 1, 1, 2, 0, tzinfo=UTC),
+    )
+
+    decoded_contractions, decoded_labour_updates = decode_snapshot(
+        LABOUR_ID, encode_snapshot(contractions, [labour_update])
+    )
+
+    assert [
+        (c.id_, c.labour_id, c.start_time, c.end_time, c.intensity, c.notes)
+        for c in decoded_contractions
+    ] == [
+        (c.id_, c.labour_id, c.start_time, c.end_time, c.intensity, c.notes) for c in contractions
+    ]
+    [decoded_labour_update] = decoded_labour_updates
+    assert decoded_labour_update.id_ == labour_update.id_
+    assert decoded_labour_update.labour_update_type is LabourUpdateType.ANNOUNCEMENT
+    assert decoded_labour_update.message == "Baby is here!"
+    assert decoded_labour_update.sent_time == labour_update.sent_time
+    assert decoded_labour_update.edited is False
+    assert decoded_labour_update.application_generated is False
+
+
+def test_snapshot_is_compressed() -> None:
+    contractions = get_contractions(
+        labour_id=LABOUR_ID,
+        number_of_contractions=500,
+        length_of_contractions=1,
+        time_between_contractions=4,
+    )
+    snapshot = encode_snapshot(contractions, [])
+
+    uncompressed = orjson.dumps(
+        [
+            {"id": str(c.id_.value), "start_time": c.start_time, "end_time": c.end_time}
+            for c in contractions
+        ]
+    )
+    assert len(snapshot) < len(uncompressed) / 2
+
+
+def test_unknown_snapshot_version_is_rejected() -> None:
+    payload = orjson.dumps({"version": 0, "contractions": [], "labour_updates": []})
+    snapshot = base64.b64encode(zlib.compress(payload)).decode("ascii")
+
+    with pytest.raises(ValueError):
+        decode_snapshot(LABOUR_ID, snapshot)
@@ -0,0 +1,88 @@
+import logging
+import sqlite3
+
+import pytest
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.util import greenlet_spawn
+
+from src.core.infrastructure.persistence.engine import instrumented_pool_class
+from src.core.infrastructure.persistence.pool_metrics import PoolMetrics, PoolMetricsRegistry
+
+
+def create_pool(metrics: PoolMetrics, max_overflow: int = 1) -> AsyncAdaptedQueuePool:
+    pool_class = instrumented_pool_class(metrics)
+    return pool_class(
+        lambda: sqlite3.connect(":memory:"), pool_size=1, max_overflow=max_overflow, timeout=0.01
+    )
+
+
+async def test_checkouts_are_recorded() -> None:
+    metrics = PoolMetrics(name="primary", slow_checkout_threshold=10)
+    pool = create_pool(metrics)
+
+    first = await greenlet_spawn(pool.connect)
+    second = await greenlet_spawn(pool.connect)
+    gauges = metrics.gauges()
+    await greenlet_spawn(first.close)
+    await greenlet_spawn(second.close)
+
+    assert gauges == {"size": 1, "checked_out": 2, "overflow": 1}
+    assert metrics.instruments.checkouts.value("primary") == 2
+    assert metrics.instruments.checkout_wait.count("primary") == 2
+    samples = list(metrics.instruments.utilisation.samples())
+    assert 'db_pool_utilisation_bucket{pool="primary",le="0.5"} 1' in samples
+    assert 'db_pool_utilisation_bucket{pool="primary",le="1"} 2' in samples
+    samples = list(metrics.instruments.overflow.samples())
+    assert 'db_pool_overflow_connections_bucket{pool="primary",le="0"} 1' in samples
+    assert 'db_pool_overflow_connections_bucket{pool="primary",le="1"} 2' in samples
+
+
+async def test_checkout_timeouts_are_recorded(caplog: pytest.LogCaptureFixture) -> None:
+    metrics = PoolMetrics(name="primary", slow_checkout_threshold=10)
+    pool = create_pool(metrics, max_overflow=0)
+
+    connection = await greenlet_spawn(pool.connect)
+    with caplog.at_level(logging.ERROR), pytest.raises(exc.TimeoutError):
+        await greenlet_spawn(pool.connect)
+    await greenlet_spawn(connection.close)
+
+    assert metrics.instruments.timeouts.value("primary") == 1
+    assert "timed out" in caplog.text
+
+
+async def test_slow_checkouts_are_logged(caplog: pytest.LogCaptureFixture) -> None:
+    metrics = PoolMetrics(name="primary", slow_checkout_threshold=0)
+    pool = create_pool(metrics)
+
+    with caplog.at_level(logging.WARNING):
+        connection = await greenlet_spawn(pool.connect)
+    await greenlet_spawn(connection.close)
+
+    assert "Slow connection checkout from 'primary' pool" in caplog.text
+
+
+async def test_pool_recreated_on_dispose_stays_instrumented() -> None:
+    metrics = PoolMetrics(name="primary", slow_checkout_threshold=10)
+    pool = create_pool(metrics).recreate()
+
+    connection = await greenlet_spawn(pool.connect)
+    await greenlet_spawn(connection.close)
+
+    assert metrics.instruments.checkouts.value("primary") == 1
+
+
+async def test_registry_collects_every_pool_under_one_family() -> None:
+    registry = PoolMetricsRegistry(slow_checkout_threshold=10)
+    pool = create_pool(registry.register("primary"))
+    registry.register("replica")
+
+    connection = await greenlet_spawn(pool.connect)
+    await greenlet_spawn(connection.close)
+    lines = list(registry.collect())
+
+    assert lines.count("# TYPE db_pool_checkout_wait_seconds histogram") == 1
+    assert 'db_pool_checkouts_total{pool="primary"} 1' in lines
+    assert 'db_pool_checkouts_total{pool="replica"} 0' in lines
+    assert 'db_pool_checkout_wait_seconds_count{pool="primary"} 1' in lines
+    assert 'db_pool_size{pool="replica"} 0' in lines
@@ -0,0 +1,78 @@
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.user.infrastructure.persistence.repositories.user_projection_repository import (
+    SQLAlchemyUserRepository,
+)
+from src.user.infrastructure.persistence.user_projection_sync import KeycloakUserProjectionSync
+
+
+def keycloak_user(index: int) -> dict[str, Any]:
+    return {
+        "id": f"user-{index}",
+        "username": f"user{index}",
+        "email": f"user{index}@example.com",
+        "firstName": "Test",
+        "lastName": f"User {index}",
+        "attributes": {"phone_number": ["07123456789"]},
+    }
+
+
+def build_sync(pages: list[list[dict[str, Any]]]) -> tuple[KeycloakUserProjectionSync, MagicMock]:
+    keycloak_admin_client = MagicMock()
+    keycloak_admin_client.get_users = AsyncMock(side_effect=pages)
+    user_repository = MagicMock(spec=SQLAlchemyUserRepository)
+    user_repository.delete_synced_before.return_value = 0
+    sync = KeycloakUserProjectionSync(
+        keycloak_admin_client=keycloak_admin_client,
+        user_repository=user_repository,
+        unit_of_work=AsyncMock(),
+        page_size=2,
+    )
+    return sync, user_repository
+
+
+@pytest.mark.parametrize(
+    ("pages", "expected_saves"),
+    [
+        ([[keycloak_user(0), keycloak_user(1)], [keycloak_user(2)]], 2),
+        ([[keycloak_user(0), keycloak_user(1)], []], 1),
+        ([[]], 0),
+    ],
+)
+async def test_sync_pages_through_keycloak_users(
+    pages: list[list[dict[str, Any]]], expected_saves: int
+) -> None:
+    sync, user_repository = build_sync(pages)
+
+    synced = await sync.sync()
+
+    assert synced == sum(len(page) for page in pages)
+    assert user_repository.save_many.await_count == expected_saves
+    user_repository.delete_synced_before.assert_awaited_once()
+
+
+async def test_sync_maps_keycloak_users() -> None:
+    sync, user_repository = build_sync([[keycloak_user(0)]])
+
+    await sync.sync()
+
+    (user,) = user_repository.save_many.await_args.args[0]
+    assert user.id_.value == "user-0"
+    assert user.last_name == "User 0"
+    assert user.phone_number == "07123456789"
+
+
+async def test_sync_does_not_remove_users_when_keycloak_fails() -> None:
+    sync, user_repository = build_sync([[keycloak_user(0), keycloak_user(1)]])
+    sync._keycloak_admin_client.get_users.side_effect = [
+        [keycloak_user(0), keycloak_user(1)],
+        ConnectionError(),
+    ]
+
+    with pytest.raises(ConnectionError):
+        await sync.sync()
+
+    user_repository.delete_synced_before.assert_not_awaited()
@@ -0,0 +1,35 @@
+import pytest
+
+from src.core.infrastructure.recent_writes.in_memory import InMemoryRecentWriteTracker
+from src.core.infrastructure.recent_writes.interface import RecentWriteTracker
+
+
+@pytest.fixture
+def tracker() -> RecentWriteTracker:
+    return InMemoryRecentWriteTracker(window_seconds=60, max_entries=2)
+
+
+def test_unknown_key_has_no_recent_write(tracker: RecentWriteTracker) -> None:
+    assert not tracker.has_recent_write("test")
+
+
+def test_recorded_write_is_recent(tracker: RecentWriteTracker) -> None:
+    tracker.record_write("test")
+    assert tracker.has_recent_write("test")
+
+
+def test_write_outside_window_is_not_recent() -> None:
+    tracker = InMemoryRecentWriteTracker(window_seconds=0, max_entries=2)
+    tracker.record_write("test")
+    assert not tracker.has_recent_write("test")
+
+
+def test_least_recent_writer_is_evicted(tracker: RecentWriteTracker) -> None:
+    tracker.record_write("a")
+    tracker.record_write("b")
+    tracker.record_write("a")
+    tracker.record_write("c")
+
+    assert tracker.has_recent_write("a")
+    assert not tracker.has_recent_write("b")
+    assert tracker.has_recent_write("c")
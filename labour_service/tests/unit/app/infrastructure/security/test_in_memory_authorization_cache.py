@@ -0,0 +1,52 @@
+from unittest.mock import patch
+
+import pytest
+
+from src.core.infrastructure.security.authorization_cache.in_memory import (
+    InMemoryAuthorizationCache,
+)
+from src.core.infrastructure.security.authorization_cache.interface import AuthorizationCache
+
+MODULE = "src.core.infrastructure.security.authorization_cache.in_memory"
+RULE = "labour:birthing_person"
+
+
+@pytest.fixture
+def authorization_cache() -> AuthorizationCache:
+    return InMemoryAuthorizationCache(ttl_seconds=30, max_labours=2)
+
+
+def test_not_allowed_until_granted(authorization_cache: AuthorizationCache) -> None:
+    assert not authorization_cache.is_allowed(RULE, "user", "labour")
+    authorization_cache.allow(RULE, "user", "labour")
+    assert authorization_cache.is_allowed(RULE, "user", "labour")
+
+
+def test_decisions_are_scoped_by_rule(authorization_cache: AuthorizationCache) -> None:
+    authorization_cache.allow(RULE, "user", "labour")
+    assert not authorization_cache.is_allowed("labour:other", "user", "labour")
+
+
+def test_decision_expires(authorization_cache: AuthorizationCache) -> None:
+    with patch(f"{MODULE}.time.monotonic", return_value=100.0):
+        authorization_cache.allow(RULE, "user", "labour")
+    with patch(f"{MODULE}.time.monotonic", return_value=130.0):
+        assert not authorization_cache.is_allowed(RULE, "user", "labour")
+
+
+def test_invalidate_labour_drops_all_requesters(authorization_cache: AuthorizationCache) -> None:
+    authorization_cache.allow(RULE, "user", "labour")
+    authorization_cache.allow(RULE, "other", "labour")
+    authorization_cache.invalidate_labour("labour")
+    assert not authorization_cache.is_allowed(RULE, "user", "labour")
+    assert not authorization_cache.is_allowed(RULE, "other", "labour")
+
+
+def test_least_recently_granted_labour_is_evicted(
+    authorization_cache: AuthorizationCache,
+) -> None:
+    authorization_cache.allow(RULE, "user", "labour_1")
+    authorization_cache.allow(RULE, "user", "labour_2")
+    authorization_cache.allow(RULE, "user", "labour_3")
+    assert not authorization_cache.is_allowed(RULE, "user", "labour_1")
+    assert authorization_cache.is_allowed(RULE, "user", "labour_3")
@@ -0,0 +1,52 @@
+import asyncio
+from unittest.mock import Mock
+
+from src.core.infrastructure.sentry.profiling import ProfilingSession
+
+
+def build_session(max_duration: int = 60) -> tuple[ProfilingSession, Mock, Mock]:
+    start, stop = Mock(), Mock()
+    return ProfilingSession(max_duration=max_duration, start=start, stop=stop), start, stop
+
+
+async def test_profiling_stops_after_duration() -> None:
+    session, start, stop = build_session()
+
+    session.start(duration=1)
+    assert session.active
+    start.assert_called_once()
+
+    await asyncio.sleep(1.1)
+    assert not session.active
+    stop.assert_called_once()
+
+
+async def test_starting_again_extends_session() -> None:
+    session, start, stop = build_session()
+
+    first_end = session.start(duration=1)
+    second_end = session.start(duration=30)
+
+    assert second_end > first_end
+    start.assert_called_once()
+    await asyncio.sleep(1.1)
+    assert session.active
+    stop.assert_not_called()
+    session.stop()
+
+
+async def test_duration_is_capped() -> None:
+    session, _, _ = build_session(max_duration=1)
+
+    session.start(duration=3600)
+    await asyncio.sleep(1.1)
+
+    assert not session.active
+
+
+async def test_stop_without_session_does_nothing() -> None:
+    session, _, stop = build_session()
+
+    session.stop()
+
+    stop.assert_not_called()
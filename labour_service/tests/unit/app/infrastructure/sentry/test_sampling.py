@@ -0,0 +1,76 @@
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import pytest
+
+from src.core.infrastructure.sentry.sampling import TraceSampler
+
+
+def sampling_context(method: str, path: str, parent_sampled: bool | None = None) -> dict[str, Any]:
+    return {
+        "parent_sampled": parent_sampled,
+        "asgi_scope": {"type": "http", "method": method, "path": path},
+    }
+
+
+def transaction(method: str, path: str, duration: float) -> dict[str, Any]:
+    start = datetime(2025, 1, 1, tzinfo=UTC)
+    return {
+        "type": "transaction",
+        "start_timestamp": start,
+        "timestamp": start + timedelta(seconds=duration),
+        "request": {"method": method, "url": f"https://api.example.com{path}"},
+    }
+
+
+@pytest.fixture
+def sampler() -> TraceSampler:
+    return TraceSampler(
+        traces_sample_rate=0.1,
+        write_traces_sample_rate=0.5,
+        unsampled_paths=["/api/v1/health"],
+    )
+
+
+def test_reads_and_writes_are_sampled_at_their_rates(sampler: TraceSampler) -> None:
+    assert sampler.traces_sampler(sampling_context("GET", "/api/v1/labour/get-all")) == 0.1
+    assert sampler.traces_sampler(sampling_context("POST", "/api/v1/labour/begin")) == 0.5
+
+
+def test_unsampled_paths_are_never_traced(sampler: TraceSampler) -> None:
+    assert sampler.traces_sampler(sampling_context("GET", "/api/v1/health")) == 0.0
+    assert sampler.traces_sampler(sampling_context("GET", "/api/v1/health/", True)) == 0.0
+
+
+def test_parent_decision_is_kept(sampler: TraceSampler) -> None:
+    assert sampler.traces_sampler(sampling_context("GET", "/api/v1/labour/get-all", True)) == 1.0
+    assert sampler.traces_sampler(sampling_context("POST", "/api/v1/labour/begin", False)) == 0.0
+
+
+def test_transactions_are_sent_without_tail_sampling(sampler: TraceSampler) -> None:
+    event = transaction("GET", "/api/v1/labour/get-all", 0.01)
+
+    assert sampler.before_send_transaction(event, {}) is event
+
+
+def test_tail_sampling_traces_every_request() -> None:
+    sampler = TraceSampler(0.0, 0.0, ["/api/v1/health"], slow_request_threshold=1.0)
+
+    assert sampler.traces_sampler(sampling_context("GET", "/api/v1/labour/get-all")) == 1.0
+    assert sampler.traces_sampler(sampling_context("GET", "/api/v1/health")) == 0.0
+
+
+def test_tail_sampling_keeps_slow_requests() -> None:
+    sampler = TraceSampler(0.0, 0.0, slow_request_threshold=1.0)
+    event = transaction("GET", "/api/v1/labour/get-all", 1.5)
+
+    assert sampler.before_send_transaction(event, {}) is event
+
+
+def test_tail_sampling_samples_fast_requests_at_their_rates() -> None:
+    sampler = TraceSampler(0.0, 1.0, slow_request_threshold=1.0)
+    read = transaction("GET", "/api/v1/labour/get-all", 0.1)
+    write = transaction("POST", "/api/v1/labour/begin", 0.1)
+
+    assert sampler.before_send_transaction(read, {}) is None
+    assert sampler.before_send_transaction(write, {}) is write
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from collections.abc import AsyncIterator
 
@@ -51,3 +52,74 @@ def test_setting_max_concurrency_does_not_overwrite_semaphore(task_manager: Asyn
     new_semaphore = task_manager._semaphores["mock"]
 
     assert semaphore is new_semaphore
+
+
+class Counter:
+    def __init__(self) -> None:
+        self.runs = 0
+
+    async def run(self, duration: float = 0) -> None:
+        self.runs += 1
+        await asyncio.sleep(duration)
+
+    async def fail(self) -> None:
+        self.runs += 1
+        await asyncio.sleep(0.01)
+        raise ValueError("failed")
+
+
+async def test_coalescing_runs_burst_of_tasks_once(task_manager: AsyncioTaskManager) -> None:
+    task_manager.set_coalescing(task_name_pattern="mock", debounce_seconds=0.01)
+    counter = Counter()
+
+    for i in range(50):
+        task_manager.create_task(coro=counter.run(), name=f"mock:{i}")
+    await task_manager.wait()
+
+    assert counter.runs == 1
+
+
+async def test_coalescing_keeps_one_pending_task_while_running(
+    task_manager: AsyncioTaskManager,
+) -> None:
+    task_manager.set_coalescing(task_name_pattern="mock")
+    counter = Counter()
+
+    task_manager.create_task(coro=counter.run(duration=0.05), name="mock:first")
+    await asyncio.sleep(0.01)
+    for i in range(10):
+        task_manager.create_task(coro=counter.run(), name=f"mock:{i}")
+    assert len(task_manager._tasks) == 1
+
+    await task_manager.wait()
+    await asyncio.sleep(0)
+
+    assert counter.runs == 2
+    assert not task_manager._pending
+    assert not task_manager._coalescing_runners
+
+
+async def test_coalescing_runs_pending_task_after_failure(
+    task_manager: AsyncioTaskManager,
+) -> None:
+    task_manager.set_coalescing(task_name_pattern="mock")
+    counter = Counter()
+
+    task_manager.create_task(coro=counter.fail(), name="mock:first")
+    while not counter.runs:
+        await asyncio.sleep(0)
+    task_manager.create_task(coro=counter.run(), name="mock:second")
+    await task_manager.wait()
+
+    assert counter.runs == 2
+
+
+async def test_coalescing_does_not_apply_to_other_tasks(task_manager: AsyncioTaskManager) -> None:
+    task_manager.set_coalescing(task_name_pattern="mock")
+    counter = Counter()
+
+    task_manager.create_task(coro=counter.run(), name="other:1")
+    task_manager.create_task(coro=counter.run(), name="other:2")
+    await task_manager.wait()
+
+    assert counter.runs == 2
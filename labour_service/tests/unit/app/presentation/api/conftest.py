@@ -1,4 +1,4 @@
-from collections.abc import Iterable, Iterator
+from collections.abc import AsyncIterator, Iterable, Iterator
 from dataclasses import dataclass
 from datetime import datetime
 from unittest.mock import MagicMock
@@ -13,8 +13,10 @@ from fastapi.testclient import TestClient
 from src.api.exception_handler import ExceptionHandler
 from src.api.routes.router_root import root_router
 from src.labour.application.dtos.labour import LabourDTO
+from src.labour.application.dtos.labour_statistics import DistributionDTO, LabourStatisticsDTO
 from src.labour.application.security.labour_authorization_service import LabourAuthorizationService
 from src.labour.application.services.contraction_service import ContractionService
+from src.labour.application.services.labour_export_service import LabourExportService
 from src.labour.application.services.labour_query_service import LabourQueryService
 from src.labour.application.services.labour_service import LabourService
 from src.payments.infrastructure.stripe.stripe_payment_service import StripePaymentService
@@ -70,6 +72,29 @@ def mock_labour_dto() -> LabourDTO:
     )
 
 
+def build_mock_labour_statistics_dto() -> LabourStatisticsDTO:
+    return LabourStatisticsDTO(
+        labour_id="540a35a9-0323-41a6-b96a-334bcf566c5b",
+        window_start=datetime(2020, 1, 1, 1),
+        window_end=datetime(2020, 1, 1, 2),
+        contraction_count=12,
+        contractions_per_10_minutes=2.0,
+        duration=DistributionDTO(mean=60.0, median=60.0, p90=70.0),
+        interval=DistributionDTO(mean=300.0, median=300.0, p90=310.0),
+        gap=DistributionDTO(mean=240.0, median=240.0, p90=250.0),
+        regularity=0.05,
+        mean_intensity=6.5,
+        intensity_trend_per_hour=1.2,
+        phase_timeline=[],
+    )
+
+
+@pytest.fixture(scope="session")
+def mock_labour_statistics_dto() -> LabourStatisticsDTO:
+    """Create a mock labour statistics DTO."""
+    return build_mock_labour_statistics_dto()
+
+
 @pytest.fixture(scope="session")
 def mock_user_summary_dto(test_user: UserDTO) -> UserSummaryDTO:
     """Create a mock user summary DTO."""
@@ -205,6 +230,10 @@ class MockSubscriptionProvider(Provider):
         service.get_by_id.return_value = self.get_mock_subscription()
         service.get_subscriber_subscriptions.return_value = [self.get_mock_subscription()]
         service.get_labour_subscriptions.return_value = [self.get_mock_subscription()]
+        service.get_labour_subscriptions_with_subscribers.return_value = (
+            [self.get_mock_subscription()],
+            [UserSummaryDTO(id="test_id", first_name="Test", last_name="User")],
+        )
         return service
 
     @provide()
@@ -270,7 +299,21 @@ class MockLabourProvider(Provider):
         service = MagicMock(spec=LabourQueryService)
         service.get_all_labours.return_value = [mock_labour_dto]
         service.get_labour_by_id.return_value = mock_labour_dto
+        service.get_accessible_labour.return_value = mock_labour_dto
         service.get_active_labour.return_value = mock_labour_dto
+        service.get_labour_statistics.return_value = build_mock_labour_statistics_dto()
+        return service
+
+    @provide()
+    def get_labour_export_service(self) -> LabourExportService:
+        """Create a mock labour export service."""
+
+        async def export() -> AsyncIterator[str]:
+            yield "record_type,id\n"
+            yield "contraction,test_id\n"
+
+        service = MagicMock(spec=LabourExportService)
+        service.export_labour.return_value = export()
         return service
 
     @provide()
@@ -293,6 +336,7 @@ class MockLabourProvider(Provider):
         mock_labour_dto = self.get_mock_labour_dto()
         service.start_contraction.return_value = mock_labour_dto
         service.end_contraction.return_value = mock_labour_dto
+        service.import_contractions.return_value = mock_labour_dto
         return service
 
 
@@ -3,6 +3,7 @@ from datetime import datetime, timedelta
 from fastapi.testclient import TestClient
 
 from src.labour.application.dtos.labour import LabourDTO
+from src.labour.application.dtos.labour_statistics import LabourStatisticsDTO
 
 
 def test_get_all_labours(client: TestClient, mock_labour_dto: LabourDTO) -> None:
@@ -30,6 +31,64 @@ def test_get_labour_by_id(
     assert response.json() == {"labour": mock_labour_dto.to_dict()}
 
 
+def test_get_labour_statistics(
+    client: TestClient,
+    mock_labour_statistics_dto: LabourStatisticsDTO,
+) -> None:
+    """Test getting the contraction statistics of a labour."""
+    response = client.get(
+        f"/api/v1/labour/statistics/{mock_labour_statistics_dto.labour_id}?window_minutes=60",
+        headers={"Authorization": "Bearer test_token"},
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"statistics": mock_labour_statistics_dto.to_dict()}
+
+
+def test_get_labour_statistics_invalid_window(client: TestClient) -> None:
+    """Test getting the contraction statistics of a labour with an empty window."""
+    response = client.get(
+        "/api/v1/labour/statistics/test_id?window_minutes=0",
+        headers={"Authorization": "Bearer test_token"},
+    )
+
+    assert response.status_code == 422
+
+
+def test_export_labour(client: TestClient) -> None:
+    """Test exporting a labour as CSV."""
+    response = client.get(
+        "/api/v1/labour/export/test_id",
+        headers={"Authorization": "Bearer test_token"},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert response.headers["content-disposition"] == 'attachment; filename="labour-test_id.csv"'
+    assert response.text == "record_type,id\ncontraction,test_id\n"
+
+
+def test_export_labour_as_ndjson(client: TestClient) -> None:
+    """Test exporting a labour as JSON lines."""
+    response = client.get(
+        "/api/v1/labour/export/test_id?format=ndjson",
+        headers={"Authorization": "Bearer test_token"},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+
+def test_export_labour_invalid_format(client: TestClient) -> None:
+    """Test exporting a labour in an unsupported format."""
+    response = client.get(
+        "/api/v1/labour/export/test_id?format=xml",
+        headers={"Authorization": "Bearer test_token"},
+    )
+
+    assert response.status_code == 422
+
+
 def test_plan_labour(client: TestClient, mock_labour_dto: LabourDTO) -> None:
     """Test planning a new labour."""
     response = client.post(
@@ -291,6 +350,38 @@ def test_end_contraction(client: TestClient, mock_labour_dto: LabourDTO) -> None
     assert response.json() == {"labour": mock_labour_dto.to_dict()}
 
 
+def test_import_contractions(client: TestClient, mock_labour_dto: LabourDTO) -> None:
+    """Test importing a batch of contractions."""
+    start_time = datetime.now()
+    response = client.post(
+        "/api/v1/labour/contraction/import",
+        headers={"Authorization": "Bearer test_token"},
+        json={
+            "contractions": [
+                {
+                    "contraction_id": "540a35a9-0323-41a6-b96a-334bcf566c5c",
+                    "start_time": start_time.isoformat(),
+                    "end_time": (start_time + timedelta(minutes=1)).isoformat(),
+                    "intensity": 5,
+                }
+            ]
+        },
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"labour": mock_labour_dto.to_dict()}
+
+
+def test_import_contractions_empty_batch(client: TestClient) -> None:
+    """Test importing an empty batch of contractions."""
+    response = client.post(
+        "/api/v1/labour/contraction/import",
+        headers={"Authorization": "Bearer test_token"},
+        json={"contractions": []},
+    )
+    assert response.status_code == 422
+
+
 def test_get_all_labours_unauthorized(client: TestClient) -> None:
     """Test getting all labours without authorization."""
     response = client.get("/api/v1/labour/get-all")
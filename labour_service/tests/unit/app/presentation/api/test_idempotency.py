@@ -0,0 +1,128 @@
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from src.api.idempotency import IdempotencyMiddleware
+from src.core.infrastructure.idempotency_keys.in_memory import InMemoryIdempotencyKeyStore
+
+
+@pytest.fixture
+def idempotent_client() -> TestClient:
+    app = FastAPI()
+    app.state.calls = 0
+
+    @app.post("/api/v1/labour/test")
+    async def write() -> dict[str, int]:
+        app.state.calls += 1
+        return {"calls": app.state.calls}
+
+    @app.post("/api/v1/labour/error")
+    async def error() -> None:
+        app.state.calls += 1
+        raise HTTPException(status_code=503)
+
+    @app.post("/api/v1/labour/rate-limited")
+    async def rate_limited() -> None:
+        app.state.calls += 1
+        raise HTTPException(status_code=429)
+
+    @app.post("/api/v1/labour/invalid")
+    async def invalid() -> None:
+        app.state.calls += 1
+        raise HTTPException(status_code=400)
+
+    @app.post("/api/v1/labour/echo")
+    async def echo(payload: dict[str, str]) -> dict[str, str | int]:
+        app.state.calls += 1
+        return {**payload, "calls": app.state.calls}
+
+    @app.post("/api/v1/other")
+    async def other() -> dict[str, int]:
+        app.state.calls += 1
+        return {"calls": app.state.calls}
+
+    app.add_middleware(
+        IdempotencyMiddleware,
+        store=InMemoryIdempotencyKeyStore(expiry_seconds=60, max_entries=10),
+        path_prefixes=("/api/v1/labour",),
+    )
+    return TestClient(app)
+
+
+def test_duplicate_request_returns_stored_response(idempotent_client: TestClient) -> None:
+    headers = {"Authorization": "Bearer test_token", "Idempotency-Key": "key"}
+    first = idempotent_client.post("/api/v1/labour/test", headers=headers)
+    second = idempotent_client.post("/api/v1/labour/test", headers=headers)
+
+    assert first.json() == {"calls": 1}
+    assert second.json() == {"calls": 1}
+    assert second.headers["idempotent-replayed"] == "true"
+
+
+def test_request_without_key_is_not_stored(idempotent_client: TestClient) -> None:
+    headers = {"Authorization": "Bearer test_token"}
+    idempotent_client.post("/api/v1/labour/test", headers=headers)
+    response = idempotent_client.post("/api/v1/labour/test", headers=headers)
+    assert response.json() == {"calls": 2}
+
+
+def test_key_is_scoped_to_credentials(idempotent_client: TestClient) -> None:
+    idempotent_client.post(
+        "/api/v1/labour/test", headers={"Authorization": "Bearer a", "Idempotency-Key": "key"}
+    )
+    response = idempotent_client.post(
+        "/api/v1/labour/test", headers={"Authorization": "Bearer b", "Idempotency-Key": "key"}
+    )
+    assert response.json() == {"calls": 2}
+
+
+def test_server_error_is_not_stored(idempotent_client: TestClient) -> None:
+    headers = {"Idempotency-Key": "key"}
+    idempotent_client.post("/api/v1/labour/error", headers=headers)
+    idempotent_client.post("/api/v1/labour/error", headers=headers)
+    assert idempotent_client.app.state.calls == 2
+
+
+def test_other_paths_are_not_stored(idempotent_client: TestClient) -> None:
+    headers = {"Idempotency-Key": "key"}
+    idempotent_client.post("/api/v1/other", headers=headers)
+    response = idempotent_client.post("/api/v1/other", headers=headers)
+    assert response.json() == {"calls": 2}
+
+
+def test_key_too_long(idempotent_client: TestClient) -> None:
+    response = idempotent_client.post("/api/v1/labour/test", headers={"Idempotency-Key": "a" * 256})
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize("path", ["/api/v1/labour/error", "/api/v1/labour/rate-limited"])
+def test_retryable_errors_are_not_stored(idempotent_client: TestClient, path: str) -> None:
+    headers = {"Idempotency-Key": "key"}
+    idempotent_client.post(path, headers=headers)
+    response = idempotent_client.post(path, headers=headers)
+    assert idempotent_client.app.state.calls == 2
+    assert "idempotent-replayed" not in response.headers
+
+
+def test_client_error_is_stored(idempotent_client: TestClient) -> None:
+    headers = {"Idempotency-Key": "key"}
+    idempotent_client.post("/api/v1/labour/invalid", headers=headers)
+    response = idempotent_client.post("/api/v1/labour/invalid", headers=headers)
+    assert response.status_code == 400
+    assert response.headers["idempotent-replayed"] == "true"
+    assert idempotent_client.app.state.calls == 1
+
+
+def test_request_body_reaches_endpoint_and_is_replayed(idempotent_client: TestClient) -> None:
+    headers = {"Idempotency-Key": "key"}
+    first = idempotent_client.post("/api/v1/labour/echo", headers=headers, json={"a": "b"})
+    second = idempotent_client.post("/api/v1/labour/echo", headers=headers, json={"a": "b"})
+    assert first.json() == second.json() == {"a": "b", "calls": 1}
+
+
+def test_key_reused_with_different_body_is_rejected(idempotent_client: TestClient) -> None:
+    headers = {"Idempotency-Key": "key"}
+    idempotent_client.post("/api/v1/labour/echo", headers=headers, json={"a": "b"})
+    response = idempotent_client.post("/api/v1/labour/echo", headers=headers, json={"a": "c"})
+    assert response.status_code == 422
+    assert idempotent_client.app.state.calls == 1
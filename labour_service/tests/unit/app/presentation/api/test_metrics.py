@@ -0,0 +1,38 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.metrics import UNMATCHED_ROUTE, MetricsMiddleware
+from src.core.infrastructure.metrics.instruments import (
+    HTTP_REQUEST_DB_QUERIES,
+    HTTP_REQUEST_DURATION,
+)
+
+
+def build_client() -> TestClient:
+    app = FastAPI()
+
+    @app.get("/api/v1/metrics-test/{labour_id}")
+    async def read(labour_id: str) -> dict[str, str]:
+        return {"labour_id": labour_id}
+
+    app.add_middleware(MetricsMiddleware)
+    return TestClient(app)
+
+
+def test_requests_are_labelled_by_route_template() -> None:
+    client = build_client()
+    client.get("/api/v1/metrics-test/a")
+    client.get("/api/v1/metrics-test/b")
+
+    route = "/api/v1/metrics-test/{labour_id}"
+    assert HTTP_REQUEST_DURATION.count("GET", route, "200") == 2
+    assert HTTP_REQUEST_DB_QUERIES.count("GET", route) == 2
+
+
+def test_unmatched_requests_share_a_label() -> None:
+    client = build_client()
+    before = HTTP_REQUEST_DURATION.count("GET", UNMATCHED_ROUTE, "404")
+
+    client.get("/not-a-route")
+
+    assert HTTP_REQUEST_DURATION.count("GET", UNMATCHED_ROUTE, "404") == before + 1
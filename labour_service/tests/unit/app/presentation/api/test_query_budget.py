@@ -0,0 +1,63 @@
+from collections.abc import Iterator
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import Engine, create_engine, text
+
+from src.api.query_budget import QUERY_COUNT_HEADER, QUERY_TIME_HEADER, QueryBudgetMiddleware
+from src.core.infrastructure.metrics.database import instrument_engine
+from src.core.infrastructure.metrics.instruments import QUERY_BUDGET_EXCEEDED
+from src.core.infrastructure.metrics.query_budget import QueryBudget
+
+ROUTE = "/api/v1/query-budget-test/{queries}"
+
+
+@pytest.fixture(scope="module")
+def engine() -> Iterator[Engine]:
+    engine = create_engine("sqlite://")
+    instrument_engine(engine, "test_query_budget")
+    yield engine
+    engine.dispose()
+
+
+def build_client(engine: Engine, expose_headers: bool) -> TestClient:
+    app = FastAPI()
+
+    @app.get(ROUTE)
+    def read(queries: int) -> dict[str, int]:
+        with engine.connect() as connection:
+            for _ in range(queries):
+                connection.execute(text("SELECT 1"))
+        return {"queries": queries}
+
+    app.add_middleware(
+        QueryBudgetMiddleware,
+        budget=QueryBudget(max_queries=3, repeated_statement_threshold=0),
+        expose_headers=expose_headers,
+    )
+    return TestClient(app)
+
+
+def test_query_counts_are_added_to_headers(engine: Engine) -> None:
+    response = build_client(engine, expose_headers=True).get("/api/v1/query-budget-test/2")
+
+    assert response.headers[QUERY_COUNT_HEADER] == "2"
+    assert float(response.headers[QUERY_TIME_HEADER]) >= 0
+
+
+def test_query_counts_are_not_exposed_when_disabled(engine: Engine) -> None:
+    response = build_client(engine, expose_headers=False).get("/api/v1/query-budget-test/2")
+
+    assert QUERY_COUNT_HEADER not in response.headers
+    assert QUERY_TIME_HEADER not in response.headers
+
+
+def test_requests_over_budget_are_flagged(engine: Engine) -> None:
+    client = build_client(engine, expose_headers=False)
+    before = QUERY_BUDGET_EXCEEDED.value("request", f"GET {ROUTE}")
+
+    client.get("/api/v1/query-budget-test/3")
+    client.get("/api/v1/query-budget-test/4")
+
+    assert QUERY_BUDGET_EXCEEDED.value("request", f"GET {ROUTE}") == before + 1
@@ -0,0 +1,74 @@
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from src.api.read_your_writes import ReadYourWritesMiddleware
+from src.core.infrastructure.persistence.read_replica import replica_reads_allowed
+from src.core.infrastructure.recent_writes.in_memory import InMemoryRecentWriteTracker
+
+
+def build_client(window_seconds: float) -> TestClient:
+    app = FastAPI()
+
+    @app.get("/api/v1/labour/test")
+    async def read() -> dict[str, bool]:
+        return {"replica": replica_reads_allowed()}
+
+    @app.post("/api/v1/labour/test")
+    async def write() -> dict[str, bool]:
+        return {"replica": replica_reads_allowed()}
+
+    @app.post("/api/v1/labour/error")
+    async def error() -> None:
+        raise HTTPException(status_code=400)
+
+    app.add_middleware(
+        ReadYourWritesMiddleware,
+        tracker=InMemoryRecentWriteTracker(window_seconds=window_seconds, max_entries=10),
+    )
+    return TestClient(app)
+
+
+@pytest.fixture
+def client() -> TestClient:
+    return build_client(window_seconds=60)
+
+
+def test_read_is_served_by_replica(client: TestClient) -> None:
+    response = client.get("/api/v1/labour/test", headers={"Authorization": "Bearer a"})
+    assert response.json() == {"replica": True}
+
+
+def test_anonymous_read_is_served_by_primary(client: TestClient) -> None:
+    response = client.get("/api/v1/labour/test")
+    assert response.json() == {"replica": False}
+
+
+def test_write_is_served_by_primary(client: TestClient) -> None:
+    response = client.post("/api/v1/labour/test", headers={"Authorization": "Bearer a"})
+    assert response.json() == {"replica": False}
+
+
+def test_read_after_write_is_served_by_primary(client: TestClient) -> None:
+    client.post("/api/v1/labour/test", headers={"Authorization": "Bearer a"})
+    response = client.get("/api/v1/labour/test", headers={"Authorization": "Bearer a"})
+    assert response.json() == {"replica": False}
+
+
+def test_read_after_failed_write_is_served_by_primary(client: TestClient) -> None:
+    client.post("/api/v1/labour/error", headers={"Authorization": "Bearer a"})
+    response = client.get("/api/v1/labour/test", headers={"Authorization": "Bearer a"})
+    assert response.json() == {"replica": False}
+
+
+def test_write_does_not_affect_other_callers(client: TestClient) -> None:
+    client.post("/api/v1/labour/test", headers={"Authorization": "Bearer a"})
+    response = client.get("/api/v1/labour/test", headers={"Authorization": "Bearer b"})
+    assert response.json() == {"replica": True}
+
+
+def test_read_after_window_is_served_by_replica() -> None:
+    client = build_client(window_seconds=0)
+    client.post("/api/v1/labour/test", headers={"Authorization": "Bearer a"})
+    response = client.get("/api/v1/labour/test", headers={"Authorization": "Bearer a"})
+    assert response.json() == {"replica": True}
@@ -0,0 +1,16 @@
+from datetime import UTC, datetime
+
+import orjson
+
+from src.api.responses import DataclassResponse
+from src.labour.application.dtos.labour import LabourDTO
+
+
+def test_dataclass_response_serializes_dto(mock_labour_dto: LabourDTO) -> None:
+    response = DataclassResponse({"labour": mock_labour_dto})
+    assert orjson.loads(response.body) == {"labour": mock_labour_dto.to_dict()}
+
+
+def test_dataclass_response_renders_utc_with_z_suffix() -> None:
+    response = DataclassResponse({"time": datetime(2020, 1, 1, 1, 0, tzinfo=UTC)})
+    assert response.body == b'{"time":"2020-01-01T01:00:00Z"}'
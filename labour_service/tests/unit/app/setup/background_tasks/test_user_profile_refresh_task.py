@@ -0,0 +1,59 @@
+from collections.abc import AsyncIterator
+from unittest.mock import AsyncMock
+
+import pytest_asyncio
+from dishka import AsyncContainer, Provider, Scope, make_async_container
+
+from src.setup.background_tasks.user_profile_refresh_task import UserProfileRefreshTask
+from src.setup.ioc.di_component_enum import ComponentEnum
+from src.user.application.dtos.user import UserDTO
+from src.user.application.services.user_service import UserService
+from src.user.infrastructure.auth.profile_refresh_queue import ProfileRefreshQueue
+
+USER = UserDTO(
+    id="test",
+    username="test",
+    first_name="User",
+    last_name="Name",
+    email="test@email.com",
+    phone_number=None,
+)
+
+
+@pytest_asyncio.fixture
+async def user_service() -> UserService:
+    return AsyncMock(spec=UserService)
+
+
+@pytest_asyncio.fixture
+async def container(user_service: UserService) -> AsyncIterator[AsyncContainer]:
+    default_provider = Provider(component=ComponentEnum.DEFAULT, scope=Scope.APP)
+    default_provider.provide(
+        lambda: ProfileRefreshQueue(debounce_seconds=60, max_entries=10),
+        provides=ProfileRefreshQueue,
+    )
+    user_provider = Provider(component=ComponentEnum.USER, scope=Scope.REQUEST)
+    user_provider.provide(lambda: user_service, provides=UserService)
+    container = make_async_container(default_provider, user_provider)
+    yield container
+    await container.close()
+
+
+async def test_queued_profiles_are_saved(
+    container: AsyncContainer, user_service: AsyncMock
+) -> None:
+    queue = await container.get(ProfileRefreshQueue, component=ComponentEnum.DEFAULT)
+    queue.add(USER)
+
+    await UserProfileRefreshTask(name="user_profile_refresh_task").execute(container)
+
+    user_service.save_profiles.assert_awaited_once_with([USER])
+    assert queue.drain() == []
+
+
+async def test_nothing_is_saved_without_queued_profiles(
+    container: AsyncContainer, user_service: AsyncMock
+) -> None:
+    await UserProfileRefreshTask(name="user_profile_refresh_task").execute(container)
+
+    user_service.save_profiles.assert_not_awaited()
@@ -33,6 +33,14 @@ class MockConfigReader(ConfigReader):
                     "SUBSCRIBER_INVITE_RATE_LIMIT": 20,
                     "SUBSCRIBER_INVITE_RATE_LIMIT_EXPIRY": 86400,
                 },
+                "idempotency": {
+                    "IDEMPOTENCY_KEY_EXPIRY": 3600,
+                    "IDEMPOTENCY_KEY_MAX_ENTRIES": 10000,
+                },
+                "authorization_cache": {
+                    "AUTHORIZATION_CACHE_TTL": 30,
+                    "AUTHORIZATION_CACHE_MAX_LABOURS": 10000,
+                },
                 "user_management": {
                     "USER_MANAGEMENT_SERVICE_CLIENT_ID": "test",
                     "USER_MANAGEMENT_SERVICE_CLIENT_SECRET": "secret",
@@ -54,12 +62,17 @@ class MockConfigReader(ConfigReader):
                     "POSTGRES_PORT": 1234,
                     "POSTGRES_DB": "test_db",
                 },
+                "replica": {},
                 "sqla_engine": {
                     "SQLA_ECHO": True,
                     "SQLA_ECHO_POOL": False,
                     "SQLA_POOL_SIZE": 1,
                     "SQLA_MAX_OVERFLOW": 0,
                 },
+                "encryption": {
+                    "DATABASE_ENCRYPTION_KEY": "test_key",
+                },
+                "archive": {},
             },
             "notifications": {
                 "email": {
@@ -68,8 +81,16 @@ class MockConfigReader(ConfigReader):
                 },
                 "twilio": {},
             },
+            "observability": {
+                "sentry": {},
+                "metrics": {},
+                "loop_monitor": {},
+                "query_budget": {},
+            },
             "events": {
                 "gcp": {"GCP_PROJECT_ID": "test"},
+                "publisher": {"DOMAIN_EVENT_PUBLISH_DEBOUNCE": 0.2},
+                "consumer": {"CONSUMER_METRICS_HOST": "test_host"},
             },
             "payments": {
                 "stripe": {"STRIPE_API_KEY": "test", "STRIPE_WEBHOOK_ENDPOINT_SECRET": "test"}
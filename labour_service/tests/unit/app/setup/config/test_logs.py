@@ -1,9 +1,33 @@
 import logging
+from collections.abc import Iterator
 from io import StringIO
+from logging.handlers import QueueHandler
 
+import orjson
+import pytest
+
+from src.setup import logs
 from src.setup.logs import configure_logging
 
 
+@pytest.fixture(autouse=True)
+def restore_logging() -> Iterator[None]:
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    yield
+    logs._stop_listener()
+    root.handlers[:] = handlers
+    root.setLevel(level)
+    logging.getLogger("tests.noisy").setLevel(logging.NOTSET)
+
+
+def capture_output(log_stream: StringIO) -> None:
+    assert logs._listener is not None
+    for handler in logs._listener.handlers:
+        if isinstance(handler, logging.StreamHandler):
+            handler.stream = log_stream
+
+
 def test_configure_logging_debug():
     log_stream = StringIO()
 
@@ -11,14 +35,82 @@ def test_configure_logging_debug():
     log.handlers = []
 
     configure_logging(level="DEBUG")
-
-    for handler in log.handlers:
-        if isinstance(handler, logging.StreamHandler):
-            handler.stream = log_stream
+    capture_output(log_stream)
 
     test_log_msg = "Test log message."
     log.debug(test_log_msg)
+    logs._stop_listener()
 
     log_output = log_stream.getvalue()
     assert log.level == logging.DEBUG
     assert test_log_msg in log_output
+
+
+def test_records_are_handed_to_a_queue():
+    configure_logging(level="INFO")
+
+    handlers = logging.getLogger().handlers
+    assert len(handlers) == 1
+    assert isinstance(handlers[0], QueueHandler)
+
+
+def test_records_are_written_as_json():
+    log_stream = StringIO()
+    configure_logging(level="INFO", json=True)
+    capture_output(log_stream)
+
+    logging.getLogger("tests.json").info("Published %d events", 3)
+    logs._stop_listener()
+
+    entry = orjson.loads(log_stream.getvalue().strip())
+    assert entry["message"] == "Published 3 events"
+    assert entry["level"] == "INFO"
+    assert entry["logger"] == "tests.json"
+
+
+def test_exceptions_are_written_to_their_own_json_field():
+    log_stream = StringIO()
+    configure_logging(level="INFO", json=True)
+    capture_output(log_stream)
+
+    try:
+        raise ValueError("Broken")
+    except ValueError:
+        logging.getLogger("tests.json").exception("Failed to publish %d events", 3)
+    logs._stop_listener()
+
+    entry = orjson.loads(log_stream.getvalue().strip())
+    assert entry["message"] == "Failed to publish 3 events"
+    assert "ValueError: Broken" in entry["exception"]
+
+
+def test_exceptions_are_appended_to_text_records():
+    log_stream = StringIO()
+    configure_logging(level="INFO")
+    capture_output(log_stream)
+
+    try:
+        raise ValueError("Broken")
+    except ValueError:
+        logging.getLogger("tests.text").exception("Failed")
+    logs._stop_listener()
+
+    log_output = log_stream.getvalue()
+    assert "Failed" in log_output
+    assert log_output.count("ValueError: Broken") == 1
+
+
+def test_module_levels_override_root_level():
+    log_stream = StringIO()
+    configure_logging(level="INFO", module_levels={"tests.noisy": "WARNING"})
+    capture_output(log_stream)
+
+    logging.getLogger("tests.noisy").info("Hidden")
+    logging.getLogger("tests.noisy").warning("Shown")
+    logging.getLogger("tests.other").info("Also shown")
+    logs._stop_listener()
+
+    log_output = log_stream.getvalue()
+    assert "Hidden" not in log_output
+    assert "Shown" in log_output
+    assert "Also shown" in log_output
@@ -44,10 +44,19 @@ def test_settings_from_file(mock_config_reader: ConfigReader, tmp_path: Path):
         )
     )
 
+    assert settings.db.replica.replica_enabled is False
+
+    assert settings.observability.sentry.all_unsampled_paths == ["/api/v1/health", "/metrics"]
+    assert settings.observability.sentry.tail_sampling_enabled is False
+
+    assert settings.logging.all_module_levels == {}
+
     assert settings.db.sqla_engine.echo is True
     assert settings.db.sqla_engine.echo_pool is False
     assert settings.db.sqla_engine.pool_size == 1
     assert settings.db.sqla_engine.max_overflow == 0
+    assert settings.db.sqla_engine.pool_timeout == 30.0
+    assert settings.db.sqla_engine.pgbouncer_mode is False
 
     assert settings.payments.stripe.stripe_enabled is True
 
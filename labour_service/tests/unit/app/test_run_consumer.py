@@ -4,6 +4,8 @@ from unittest.mock import AsyncMock, patch
 
 from fern_labour_core.events.consumer import EventConsumer
 
+from src.core.infrastructure.diagnostics.loop_lag import LoopLagMonitor
+from src.core.infrastructure.metrics.server import MetricsServer
 from src.run_consumer import AsyncioTaskManager, ConsumerRunner
 
 
@@ -48,6 +50,44 @@ async def test_consumer_runner_start_and_shutdown():
     mock_consumer.stop.assert_called_once()
 
 
+async def test_consumer_runner_serves_metrics_while_running():
+    """Test that the ConsumerRunner starts and stops its metrics server."""
+    mock_consumer = AsyncMock(spec=EventConsumer)
+    mock_consumer.is_healthy.return_value = True
+    mock_metrics_server = AsyncMock(spec=MetricsServer)
+
+    runner = ConsumerRunner(consumer=mock_consumer, metrics_server=mock_metrics_server)
+
+    async def stop_after_delay():
+        await asyncio.sleep(0.01)
+        runner.stop()
+
+    asyncio.create_task(stop_after_delay())
+    await runner.start()
+
+    mock_metrics_server.start.assert_awaited_once()
+    mock_metrics_server.stop.assert_awaited_once()
+
+
+async def test_consumer_runner_monitors_loop_lag_while_running():
+    """Test that the ConsumerRunner starts and stops its loop lag monitor."""
+    mock_consumer = AsyncMock(spec=EventConsumer)
+    mock_consumer.is_healthy.return_value = True
+    mock_loop_lag_monitor = AsyncMock(spec=LoopLagMonitor)
+
+    runner = ConsumerRunner(consumer=mock_consumer, loop_lag_monitor=mock_loop_lag_monitor)
+
+    async def stop_after_delay():
+        await asyncio.sleep(0.01)
+        runner.stop()
+
+    asyncio.create_task(stop_after_delay())
+    await runner.start()
+
+    mock_loop_lag_monitor.start.assert_awaited_once()
+    mock_loop_lag_monitor.stop.assert_awaited_once()
+
+
 async def test_consumer_runner_health_check():
     """Test the health check functionality of ConsumerRunner."""
     mock_consumer = AsyncMock(spec=EventConsumer)